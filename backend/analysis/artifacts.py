@@ -0,0 +1,627 @@
+"""
+Phase Artifact Builders.
+Build the numeric skeletons of the phase outputs (performance_analysis.json,
+keyword_audit.json and ad_copy_audit.json) straight from the audit data.
+
+Every count, total and ratio the schemas under schemas/ ask for is computed
+here, in one pass per section plus the vectorized Quality Score and n-gram
+engines, so the phases start from precomputed figures instead of reading
+raw rows. Judgment calls (search term relevance, recommended negatives,
+findings) are left for the phases to add; the skeletons validate against
+the schemas as they are.
+
+Usage:
+    artifacts = build_artifacts(audit_data, target_cpa=250)
+    paths = write_artifacts(audit_data, "audits/acme", target_cpa=250)
+"""
+
+import json
+import os
+from datetime import datetime
+from urllib.parse import urlparse
+
+from backend.analysis.negative_conflicts import collect_negatives, find_conflicts
+from backend.analysis.ngrams import analyze_search_terms
+from backend.analysis.quality_score import analyze_quality_scores
+from backend.services.aggregation import aggregate_rows, summarize_rows
+from backend.services.date_ranges import resolve_date_range
+from backend.services.multi_window import window_label
+from backend.services.report_registry import get_report
+
+# Date range of the audit's google_ads sections (audit_account.py default)
+AUDIT_DATE_RANGE = "LAST_30_DAYS"
+
+# Rows listed per ranked artifact list
+TOP_ROWS = 25
+
+# ---- performance_analysis ----
+
+# advertising_channel_type -> schema campaign type
+CHANNEL_TYPES = {
+    "SEARCH": "Search",
+    "DISPLAY": "Display",
+    "SHOPPING": "Shopping",
+    "VIDEO": "Video",
+    "PERFORMANCE_MAX": "Performance Max",
+    "DISCOVERY": "Discovery",
+    "DEMAND_GEN": "Discovery",
+    "MULTI_CHANNEL": "App",
+}
+
+# Audits without channel types only have search impression share data
+DEFAULT_CAMPAIGN_TYPE = "Search"
+
+# bidding_strategy_type -> schema strategy
+BID_STRATEGIES = {
+    "MANUAL_CPC": "Manual CPC",
+    "ENHANCED_CPC": "Enhanced CPC",
+    "MAXIMIZE_CLICKS": "Maximize Clicks",
+    "TARGET_SPEND": "Maximize Clicks",
+    "MAXIMIZE_CONVERSIONS": "Maximize Conversions",
+    "TARGET_CPA": "Target CPA",
+    "TARGET_ROAS": "Target ROAS",
+    "MAXIMIZE_CONVERSION_VALUE": "Maximize Conversion Value",
+    "TARGET_IMPRESSION_SHARE": "Target Impression Share",
+}
+
+# Search impression share lost to budget from which a campaign counts as
+# limited by budget
+LIMITED_BY_BUDGET_LOST_IS = 0.10
+
+# Phase 3, Step 3 volume thresholds (conversions per month)
+SMART_BIDDING_MIN_CONVERSIONS = 15
+TARGET_CPA_MIN_CONVERSIONS = 30
+
+# Actual / target CPA band counted as on target
+ON_TARGET_RANGE = (0.8, 1.2)
+
+# ---- keyword_audit ----
+
+# Upper bounds of the Phase 4 negative:positive ratio assessments
+RATIO_ASSESSMENTS = (
+    (0.3, "severely_under_protected"),
+    (0.6, "under_protected"),
+    (1.0, "moderate"),
+)
+
+# Search terms with a CPA above this multiple of the target count as wasted
+WASTED_CPA_MULTIPLE = 3
+
+# ---- ad_copy_audit ----
+
+EXTENSION_TYPES = {
+    "sitelinks": "SITELINK",
+    "callouts": "CALLOUT",
+    "structured_snippets": "STRUCTURED_SNIPPET",
+}
+AD_STRENGTHS = ("EXCELLENT", "GOOD", "AVERAGE", "POOR")
+FULL_HEADLINES = 10
+FULL_DESCRIPTIONS = 4
+
+# Share of ads pointing to the homepage: (upper bound, assessment)
+HOMEPAGE_ASSESSMENTS = ((25, "good"), (50, "acceptable"))
+
+
+def audit_period(audit_data, date_range=AUDIT_DATE_RANGE):
+    """Schema audit_period of a date range, resolved on the audit's date."""
+    audit_date = audit_data["metadata"]["audit_date"]
+    today = datetime.fromisoformat(audit_date).date()
+    start, end = resolve_date_range(date_range, today=today)
+    return {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "days": (end - start).days + 1,
+    }
+
+
+def _metrics(totals):
+    """Schema metrics object (percentages for rates) from summed totals."""
+    cost = totals.get("cost") or 0
+    clicks = int(totals.get("clicks") or 0)
+    impressions = int(totals.get("impressions") or 0)
+    conversions = totals.get("conversions") or 0
+    metrics = {
+        "cost": round(cost, 2),
+        "conversions": round(conversions, 2),
+        "clicks": clicks,
+        "impressions": impressions,
+        "ctr": round(100 * clicks / impressions, 2) if impressions else 0,
+        "conversion_rate": (
+            round(min(100 * conversions / clicks, 100), 2) if clicks else 0
+        ),
+        "avg_cpc": round(cost / clicks, 2) if clicks else 0,
+    }
+    if conversions:
+        metrics["cpa"] = round(cost / conversions, 2)
+    return metrics
+
+
+def _campaigns(ads):
+    """Campaign rows of the audit rolled up to one row per campaign."""
+    rows = sorted(ads.get("campaigns", []), key=lambda row: row.get("date") or "")
+    return aggregate_rows(get_report("campaign_performance"), rows, True)
+
+
+def _by_name(rows, key="campaign_name"):
+    return {row.get(key): row for row in rows}
+
+
+# ============================================
+# Phase 3: performance_analysis.json
+# ============================================
+
+
+def _assess_bidding(strategy, conversions, target_cpa, actual_cpa):
+    """Schema assessment of a campaign's bid strategy (Phase 3, Step 3)."""
+    if strategy in ("Manual CPC", "Enhanced CPC"):
+        # Enough volume for smart bidding means manual bidding is holding back
+        if conversions >= SMART_BIDDING_MIN_CONVERSIONS:
+            return "wrong_strategy"
+        return "insufficient_data"
+    if target_cpa is None or actual_cpa is None:
+        return "insufficient_data"
+    if strategy == "Target CPA" and conversions < TARGET_CPA_MIN_CONVERSIONS:
+        return "insufficient_data"
+
+    ratio = actual_cpa / target_cpa
+    if ratio > ON_TARGET_RANGE[1]:
+        return "above_target"
+    if ratio < ON_TARGET_RANGE[0]:
+        return "below_target"
+    return "on_target"
+
+
+def build_performance_analysis(audit_data, target_cpa=None):
+    """
+    performance_analysis.json skeleton (Phase 3).
+
+    Args:
+        audit_data: Audit dict (collect_audit output or the saved audit JSON)
+        target_cpa: $TARGET_CPA, used for strategies without their own target
+
+    Returns:
+        Dict matching performance_analysis.schema.json (findings left out)
+    """
+    ads = audit_data.get("google_ads", {})
+    campaigns = _campaigns(ads)
+    impression_share = _by_name(ads.get("impression_share", []))
+    bidding = _by_name(ads.get("bidding_strategies", []))
+    trends = ads.get("campaign_trends") or {}
+    windows = {
+        days: {
+            row.get("campaign_id"): row
+            for row in trends.get(window_label(days), {}).get("rows", [])
+        }
+        for days in (90, 180)
+    }
+
+    campaign_entries = []
+    bid_strategy_analysis = []
+    limited = []
+    for row in campaigns:
+        name = row["campaign_name"]
+        strategy_row = bidding.get(name, {})
+        channel = strategy_row.get("channel_type")
+        entry = {
+            "name": name,
+            "type": CHANNEL_TYPES.get(channel, DEFAULT_CAMPAIGN_TYPE),
+            "status": row["status"],
+            "metrics_30d": _metrics(row),
+        }
+        if channel and channel not in CHANNEL_TYPES:
+            entry["channel_type"] = channel
+        for days, window_rows in windows.items():
+            if row.get("campaign_id") in window_rows:
+                entry[f"metrics_{days}d"] = _metrics(window_rows[row["campaign_id"]])
+
+        share = impression_share.get(name)
+        if share:
+            lost_budget = share.get("lost_is_budget") or 0
+            entry["metrics_30d"]["impression_share"] = round(
+                100 * (share.get("search_is") or 0), 2
+            )
+            entry["limited_by_budget"] = lost_budget >= LIMITED_BY_BUDGET_LOST_IS
+            entry["is_lost_budget_pct"] = round(100 * lost_budget, 2)
+            entry["is_lost_rank_pct"] = round(100 * (share.get("lost_is_rank") or 0), 2)
+            if entry["limited_by_budget"]:
+                limited.append(name)
+
+        strategy = BID_STRATEGIES.get(strategy_row.get("type"))
+        if strategy:
+            own_target = strategy_row.get("target_cpa") or strategy_row.get(
+                "target_roas"
+            )
+            conversions = row.get("conversions") or 0
+            actual_cpa = entry["metrics_30d"].get("cpa")
+            analysis = {"campaign": name, "strategy": strategy}
+            if strategy_row.get("target_cpa"):
+                analysis["target"] = strategy_row["target_cpa"]
+            elif strategy_row.get("target_roas"):
+                # ROAS targets are reported in %
+                analysis["target"] = round(100 * strategy_row["target_roas"], 2)
+            if actual_cpa is not None and "roas" not in strategy.lower():
+                analysis["actual"] = actual_cpa
+            # Maximize Conversions without its own target is held to $TARGET_CPA
+            cpa_target = strategy_row.get("target_cpa")
+            if not own_target and strategy == "Maximize Conversions":
+                cpa_target = target_cpa
+            analysis["assessment"] = _assess_bidding(
+                strategy, conversions, cpa_target, actual_cpa
+            )
+            analysis["conversions_30d"] = round(conversions, 2)
+            bid_strategy_analysis.append(analysis)
+
+            entry["bid_strategy"] = strategy
+            if "target" in analysis:
+                entry["bid_strategy_target"] = analysis["target"]
+            if "actual" in analysis:
+                entry["bid_strategy_actual"] = analysis["actual"]
+
+        campaign_entries.append(entry)
+
+    return {
+        "audit_period": audit_period(audit_data),
+        "campaigns": campaign_entries,
+        "overall_metrics": _metrics(
+            summarize_rows(get_report("campaign_performance"), campaigns)
+        ),
+        "budget_analysis": _budget_analysis(ads, campaigns, limited),
+        "bid_strategy_analysis": bid_strategy_analysis,
+    }
+
+
+def _budget_analysis(ads, campaigns, limited):
+    """Daily budget totals of enabled campaigns (shared budgets counted once)."""
+    enabled = {row["campaign_name"] for row in campaigns if row["status"] == "ENABLED"}
+    budgets = {}
+    for row in ads.get("budgets", []):
+        if row.get("campaign_name") in enabled and row.get("period") in (
+            None,
+            "DAILY",
+        ):
+            budgets[row.get("budget_resource") or row["campaign_name"]] = (
+                row.get("amount") or 0
+            )
+
+    total = sum(budgets.values())
+    return {
+        "total_daily_budget": round(total, 2),
+        "campaigns_limited_by_budget": limited,
+        "avg_daily_budget_per_campaign": (
+            round(total / len(enabled), 2) if enabled else 0
+        ),
+    }
+
+
+# ============================================
+# Phase 4: keyword_audit.json
+# ============================================
+
+
+def _ratio_assessment(ratio):
+    for upper, assessment in RATIO_ASSESSMENTS:
+        if ratio < upper:
+            return assessment
+    return "good"
+
+
+def build_keyword_audit(audit_data, target_cpa=None):
+    """
+    keyword_audit.json skeleton (Phase 4).
+
+    Wasted spend counts search terms without conversions, plus terms with a
+    CPA above WASTED_CPA_MULTIPLE x target_cpa when a target is given.
+    Relevance judgments and recommended negatives are left to the phase.
+
+    Returns:
+        Dict matching keyword_audit.schema.json (findings left out)
+    """
+    ads = audit_data.get("google_ads", {})
+    keywords = ads.get("keywords", [])
+    search_terms = ads.get("search_terms", [])
+
+    wasted_spend = 0.0
+    wasted_terms = []
+    converting_terms = []
+    distinct_terms = set()
+    for row in search_terms:
+        distinct_terms.add(row.get("search_term"))
+        cost = row.get("cost") or 0
+        conversions = row.get("conversions") or 0
+        if not conversions:
+            wasted_spend += cost
+            if cost > 0:
+                wasted_terms.append(row)
+            continue
+        converting_terms.append(row)
+        if target_cpa and cost / conversions > WASTED_CPA_MULTIPLE * target_cpa:
+            wasted_spend += cost
+
+    wasted_terms.sort(key=lambda row: -(row.get("cost") or 0))
+    # Most conversions first, cheapest CPA among equals
+    converting_terms.sort(
+        key=lambda row: (
+            -row["conversions"],
+            (row.get("cost") or 0) / row["conversions"],
+        )
+    )
+
+    qs = analyze_quality_scores(keywords)
+    ngrams = analyze_search_terms(search_terms, target_cpa=target_cpa)
+
+    campaign_negatives = ads.get("negative_keywords", [])
+    shared_negatives = ads.get("shared_negative_keywords", [])
+    conflicts = find_conflicts(
+        collect_negatives(
+            campaign_negatives, shared_negatives, ads.get("negative_lists", [])
+        ),
+        keywords=keywords,
+        search_terms=search_terms,
+    )
+
+    positives = sum(1 for row in keywords if row.get("status") == "ENABLED")
+    negatives = len(campaign_negatives) + len(shared_negatives)
+    ratio = round(negatives / positives, 2) if positives else 0
+
+    summary = {
+        "total_keywords": len(keywords),
+        "total_search_terms": len(distinct_terms),
+        "total_wasted_spend_dkk": round(wasted_spend, 2),
+        "qs_weighted_avg": qs["qs_weighted_avg"],
+        "negative_positive_ratio": ratio,
+        "total_negatives": negatives,
+        "total_positives": positives,
+    }
+    if summary["qs_weighted_avg"] is None:
+        # No keyword with a Quality Score had spend; the schema needs 1-10,
+        # so the phase has to fill this in (or explain its absence)
+        del summary["qs_weighted_avg"]
+
+    return {
+        "audit_period": audit_period(audit_data),
+        "summary": summary,
+        "quality_score_analysis": {
+            "distribution": qs["distribution"],
+            "low_qs_keywords": qs["low_qs_keywords"],
+            "components": qs["components"],
+        },
+        "search_term_analysis": {
+            "wasted_spend_terms": [
+                _search_term(row) for row in wasted_terms[:TOP_ROWS]
+            ],
+            "top_converting_terms": [
+                _search_term(row) for row in converting_terms[:TOP_ROWS]
+            ],
+            "ngram_analysis": {
+                "top_wasting_patterns": ngrams["top_wasting_patterns"],
+                "top_converting_patterns": ngrams["top_converting_patterns"],
+            },
+        },
+        "negative_keyword_analysis": {
+            "current_negatives": {
+                "account_level": len(shared_negatives),
+                "campaign_level": len(campaign_negatives),
+                "total": negatives,
+            },
+            "ratio_assessment": _ratio_assessment(ratio),
+            "recommended_negatives": [],
+            "conflicts": {
+                "blocked_keywords": conflicts["blocked_keywords"][:TOP_ROWS],
+                "blocked_search_terms": conflicts["blocked_search_terms"][:TOP_ROWS],
+                "blocked_conversions": conflicts["blocked_conversions"],
+            },
+        },
+    }
+
+
+def _search_term(row):
+    conversions = row.get("conversions") or 0
+    cost = row.get("cost") or 0
+    item = {
+        "search_term": row.get("search_term"),
+        "spend": round(cost, 2),
+        "clicks": int(row.get("clicks") or 0),
+        "conversions": round(conversions, 2),
+    }
+    if row.get("campaign_name"):
+        item["campaign"] = row["campaign_name"]
+    if conversions:
+        item["cpa"] = round(cost / conversions, 2)
+    return item
+
+
+# ============================================
+# Phase 5: ad_copy_audit.json
+# ============================================
+
+
+def _rsa_severity(headlines, descriptions):
+    if headlines < 5 or descriptions < 2:
+        return "CRITICAL"
+    return "HIGH"
+
+
+def build_ad_copy_audit(audit_data, target_cpa=None):
+    """
+    ad_copy_audit.json skeleton (Phase 5).
+
+    RSA counts cover enabled responsive search ads. Landing page checks are
+    limited to what the URLs show (homepage usage, missing HTTPS).
+    target_cpa is unused; it keeps the builders' signatures alike.
+
+    Returns:
+        Dict matching ad_copy_audit.schema.json (findings left out)
+    """
+    ads = audit_data.get("google_ads", {})
+    enabled_ads = [row for row in ads.get("ads", []) if row.get("status") == "ENABLED"]
+    rsas = [row for row in enabled_ads if row.get("type") == "RESPONSIVE_SEARCH_AD"]
+
+    strengths = dict.fromkeys((s.lower() for s in AD_STRENGTHS), 0)
+    headline_bands = {"1_4": 0, "5_9": 0, "10_15": 0}
+    description_bands = {"1": 0, "2_3": 0, "4": 0}
+    underfilled = []
+    total_headlines = total_descriptions = 0
+    for row in rsas:
+        headlines = len(row.get("headlines") or [])
+        descriptions = len(row.get("descriptions") or [])
+        total_headlines += headlines
+        total_descriptions += descriptions
+
+        strength = row.get("ad_strength")
+        if strength in AD_STRENGTHS:
+            strengths[strength.lower()] += 1
+        if headlines:
+            band = "1_4" if headlines < 5 else "5_9" if headlines < 10 else "10_15"
+            headline_bands[band] += 1
+        if descriptions:
+            band = "1" if descriptions < 2 else "2_3" if descriptions < 4 else "4"
+            description_bands[band] += 1
+
+        if headlines and descriptions and (
+            headlines < FULL_HEADLINES or descriptions < FULL_DESCRIPTIONS
+        ):
+            item = {
+                "campaign": row.get("campaign_name"),
+                "ad_group": row.get("ad_group_name"),
+                "headlines_count": headlines,
+                "descriptions_count": descriptions,
+            }
+            if strength in AD_STRENGTHS:
+                item["ad_strength"] = strength
+            item.update(
+                {
+                    "impressions": int(row.get("impressions") or 0),
+                    "clicks": int(row.get("clicks") or 0),
+                    "severity": _rsa_severity(headlines, descriptions),
+                }
+            )
+            underfilled.append(item)
+    underfilled.sort(key=lambda item: -item["impressions"])
+
+    extension_analysis, coverage = _extension_analysis(ads)
+    ad_groups = {(row.get("campaign_name"), row.get("ad_group_name")) for row in rsas}
+    return {
+        "audit_period": audit_period(audit_data),
+        "summary": {
+            "total_ads": len(rsas),
+            "total_ad_groups": len(ad_groups),
+            "avg_headlines": round(total_headlines / len(rsas), 2) if rsas else 0,
+            "avg_descriptions": (
+                round(total_descriptions / len(rsas), 2) if rsas else 0
+            ),
+            "ads_with_poor_strength": strengths["poor"] + strengths["average"],
+            "extension_coverage_pct": coverage,
+        },
+        "rsa_analysis": {
+            "strength_distribution": strengths,
+            "headline_distribution": headline_bands,
+            "description_distribution": description_bands,
+            "underfilled_ads": underfilled,
+        },
+        "extension_analysis": extension_analysis,
+        "landing_page_analysis": _landing_page_analysis(enabled_ads),
+    }
+
+
+def _extension_analysis(ads):
+    """Extension presence per type; returns (analysis, campaign coverage %)."""
+    campaigns = [
+        row["campaign_name"] for row in _campaigns(ads) if row["status"] == "ENABLED"
+    ]
+    account_assets = {}
+    for row in ads.get("account_extensions", []):
+        account_assets.setdefault(row["field_type"], set()).add(row["asset_id"])
+    campaign_assets = {}
+    for row in ads.get("campaign_extensions", []):
+        campaign_assets.setdefault(row["field_type"], {}).setdefault(
+            row["campaign_name"], set()
+        ).add(row["asset_id"])
+
+    analysis = {}
+    covered = set(campaigns)
+    for key, field_type in EXTENSION_TYPES.items():
+        by_campaign = campaign_assets.get(field_type, {})
+        assets = set(account_assets.get(field_type, ()))
+        for asset_ids in by_campaign.values():
+            assets |= asset_ids
+        # Account-level assets apply to every campaign
+        missing = (
+            []
+            if field_type in account_assets
+            else [name for name in campaigns if name not in by_campaign]
+        )
+        covered -= set(missing)
+        analysis[key] = {
+            "present": bool(assets),
+            "count": len(assets),
+            "campaigns_missing": missing,
+        }
+
+    calls = account_assets.get("CALL") or campaign_assets.get("CALL")
+    analysis["call_extensions"] = {"present": bool(calls)}
+    coverage = round(100 * len(covered) / len(campaigns), 1) if campaigns else 0
+    return analysis, coverage
+
+
+def _landing_page_analysis(enabled_ads):
+    urls = [url for row in enabled_ads for url in row.get("final_urls") or []]
+    unique_urls = list(dict.fromkeys(urls))
+
+    with_urls = [row for row in enabled_ads if row.get("final_urls")]
+    homepage = sum(
+        1 for row in with_urls if urlparse(row["final_urls"][0]).path in ("", "/")
+    )
+    percentage = round(100 * homepage / len(with_urls), 1) if with_urls else 0
+    assessment = "too_high"
+    for upper, label in HOMEPAGE_ASSESSMENTS:
+        if percentage <= upper:
+            assessment = label
+            break
+
+    return {
+        "total_urls": len(urls),
+        "unique_urls": len(unique_urls),
+        "issues": [
+            {"url": url, "issue_type": "no_https", "severity": "MEDIUM"}
+            for url in unique_urls
+            if urlparse(url).scheme == "http"
+        ],
+        "homepage_usage": {
+            "ads_using_homepage": homepage,
+            "total_ads": len(with_urls),
+            "percentage": percentage,
+            "assessment": assessment,
+        },
+    }
+
+
+# ============================================
+# All artifacts
+# ============================================
+
+# Artifact name (file stem) -> builder
+ARTIFACT_BUILDERS = {
+    "performance_analysis": build_performance_analysis,
+    "keyword_audit": build_keyword_audit,
+    "ad_copy_audit": build_ad_copy_audit,
+}
+
+
+def build_artifacts(audit_data, target_cpa=None):
+    """Every phase artifact of an audit, keyed by artifact name."""
+    return {
+        name: builder(audit_data, target_cpa=target_cpa)
+        for name, builder in ARTIFACT_BUILDERS.items()
+    }
+
+
+def write_artifacts(audit_data, directory, target_cpa=None):
+    """Write <artifact>.json files to directory and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, artifact in build_artifacts(audit_data, target_cpa).items():
+        path = os.path.join(directory, f"{name}.json")
+        with open(path, "w") as f:
+            json.dump(artifact, f, indent=2, default=str)
+        paths.append(path)
+    return paths
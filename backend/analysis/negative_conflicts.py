@@ -0,0 +1,279 @@
+"""
+Negative Keyword Conflicts.
+Finds negatives that block active keywords or converting search terms
+(Phase 4, Step 3).
+
+All campaign-level and shared-list negatives are compiled once into a
+NegativeMatcher. Exact negatives go into a hash map keyed by their word
+sequence; phrase and broad negatives go into one word-level Aho-Corasick
+automaton, where a phrase negative is one pattern and every word of a
+broad negative is a pattern of its own. Each keyword or search term is
+then matched in a single pass over its words, so scanning costs
+O(words + matches) per term however many negatives the account has.
+
+Matching follows the negative keyword rules of Google Ads, which do not
+expand to close variants:
+    EXACT  - the term is exactly the negative's words, in order
+    PHRASE - the term contains the negative's words, in order and adjacent
+    BROAD  - the term contains all of the negative's words, in any order
+"""
+
+from collections import deque
+
+from backend.analysis.ngrams import tokenize
+
+MATCH_TYPES = ("EXACT", "PHRASE", "BROAD")
+
+# Keyword statuses that count as active
+ACTIVE_KEYWORD_STATUSES = {"ENABLED"}
+
+
+def collect_negatives(campaign_negatives=(), shared_negatives=(), list_links=()):
+    """
+    Combine campaign-level and shared-list negatives with the campaigns they
+    apply to.
+
+    Args:
+        campaign_negatives: get_existing_negative_keywords rows
+        shared_negatives: get_shared_negative_keywords rows
+        list_links: get_campaign_negative_lists rows (list -> campaign)
+
+    Returns:
+        List of negative dicts (keyword, match_type, level, source, campaigns).
+        Lists applied to no campaign are left out, as they block nothing.
+    """
+    negatives = [
+        {
+            "keyword": row["keyword"],
+            "match_type": row["match_type"],
+            "level": "campaign",
+            "source": row.get("campaign_name"),
+            "campaigns": frozenset([row.get("campaign_name")]),
+        }
+        for row in campaign_negatives
+    ]
+
+    list_campaigns = {}
+    for link in list_links:
+        list_campaigns.setdefault(link["shared_set_id"], set()).add(
+            link["campaign_name"]
+        )
+    for row in shared_negatives:
+        campaigns = list_campaigns.get(row["shared_set_id"])
+        if campaigns:
+            negatives.append(
+                {
+                    "keyword": row["keyword"],
+                    "match_type": row["match_type"],
+                    "level": "shared_list",
+                    "source": row.get("shared_set_name"),
+                    "campaigns": frozenset(campaigns),
+                }
+            )
+    return negatives
+
+
+class NegativeMatcher:
+    """
+    Compiled negative keywords.
+
+    Args:
+        negatives: Dicts with keyword and match_type, plus optional campaigns
+            (campaign names the negative applies to; None means everywhere),
+            as built by collect_negatives
+
+    Usage:
+        matcher = NegativeMatcher(collect_negatives(negatives, shared, links))
+        for negative in matcher.matches("free plumber", "Plumbing - Search"):
+            ...
+    """
+
+    def __init__(self, negatives):
+        self.negatives = []
+        # Word tuple -> indexes of exact negatives
+        self._exact = {}
+        # Automaton: per state a word -> state map, fail link and the
+        # patterns ending there (including those reached via fail links)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        # Pattern ID -> negatives it completes (phrase) or counts toward (broad)
+        self._phrase_of = []
+        self._broad_of = []
+        # Negative index -> distinct words a broad term must contain
+        self._broad_words = {}
+        self._patterns = {}
+
+        for negative in negatives:
+            match_type = negative["match_type"]
+            words = tokenize(negative["keyword"] or "")
+            if match_type not in MATCH_TYPES or not words:
+                continue
+            index = len(self.negatives)
+            self.negatives.append(negative)
+
+            if match_type == "EXACT":
+                self._exact.setdefault(tuple(words), []).append(index)
+            elif match_type == "PHRASE":
+                self._phrase_of[self._add_pattern(words)].append(index)
+            else:
+                distinct = set(words)
+                self._broad_words[index] = len(distinct)
+                for word in distinct:
+                    self._broad_of[self._add_pattern((word,))].append(index)
+
+        self._link()
+
+    def __len__(self):
+        return len(self.negatives)
+
+    def _add_pattern(self, words):
+        words = tuple(words)
+        pattern = self._patterns.get(words)
+        if pattern is not None:
+            return pattern
+
+        state = 0
+        for word in words:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = self._goto[state][word] = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        pattern = self._patterns[words] = len(self._phrase_of)
+        self._phrase_of.append([])
+        self._broad_of.append([])
+        self._output[state].append(pattern)
+        return pattern
+
+    def _link(self):
+        """Compute fail links breadth-first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(word, 0)
+                self._output[child] = (
+                    self._output[child] + self._output[self._fail[child]]
+                )
+
+    def match_indexes(self, words):
+        """Indexes of the negatives matching a tokenized term (any campaign)."""
+        matched = list(self._exact.get(tuple(words), ()))
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        patterns = set()
+        for word in words:
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            patterns.update(output[state])
+
+        broad_hits = {}
+        for pattern in patterns:
+            matched.extend(self._phrase_of[pattern])
+            for index in self._broad_of[pattern]:
+                broad_hits[index] = broad_hits.get(index, 0) + 1
+        matched.extend(
+            index
+            for index, hits in broad_hits.items()
+            if hits == self._broad_words[index]
+        )
+        return matched
+
+    def matches(self, text, campaign_name=None):
+        """
+        Negatives that block `text` in a campaign.
+
+        Args:
+            text: Keyword text or search term
+            campaign_name: Campaign the term belongs to; None ignores scope
+        """
+        found = []
+        for index in sorted(self.match_indexes(tokenize(text or ""))):
+            negative = self.negatives[index]
+            campaigns = negative.get("campaigns")
+            if campaign_name is None or campaigns is None or campaign_name in campaigns:
+                found.append(negative)
+        return found
+
+
+def _conflict(row, text_key, negative):
+    return {
+        text_key: row.get(text_key),
+        "match_type": row.get("match_type"),
+        "campaign_name": row.get("campaign_name"),
+        "ad_group_name": row.get("ad_group_name"),
+        "cost": row.get("cost") or 0,
+        "conversions": row.get("conversions") or 0,
+        "negative": negative["keyword"],
+        "negative_match_type": negative["match_type"],
+        "negative_level": negative["level"],
+        "negative_source": negative["source"],
+    }
+
+
+def find_conflicts(
+    negatives,
+    keywords=(),
+    search_terms=(),
+    converting_only=True,
+):
+    """
+    Keywords and search terms blocked by negative keywords.
+
+    Args:
+        negatives: Negative dicts (see collect_negatives) or a NegativeMatcher
+        keywords: get_keyword_performance rows (only active keywords are checked)
+        search_terms: get_search_terms rows
+        converting_only: Only check search terms with conversions
+
+    Returns:
+        Dict with blocked_keywords and blocked_search_terms (one row per
+        term and blocking negative, highest cost / conversions first) plus
+        counts
+    """
+    matcher = negatives
+    if not isinstance(matcher, NegativeMatcher):
+        matcher = NegativeMatcher(negatives)
+
+    blocked_keywords = []
+    keywords_checked = 0
+    for row in keywords:
+        if row.get("status") not in ACTIVE_KEYWORD_STATUSES:
+            continue
+        keywords_checked += 1
+        for negative in matcher.matches(row.get("keyword"), row.get("campaign_name")):
+            blocked_keywords.append(_conflict(row, "keyword", negative))
+
+    blocked_search_terms = []
+    search_terms_checked = 0
+    blocked_conversions = 0.0
+    for row in search_terms:
+        if converting_only and not row.get("conversions"):
+            continue
+        search_terms_checked += 1
+        found = matcher.matches(row.get("search_term"), row.get("campaign_name"))
+        if found:
+            blocked_conversions += row.get("conversions") or 0
+        for negative in found:
+            blocked_search_terms.append(_conflict(row, "search_term", negative))
+
+    blocked_keywords.sort(key=lambda c: -c["cost"])
+    blocked_search_terms.sort(key=lambda c: (-c["conversions"], -c["cost"]))
+    return {
+        "blocked_keywords": blocked_keywords,
+        "blocked_search_terms": blocked_search_terms,
+        "negatives_checked": len(matcher),
+        "keywords_checked": keywords_checked,
+        "search_terms_checked": search_terms_checked,
+        "blocked_conversions": round(blocked_conversions, 2),
+    }
@@ -0,0 +1,280 @@
+"""
+Search Term N-Gram Analysis.
+Aggregates search term metrics by 1-, 2- and 3-word patterns (Phase 4,
+Step 4) to find $TOP_WASTING_TERMS and $TOP_CONVERTING_TERMS.
+
+Each distinct search term is tokenized once. Every n-gram gets an integer
+ID, and the (n-gram, term) incidence pairs are kept as two flat integer
+arrays, a sparse term x n-gram matrix in coordinate form. Metrics are then
+summed per n-gram with numpy.bincount, one vectorized pass per metric, and
+ranked with array masks, so only the top patterns become dicts. Without
+numpy the same sums run in plain Python.
+"""
+
+import re
+from array import array
+
+DEFAULT_N_VALUES = (1, 2, 3)
+DEFAULT_LIMIT = 10
+
+# Patterns must appear in at least this many distinct search terms
+DEFAULT_MIN_OCCURRENCES = 2
+
+# Converting patterns need at least this many conversions
+DEFAULT_MIN_CONVERSIONS = 2.0
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _numpy():
+    # Imported on first use, like the other heavy dependencies
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def tokenize(term):
+    """Lowercase word tokens of a search term (letters like æ/ø/å included)."""
+    return _TOKEN.findall(term.lower())
+
+
+class NgramTable:
+    """
+    Metric totals per n-gram of a set of search terms.
+
+    Attributes are parallel sequences indexed by n-gram ID: patterns, sizes
+    (words per pattern), occurrences (distinct search terms containing it),
+    cost, clicks and conversions. They are numpy arrays when numpy is
+    available (np is then the numpy module), else lists.
+
+    Usage:
+        table = NgramTable.from_search_terms(ads_connector.get_search_terms(cid))
+        wasting = table.top_wasting()
+        converting = table.top_converting()
+    """
+
+    def __init__(
+        self, patterns, sizes, occurrences, cost, clicks, conversions, np=None
+    ):
+        self.np = np
+        self.patterns = patterns
+        self.sizes = sizes
+        self.occurrences = occurrences
+        self.cost = cost
+        self.clicks = clicks
+        self.conversions = conversions
+        self.total_cost = 0.0
+        self.total_conversions = 0.0
+        self.term_count = 0
+
+    def __len__(self):
+        return len(self.patterns)
+
+    @classmethod
+    def from_search_terms(cls, search_terms, n_values=DEFAULT_N_VALUES):
+        """
+        Build the table from search term rows (get_search_terms output).
+
+        Rows of the same term (e.g. from several ad groups) are merged first,
+        and an n-gram counts once per term even if it repeats within it.
+        """
+        # 1. Merge rows per distinct term
+        term_index = {}
+        term_cost, term_clicks, term_conversions = [], [], []
+        for row in search_terms:
+            term = row.get("search_term") or ""
+            index = term_index.get(term)
+            if index is None:
+                index = term_index[term] = len(term_cost)
+                term_cost.append(0.0)
+                term_clicks.append(0)
+                term_conversions.append(0.0)
+            term_cost[index] += row.get("cost") or 0
+            term_clicks[index] += row.get("clicks") or 0
+            term_conversions[index] += row.get("conversions") or 0
+
+        # 2. Tokenize each term once and intern its n-grams
+        gram_index = {}
+        patterns, sizes = [], []
+        gram_ids, owners = array("q"), array("q")
+        for index, term in enumerate(term_index):
+            tokens = tokenize(term)
+            seen = set()
+            for n in n_values:
+                for start in range(len(tokens) - n + 1):
+                    gram = " ".join(tokens[start : start + n])
+                    if gram in seen:
+                        continue
+                    seen.add(gram)
+                    gram_id = gram_index.get(gram)
+                    if gram_id is None:
+                        gram_id = gram_index[gram] = len(patterns)
+                        patterns.append(gram)
+                        sizes.append(n)
+                    gram_ids.append(gram_id)
+                    owners.append(index)
+
+        # 3. Sum term metrics per n-gram
+        count = len(patterns)
+        np = _numpy() if count else None
+        if np is not None:
+            ids = np.frombuffer(gram_ids, dtype=np.int64)
+            rows = np.frombuffer(owners, dtype=np.int64)
+
+            def total(values):
+                weights = np.asarray(values, dtype=np.float64)[rows]
+                return np.bincount(ids, weights=weights, minlength=count)
+
+            table = cls(
+                patterns,
+                np.asarray(sizes, dtype=np.int64),
+                np.bincount(ids, minlength=count),
+                total(term_cost),
+                total(term_clicks),
+                total(term_conversions),
+                np,
+            )
+        else:
+            occurrences = [0] * count
+            cost, clicks, conversions = [0.0] * count, [0] * count, [0.0] * count
+            for gram_id, index in zip(gram_ids, owners):
+                occurrences[gram_id] += 1
+                cost[gram_id] += term_cost[index]
+                clicks[gram_id] += term_clicks[index]
+                conversions[gram_id] += term_conversions[index]
+            table = cls(patterns, sizes, occurrences, cost, clicks, conversions)
+
+        table.total_cost = float(sum(term_cost))
+        table.total_conversions = float(sum(term_conversions))
+        table.term_count = len(term_index)
+        return table
+
+    @property
+    def account_cpa(self):
+        """CPA across all search terms, or None without conversions."""
+        if not self.total_conversions:
+            return None
+        return self.total_cost / self.total_conversions
+
+    # --- Ranking ---
+
+    def top_wasting(
+        self,
+        limit=DEFAULT_LIMIT,
+        min_occurrences=DEFAULT_MIN_OCCURRENCES,
+        target_cpa=None,
+    ):
+        """
+        Patterns with the most wasted spend ($TOP_WASTING_TERMS).
+
+        Wasted spend is the cost beyond what a pattern's conversions justify
+        at the target CPA (default: the account CPA). Without conversions
+        all spend counts as wasted.
+        """
+        target = target_cpa or self.account_cpa or 0.0
+        np = self.np
+        if np is not None:
+            wasted = np.maximum(self.cost - self.conversions * target, 0.0)
+            mask = (self.occurrences >= min_occurrences) & (wasted > 0)
+            candidates = np.flatnonzero(mask)
+            order = candidates[np.argsort(-wasted[candidates], kind="stable")]
+        else:
+            wasted = [
+                max(cost - conversions * target, 0.0)
+                for cost, conversions in zip(self.cost, self.conversions)
+            ]
+            order = sorted(
+                (
+                    i
+                    for i in range(len(self))
+                    if self.occurrences[i] >= min_occurrences and wasted[i] > 0
+                ),
+                key=lambda i: -wasted[i],
+            )
+        return [
+            dict(self.row(i), wasted_spend=round(float(wasted[i]), 2))
+            for i in order[:limit]
+        ]
+
+    def top_converting(
+        self,
+        limit=DEFAULT_LIMIT,
+        min_occurrences=DEFAULT_MIN_OCCURRENCES,
+        min_conversions=DEFAULT_MIN_CONVERSIONS,
+        target_cpa=None,
+    ):
+        """
+        Patterns with the most conversions at or below the target CPA
+        ($TOP_CONVERTING_TERMS; target defaults to the account CPA).
+        """
+        target = target_cpa or self.account_cpa
+        np = self.np
+        if np is not None:
+            mask = (self.occurrences >= min_occurrences) & (
+                self.conversions >= min_conversions
+            )
+            if target:
+                mask &= self.cost <= self.conversions * target
+            candidates = np.flatnonzero(mask)
+            # Most conversions first, cheaper patterns first on ties
+            order = candidates[
+                np.lexsort((self.cost[candidates], -self.conversions[candidates]))
+            ]
+        else:
+            order = sorted(
+                (
+                    i
+                    for i in range(len(self))
+                    if self.occurrences[i] >= min_occurrences
+                    and self.conversions[i] >= min_conversions
+                    and (not target or self.cost[i] <= self.conversions[i] * target)
+                ),
+                key=lambda i: (-self.conversions[i], self.cost[i]),
+            )
+        return [self.row(i) for i in order[:limit]]
+
+    def row(self, index):
+        """One n-gram as a dict (field names follow keyword_audit.schema.json)."""
+        cost = float(self.cost[index])
+        clicks = int(self.clicks[index])
+        conversions = float(self.conversions[index])
+        return {
+            "pattern": self.patterns[index],
+            "words": int(self.sizes[index]),
+            "occurrences": int(self.occurrences[index]),
+            "total_spend": round(cost, 2),
+            "total_clicks": clicks,
+            "total_conversions": round(conversions, 2),
+            "cpa": round(cost / conversions, 2) if conversions else None,
+            "conversion_rate": round(conversions / clicks, 4) if clicks else 0,
+        }
+
+
+def analyze_search_terms(
+    search_terms,
+    n_values=DEFAULT_N_VALUES,
+    limit=DEFAULT_LIMIT,
+    min_occurrences=DEFAULT_MIN_OCCURRENCES,
+    target_cpa=None,
+):
+    """
+    N-gram analysis of search terms for the keyword audit.
+
+    Returns:
+        Dict with top_wasting_patterns and top_converting_patterns (the
+        ngram_analysis object of keyword_audit.schema.json) plus counts
+    """
+    table = NgramTable.from_search_terms(search_terms, n_values)
+    return {
+        "top_wasting_patterns": table.top_wasting(
+            limit, min_occurrences, target_cpa=target_cpa
+        ),
+        "top_converting_patterns": table.top_converting(
+            limit, min_occurrences, target_cpa=target_cpa
+        ),
+        "search_terms_analyzed": table.term_count,
+        "ngrams": len(table),
+        "account_cpa": round(table.account_cpa, 2) if table.account_cpa else None,
+    }
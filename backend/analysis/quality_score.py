@@ -0,0 +1,253 @@
+"""
+Quality Score Analysis.
+Spend-weighted Quality Score, QS-band distribution and component breakdowns
+of the keyword report (Phase 4, Step 1).
+
+Every keyword is reduced to a QS band index and one rating code per QS
+component (expected CTR, ad relevance, landing page experience). All totals
+are then bincounts over those codes, weighted by spend where needed, so a
+six-figure keyword list is aggregated in a handful of vectorized passes.
+Without numpy the same sums run in plain Python.
+
+The output populates keyword_audit.schema.json directly: qs_weighted_avg
+goes to summary, distribution and low_qs_keywords to quality_score_analysis.
+"""
+
+import heapq
+from itertools import repeat
+
+# Schema band -> (lowest, highest) Quality Score
+QS_BANDS = {
+    "qs_1": (1, 1),
+    "qs_2_3": (2, 3),
+    "qs_4_6": (4, 6),
+    "qs_7_8": (7, 8),
+    "qs_9_10": (9, 10),
+}
+NULL_BAND = "qs_null"
+BAND_NAMES = (*QS_BANDS, NULL_BAND)
+
+# Band index of each Quality Score 0-10 (0 means no score reported)
+_BAND_OF_SCORE = [len(QS_BANDS)] + [
+    index
+    for index, (low, high) in enumerate(QS_BANDS.values())
+    for _ in range(low, high + 1)
+]
+
+# Schema component field -> keyword_performance column
+COMPONENTS = {
+    "expected_ctr": "expected_ctr",
+    "ad_relevance": "creative_qs",
+    "landing_page_exp": "landing_page_qs",
+}
+
+# API enum name -> schema rating
+COMPONENT_RATINGS = {
+    "ABOVE_AVERAGE": "Above average",
+    "AVERAGE": "Average",
+    "BELOW_AVERAGE": "Below average",
+}
+UNKNOWN_RATING = "Unknown"
+RATING_NAMES = (*COMPONENT_RATINGS.values(), UNKNOWN_RATING)
+_RATING_CODES = {name: code for code, name in enumerate(COMPONENT_RATINGS)}
+
+# Keywords with at most this QS are reported as low QS keywords
+LOW_QS_MAX = 6
+DEFAULT_LOW_QS_LIMIT = 20
+
+
+def _numpy():
+    # Imported on first use, like the other heavy dependencies
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _column(keywords, name, default=0):
+    """Values of one column of a row list or DataFrame."""
+    if hasattr(keywords, "iloc"):
+        if name not in keywords:
+            return [default] * len(keywords)
+        return keywords[name].tolist()
+    return [row.get(name, default) for row in keywords]
+
+
+def _bincount(np, index, size, weights=None):
+    """Per-index totals (counts without weights), vectorized when np is set."""
+    if np is not None:
+        return np.bincount(index, weights=weights, minlength=size).tolist()
+    totals = [0] * size
+    for i, weight in zip(index, repeat(1) if weights is None else weights):
+        totals[i] += weight
+    return totals
+
+
+def _rating_totals(cells, bands):
+    """Per-rating sums of band x rating cells over the given bands."""
+    return [
+        sum(cells[band * len(RATING_NAMES) + code] for band in bands)
+        for code in range(len(RATING_NAMES))
+    ]
+
+
+def _shares(counts, spend, names, total_spend):
+    return {
+        name: {
+            "keyword_count": int(count),
+            "spend": round(amount, 2),
+            "spend_pct": round(100 * amount / total_spend, 1) if total_spend else 0,
+        }
+        for name, count, amount in zip(names, counts, spend)
+    }
+
+
+def analyze_quality_scores(
+    keywords,
+    enabled_only=True,
+    low_qs_limit=DEFAULT_LOW_QS_LIMIT,
+    low_qs_min_spend=0,
+):
+    """
+    Quality Score analysis of keyword performance rows.
+
+    Args:
+        keywords: get_keyword_performance rows (list of dicts or DataFrame)
+        enabled_only: Only analyze enabled keywords with impressions
+        low_qs_limit: Low QS keywords to list, highest spend first
+        low_qs_min_spend: Minimum spend for a low QS keyword to be listed
+
+    Returns:
+        Dict with qs_weighted_avg ($QS_WEIGHTED_AVG; None without scored
+        spend), distribution (per QS band), components (per component and
+        rating, overall and for QS 1-6 keywords), low_qs_keywords and counts
+    """
+    scores = [int(qs or 0) for qs in _column(keywords, "quality_score")]
+    cost = [float(c or 0) for c in _column(keywords, "cost")]
+    ratings = {
+        field: [
+            _RATING_CODES.get(value, len(COMPONENT_RATINGS))
+            for value in _column(keywords, column, None)
+        ]
+        for field, column in COMPONENTS.items()
+    }
+
+    keep = range(len(scores))
+    if enabled_only:
+        keep = [
+            i
+            for i, (status, impressions) in enumerate(
+                zip(
+                    _column(keywords, "status", None),
+                    _column(keywords, "impressions"),
+                )
+            )
+            if status == "ENABLED" and impressions
+        ]
+        scores = [scores[i] for i in keep]
+        cost = [cost[i] for i in keep]
+        ratings = {field: [codes[i] for i in keep] for field, codes in ratings.items()}
+
+    bands = [_BAND_OF_SCORE[min(max(qs, 0), 10)] for qs in scores]
+    weighted = [qs * spend for qs, spend in zip(scores, cost)]
+    band_count = len(BAND_NAMES)
+    rating_count = len(RATING_NAMES)
+
+    np = _numpy()
+    if np is not None and scores:
+        bands = np.asarray(bands, dtype=np.int64)
+        cost_values = np.asarray(cost, dtype=np.float64)
+        weighted = np.asarray(weighted, dtype=np.float64)
+    else:
+        np = None
+        cost_values = cost
+
+    band_keywords = _bincount(np, bands, band_count)
+    band_spend = _bincount(np, bands, band_count, cost_values)
+    band_weighted = _bincount(np, bands, band_count, weighted)
+    total_spend = sum(band_spend)
+
+    # QS-band x rating cells, so overall and low-QS breakdowns share one pass
+    low_bands = [
+        index for index, (low, _) in enumerate(QS_BANDS.values()) if low <= LOW_QS_MAX
+    ]
+    components = {}
+    for field, codes in ratings.items():
+        if np is not None:
+            cells = bands * rating_count + np.asarray(codes, dtype=np.int64)
+        else:
+            cells = [band * rating_count + code for band, code in zip(bands, codes)]
+        size = band_count * rating_count
+        cell_keywords = _bincount(np, cells, size)
+        cell_spend = _bincount(np, cells, size, cost_values)
+
+        all_bands = range(band_count)
+        low_spend = _rating_totals(cell_spend, low_bands)
+        components[field] = {
+            "all": _shares(
+                _rating_totals(cell_keywords, all_bands),
+                _rating_totals(cell_spend, all_bands),
+                RATING_NAMES,
+                total_spend,
+            ),
+            "low_qs": _shares(
+                _rating_totals(cell_keywords, low_bands),
+                low_spend,
+                RATING_NAMES,
+                sum(low_spend),
+            ),
+        }
+
+    scored_spend = total_spend - band_spend[-1]
+    qs_weighted_avg = (
+        round(sum(band_weighted) / scored_spend, 2) if scored_spend > 0 else None
+    )
+
+    return {
+        "qs_weighted_avg": qs_weighted_avg,
+        "keyword_count": len(scores),
+        "total_spend": round(total_spend, 2),
+        "distribution": _shares(band_keywords, band_spend, BAND_NAMES, total_spend),
+        "components": components,
+        "low_qs_keywords": _low_qs_keywords(
+            keywords, keep, scores, cost, ratings, low_qs_limit, low_qs_min_spend
+        ),
+    }
+
+
+def _low_qs_keywords(keywords, keep, scores, cost, ratings, limit, min_spend):
+    """Highest-spend keywords with QS 1-6, shaped like the schema items."""
+    candidates = [
+        i
+        for i, qs in enumerate(scores)
+        if 1 <= qs <= LOW_QS_MAX and cost[i] >= min_spend
+    ]
+    top = heapq.nlargest(limit, candidates, key=cost.__getitem__)
+    if not top:
+        return []
+
+    names = ("keyword", "clicks", "conversions", "campaign_name", "ad_group_name")
+    columns = {name: _column(keywords, name, None) for name in names}
+    low_qs = []
+    for i in top:
+        row = keep[i]
+        item = {
+            "keyword": columns["keyword"][row],
+            "quality_score": scores[i],
+        }
+        for field, codes in ratings.items():
+            # Unknown ratings are left out (the schema only allows the three)
+            if codes[i] < len(COMPONENT_RATINGS):
+                item[field] = RATING_NAMES[codes[i]]
+        item.update(
+            {
+                "spend": round(cost[i], 2),
+                "clicks": int(columns["clicks"][row] or 0),
+                "conversions": float(columns["conversions"][row] or 0),
+                "campaign": columns["campaign_name"][row],
+                "ad_group": columns["ad_group_name"][row],
+            }
+        )
+        low_qs.append(item)
+    return low_qs
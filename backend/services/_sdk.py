@@ -0,0 +1,53 @@
+"""
+Lazy Google SDK imports.
+The google-ads and GA4 client libraries take seconds to import, so services
+reference them as attributes of this module (e.g. _sdk.GoogleAdsException)
+and the import happens on first use instead of at module load.
+"""
+
+import importlib
+
+# Attribute name -> (module, attribute in that module, or None for the module)
+_LAZY_ATTRIBUTES = {
+    # Google Ads
+    "GoogleAdsClient": ("google.ads.googleads.client", "GoogleAdsClient"),
+    "GoogleAdsException": ("google.ads.googleads.errors", "GoogleAdsException"),
+    "protobuf_helpers": ("google.api_core.protobuf_helpers", None),
+    # GA4 Data & Admin APIs
+    "BetaAnalyticsDataClient": (
+        "google.analytics.data_v1beta",
+        "BetaAnalyticsDataClient",
+    ),
+    "AnalyticsAdminServiceClient": (
+        "google.analytics.admin",
+        "AnalyticsAdminServiceClient",
+    ),
+    "Credentials": ("google.oauth2.credentials", "Credentials"),
+    "DateRange": ("google.analytics.data_v1beta.types", "DateRange"),
+    "Dimension": ("google.analytics.data_v1beta.types", "Dimension"),
+    "Metric": ("google.analytics.data_v1beta.types", "Metric"),
+    "RunReportRequest": ("google.analytics.data_v1beta.types", "RunReportRequest"),
+    "OrderBy": ("google.analytics.data_v1beta.types", "OrderBy"),
+    "CheckCompatibilityRequest": (
+        "google.analytics.data_v1beta.types",
+        "CheckCompatibilityRequest",
+    ),
+    "RunRealtimeReportRequest": (
+        "google.analytics.data_v1beta.types",
+        "RunRealtimeReportRequest",
+    ),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
@@ -12,43 +12,105 @@ if str(_plugin_root) not in sys.path:
     sys.path.insert(0, str(_plugin_root))
 
 import os
-from google.ads.googleads.client import GoogleAdsClient
-from google.ads.googleads.errors import GoogleAdsException
-from google.api_core import protobuf_helpers
-import pandas as pd
+import time
 from datetime import datetime, timedelta
+from backend.services import _sdk, client_pool
+from backend.services.batch_jobs import BatchJobMutator
+from backend.services.bulk_mutations import BulkMutator
 from backend.services.credentials import ensure_credentials
-
-# Load credentials from ~/.mondaybrew/.env - MUST succeed or raise error
-_cred_source = ensure_credentials()
-print(f"[AdsConnector] Credentials loaded from: {_cred_source}")
+from backend.services.columnar import ColumnarDecoder
+from backend.services.incremental_sync import IncrementalSync
+from backend.services.instrumentation import ConnectorMetrics, report_label
+from backend.services.multi_window import DEFAULT_WINDOWS, fetch_span, split_windows
+from backend.services.rate_limiter import shared_limiter
+from backend.services.report_registry import get_report
+from backend.services.retry import (
+    RetryPolicy,
+    describe_error,
+    is_quota_error,
+    is_retryable,
+)
+
+# Rows per batch when replaying a cached response (search_stream's batch size)
+CACHE_BATCH_SIZE = 10000
+
+# How bulk writes are submitted: synchronous mutate requests or batch jobs
+MUTATION_MODES = ("sync", "batch_job")
 
 
 class AdsConnector:
-    def __init__(self):
+    def __init__(
+        self,
+        cache=None,
+        partitions=None,
+        rate_limiter=None,
+        retry_policy=None,
+        login_customer_id=None,
+        metrics=None,
+        mutation_mode="sync",
+    ):
+        """
+        Connectors with the same credentials and login customer share one
+        GoogleAdsClient and its service stubs (see client_pool), so creating
+        one per account costs no extra channel or token refresh.
+
+        Args:
+            cache: Optional ReportCache; registered reports are then served from
+                and stored in the on-disk response cache
+            partitions: Optional PartitionStore; daily-aggregatable reports are
+                then synced incrementally and assembled from local partitions
+            rate_limiter: RateLimiter every API request draws from. Defaults to
+                the process-wide limiter of the developer token.
+            retry_policy: RetryPolicy for quota and transient API errors
+            login_customer_id: Manager account to operate through (defaults to
+                GOOGLE_ADS_LOGIN_CUSTOMER_ID)
+            metrics: ConnectorMetrics recording every search_stream and mutate
+                call (a private one by default; pass one to share or export)
+            mutation_mode: "sync" applies bulk writes (keywords, negatives,
+                bids, removals, asset links) with chunked mutate requests,
+                "batch_job" stages them into BatchJobService jobs instead
+        """
+        if mutation_mode not in MUTATION_MODES:
+            raise ValueError(f"Unknown mutation mode: {mutation_mode}")
+
+        # Load credentials from ~/.mondaybrew/.env - MUST succeed or raise error
+        cred_source = ensure_credentials()
+        print(f"[AdsConnector] Credentials loaded from: {cred_source}")
+
+        self.cache = cache
+        self.rate_limiter = rate_limiter or shared_limiter(
+            os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or ConnectorMetrics()
+        self.mutation_mode = mutation_mode
+        self.incremental = (
+            IncrementalSync(self, partitions) if partitions is not None else None
+        )
         try:
             config = {
                 "developer_token": os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN"),
                 "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
                 "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
                 "refresh_token": os.getenv("GOOGLE_ADS_REFRESH_TOKEN"),
-                "login_customer_id": os.getenv(
-                    "GOOGLE_ADS_LOGIN_CUSTOMER_ID", ""
+                "login_customer_id": str(
+                    login_customer_id or os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID", "")
                 ).strip(),
                 "use_proto_plus": "True",
             }
             print(
                 f"DEBUG: Config login_customer_id: '{config['login_customer_id']}' (Type: {type(config['login_customer_id'])})"
             )
-            self.client = GoogleAdsClient.load_from_dict(config)
-            self.ga_service = self.client.get_service("GoogleAdsService")
+            self.login_customer_id = config["login_customer_id"]
+            self.client = client_pool.get_client(config)
+            self.ga_service = self._service("GoogleAdsService")
         except Exception as e:
             print(f"Failed to initialize AdsConnector: {e}")
             raise e
 
     def get_accessible_customers(self):
         """Returns a list of customer IDs accessible by the login customer."""
-        customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
+        customer_id = self.login_customer_id
         query = """
             SELECT
                 customer_client.client_customer,
@@ -60,468 +122,396 @@ class AdsConnector:
         """
 
         accounts = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    client = row.customer_client
-                    # Only add leaf accounts (not the MCC itself if it shows up)
-                    if client.id != int(customer_id):
-                        accounts.append(
-                            {"name": client.descriptive_name, "id": str(client.id)}
-                        )
-        except GoogleAdsException as ex:
-            print(f"Error fetching accounts: {ex}")
+        attempt = 0
+        while True:
+            try:
+                self._throttle(customer_id)
+                response = self.ga_service.search_stream(
+                    customer_id=customer_id, query=query
+                )
+                for batch in response:
+                    for row in batch.results:
+                        client = row.customer_client
+                        # Only add leaf accounts (not the MCC itself if it shows up)
+                        if client.id != int(customer_id):
+                            accounts.append(
+                                {"name": client.descriptive_name, "id": str(client.id)}
+                            )
+            except _sdk.GoogleAdsException as ex:
+                accounts = []
+                if self._wait_to_retry(ex, attempt, "accounts", customer_id):
+                    attempt += 1
+                    continue
+                if is_retryable(ex):
+                    raise
+                print(f"Error fetching accounts: {ex}")
+            break
 
         return accounts
 
-    def get_auction_insights(self, customer_id, date_range="LAST_30_DAYS"):
-        """
-        Fetches auction insights for campaigns.
+    # ============================================
+    # READ OPERATIONS - Registered Reports
+    # ============================================
+
+    def run_report(
+        self,
+        name,
+        customer_id,
+        date_range=None,
+        extra_where=(),
+        output=None,
+        stream=False,
+        segment_by_date=False,
+        raise_errors=False,
+    ):
         """
-        query = f"""
-            SELECT
-                segments.date,
-                campaign.id,
-                campaign.name,
-                segments.auction_insight_domain,
-                metrics.auction_insight_search_impression_share,
-                metrics.auction_insight_search_outranking_share,
-                metrics.auction_insight_search_overlap_rate,
-                metrics.auction_insight_search_position_above_rate
-            FROM campaign_auction_insight
-            WHERE segments.date DURING {date_range}
-                AND campaign.status != 'REMOVED'
+        Run any report from the report registry.
+
+        Args:
+            name: Registered report name (see backend/services/report_registry.py)
+            customer_id: Google Ads customer ID
+            date_range: DURING value (e.g. LAST_30_DAYS) or a (start, end) tuple;
+                defaults to the report's own
+            extra_where: Additional GAQL conditions ANDed onto the report's filters
+            output: "rows" (list of dicts), "frame" (pandas DataFrame) or "arrow"
+                (pyarrow Table). Defaults to "frame" for reports registered with
+                as_frame, otherwise "rows". Frame and Arrow output are decoded
+                column-wise into typed buffers without building per-row dicts.
+            stream: Return a generator of row dicts instead (see iter_report);
+                streamed reads bypass the report cache
+            segment_by_date: Return one row per day, with a leading "date" column
+            raise_errors: Raise API errors instead of printing them and
+                returning empty data
+
+        Returns:
+            Report data in the requested output format (empty on API errors)
+        """
+        spec = get_report(name)
+        if segment_by_date:
+            spec = spec.segmented_by_date()
+        output = output or ("frame" if spec.as_frame else "rows")
+        if output not in ("rows", "frame", "arrow"):
+            raise ValueError(f"Unknown report output '{output}'")
+
+        if stream:
+            return self._iter_spec(
+                spec,
+                customer_id,
+                date_range,
+                extra_where,
+                raise_errors=raise_errors,
+                use_cache=False,
+            )
+
+        if output == "rows":
+            if (
+                self.incremental is not None
+                and not segment_by_date
+                and not extra_where
+                and self.incremental.supports(spec)
+            ):
+                return self._fetch_incremental(spec, customer_id, date_range)
+            rows = self._iter_spec(
+                spec, customer_id, date_range, extra_where, raise_errors=raise_errors
+            )
+            return list(rows)
+
+        columns = ColumnarDecoder(spec, customer_id)
+        for results in self._stream_results(
+            spec, customer_id, date_range, extra_where, raise_errors=raise_errors
+        ):
+            columns.append(results)
+
+        if output == "arrow":
+            return columns.to_arrow()
+        return columns.to_frame()
+
+    def run_report_windows(
+        self,
+        name,
+        customer_id,
+        windows=DEFAULT_WINDOWS,
+        compare=True,
+        today=None,
+        raise_errors=False,
+    ):
         """
+        Run a report for several trailing windows with a single fetch.
 
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
+        The widest span (twice the widest window when comparing) is fetched
+        once segmented by date, or assembled from local partitions in
+        incremental mode, and each window is rolled up locally.
+
+        Args:
+            name: Registered report name; it must be segmentable by date and
+                aggregatable (see IncrementalSync.supports)
+            customer_id: Google Ads customer ID
+            windows: Window lengths in days, each ending yesterday
+            compare: Add the period before each window and the changes
+                against it (see multi_window.split_windows)
+            today: Reference date (defaults to date.today())
+            raise_errors: Raise API errors instead of printing them and
+                returning empty windows
+
+        Returns:
+            Dict of window label (e.g. "LAST_30_DAYS") -> window data
+        """
+        spec = get_report(name)
+        if not IncrementalSync.supports(spec):
+            raise ValueError(f"Report '{name}' cannot be split into date windows")
+
+        span = fetch_span(windows, today, compare)
+        if self.incremental is not None:
+            try:
+                self.incremental.sync(customer_id, name, span, today)
+            except _sdk.GoogleAdsException as ex:
+                if raise_errors or is_retryable(ex):
+                    raise
+                print(f"Error fetching {spec.description} for {customer_id}: {ex}")
+            rows = self.incremental.window(
+                customer_id, name, span, aggregate=False, today=today
             )
-            data = []
-            for batch in response:
-                for row in batch.results:
-                    data.append(
-                        {
-                            "date": row.segments.date,
-                            "campaign_id": row.campaign.id,
-                            "campaign_name": row.campaign.name,
-                            "competitor_domain": row.segments.auction_insight_domain,
-                            "impression_share": row.metrics.auction_insight_search_impression_share,
-                            "outranking_share": row.metrics.auction_insight_search_outranking_share,
-                            "overlap_rate": row.metrics.auction_insight_search_overlap_rate,
-                            "position_above_rate": row.metrics.auction_insight_search_position_above_rate,
-                        }
-                    )
-            return pd.DataFrame(data)
-        except GoogleAdsException as ex:
-            print(
-                f"Request with ID '{ex.request_id}' failed with status '{ex.error.code().name}' and includes the following errors:"
+        else:
+            rows = self.run_report(
+                name,
+                customer_id,
+                date_range=span,
+                output="rows",
+                segment_by_date=True,
+                raise_errors=raise_errors,
             )
-            for error in ex.failure.errors:
-                print(f"\tError with message '{error.message}'.")
-                if error.location:
-                    for field_path_element in error.location.field_path_elements:
-                        print(f"\t\tOn field: {field_path_element.field_name}")
-            return pd.DataFrame()
+        return split_windows(spec, rows, windows, span[1], compare)
 
-    def get_campaign_performance(self, customer_id, date_range="LAST_30_DAYS"):
-        """Fetches campaign performance for a specific customer."""
+    def iter_report(
+        self, name, customer_id, date_range=None, extra_where=(), batch_size=None
+    ):
+        """
+        Stream a registered report without holding the full result in memory.
 
-        # If date_range is a string like 'LAST_30_DAYS', we use it in the WHERE clause.
-        # But for BigQuery sync, we usually want specific dates.
-        # For MVP, let's just fetch YESTERDAY by default if no range specified.
+        Rows are decoded as search_stream delivers them, so peak memory stays
+        at one API batch regardless of account size. The report cache is
+        bypassed, since reading or writing an entry means holding the whole
+        response.
 
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.status,
-                segments.date,
-                metrics.cost_micros,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.conversions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_per_conversion,
-                metrics.search_budget_lost_impression_share,
-                metrics.search_rank_lost_impression_share
-            FROM campaign
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
+        Args:
+            name: Registered report name
+            customer_id: Google Ads customer ID
+            date_range: DURING value or (start, end) tuple; defaults to the
+                report's own
+            extra_where: Additional GAQL conditions ANDed onto the report's filters
+            batch_size: If set, yield lists of up to batch_size row dicts
+                instead of single rows
+
+        Yields:
+            Row dicts (or lists of row dicts when batch_size is set)
+        """
+        return self._iter_spec(
+            get_report(name),
+            customer_id,
+            date_range,
+            extra_where,
+            batch_size,
+            use_cache=False,
+        )
+
+    def _iter_spec(
+        self,
+        spec,
+        customer_id,
+        date_range,
+        extra_where,
+        batch_size=None,
+        raise_errors=False,
+        use_cache=True,
+    ):
+        decode = spec.decoder(customer_id)
+        results = self._stream_results(
+            spec,
+            customer_id,
+            date_range,
+            extra_where,
+            raise_errors=raise_errors,
+            use_cache=use_cache,
+        )
+
+        if not batch_size:
+            for batch in results:
+                yield from map(decode, batch)
+            return
+
+        pending = []
+        for batch in results:
+            pending.extend(map(decode, batch))
+            while len(pending) >= batch_size:
+                yield pending[:batch_size]
+                del pending[:batch_size]
+        if pending:
+            yield pending
+
+    def _fetch_incremental(self, spec, customer_id, date_range):
+        """Serve a report window from local daily partitions (see IncrementalSync)."""
         try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "customer_id": str(customer_id),
-                            "campaign_id": str(row.campaign.id),
-                            "campaign_name": row.campaign.name,
-                            "status": row.campaign.status.name,
-                            "date": row.segments.date,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "impressions": row.metrics.impressions,
-                            "clicks": row.metrics.clicks,
-                            "conversions": row.metrics.conversions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cpa": (
-                                row.metrics.cost_per_conversion / 1000000.0
-                                if row.metrics.cost_per_conversion
-                                else 0
-                            ),
-                        }
+            return self.incremental.fetch(customer_id, spec.name, date_range)
+        except _sdk.GoogleAdsException as ex:
+            if is_retryable(ex):
+                raise
+            print(f"Error fetching {spec.description} for {customer_id}: {ex}")
+            return []
+
+    def _stream_results(
+        self,
+        spec,
+        customer_id,
+        date_range,
+        extra_where,
+        raise_errors=False,
+        use_cache=True,
+    ):
+        """
+        Yield the raw result batches of a report, one per streamed response.
+
+        With use_cache (and a cache configured), the response is served from
+        the cache or buffered whole to be stored in it.
+        """
+        query = spec.build_query(date_range, extra_where)
+
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            window = cache.resolve_window(spec, date_range)
+            key = cache.make_key(customer_id, query, window)
+            cached = cache.get(key)
+            if cached is not None:
+                yield from self._replay_cached(cached)
+                return
+
+        attempt = 0
+        while True:
+            records = []
+            streamed = False
+            try:
+                self._throttle(customer_id)
+                with report_label(spec.name):
+                    response = self.ga_service.search_stream(
+                        customer_id=customer_id, query=query
                     )
-        except GoogleAdsException as ex:
-            print(f"Error fetching campaign data for {customer_id}: {ex}")
+                for batch in response:
+                    if cache is not None:
+                        records.extend(
+                            type(row).serialize(row) for row in batch.results
+                        )
+                    streamed = True
+                    yield batch.results
+                break
+            except Exception as ex:
+                # Retry only before any rows reached the caller, so nothing is
+                # duplicated. Quota and transient failures that outlast the
+                # retries are raised, never turned into an empty report.
+                if not streamed and self._wait_to_retry(
+                    ex, attempt, spec.description, customer_id
+                ):
+                    attempt += 1
+                    continue
+                if (
+                    raise_errors
+                    or not isinstance(ex, _sdk.GoogleAdsException)
+                    or is_retryable(ex)
+                ):
+                    raise
+                print(f"Error fetching {spec.description} for {customer_id}: {ex}")
+                return
+
+        self.rate_limiter.recover()
+
+        # Only complete responses are cached
+        if cache is not None:
+            cache.put(
+                key, spec.name, customer_id, records, cache.ttl_for(spec.name, window)
+            )
+
+    def _service(self, name):
+        """
+        Pooled service stub, shared by all connectors using the same client,
+        behind this connector's call instrumentation.
+        """
+        return self.metrics.wrap(client_pool.get_service(self.client, name))
+
+    def _throttle(self, customer_id=None):
+        """Wait for the shared rate limiter before an API request."""
+        self.rate_limiter.acquire(customer_id)
+
+    def _wait_to_retry(self, error, attempt, description, customer_id):
+        """
+        Sleep before retrying a failed request, if the retry policy allows it.
+
+        Quota errors also slow down the shared rate limiter. Returns False when
+        the error is not retryable or the attempts are used up.
+        """
+        delay = self.retry_policy.delay(attempt, error)
+        if delay is None:
+            return False
+        if is_quota_error(error):
+            self.rate_limiter.backoff()
+        print(
+            f"Retrying {description} for {customer_id} in {delay:.1f}s "
+            f"({describe_error(error)}, attempt {attempt + 2})"
+        )
+        time.sleep(delay)
+        return True
+
+    def _replay_cached(self, records):
+        """Deserialize cached rows back into GoogleAdsRow batches."""
+        row_type = type(self.client.get_type("GoogleAdsRow"))
+        for start in range(0, len(records), CACHE_BATCH_SIZE):
+            yield [
+                row_type.deserialize(record)
+                for record in records[start : start + CACHE_BATCH_SIZE]
+            ]
 
-        return rows
+    def get_auction_insights(self, customer_id, date_range="LAST_30_DAYS"):
+        """
+        Fetches auction insights for campaigns.
+        """
+        return self.run_report("auction_insights", customer_id, date_range=date_range)
 
-    def get_ad_group_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_campaign_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
+        """Fetches campaign performance for a specific customer."""
+        return self.run_report(
+            "campaign_performance", customer_id, date_range=date_range, stream=stream
+        )
+
+    def get_ad_group_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Fetches ad group level performance data."""
-        query = f"""
-            SELECT
-                ad_group.id,
-                ad_group.name,
-                ad_group.status,
-                ad_group.type,
-                campaign.id,
-                campaign.name,
-                segments.date,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.cost_per_conversion,
-                metrics.search_budget_lost_impression_share,
-                metrics.search_rank_lost_impression_share
-            FROM ad_group
-            WHERE segments.date DURING {date_range}
-                AND ad_group.status != 'REMOVED'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "ad_group_id": str(row.ad_group.id),
-                            "ad_group_name": row.ad_group.name,
-                            "status": row.ad_group.status.name,
-                            "type": row.ad_group.type_.name,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                            "cpa": (
-                                row.metrics.cost_per_conversion / 1000000.0
-                                if row.metrics.cost_per_conversion
-                                else 0
-                            ),
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching ad group data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "ad_group_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_keyword_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_keyword_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Fetches keyword performance with Quality Scores."""
-        query = f"""
-            SELECT
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.status,
-                ad_group_criterion.quality_info.quality_score,
-                ad_group_criterion.quality_info.creative_quality_score,
-                ad_group_criterion.quality_info.post_click_quality_score,
-                ad_group_criterion.quality_info.search_predicted_ctr,
-                campaign.name,
-                ad_group.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.cost_per_conversion
-            FROM keyword_view
-            WHERE segments.date DURING {date_range}
-                AND ad_group_criterion.status != 'REMOVED'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    kw = row.ad_group_criterion
-                    qs = kw.quality_info
-                    rows.append(
-                        {
-                            "keyword": kw.keyword.text,
-                            "match_type": kw.keyword.match_type.name,
-                            "status": kw.status.name,
-                            "quality_score": (
-                                qs.quality_score if qs.quality_score else 0
-                            ),
-                            "creative_qs": (
-                                qs.creative_quality_score.name
-                                if qs.creative_quality_score
-                                else "UNKNOWN"
-                            ),
-                            "landing_page_qs": (
-                                qs.post_click_quality_score.name
-                                if qs.post_click_quality_score
-                                else "UNKNOWN"
-                            ),
-                            "expected_ctr": (
-                                qs.search_predicted_ctr.name
-                                if qs.search_predicted_ctr
-                                else "UNKNOWN"
-                            ),
-                            "campaign_name": row.campaign.name,
-                            "ad_group_name": row.ad_group.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                            "cpa": (
-                                row.metrics.cost_per_conversion / 1000000.0
-                                if row.metrics.cost_per_conversion
-                                else 0
-                            ),
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching keyword data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "keyword_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_search_terms(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_search_terms(self, customer_id, date_range="LAST_30_DAYS", stream=False):
         """Fetch search terms report - critical for negative keyword discovery."""
-        query = f"""
-            SELECT
-                search_term_view.search_term,
-                search_term_view.status,
-                segments.keyword.info.match_type,
-                campaign.name,
-                ad_group.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.cost_per_conversion
-            FROM search_term_view
-            WHERE segments.date DURING {date_range}
-            ORDER BY metrics.cost_micros DESC
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "search_term": row.search_term_view.search_term,
-                            "status": row.search_term_view.status.name,
-                            "match_type": (
-                                row.segments.keyword.info.match_type.name
-                                if row.segments.keyword.info.match_type
-                                else "UNKNOWN"
-                            ),
-                            "campaign_name": row.campaign.name,
-                            "ad_group_name": row.ad_group.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                            "cpa": (
-                                row.metrics.cost_per_conversion / 1000000.0
-                                if row.metrics.cost_per_conversion
-                                else 0
-                            ),
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching search terms for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "search_terms", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_ad_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_ad_performance(self, customer_id, date_range="LAST_30_DAYS", stream=False):
         """Fetch RSA ad performance including ad strength."""
-        query = f"""
-            SELECT
-                ad_group_ad.ad.id,
-                ad_group_ad.ad.type,
-                ad_group_ad.ad.responsive_search_ad.headlines,
-                ad_group_ad.ad.responsive_search_ad.descriptions,
-                ad_group_ad.ad.final_urls,
-                ad_group_ad.status,
-                ad_group_ad.ad_strength,
-                ad_group_ad.policy_summary.approval_status,
-                campaign.name,
-                ad_group.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM ad_group_ad
-            WHERE segments.date DURING {date_range}
-                AND ad_group_ad.status != 'REMOVED'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    ad = row.ad_group_ad
-
-                    # Extract RSA headlines and descriptions
-                    headlines = []
-                    descriptions = []
-                    if (
-                        ad.ad.type_.name == "RESPONSIVE_SEARCH_AD"
-                    ):  # Check type name string or enum
-                        # Note: GoogleAdsClient enums are usually accessed via client.enums...
-                        # but here we can just check the string if we want to be safe or use the property if accessible.
-                        # The user provided code uses `self.client.enums.AdTypeEnum.RESPONSIVE_SEARCH_AD` but `ad.ad.type_` returns an enum wrapper.
-                        # Using `.name` comparison is often safer/easier without importing the enum class.
-
-                        if hasattr(ad.ad, "responsive_search_ad"):
-                            for headline in ad.ad.responsive_search_ad.headlines:
-                                headlines.append(
-                                    {
-                                        "text": headline.text,
-                                        "pinned_field": (
-                                            headline.pinned_field.name
-                                            if headline.pinned_field
-                                            else None
-                                        ),
-                                    }
-                                )
-                            for desc in ad.ad.responsive_search_ad.descriptions:
-                                descriptions.append(
-                                    {
-                                        "text": desc.text,
-                                        "pinned_field": (
-                                            desc.pinned_field.name
-                                            if desc.pinned_field
-                                            else None
-                                        ),
-                                    }
-                                )
-
-                    rows.append(
-                        {
-                            "ad_id": str(ad.ad.id),
-                            "type": ad.ad.type_.name,
-                            "headlines": headlines,
-                            "descriptions": descriptions,
-                            "final_urls": list(ad.ad.final_urls),
-                            "status": ad.status.name,
-                            "ad_strength": ad.ad_strength.name,
-                            "approval_status": ad.policy_summary.approval_status.name,
-                            "campaign_name": row.campaign.name,
-                            "ad_group_name": row.ad_group.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching ad performance for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "ad_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_conversion_actions(self, customer_id):
+    def get_conversion_actions(self, customer_id, stream=False):
         """List all conversion actions."""
-        query = """
-            SELECT
-                conversion_action.id,
-                conversion_action.name,
-                conversion_action.type,
-                conversion_action.status,
-                conversion_action.category,
-                conversion_action.counting_type
-            FROM conversion_action
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    ca = row.conversion_action
-                    rows.append(
-                        {
-                            "id": str(ca.id),
-                            "name": ca.name,
-                            "type": ca.type_.name,
-                            "status": ca.status.name,
-                            "category": ca.category.name,
-                            "conversions": 0,  # Metrics not available in this view
-                            "value": 0,
-                            "all_conversions": 0,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching conversion actions for {customer_id}: {ex}")
-        return rows
+        return self.run_report("conversion_actions", customer_id, stream=stream)
 
     def update_conversion_action(self, customer_id, conversion_action_id, **kwargs):
         """
@@ -532,9 +522,7 @@ class AdsConnector:
             f"--- Updating Conversion Action {conversion_action_id} for Customer {customer_id} ---"
         )
         try:
-            conversion_action_service = self.client.get_service(
-                "ConversionActionService"
-            )
+            conversion_action_service = self._service("ConversionActionService")
             operation = self.client.get_type("ConversionActionOperation")
 
             # Create the update mask
@@ -549,7 +537,7 @@ class AdsConnector:
                     setattr(update, key, value)
                     self.client.copy_from(
                         operation.update_mask,
-                        protobuf_helpers.field_mask(None, update._pb),
+                        _sdk.protobuf_helpers.field_mask(None, update._pb),
                     )
                 else:
                     print(f"Warning: Field '{key}' not found on ConversionAction")
@@ -560,7 +548,7 @@ class AdsConnector:
             )
 
             return {"resource_name": response.results[0].resource_name}
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating conversion action: {ex}")
             return {"error": str(ex)}
 
@@ -589,9 +577,7 @@ class AdsConnector:
         """
         print(f"--- Creating Conversion Action '{name}' for Customer {customer_id} ---")
         try:
-            conversion_action_service = self.client.get_service(
-                "ConversionActionService"
-            )
+            conversion_action_service = self._service("ConversionActionService")
             operation = self.client.get_type("ConversionActionOperation")
 
             conversion_action = operation.create
@@ -635,641 +621,148 @@ class AdsConnector:
             print(f"  ID: {conversion_id}")
 
             return {"id": conversion_id, "resource_name": resource_name}
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating conversion action: {ex}")
             return {"error": str(ex)}
 
-    def get_geographic_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_geographic_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Fetch performance by geographic location."""
-        query = f"""
-            SELECT
-                geographic_view.country_criterion_id,
-                geographic_view.location_type,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM geographic_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "country_id": str(row.geographic_view.country_criterion_id),
-                            "location_type": row.geographic_view.location_type.name,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching geographic data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "geographic_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_device_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_device_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Fetch performance by device type."""
-        query = f"""
-            SELECT
-                segments.device,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM campaign
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "device": row.segments.device.name,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "ctr": row.metrics.ctr,
-                            "avg_cpc": (
-                                row.metrics.average_cpc / 1000000.0
-                                if row.metrics.average_cpc
-                                else 0
-                            ),
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching device data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "device_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_change_history(self, customer_id, days=14):
+    def get_change_history(self, customer_id, days=14, stream=False):
         """Fetch recent changes to the account."""
-        # Calculate date range for change history manually as it doesn't support DURING syntax the same way in all contexts,
-        # but here we use DURING LAST_14_DAYS as requested.
-
-        query = """
-            SELECT
-                change_event.change_date_time,
-                change_event.change_resource_type,
-                change_event.change_resource_name,
-                change_event.client_type,
-                change_event.user_email,
-                change_event.old_resource,
-                change_event.new_resource,
-                change_event.resource_change_operation
-            FROM change_event
-            WHERE change_event.change_date_time DURING LAST_14_DAYS
-            ORDER BY change_event.change_date_time DESC
-            LIMIT 1000
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    ce = row.change_event
-                    rows.append(
-                        {
-                            "date": ce.change_date_time,
-                            "type": ce.change_resource_type.name,
-                            "resource": ce.change_resource_name,
-                            "user": ce.user_email,
-                            "operation": ce.resource_change_operation.name,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching change history for {customer_id}: {ex}")
-        return rows
+        # change_event only supports a fixed DURING window; the report uses LAST_14_DAYS.
+        return self.run_report("change_history", customer_id, stream=stream)
 
-    def get_recommendations(self, customer_id):
+    def get_recommendations(self, customer_id, stream=False):
         """Fetch Google's recommendations for the account."""
-        query = """
-            SELECT
-                recommendation.resource_name,
-                recommendation.type,
-                recommendation.impact,
-                recommendation.campaign,
-                recommendation.ad_group
-            FROM recommendation
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rec = row.recommendation
-                    rows.append(
-                        {
-                            "type": rec.type_.name,
-                            "resource": rec.resource_name,
-                            "campaign": rec.campaign,
-                            "ad_group": rec.ad_group,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching recommendations for {customer_id}: {ex}")
-        return rows
+        return self.run_report("recommendations", customer_id, stream=stream)
 
-    def get_asset_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_asset_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Get asset-level performance with Google's performance labels (BEST/GOOD/LOW/LEARNING)."""
-        query = f"""
-            SELECT
-                ad_group_ad_asset_view.ad_group_ad,
-                ad_group_ad_asset_view.asset,
-                ad_group_ad_asset_view.field_type,
-                ad_group_ad_asset_view.performance_label,
-                asset.text_asset.text,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM ad_group_ad_asset_view
-            WHERE segments.date DURING {date_range}
-            ORDER BY ad_group_ad_asset_view.performance_label
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    view = row.ad_group_ad_asset_view
-                    rows.append(
-                        {
-                            "asset_id": str(view.asset),
-                            "field_type": view.field_type.name,
-                            "performance_label": view.performance_label.name,
-                            "text": row.asset.text_asset.text,
-                            "impressions": row.metrics.impressions,
-                            "clicks": row.metrics.clicks,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching asset performance for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "asset_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_landing_page_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_landing_page_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Analyze landing page effectiveness."""
-        query = f"""
-            SELECT
-                landing_page_view.unexpanded_final_url,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.mobile_friendly_clicks_percentage,
-                metrics.valid_accelerated_mobile_pages_clicks_percentage,
-                metrics.speed_score
-            FROM landing_page_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "url": row.landing_page_view.unexpanded_final_url,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                            "mobile_friendly_click_pct": row.metrics.mobile_friendly_clicks_percentage,
-                            "speed_score": row.metrics.speed_score,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching landing page performance for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "landing_page_performance",
+            customer_id,
+            date_range=date_range,
+            stream=stream,
+        )
 
     def get_expanded_landing_page_performance(
-        self, customer_id, date_range="LAST_30_DAYS"
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
     ):
         """Get performance for each unique final URL."""
-        query = f"""
-            SELECT
-                expanded_landing_page_view.expanded_final_url,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM expanded_landing_page_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "url": row.expanded_landing_page_view.expanded_final_url,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(
-                f"Error fetching expanded landing page performance for {customer_id}: {ex}"
-            )
-        return rows
+        return self.run_report(
+            "expanded_landing_page_performance",
+            customer_id,
+            date_range=date_range,
+            stream=stream,
+        )
 
-    def get_user_location_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_user_location_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Get performance by actual user location (not just targeted locations)."""
-        query = f"""
-            SELECT
-                user_location_view.country_criterion_id,
-                user_location_view.targeting_location,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM user_location_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "country_id": str(
-                                row.user_location_view.country_criterion_id
-                            ),
-                            "targeting_location": row.user_location_view.targeting_location,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching user location performance for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "user_location_performance",
+            customer_id,
+            date_range=date_range,
+            stream=stream,
+        )
 
-    def get_impression_share_data(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_impression_share_data(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Get detailed impression share metrics."""
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                metrics.search_impression_share,
-                metrics.search_top_impression_share,
-                metrics.search_absolute_top_impression_share,
-                metrics.search_budget_lost_impression_share,
-                metrics.search_rank_lost_impression_share,
-                metrics.search_budget_lost_top_impression_share,
-                metrics.search_rank_lost_top_impression_share,
-                metrics.search_budget_lost_absolute_top_impression_share,
-                metrics.search_rank_lost_absolute_top_impression_share
-            FROM campaign
-            WHERE segments.date DURING {date_range}
-                AND campaign.advertising_channel_type = 'SEARCH'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "campaign_name": row.campaign.name,
-                            "search_is": row.metrics.search_impression_share,
-                            "search_top_is": row.metrics.search_top_impression_share,
-                            "search_abs_top_is": row.metrics.search_absolute_top_impression_share,
-                            "lost_is_budget": row.metrics.search_budget_lost_impression_share,
-                            "lost_is_rank": row.metrics.search_rank_lost_impression_share,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching impression share data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "impression_share", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_campaign_budgets(self, customer_id):
+    def get_campaign_budgets(self, customer_id, stream=False):
         """Get campaign budget details."""
-        query = """
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.campaign_budget,
-                campaign_budget.amount_micros,
-                campaign_budget.delivery_method,
-                campaign_budget.period,
-                campaign_budget.type,
-                campaign_budget.explicitly_shared,
-                metrics.cost_micros
-            FROM campaign
-            WHERE campaign.status != 'REMOVED'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "campaign_name": row.campaign.name,
-                            "budget_resource": row.campaign.campaign_budget,
-                            "amount": row.campaign_budget.amount_micros / 1000000.0,
-                            "delivery_method": row.campaign_budget.delivery_method.name,
-                            "period": row.campaign_budget.period.name,
-                            "type": row.campaign_budget.type_.name,
-                            "shared": row.campaign_budget.explicitly_shared,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching campaign budgets for {customer_id}: {ex}")
-        return rows
+        return self.run_report("campaign_budgets", customer_id, stream=stream)
 
-    def get_bidding_strategies(self, customer_id):
+    def get_bidding_strategies(self, customer_id, stream=False):
         """Analyze bidding strategies in use."""
-        query = """
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.bidding_strategy_type,
-                campaign.maximize_conversions.target_cpa_micros,
-                campaign.maximize_conversion_value.target_roas,
-                campaign.target_cpa.target_cpa_micros,
-                campaign.target_roas.target_roas,
-                accessible_bidding_strategy.id,
-                accessible_bidding_strategy.name,
-                accessible_bidding_strategy.type,
-                accessible_bidding_strategy.maximize_conversions.target_cpa_micros,
-                accessible_bidding_strategy.target_cpa.target_cpa_micros
-            FROM campaign
-            WHERE campaign.status != 'REMOVED'
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    c = row.campaign
-                    rows.append(
-                        {
-                            "campaign_name": c.name,
-                            "type": c.bidding_strategy_type.name,
-                            "target_cpa": (
-                                c.maximize_conversions.target_cpa_micros / 1000000.0
-                                if c.maximize_conversions.target_cpa_micros
-                                else (
-                                    c.target_cpa.target_cpa_micros / 1000000.0
-                                    if c.target_cpa.target_cpa_micros
-                                    else None
-                                )
-                            ),
-                            "target_roas": (
-                                c.maximize_conversion_value.target_roas
-                                if c.maximize_conversion_value.target_roas
-                                else (
-                                    c.target_roas.target_roas
-                                    if c.target_roas.target_roas
-                                    else None
-                                )
-                            ),
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching bidding strategies for {customer_id}: {ex}")
-        return rows
+        return self.run_report("bidding_strategies", customer_id, stream=stream)
 
-    def get_paid_organic_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_paid_organic_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Compare paid vs organic search performance."""
-        query = f"""
-            SELECT
-                paid_organic_search_term_view.search_term,
-                metrics.combined_clicks,
-                metrics.combined_queries,
-                metrics.organic_clicks,
-                metrics.organic_queries,
-                metrics.organic_impressions
-            FROM paid_organic_search_term_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "search_term": row.paid_organic_search_term_view.search_term,
-                            "combined_clicks": row.metrics.combined_clicks,
-                            "organic_clicks": row.metrics.organic_clicks,
-                            "organic_impressions": row.metrics.organic_impressions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching paid/organic data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "paid_organic_performance",
+            customer_id,
+            date_range=date_range,
+            stream=stream,
+        )
 
-    def get_click_data(self, customer_id, date_range="YESTERDAY"):
+    def get_click_data(self, customer_id, date_range="YESTERDAY", stream=False):
         """Get click-level data with GCLID - useful for conversion debugging. Note: ClickView requires single day query."""
-        query = f"""
-            SELECT
-                click_view.gclid,
-                click_view.area_of_interest.city,
-                click_view.area_of_interest.country,
-                click_view.keyword,
-                click_view.keyword_info.text,
-                click_view.keyword_info.match_type,
-                click_view.ad_group_ad,
-                campaign.name,
-                ad_group.name
-            FROM click_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "gclid": row.click_view.gclid,
-                            "city": row.click_view.area_of_interest.city,
-                            "country": row.click_view.area_of_interest.country,
-                            "keyword": row.click_view.keyword_info.text,
-                            "campaign_name": row.campaign.name,
-                            "ad_group_name": row.ad_group.name,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching click data for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "click_data", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_ad_schedule_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_ad_schedule_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """Analyze performance by hour/day of week."""
-        query = f"""
-            SELECT
-                segments.hour,
-                segments.day_of_week,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM campaign
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "hour": row.segments.hour,
-                            "day": row.segments.day_of_week.name,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching ad schedule for {customer_id}: {ex}")
-        return rows
+        return self.run_report(
+            "ad_schedule_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-    def get_audience_performance(self, customer_id, date_range="LAST_30_DAYS"):
-        """Get performance by audience segments."""
-        query = f"""
-            SELECT
-                campaign_audience_view.resource_name,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM campaign_audience_view
-            WHERE segments.date DURING {date_range}
-        """
+    def get_demographic_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
+        """Get performance by age and gender demographics."""
+        return self.run_report(
+            "demographic_performance", customer_id, date_range=date_range, stream=stream
+        )
 
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "resource": row.campaign_audience_view.resource_name,
-                            "campaign_name": row.campaign.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching audience performance for {customer_id}: {ex}")
-        return rows
+    # ============================================
+    # WRITE OPERATIONS - Bulk
+    # ============================================
 
-    def get_demographic_performance(self, customer_id, date_range="LAST_30_DAYS"):
-        """Get performance by age and gender demographics."""
-        # Note: Age and Gender are separate views. We'll fetch age here as requested in the query example.
-        # The user's query example selects from 'age_range_view' but also selects 'gender.type' which is invalid.
-        # You can't select gender from age_range_view. We need two queries or just one.
-        # I will implement Age Range view as per the FROM clause in the user's example.
+    def bulk_mutator(self, validate_only=True, mode=None, **kwargs):
+        """
+        Mutator submitting through this connector. Operations of any
+        supported service and customer are reported per input.
 
-        query = f"""
-            SELECT
-                ad_group_criterion.age_range.type,
-                campaign.name,
-                ad_group.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM age_range_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "age_range": row.ad_group_criterion.age_range.type_.name,
-                            "campaign_name": row.campaign.name,
-                            "ad_group_name": row.ad_group.name,
-                            "clicks": row.metrics.clicks,
-                            "impressions": row.metrics.impressions,
-                            "cost": row.metrics.cost_micros / 1000000.0,
-                            "conversions": row.metrics.conversions,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching demographic data for {customer_id}: {ex}")
-        return rows
+        In "sync" mode (BulkMutator) they are chunked and sent concurrently
+        with partial_failure enabled; in "batch_job" mode (BatchJobMutator)
+        they are staged into one batch job per customer, which is polled
+        until done. Dry runs are validate-only mutate requests in both modes.
+
+        Args:
+            validate_only: Validate the operations without applying them
+            mode: "sync" or "batch_job" (defaults to the connector's
+                mutation_mode)
+            **kwargs: Passed to BulkMutator or BatchJobMutator
+        """
+        if (mode or self.mutation_mode) == "batch_job":
+            return BatchJobMutator(self, validate_only=validate_only, **kwargs)
+        return BulkMutator(self, validate_only=validate_only, **kwargs)
 
     # ============================================
     # WRITE OPERATIONS - Negative Keywords
@@ -1279,6 +772,9 @@ class AdsConnector:
         """
         Add negative keywords to a campaign (campaign-level negatives).
 
+        Keywords the API rejects are reported individually; the others are
+        still added.
+
         Args:
             customer_id: The Google Ads customer ID
             campaign_id: The campaign ID to add negatives to
@@ -1287,9 +783,7 @@ class AdsConnector:
         Returns:
             dict with results and any errors
         """
-        campaign_criterion_service = self.client.get_service("CampaignCriterionService")
-
-        operations = []
+        bulk = self.bulk_mutator(validate_only=False)
         for keyword in keywords:
             # Create the operation
             operation = self.client.get_type("CampaignCriterionOperation")
@@ -1305,33 +799,21 @@ class AdsConnector:
             criterion.keyword.text = keyword
             criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum.PHRASE
 
-            operations.append(operation)
-
-        results = {"added": [], "errors": []}
-
-        try:
-            response = campaign_criterion_service.mutate_campaign_criteria(
-                customer_id=customer_id, operations=operations
-            )
-
-            for result in response.results:
-                results["added"].append(result.resource_name)
-
-            print(
-                f"Added {len(results['added'])} negative keywords to campaign {campaign_id}"
-            )
+            bulk.add(customer_id, "CampaignCriterionService", operation, keyword)
 
-        except GoogleAdsException as ex:
-            for error in ex.failure.errors:
-                results["errors"].append(
-                    {
-                        "message": error.message,
-                        "keyword": (
-                            keywords[0] if keywords else "unknown"
-                        ),  # Simplified error tracking
-                    }
-                )
-            print(f"Error adding negative keywords: {ex}")
+        response = bulk.run()
+        results = {
+            "added": response["resources"],
+            "errors": [
+                {"message": error["message"], "keyword": error["input"]}
+                for error in response["errors"]
+            ],
+        }
+        print(
+            f"Added {len(results['added'])} negative keywords to campaign {campaign_id}"
+        )
+        if results["errors"]:
+            print(f"Error adding {len(results['errors'])} negative keywords")
 
         return results
 
@@ -1347,8 +829,7 @@ class AdsConnector:
         Returns:
             dict with list resource name and results
         """
-        shared_set_service = self.client.get_service("SharedSetService")
-        shared_criterion_service = self.client.get_service("SharedCriterionService")
+        shared_set_service = self._service("SharedSetService")
 
         results = {"list_resource": None, "added": [], "errors": []}
 
@@ -1367,31 +848,28 @@ class AdsConnector:
             results["list_resource"] = shared_set_resource
             print(f"Created shared negative keyword list: {list_name}")
 
-            # Step 2: Add keywords to the shared list
-            operations = []
-            for keyword in keywords:
-                operation = self.client.get_type("SharedCriterionOperation")
-                criterion = operation.create
-                criterion.shared_set = shared_set_resource
-                criterion.keyword.text = keyword
-                criterion.keyword.match_type = (
-                    self.client.enums.KeywordMatchTypeEnum.PHRASE
-                )
-                operations.append(operation)
-
-            response = shared_criterion_service.mutate_shared_criteria(
-                customer_id=customer_id, operations=operations
-            )
-
-            for result in response.results:
-                results["added"].append(result.resource_name)
-
-            print(f"Added {len(results['added'])} keywords to shared list")
-
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             for error in ex.failure.errors:
                 results["errors"].append(error.message)
             print(f"Error creating shared list: {ex}")
+            return results
+
+        # Step 2: Add keywords to the shared list
+        bulk = self.bulk_mutator(validate_only=False)
+        for keyword in keywords:
+            operation = self.client.get_type("SharedCriterionOperation")
+            criterion = operation.create
+            criterion.shared_set = shared_set_resource
+            criterion.keyword.text = keyword
+            criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum.PHRASE
+            bulk.add(customer_id, "SharedCriterionService", operation, keyword)
+
+        response = bulk.run()
+        results["added"] = response["resources"]
+        results["errors"] = [
+            f"{error['input']}: {error['message']}" for error in response["errors"]
+        ]
+        print(f"Added {len(results['added'])} keywords to shared list")
 
         return results
 
@@ -1409,9 +887,7 @@ class AdsConnector:
         Returns:
             dict with result
         """
-        campaign_shared_set_service = self.client.get_service(
-            "CampaignSharedSetService"
-        )
+        campaign_shared_set_service = self._service("CampaignSharedSetService")
 
         try:
             operation = self.client.get_type("CampaignSharedSetOperation")
@@ -1428,54 +904,44 @@ class AdsConnector:
             print(f"Attached shared set to campaign {campaign_id}")
             return {"success": True, "resource": response.results[0].resource_name}
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error attaching shared set: {ex}")
             return {"success": False, "error": str(ex)}
 
-    def get_existing_negative_keywords(self, customer_id, campaign_id=None):
+    def get_existing_negative_keywords(
+        self, customer_id, campaign_id=None, stream=False
+    ):
         """
         Get existing negative keywords for a campaign or account.
 
         Args:
             customer_id: The Google Ads customer ID
             campaign_id: Optional campaign ID to filter by
+            stream: Return a generator of rows instead of a list
 
         Returns:
             List of existing negative keywords
         """
-        query = """
-            SELECT
-                campaign_criterion.keyword.text,
-                campaign_criterion.keyword.match_type,
-                campaign_criterion.negative,
-                campaign.id,
-                campaign.name
-            FROM campaign_criterion
-            WHERE campaign_criterion.type = 'KEYWORD'
-                AND campaign_criterion.negative = TRUE
-        """
+        extra_where = [f"campaign.id = {campaign_id}"] if campaign_id else []
+        return self.run_report(
+            "negative_keywords", customer_id, extra_where=extra_where, stream=stream
+        )
 
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
+    def get_shared_negative_keywords(self, customer_id, stream=False):
+        """Keywords of the account's enabled shared negative keyword lists."""
+        return self.run_report("shared_negative_keywords", customer_id, stream=stream)
 
-        rows = []
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            for batch in response:
-                for row in batch.results:
-                    rows.append(
-                        {
-                            "keyword": row.campaign_criterion.keyword.text,
-                            "match_type": row.campaign_criterion.keyword.match_type.name,
-                            "campaign_id": str(row.campaign.id),
-                            "campaign_name": row.campaign.name,
-                        }
-                    )
-        except GoogleAdsException as ex:
-            print(f"Error fetching negative keywords for {customer_id}: {ex}")
-        return rows
+    def get_campaign_negative_lists(self, customer_id, stream=False):
+        """Which campaigns each shared negative keyword list is applied to."""
+        return self.run_report("campaign_negative_lists", customer_id, stream=stream)
+
+    def get_campaign_extension_assets(self, customer_id, stream=False):
+        """Sitelinks, callouts, snippets, ... attached to campaigns."""
+        return self.run_report("campaign_extension_assets", customer_id, stream=stream)
+
+    def get_account_extension_assets(self, customer_id, stream=False):
+        """Account-level extension assets (apply to every campaign)."""
+        return self.run_report("account_extension_assets", customer_id, stream=stream)
 
     # ============================================
     # WRITE OPERATIONS - Campaigns & Budgets
@@ -1492,7 +958,7 @@ class AdsConnector:
         """
         Create a campaign budget.
         """
-        campaign_budget_service = self.client.get_service("CampaignBudgetService")
+        campaign_budget_service = self._service("CampaignBudgetService")
         operation = self.client.get_type("CampaignBudgetOperation")
         campaign_budget = operation.create
 
@@ -1519,7 +985,7 @@ class AdsConnector:
             print(f"Created campaign budget: {resource_name}")
             return {"success": True, "resource": resource_name, "dry_run": False}
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating budget: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1538,7 +1004,7 @@ class AdsConnector:
         """
         Create a new campaign with support for Smart Bidding.
         """
-        campaign_service = self.client.get_service("CampaignService")
+        campaign_service = self._service("CampaignService")
         operation = self.client.get_type("CampaignOperation")
 
         campaign = operation.create
@@ -1615,7 +1081,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating campaign: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1625,7 +1091,7 @@ class AdsConnector:
         """
         Update campaign status (ENABLED/PAUSED).
         """
-        campaign_service = self.client.get_service("CampaignService")
+        campaign_service = self._service("CampaignService")
         operation = self.client.get_type("CampaignOperation")
 
         campaign = operation.update
@@ -1633,7 +1099,7 @@ class AdsConnector:
         campaign.status = getattr(self.client.enums.CampaignStatusEnum, status)
 
         self.client.copy_from(
-            operation.update_mask, protobuf_helpers.field_mask(None, campaign._pb)
+            operation.update_mask, _sdk.protobuf_helpers.field_mask(None, campaign._pb)
         )
 
         try:
@@ -1657,7 +1123,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating campaign status: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1688,14 +1154,15 @@ class AdsConnector:
                     "error": "Campaign not found or no budget assigned.",
                 }
 
-            campaign_budget_service = self.client.get_service("CampaignBudgetService")
+            campaign_budget_service = self._service("CampaignBudgetService")
             operation = self.client.get_type("CampaignBudgetOperation")
             budget = operation.update
             budget.resource_name = budget_resource
             budget.amount_micros = new_amount_micros
 
             self.client.copy_from(
-                operation.update_mask, protobuf_helpers.field_mask(None, budget._pb)
+                operation.update_mask,
+                _sdk.protobuf_helpers.field_mask(None, budget._pb),
             )
 
             request = self.client.get_type("MutateCampaignBudgetsRequest")
@@ -1718,57 +1185,19 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating campaign budget: {ex}")
             return {"success": False, "error": str(ex)}
 
-    def get_audience_performance(self, customer_id, date_range="LAST_30_DAYS"):
+    def get_audience_performance(
+        self, customer_id, date_range="LAST_30_DAYS", stream=False
+    ):
         """
         Fetches audience performance (Campaign Audience View).
         """
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign_criterion.criterion_id,
-                campaign_criterion.display_name,
-                campaign_criterion.type,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.ctr,
-                metrics.average_cpc
-            FROM campaign_audience_view
-            WHERE segments.date DURING {date_range}
-        """
-
-        try:
-            response = self.ga_service.search_stream(
-                customer_id=customer_id, query=query
-            )
-            data = []
-            for batch in response:
-                for row in batch.results:
-                    data.append(
-                        {
-                            "campaign_id": row.campaign.id,
-                            "campaign_name": row.campaign.name,
-                            "criterion_id": row.campaign_criterion.criterion_id,
-                            "audience_name": row.campaign_criterion.display_name,
-                            "type": row.campaign_criterion.type_.name,
-                            "impressions": row.metrics.impressions,
-                            "clicks": row.metrics.clicks,
-                            "cost_micros": row.metrics.cost_micros,
-                            "conversions": row.metrics.conversions,
-                            "ctr": row.metrics.ctr,
-                            "average_cpc": row.metrics.average_cpc,
-                        }
-                    )
-            return pd.DataFrame(data)
-        except GoogleAdsException as ex:
-            print(f"Error fetching audience performance: {ex}")
-            return pd.DataFrame()
+        return self.run_report(
+            "audience_performance", customer_id, date_range=date_range, stream=stream
+        )
 
     def attach_audience(
         self,
@@ -1818,7 +1247,7 @@ class AdsConnector:
 
             operations.append(operation)
 
-        service = self.client.get_service(service_name)
+        service = self._service(service_name)
 
         try:
             request = self.client.get_type(request_type)
@@ -1841,7 +1270,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error attaching audience: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1853,7 +1282,7 @@ class AdsConnector:
         """
         Remove (cancel) a campaign.
         """
-        campaign_service = self.client.get_service("CampaignService")
+        campaign_service = self._service("CampaignService")
         operation = self.client.get_type("CampaignOperation")
 
         operation.remove = f"customers/{customer_id}/campaigns/{campaign_id}"
@@ -1877,7 +1306,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error removing campaign: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1885,7 +1314,7 @@ class AdsConnector:
         """
         Create a new label.
         """
-        label_service = self.client.get_service("LabelService")
+        label_service = self._service("LabelService")
         operation = self.client.get_type("LabelOperation")
 
         label = operation.create
@@ -1912,7 +1341,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating label: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -1946,7 +1375,7 @@ class AdsConnector:
         else:
             return {"success": False, "error": "Unsupported resource type for labeling"}
 
-        service = self.client.get_service(service_name)
+        service = self._service(service_name)
         operation = self.client.get_type(operation_type)
 
         # Create the relationship object (e.g., CampaignLabel)
@@ -1989,7 +1418,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error applying label: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2005,7 +1434,7 @@ class AdsConnector:
         """
         Create a new ad group.
         """
-        ad_group_service = self.client.get_service("AdGroupService")
+        ad_group_service = self._service("AdGroupService")
         operation = self.client.get_type("AdGroupOperation")
         ad_group = operation.create
 
@@ -2031,7 +1460,7 @@ class AdsConnector:
             print(f"Created ad group: {resource_name}")
             return {"success": True, "resource": resource_name, "dry_run": False}
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating ad group: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2041,7 +1470,7 @@ class AdsConnector:
         """
         Update ad group status (ENABLED/PAUSED).
         """
-        ad_group_service = self.client.get_service("AdGroupService")
+        ad_group_service = self._service("AdGroupService")
         operation = self.client.get_type("AdGroupOperation")
 
         ad_group = operation.update
@@ -2049,7 +1478,7 @@ class AdsConnector:
         ad_group.status = getattr(self.client.enums.AdGroupStatusEnum, status)
 
         self.client.copy_from(
-            operation.update_mask, protobuf_helpers.field_mask(None, ad_group._pb)
+            operation.update_mask, _sdk.protobuf_helpers.field_mask(None, ad_group._pb)
         )
 
         try:
@@ -2073,7 +1502,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating ad group status: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2083,7 +1512,7 @@ class AdsConnector:
         """
         Update ad group default CPC bid.
         """
-        ad_group_service = self.client.get_service("AdGroupService")
+        ad_group_service = self._service("AdGroupService")
         operation = self.client.get_type("AdGroupOperation")
 
         ad_group = operation.update
@@ -2091,7 +1520,7 @@ class AdsConnector:
         ad_group.cpc_bid_micros = cpc_bid_micros
 
         self.client.copy_from(
-            operation.update_mask, protobuf_helpers.field_mask(None, ad_group._pb)
+            operation.update_mask, _sdk.protobuf_helpers.field_mask(None, ad_group._pb)
         )
 
         try:
@@ -2115,7 +1544,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating ad group bid: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2134,10 +1563,11 @@ class AdsConnector:
     ):
         """
         Add positive keywords to an ad group.
-        """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
 
-        operations = []
+        Keywords the API rejects are listed in "errors" (keyword and message);
+        the others are still added.
+        """
+        bulk = self.bulk_mutator(validate_only=validate_only)
         for keyword_text in keywords:
             operation = self.client.get_type("AdGroupCriterionOperation")
             criterion = operation.create
@@ -2151,29 +1581,27 @@ class AdsConnector:
             if cpc_bid_micros:
                 criterion.cpc_bid_micros = cpc_bid_micros
 
-            operations.append(operation)
-
-        try:
-            request = self.client.get_type("MutateAdGroupCriteriaRequest")
-            request.customer_id = customer_id
-            request.operations = operations
-            request.validate_only = validate_only
-
-            response = ad_group_criterion_service.mutate_ad_group_criteria(
-                request=request
-            )
-
-            if validate_only:
-                print(f"Dry run successful: {len(keywords)} keywords would be added.")
-                return {"success": True, "dry_run": True}
-
-            added_resources = [res.resource_name for res in response.results]
-            print(f"Added {len(added_resources)} keywords to ad group {ad_group_id}")
-            return {"success": True, "resources": added_resources, "dry_run": False}
-
-        except GoogleAdsException as ex:
-            print(f"Error adding keywords: {ex}")
-            return {"success": False, "error": str(ex)}
+            bulk.add(customer_id, "AdGroupCriterionService", operation, keyword_text)
+
+        response = bulk.run()
+        errors = [
+            {"keyword": error["input"], "message": error["message"]}
+            for error in response["errors"]
+        ]
+        if errors:
+            print(f"Error adding {len(errors)} of {len(keywords)} keywords")
+        if validate_only:
+            print(f"Dry run: {len(keywords) - len(errors)} keywords would be added.")
+            return {"success": not errors, "dry_run": True, "errors": errors}
+
+        added_resources = response["resources"]
+        print(f"Added {len(added_resources)} keywords to ad group {ad_group_id}")
+        return {
+            "success": not errors,
+            "resources": added_resources,
+            "errors": errors,
+            "dry_run": False,
+        }
 
     def update_keyword_bids(
         self, customer_id, criterion_id, cpc_bid_micros, validate_only=True
@@ -2181,79 +1609,108 @@ class AdsConnector:
         """
         Update bid for a specific keyword.
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-        operation = self.client.get_type("AdGroupCriterionOperation")
-
-        criterion = operation.update
-        criterion.resource_name = (
-            f"customers/{customer_id}/adGroupCriteria/{criterion_id}"
+        response = self.set_keyword_bids(
+            customer_id, {criterion_id: cpc_bid_micros}, validate_only
         )
-        criterion.cpc_bid_micros = cpc_bid_micros
+        if response["errors"]:
+            return {"success": False, "error": response["errors"][0]["message"]}
+        if validate_only:
+            return {"success": True, "dry_run": True}
+        return {
+            "success": True,
+            "resource": response["resources"][0],
+            "dry_run": False,
+        }
 
-        self.client.copy_from(
-            operation.update_mask, protobuf_helpers.field_mask(None, criterion._pb)
-        )
+    def set_keyword_bids(self, customer_id, bids, validate_only=True):
+        """
+        Update the CPC bids of many keywords in as few requests as possible.
 
-        try:
-            request = self.client.get_type("MutateAdGroupCriteriaRequest")
-            request.customer_id = customer_id
-            request.operations = [operation]
-            request.validate_only = validate_only
+        Args:
+            customer_id: The Google Ads customer ID
+            bids: dict of criterion ID ("adGroupId~criterionId") -> cpc_bid_micros
+            validate_only: Validate the changes without applying them
 
-            response = ad_group_criterion_service.mutate_ad_group_criteria(
-                request=request
+        Returns:
+            dict with success, dry_run, resources and errors (criterion_id and
+            message per rejected bid)
+        """
+        bulk = self.bulk_mutator(validate_only=validate_only)
+        for criterion_id, cpc_bid_micros in bids.items():
+            operation = self.client.get_type("AdGroupCriterionOperation")
+            criterion = operation.update
+            criterion.resource_name = (
+                f"customers/{customer_id}/adGroupCriteria/{criterion_id}"
             )
+            criterion.cpc_bid_micros = cpc_bid_micros
+            self.client.copy_from(
+                operation.update_mask,
+                _sdk.protobuf_helpers.field_mask(None, criterion._pb),
+            )
+            bulk.add(customer_id, "AdGroupCriterionService", operation, criterion_id)
 
-            if validate_only:
-                print(
-                    f"Dry run successful: Keyword bid for {criterion_id} would be updated."
-                )
-                return {"success": True, "dry_run": True}
-
-            print(f"Updated keyword bid for {criterion_id}")
-            return {
-                "success": True,
-                "resource": response.results[0].resource_name,
-                "dry_run": False,
-            }
-
-        except GoogleAdsException as ex:
-            print(f"Error updating keyword bid: {ex}")
-            return {"success": False, "error": str(ex)}
+        response = bulk.run()
+        return self._keyword_changes(response, bids, "bid updates", "updated")
 
     def remove_keyword(self, customer_id, criterion_id, validate_only=True):
         """
         Remove (actually pause/remove) a keyword.
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-        operation = self.client.get_type("AdGroupCriterionOperation")
+        response = self.remove_keywords(customer_id, [criterion_id], validate_only)
+        if response["errors"]:
+            return {"success": False, "error": response["errors"][0]["message"]}
+        if validate_only:
+            return {"success": True, "dry_run": True}
+        return {
+            "success": True,
+            "resource": response["resources"][0],
+            "dry_run": False,
+        }
 
-        operation.remove = f"customers/{customer_id}/adGroupCriteria/{criterion_id}"
+    def remove_keywords(self, customer_id, criterion_ids, validate_only=True):
+        """
+        Remove many keywords in as few requests as possible.
 
-        try:
-            request = self.client.get_type("MutateAdGroupCriteriaRequest")
-            request.customer_id = customer_id
-            request.operations = [operation]
-            request.validate_only = validate_only
+        Args:
+            customer_id: The Google Ads customer ID
+            criterion_ids: Criterion IDs ("adGroupId~criterionId")
+            validate_only: Validate the removals without applying them
 
-            response = ad_group_criterion_service.mutate_ad_group_criteria(
-                request=request
+        Returns:
+            dict with success, dry_run, resources and errors (criterion_id and
+            message per rejected removal)
+        """
+        bulk = self.bulk_mutator(validate_only=validate_only)
+        for criterion_id in criterion_ids:
+            operation = self.client.get_type("AdGroupCriterionOperation")
+            operation.remove = f"customers/{customer_id}/adGroupCriteria/{criterion_id}"
+            bulk.add(customer_id, "AdGroupCriterionService", operation, criterion_id)
+
+        response = bulk.run()
+        return self._keyword_changes(response, criterion_ids, "removals", "removed")
+
+    @staticmethod
+    def _keyword_changes(response, criterion_ids, description, verb):
+        """Result dict of a bulk keyword update or removal."""
+        errors = [
+            {"criterion_id": error["input"], "message": error["message"]}
+            for error in response["errors"]
+        ]
+        if errors:
+            print(
+                f"Error in {len(errors)} of {len(criterion_ids)} keyword {description}"
             )
-
-            if validate_only:
-                print(f"Dry run successful: Keyword {criterion_id} would be removed.")
-                return {"success": True, "dry_run": True}
-
-            print(f"Removed keyword {criterion_id}")
-            return {
-                "success": True,
-                "resource": response.results[0].resource_name,
-                "dry_run": False,
-            }
-
-        except GoogleAdsException as ex:
-            print(f"Error removing keyword: {ex}")
-            return {"success": False, "error": str(ex)}
+        applied = len(criterion_ids) - len(errors)
+        if response["dry_run"]:
+            print(f"Dry run: {applied} keywords would be {verb}.")
+        else:
+            print(f"{verb.capitalize()} {applied} keywords")
+        return {
+            "success": not errors,
+            "resources": response["resources"],
+            "errors": errors,
+            "dry_run": response["dry_run"],
+        }
 
     # ============================================
     # WRITE OPERATIONS - Ads
@@ -2275,7 +1732,7 @@ class AdsConnector:
         headlines: list of strings OR list of dicts {'text': '...', 'pinned_field': 'HEADLINE_1'}
         descriptions: list of strings OR list of dicts {'text': '...', 'pinned_field': 'DESCRIPTION_1'}
         """
-        ad_group_ad_service = self.client.get_service("AdGroupAdService")
+        ad_group_ad_service = self._service("AdGroupAdService")
         operation = self.client.get_type("AdGroupAdOperation")
 
         ad_group_ad = operation.create
@@ -2339,7 +1796,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating RSA: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2371,7 +1828,7 @@ class AdsConnector:
             if not resource_name:
                 return {"success": False, "error": f"Ad {ad_id} not found."}
 
-            ad_group_ad_service = self.client.get_service("AdGroupAdService")
+            ad_group_ad_service = self._service("AdGroupAdService")
             operation = self.client.get_type("AdGroupAdOperation")
 
             ad = operation.update
@@ -2379,7 +1836,7 @@ class AdsConnector:
             ad.status = getattr(self.client.enums.AdGroupAdStatusEnum, status)
 
             self.client.copy_from(
-                operation.update_mask, protobuf_helpers.field_mask(None, ad._pb)
+                operation.update_mask, _sdk.protobuf_helpers.field_mask(None, ad._pb)
             )
 
             request = self.client.get_type("MutateAdGroupAdsRequest")
@@ -2402,7 +1859,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error updating ad status: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2415,7 +1872,7 @@ class AdsConnector:
         Upload offline click conversions.
         conversions: list of dicts with 'gclid', 'conversion_action', 'conversion_date_time', 'conversion_value'
         """
-        conversion_upload_service = self.client.get_service("ConversionUploadService")
+        conversion_upload_service = self._service("ConversionUploadService")
 
         click_conversions = []
         for conv in conversions:
@@ -2462,7 +1919,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error uploading conversions: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2474,7 +1931,7 @@ class AdsConnector:
         """
         Upload an image asset.
         """
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         operation = self.client.get_type("AssetOperation")
         asset = operation.create
 
@@ -2498,7 +1955,7 @@ class AdsConnector:
             print(f"Uploaded image asset: {resource_name}")
             return {"success": True, "resource": resource_name, "dry_run": False}
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error uploading image asset: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2510,7 +1967,7 @@ class AdsConnector:
         sitelinks: list of dicts with 'text', 'description1', 'description2', 'final_urls'
         """
         # 1. Create Assets
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         asset_operations = []
 
         for sl in sitelinks:
@@ -2543,7 +2000,7 @@ class AdsConnector:
             asset_resource_names = [res.resource_name for res in asset_response.results]
 
             # 2. Attach to Campaign
-            campaign_asset_service = self.client.get_service("CampaignAssetService")
+            campaign_asset_service = self._service("CampaignAssetService")
             camp_asset_operations = []
 
             for resource_name in asset_resource_names:
@@ -2569,7 +2026,7 @@ class AdsConnector:
                 "dry_run": False,
             }
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating sitelinks: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2590,7 +2047,7 @@ class AdsConnector:
                 "error": "Must provide either campaign_id or ad_group_id",
             }
 
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         operations = []
 
         for text in callout_texts:
@@ -2627,7 +2084,7 @@ class AdsConnector:
                 validate_only,
             )
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating callout assets: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2649,7 +2106,7 @@ class AdsConnector:
                 "error": "Must provide either campaign_id or ad_group_id",
             }
 
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         operation = self.client.get_type("AssetOperation")
         asset = operation.create
 
@@ -2682,7 +2139,7 @@ class AdsConnector:
                 validate_only,
             )
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating structured snippet asset: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2705,7 +2162,7 @@ class AdsConnector:
                 "error": "Must provide either campaign_id or ad_group_id",
             }
 
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         operation = self.client.get_type("AssetOperation")
         asset = operation.create
 
@@ -2746,7 +2203,7 @@ class AdsConnector:
                 validate_only,
             )
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating call asset: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2771,7 +2228,7 @@ class AdsConnector:
                 "error": "Must provide either campaign_id or ad_group_id",
             }
 
-        asset_service = self.client.get_service("AssetService")
+        asset_service = self._service("AssetService")
         operation = self.client.get_type("AssetOperation")
         asset = operation.create
 
@@ -2813,7 +2270,7 @@ class AdsConnector:
                 validate_only,
             )
 
-        except GoogleAdsException as ex:
+        except _sdk.GoogleAdsException as ex:
             print(f"Error creating lead form asset: {ex}")
             return {"success": False, "error": str(ex)}
 
@@ -2829,12 +2286,9 @@ class AdsConnector:
         """
         Helper to attach assets to Campaign or AdGroup.
         """
-        operations = []
+        bulk = self.bulk_mutator(validate_only=validate_only)
 
         if campaign_id:
-            service_name = "CampaignAssetService"
-            request_type = "MutateCampaignAssetsRequest"
-
             for asset_resource in asset_resource_names:
                 operation = self.client.get_type("CampaignAssetOperation")
                 link = operation.create
@@ -2843,12 +2297,9 @@ class AdsConnector:
                 link.field_type = getattr(
                     self.client.enums.AssetFieldTypeEnum, field_type
                 )
-                operations.append(operation)
+                bulk.add(customer_id, "CampaignAssetService", operation, asset_resource)
 
         elif ad_group_id:
-            service_name = "AdGroupAssetService"
-            request_type = "MutateAdGroupAssetsRequest"
-
             for asset_resource in asset_resource_names:
                 operation = self.client.get_type("AdGroupAssetOperation")
                 link = operation.create
@@ -2857,36 +2308,24 @@ class AdsConnector:
                 link.field_type = getattr(
                     self.client.enums.AssetFieldTypeEnum, field_type
                 )
-                operations.append(operation)
-
-        service = self.client.get_service(service_name)
-
-        # Construct method name: mutate_campaign_assets, mutate_ad_group_assets
-        method_name_map = {
-            "CampaignAssetService": "mutate_campaign_assets",
-            "AdGroupAssetService": "mutate_ad_group_assets",
+                bulk.add(customer_id, "AdGroupAssetService", operation, asset_resource)
+
+        response = bulk.run()
+        errors = [
+            {"asset": error["input"], "message": error["message"]}
+            for error in response["errors"]
+        ]
+        if errors:
+            print(f"Error attaching {len(errors)} assets")
+
+        if validate_only:
+            print(f"Dry run: Assets would be attached.")
+            return {"success": not errors, "dry_run": True, "errors": errors}
+
+        print(f"Attached {len(response['resources'])} assets.")
+        return {
+            "success": not errors,
+            "resources": response["resources"],
+            "errors": errors,
+            "dry_run": False,
         }
-        method_name = method_name_map.get(service_name)
-
-        try:
-            request = self.client.get_type(request_type)
-            request.customer_id = customer_id
-            request.operations = operations
-            request.validate_only = validate_only
-
-            response = getattr(service, method_name)(request=request)
-
-            if validate_only:
-                print(f"Dry run successful: Assets would be attached.")
-                return {"success": True, "dry_run": True}
-
-            print(f"Attached {len(response.results)} assets.")
-            return {
-                "success": True,
-                "resources": [res.resource_name for res in response.results],
-                "dry_run": False,
-            }
-
-        except GoogleAdsException as ex:
-            print(f"Error attaching assets: {ex}")
-            return {"success": False, "error": str(ex)}
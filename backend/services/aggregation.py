@@ -0,0 +1,172 @@
+"""
+Report Row Aggregation.
+Rolls daily report rows up into window totals.
+
+Additive metrics (clicks, cost, ...) are summed per entity; ratio metrics
+(ctr, avg_cpc, cpa) are recomputed from the summed totals, so the result
+matches what the API returns for the whole window.
+"""
+
+ADDITIVE_METRICS = {
+    "clicks",
+    "impressions",
+    "cost",
+    "cost_micros",
+    "conversions",
+    "combined_clicks",
+    "combined_queries",
+    "organic_clicks",
+    "organic_impressions",
+    "organic_queries",
+}
+
+# Ratio metric -> (numerator, denominator)
+DERIVED_METRICS = {
+    "ctr": ("clicks", "impressions"),
+    "avg_cpc": ("cost", "clicks"),
+    "average_cpc": ("cost_micros", "clicks"),
+    "cpa": ("cost", "conversions"),
+}
+
+
+def metric_columns(spec):
+    """Names of a report's columns that read metrics.* fields."""
+    return [
+        column.name
+        for column in spec.columns
+        if isinstance(column.source, str) and column.source.startswith("metrics.")
+    ]
+
+
+def can_aggregate(spec):
+    """Whether every metric of a report can be rebuilt from daily rows."""
+    metrics = metric_columns(spec)
+    for name in metrics:
+        if name in ADDITIVE_METRICS:
+            continue
+        if name not in DERIVED_METRICS or not set(DERIVED_METRICS[name]) <= set(
+            metrics
+        ):
+            return False
+    return bool(metrics)
+
+
+# Entity attributes that can change from day to day (see aggregate_rows)
+MUTABLE_ATTRIBUTES = {
+    "status",
+    "approval_status",
+    "ad_strength",
+    "performance_label",
+    "quality_score",
+    "creative_qs",
+    "landing_page_qs",
+    "expected_ctr",
+}
+
+
+def aggregate_rows(spec, rows, latest_attributes=False):
+    """
+    Aggregate daily rows of a report into one row per entity.
+
+    Rows are grouped by every non-metric column except "date". Attributes that
+    change inside the window (e.g. a campaign renamed mid-month) therefore
+    yield one row per distinct value.
+
+    Args:
+        spec: ReportSpec the rows were decoded with (see can_aggregate)
+        rows: Row dicts, typically with a "date" key
+        latest_attributes: Leave MUTABLE_ATTRIBUTES (status, quality score,
+            ...) out of the grouping and report their last value instead, so
+            an entity keeps one row when e.g. it was paused mid-window. Rows
+            must then be ordered by date.
+
+    Returns:
+        List of row dicts in the report's column layout, without "date"
+    """
+    metrics = set(metric_columns(spec))
+    names = [column.name for column in spec.columns if column.name != "date"]
+    dimensions = group_columns(spec, latest_attributes)
+    latest = [
+        name for name in names if name not in metrics and name not in dimensions
+    ]
+    additive = [name for name in names if name in ADDITIVE_METRICS]
+    derived = [name for name in names if name in DERIVED_METRICS]
+
+    groups = {}
+    for row in rows:
+        key = group_key(row, dimensions)
+        totals = groups.get(key)
+        if totals is None:
+            totals = groups[key] = {name: row.get(name) for name in dimensions}
+            for name in additive:
+                totals[name] = 0
+        for name in latest:
+            totals[name] = row.get(name)
+        for name in additive:
+            totals[name] += row.get(name) or 0
+
+    aggregated = []
+    for totals in groups.values():
+        _derive(totals, derived)
+        aggregated.append({name: totals[name] for name in names})
+    return _order(spec, aggregated)
+
+
+def group_columns(spec, latest_attributes=False):
+    """Columns aggregate_rows groups a report's rows by."""
+    metrics = set(metric_columns(spec))
+    return [
+        column.name
+        for column in spec.columns
+        if column.name != "date"
+        and column.name not in metrics
+        and not (latest_attributes and column.name in MUTABLE_ATTRIBUTES)
+    ]
+
+
+def group_key(row, columns):
+    """Hashable grouping key of a row dict."""
+    return tuple(_hashable(row.get(name)) for name in columns)
+
+
+def summarize_rows(spec, rows):
+    """Report-wide metric totals of rows, with ratio metrics recomputed."""
+    names = metric_columns(spec)
+    totals = {name: 0 for name in names if name in ADDITIVE_METRICS}
+    for row in rows:
+        for name in totals:
+            totals[name] += row.get(name) or 0
+    _derive(totals, [name for name in names if name in DERIVED_METRICS])
+    return totals
+
+
+def _derive(totals, derived):
+    for name in derived:
+        numerator, denominator = DERIVED_METRICS[name]
+        totals[name] = (
+            totals[numerator] / totals[denominator] if totals[denominator] else 0
+        )
+
+
+def _order(spec, rows):
+    """Apply the report's ORDER BY to aggregated rows, where it maps to a column."""
+    if not spec.order_by:
+        return rows
+    field, _, direction = spec.order_by.partition(" ")
+    for column in spec.columns:
+        if column.source == field:
+            name = column.name
+            rows.sort(
+                key=lambda row: (row[name] is not None, row[name]),
+                reverse=direction.strip().upper() == "DESC",
+            )
+            break
+    return rows
+
+
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
@@ -0,0 +1,212 @@
+"""
+Audit Export.
+Writes audit sections as compressed Parquet or Arrow IPC files plus a JSON
+manifest (requires pyarrow).
+
+Every tabular google_ads and ga4 section becomes one file, so later phases
+can memory-map a single section or read only the columns they need instead
+of parsing the whole audit JSON. Sections that are not row lists (e.g.
+campaign_trends) are kept as small JSON files. SectionExporter writes the
+files as sections arrive; export_audit exports a complete audit dict.
+
+Layout:
+    audit_<customer_id>_<date>/
+        manifest.json
+        google_ads/campaigns.parquet
+        ga4/behavior.parquet
+        ...
+"""
+
+import json
+import os
+from datetime import datetime
+
+from backend.services.audit_writer import is_rows, iter_records
+
+MANIFEST_NAME = "manifest.json"
+EXPORT_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_COMPRESSION = "zstd"
+
+# Audit data keys exported section by section
+EXPORT_GROUPS = ("google_ads", "ga4")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet/Arrow export: pip install pyarrow"
+        ) from e
+    return pa
+
+
+def _to_table(pa, rows):
+    """Arrow table of row dicts; columns with mixed value types become JSON text."""
+    try:
+        return pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            try:
+                columns[name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                columns[name] = pa.array(
+                    [None if v is None else json.dumps(v, default=str) for v in values]
+                )
+        return pa.table(columns)
+
+
+def _write_table(pa, table, path, export_format, compression):
+    if export_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path, compression=compression)
+        return
+
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+class SectionExporter:
+    """
+    Writes audit sections to Parquet/Arrow files one at a time.
+
+    Usage:
+        exporter = SectionExporter(directory, "parquet")
+        exporter.write_section("google_ads", "campaigns", rows)
+        manifest_path = exporter.close(audit_data["metadata"])
+    """
+
+    def __init__(
+        self, directory, export_format="parquet", compression=DEFAULT_COMPRESSION
+    ):
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{export_format}'")
+        self.pa = _require_pyarrow()
+        self.directory = directory
+        self.export_format = export_format
+        self.compression = compression
+        self.sections = {}
+        for group in EXPORT_GROUPS:
+            os.makedirs(os.path.join(directory, group), exist_ok=True)
+
+    def write_section(self, group, key, value):
+        """Write one section (row list, DataFrame or other JSON value)."""
+        name = f"{group}/{key}"
+        if not is_rows(value):
+            path = f"{name}.json"
+            with open(os.path.join(self.directory, path), "w") as f:
+                json.dump(value, f, default=str)
+            self.sections[name] = {"path": path, "format": "json"}
+            return
+
+        rows = list(iter_records(value))
+        if not rows:
+            # Empty sections get no file
+            self.sections[name] = {
+                "path": None,
+                "format": self.export_format,
+                "rows": 0,
+                "columns": [],
+            }
+            return
+
+        path = f"{name}{EXPORT_FORMATS[self.export_format]}"
+        full_path = os.path.join(self.directory, path)
+        table = _to_table(self.pa, rows)
+        _write_table(self.pa, table, full_path, self.export_format, self.compression)
+        self.sections[name] = {
+            "path": path,
+            "format": self.export_format,
+            "rows": table.num_rows,
+            "columns": table.schema.names,
+            "bytes": os.path.getsize(full_path),
+        }
+
+    def close(self, metadata):
+        """Write the manifest and return its path."""
+        manifest = {
+            "created": datetime.now().isoformat(),
+            "format": self.export_format,
+            "compression": self.compression,
+            "metadata": metadata,
+            "sections": self.sections,
+        }
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        return manifest_path
+
+
+def export_audit(
+    audit_data, directory, export_format="parquet", compression=DEFAULT_COMPRESSION
+):
+    """
+    Write every audit section to its own file and a manifest describing them.
+
+    Args:
+        audit_data: Audit dict (as returned by collect_audit)
+        directory: Export directory (created if missing)
+        export_format: "parquet" or "arrow" (Arrow IPC file)
+        compression: Codec for the files ("zstd", "lz4", "snappy", ...);
+            Arrow IPC supports zstd and lz4 only
+
+    Returns:
+        Path of the manifest
+    """
+    exporter = SectionExporter(directory, export_format, compression)
+    for group in EXPORT_GROUPS:
+        for key, value in audit_data.get(group, {}).items():
+            exporter.write_section(group, key, value)
+    return exporter.close(audit_data.get("metadata", {}))
+
+
+def load_manifest(path):
+    """Read an export manifest (path of the file or of its directory)."""
+    if os.path.isdir(path):
+        path = os.path.join(path, MANIFEST_NAME)
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest["directory"] = os.path.dirname(os.path.abspath(path))
+    return manifest
+
+
+def load_section(path, section, columns=None):
+    """
+    Read one exported section, memory-mapped and projected to `columns`.
+
+    Args:
+        path: Export directory or manifest path
+        section: Section name, e.g. "google_ads/search_terms"
+        columns: Optional column names to read
+
+    Returns:
+        pyarrow Table (or the decoded JSON for non-tabular sections)
+    """
+    manifest = load_manifest(path)
+    try:
+        entry = manifest["sections"][section]
+    except KeyError:
+        raise KeyError(f"Section '{section}' is not in the export") from None
+    if entry["path"] is None:
+        return _require_pyarrow().table({})
+    file_path = os.path.join(manifest["directory"], entry["path"])
+
+    if entry["format"] == "json":
+        with open(file_path) as f:
+            return json.load(f)
+
+    pa = _require_pyarrow()
+    if entry["format"] == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(file_path, columns=columns, memory_map=True)
+
+    with pa.memory_map(file_path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
@@ -0,0 +1,278 @@
+"""
+Audit Warehouse.
+Local SQLite store of audit data with per-customer history
+(~/.mondaybrew/warehouse).
+
+Each audit is written as a snapshot: one row per report row in normalized
+tables (campaigns, ad_groups, keywords, ...) keyed by customer ID and
+snapshot date, whose columns follow the report registry. Re-running an audit
+on the same day replaces that day's snapshot. Phase analyses can then query
+months of history with SQL instead of reloading the JSON outputs.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from backend.services.audit_writer import iter_records
+from backend.services.report_registry import get_report
+
+DEFAULT_WAREHOUSE_DIR = Path.home() / ".mondaybrew" / "warehouse"
+
+# Warehouse table -> (audit section key, registered report)
+WAREHOUSE_TABLES = {
+    "campaigns": ("campaigns", "campaign_performance"),
+    "ad_groups": ("ad_groups", "ad_group_performance"),
+    "keywords": ("keywords", "keyword_performance"),
+    "search_terms": ("search_terms", "search_terms"),
+    "assets": ("asset_performance", "asset_performance"),
+    "geo": ("geographic", "geographic_performance"),
+    "devices": ("devices", "device_performance"),
+}
+
+# (audit group, section key) -> warehouse table
+_SECTION_TABLES = {
+    ("google_ads", section): table for table, (section, _) in WAREHOUSE_TABLES.items()
+}
+
+# Column dtype (see report_registry.Column) -> SQLite column type
+_SQL_TYPES = {"int64": "INTEGER", "float64": "REAL", "object": "TEXT"}
+
+# Columns every table starts with
+_KEY_COLUMNS = ("customer_id", "snapshot_date")
+
+_AUDITS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audits (
+    customer_id TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    audit_date TEXT NOT NULL,
+    ga4_property_id TEXT,
+    fetch_errors TEXT NOT NULL,
+    PRIMARY KEY (customer_id, snapshot_date)
+)
+"""
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_columns(table):
+    """(name, SQLite type) pairs of a warehouse table's report columns."""
+    _, report = WAREHOUSE_TABLES[table]
+    return [
+        # Micros columns are decoded to currency units
+        (column.name, "REAL" if column.is_micros else _SQL_TYPES[column.dtype])
+        for column in get_report(report).columns
+        if column.name not in _KEY_COLUMNS
+    ]
+
+
+def _to_sql(value):
+    # Lists and dicts (RSA headlines, final URLs, ...) are stored as JSON text
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+class AuditWarehouse:
+    """
+    SQLite warehouse of audit snapshots.
+
+    Every operation opens its own connection, so one warehouse can be shared
+    by the accounts of a fleet run.
+
+    Usage:
+        warehouse = AuditWarehouse()
+        warehouse.write_audit(audit_data)
+        rows = warehouse.query(
+            "SELECT snapshot_date, SUM(cost) AS cost FROM campaigns "
+            "WHERE customer_id = ? GROUP BY snapshot_date",
+            (customer_id,),
+        )
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else DEFAULT_WAREHOUSE_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "audits.sqlite3"
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_AUDITS_SCHEMA)
+            for table in WAREHOUSE_TABLES:
+                self._ensure_table(conn, table)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _ensure_table(conn, table):
+        """Create a table, or add report columns registered since it was created."""
+        columns = table_columns(table)
+        definitions = ", ".join(
+            [f"{name} TEXT NOT NULL" for name in _KEY_COLUMNS]
+            + [f"{_quote(name)} {sql_type}" for name, sql_type in columns]
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definitions})")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_snapshot "
+            f"ON {table} (customer_id, snapshot_date)"
+        )
+
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, sql_type in columns:
+            if name not in existing:
+                conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {_quote(name)} {sql_type}"
+                )
+
+    # --- Writes ---
+
+    def write_audit(self, audit_data):
+        """
+        Store one audit (as returned by collect_audit) as a snapshot.
+
+        The snapshot date is the audit's date; an existing snapshot of the
+        same customer and date is replaced in the same transaction.
+
+        Returns:
+            Dict of table -> rows written
+        """
+        metadata = audit_data["metadata"]
+        customer_id = str(metadata["customer_id"])
+        snapshot_date = metadata["audit_date"][:10]
+        sections = audit_data.get("google_ads", {})
+
+        written = {}
+        with closing(self._connect()) as conn, conn:
+            self._record_audit(conn, customer_id, snapshot_date, metadata)
+            for table, (section, _) in WAREHOUSE_TABLES.items():
+                written[table] = self._replace(
+                    conn, table, customer_id, snapshot_date, sections.get(section)
+                )
+        return written
+
+    def snapshot(self, customer_id, audit_date):
+        """Section-by-section writer of one snapshot (see WarehouseSnapshot)."""
+        return WarehouseSnapshot(self, customer_id, audit_date)
+
+    @staticmethod
+    def _record_audit(conn, customer_id, snapshot_date, metadata):
+        conn.execute(
+            "INSERT OR REPLACE INTO audits VALUES (?, ?, ?, ?, ?)",
+            (
+                customer_id,
+                snapshot_date,
+                metadata["audit_date"],
+                metadata.get("ga4_property_id"),
+                json.dumps(metadata.get("fetch_errors", {})),
+            ),
+        )
+
+    @staticmethod
+    def _replace(conn, table, customer_id, snapshot_date, rows):
+        names = [name for name, _ in table_columns(table)]
+        conn.execute(
+            f"DELETE FROM {table} WHERE customer_id = ? AND snapshot_date = ?",
+            (customer_id, snapshot_date),
+        )
+        if rows is None:
+            return 0
+
+        placeholders = ", ".join("?" * (len(_KEY_COLUMNS) + len(names)))
+        column_list = ", ".join(list(_KEY_COLUMNS) + [_quote(n) for n in names])
+        cursor = conn.executemany(
+            f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})",
+            (
+                (customer_id, snapshot_date, *(_to_sql(row.get(n)) for n in names))
+                for row in rows
+            ),
+        )
+        return max(cursor.rowcount, 0)
+
+    # --- Reads ---
+
+    def query(self, sql, params=()):
+        """Run a read query and return the result rows as dicts."""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(sql, params)
+            names = [description[0] for description in cursor.description or ()]
+            return [dict(zip(names, row)) for row in cursor]
+
+    def snapshots(self, customer_id=None):
+        """Stored audits (customer, snapshot date, fetch errors), newest first."""
+        sql = "SELECT customer_id, snapshot_date, audit_date, fetch_errors FROM audits"
+        params = ()
+        if customer_id is not None:
+            sql += " WHERE customer_id = ?"
+            params = (str(customer_id),)
+        rows = self.query(sql + " ORDER BY snapshot_date DESC, customer_id", params)
+        for row in rows:
+            row["fetch_errors"] = json.loads(row["fetch_errors"])
+        return rows
+
+    def history(self, table, customer_id, start=None, end=None):
+        """
+        Rows of a table across snapshots of one customer, oldest first.
+
+        Args:
+            table: Warehouse table (see WAREHOUSE_TABLES)
+            start, end: Optional inclusive snapshot date bounds (YYYY-MM-DD)
+        """
+        if table not in WAREHOUSE_TABLES:
+            raise ValueError(f"Unknown warehouse table '{table}'")
+        sql = f"SELECT * FROM {table} WHERE customer_id = ?"
+        params = [str(customer_id)]
+        if start is not None:
+            sql += " AND snapshot_date >= ?"
+            params.append(str(start))
+        if end is not None:
+            sql += " AND snapshot_date <= ?"
+            params.append(str(end))
+        return self.query(sql + " ORDER BY snapshot_date, rowid", params)
+
+
+class WarehouseSnapshot:
+    """
+    Writes one audit snapshot section by section, as fetches complete.
+
+    Each section replaces its table's rows for the snapshot in its own
+    transaction. close() clears the tables no section was written for and
+    records the audit, so an interrupted run leaves no audits entry.
+
+    Usage:
+        snapshot = warehouse.snapshot(customer_id, audit_date)
+        snapshot.write_section("google_ads", "campaigns", rows)
+        snapshot.close(metadata)
+    """
+
+    def __init__(self, warehouse, customer_id, audit_date):
+        self.warehouse = warehouse
+        self.customer_id = str(customer_id)
+        self.snapshot_date = audit_date[:10]
+        self.written = {}
+
+    def write_section(self, group, key, value):
+        """Store a section if it maps to a warehouse table (others are ignored)."""
+        table = _SECTION_TABLES.get((group, key))
+        if table is None:
+            return
+        with closing(self.warehouse._connect()) as conn, conn:
+            self.written[table] = self.warehouse._replace(
+                conn, table, self.customer_id, self.snapshot_date, iter_records(value)
+            )
+
+    def close(self, metadata):
+        """Record the audit and clear tables without a section; returns rows written."""
+        with closing(self.warehouse._connect()) as conn, conn:
+            for table in WAREHOUSE_TABLES:
+                if table not in self.written:
+                    self.written[table] = self.warehouse._replace(
+                        conn, table, self.customer_id, self.snapshot_date, None
+                    )
+            self.warehouse._record_audit(
+                conn, self.customer_id, self.snapshot_date, metadata
+            )
+        return self.written
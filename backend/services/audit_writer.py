@@ -0,0 +1,150 @@
+"""
+Streaming Audit Writer.
+Writes the audit JSON section by section as fetches complete.
+
+The output has the same structure as a json.dump of the whole audit dict
+({"google_ads": {...}, "ga4": {...}, "metadata": {...}}), but each section is
+serialized and written as soon as it arrives, row by row with compact
+separators, and is released once it is on disk. The metadata (fetch errors
+included) is written last, when the audit is closed.
+
+Memory is bounded, not constant: each fetch still builds its whole section
+before handing it over, so up to max_workers complete sections are held at
+once. With a ReportCache configured, each of those fetches also buffers its
+serialized rows until the cache entry is written, roughly doubling that.
+
+Optional compression: gzip (standard library) or zstd (requires zstandard).
+"""
+
+import gzip
+import io
+import json
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Rows converted per DataFrame slice, bounding the records copy
+FRAME_CHUNK_ROWS = 5000
+
+_SEPARATORS = (",", ":")
+
+
+def _json_default(value):
+    # numpy scalars, pandas Timestamps, dates, ...
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(value):
+    return json.dumps(value, separators=_SEPARATORS, default=_json_default)
+
+
+def open_output(path, compression=None):
+    """Open a text stream for writing, compressed according to `compression`."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'")
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstandard is required for zstd output: pip install zstandard"
+            ) from e
+        raw = zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def iter_records(value):
+    """Yield the rows of a list or DataFrame section, converting frames in slices."""
+    if hasattr(value, "iloc") and hasattr(value, "to_dict"):
+        for start in range(0, len(value), FRAME_CHUNK_ROWS):
+            chunk = value.iloc[start : start + FRAME_CHUNK_ROWS]
+            yield from chunk.to_dict(orient="records")
+        return
+    yield from value
+
+
+def is_rows(value):
+    """Whether a section is a row list (or DataFrame) that can be streamed."""
+    return isinstance(value, list) or (
+        hasattr(value, "iloc") and hasattr(value, "to_dict")
+    )
+
+
+class AuditJsonWriter:
+    """
+    Incremental writer of the audit JSON.
+
+    Sections must arrive grouped: all google_ads sections, then all ga4
+    sections. Groups without sections are written as empty objects.
+
+    Usage:
+        writer = AuditJsonWriter(path, compression="gzip")
+        writer.write_section("google_ads", "campaigns", rows)
+        ...
+        writer.close(audit_data["metadata"])
+    """
+
+    GROUPS = ("google_ads", "ga4")
+
+    def __init__(self, path, compression=None):
+        self.path = path
+        self._file = open_output(path, compression)
+        self._file.write("{")
+        self._group = None
+        self._written_groups = []
+        self._sections_in_group = 0
+        self.rows_written = 0
+
+    def _enter_group(self, group):
+        if group == self._group:
+            return
+        if group in self._written_groups:
+            raise ValueError(f"Sections of '{group}' must be written together")
+        self._leave_group()
+        if self._written_groups:
+            self._file.write(",")
+        self._file.write(f"{_dumps(group)}:{{")
+        self._group = group
+        self._written_groups.append(group)
+        self._sections_in_group = 0
+
+    def _leave_group(self):
+        if self._group is not None:
+            self._file.write("}")
+            self._group = None
+
+    def write_section(self, group, key, value):
+        """Serialize one section to disk (rows are written one at a time)."""
+        self._enter_group(group)
+        if self._sections_in_group:
+            self._file.write(",")
+        self._sections_in_group += 1
+        self._file.write(f"{_dumps(key)}:")
+
+        if not is_rows(value):
+            self._file.write(_dumps(value))
+            return
+
+        write = self._file.write
+        write("[")
+        for index, row in enumerate(iter_records(value)):
+            if index:
+                write(",")
+            write(_dumps(row))
+            self.rows_written += 1
+        write("]")
+
+    def close(self, metadata):
+        """Write the remaining (empty) groups and the metadata, then close."""
+        for group in self.GROUPS:
+            if group not in self._written_groups:
+                self._enter_group(group)
+        self._leave_group()
+        self._file.write(f',"metadata":{_dumps(metadata)}}}')
+        self._file.close()
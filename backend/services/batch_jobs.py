@@ -0,0 +1,360 @@
+"""
+Batch Jobs.
+Offline mutations through BatchJobService for change sets too large for
+synchronous mutate requests (pausing low-QS keywords fleet-wide, mass
+negative list updates).
+
+Operations are staged into one BatchJob per customer in chunks of
+AddBatchJobOperations requests, the jobs are started, polled with
+exponential backoff until they finish and their results are streamed back
+page by page. The API executes the job on its side, so staging 50,000
+operations takes a dozen requests instead of ten synchronous mutates
+competing for the connector's request quota.
+
+Batch jobs cannot validate without applying, so validate_only runs are sent
+through the synchronous BulkMutator as validate-only requests instead; dry
+runs report the same per-input errors either way.
+
+Creating a job and staging operations are not idempotent: a request that
+timed out may still have created the job or appended its chunk, so they are
+only retried after quota errors, which reject a request before it runs. Any
+other failure leaves the job unstarted and fails the customer's operations.
+Starting a job (a second start is rejected, not executed twice), polling it
+and reading its results page by page are retried like every other request.
+A job whose status cannot be read is reported as pending under its resource
+name instead of failing the run, since it may already be executing.
+"""
+
+import re
+import time
+
+from backend.services import _sdk
+from backend.services.bulk_mutations import (
+    MUTATE_METHODS,
+    BulkMutator,
+    operation_error,
+    status_errors,
+)
+from backend.services.retry import describe_error, is_quota_error
+
+# Operations per AddBatchJobOperations request
+DEFAULT_CHUNK_SIZE = 5000
+
+# Seconds between completion checks: doubled after every check, up to the max
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_POLL_INTERVAL = 120.0
+
+# Seconds to wait for a job before reporting its operations as pending
+DEFAULT_TIMEOUT = 3600.0
+
+# Results per ListBatchJobResults page
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _mutate_field(service, suffix="operation"):
+    """
+    MutateOperation (or, with suffix="result", MutateOperationResponse) field
+    of a service, e.g. ad_group_criterion_operation.
+    """
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", service[: -len("Service")]).lower()
+    return f"{name}_{suffix}"
+
+
+class BatchJobMutator:
+    """
+    BulkMutator counterpart that applies operations through batch jobs.
+
+    Usage:
+        batch = BatchJobMutator(connector, validate_only=False)
+        for criterion_id, operation in operations:
+            batch.add(customer_id, "AdGroupCriterionService", operation, criterion_id)
+        result = batch.run()
+        print(result["batch_jobs"], len(result["errors"]))
+
+    Args:
+        connector: AdsConnector whose client, rate limiter, retry policy and
+            instrumented service stubs the requests go through
+        validate_only: Validate the operations without applying them
+        chunk_size: Operations per AddBatchJobOperations request
+        poll_interval: Seconds before the first completion check
+        max_poll_interval: Longest wait between completion checks
+        timeout: Seconds to wait for a job to finish
+        page_size: Results per ListBatchJobResults page
+    """
+
+    def __init__(
+        self,
+        connector,
+        validate_only=True,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        poll_interval=DEFAULT_POLL_INTERVAL,
+        max_poll_interval=DEFAULT_MAX_POLL_INTERVAL,
+        timeout=DEFAULT_TIMEOUT,
+        page_size=DEFAULT_PAGE_SIZE,
+    ):
+        self.connector = connector
+        self.validate_only = validate_only
+        self.chunk_size = max(1, int(chunk_size))
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self.timeout = timeout
+        self.page_size = page_size
+        self._operations = []
+
+    def __len__(self):
+        return len(self._operations)
+
+    def add(self, customer_id, service, operation, input=None):
+        """Queue an operation (see BulkMutator.add)."""
+        if service not in MUTATE_METHODS:
+            raise ValueError(f"Unsupported mutate service: {service}")
+        self._operations.append((str(customer_id), service, operation, input))
+        return len(self._operations) - 1
+
+    def run(self):
+        """
+        Apply every queued operation through one batch job per customer and
+        clear the queue.
+
+        Returns:
+            The BulkMutator.run() dict, plus batch_jobs (resource names of
+            the jobs); requests counts the requests that created, staged and
+            started them. Operations of a job that did not finish in time,
+            or whose status could not be read, fail with a message naming
+            the job; iter_results() fetches them later.
+        """
+        operations = self._operations
+        self._operations = []
+
+        if self.validate_only:
+            bulk = BulkMutator(self.connector, validate_only=True)
+            for operation in operations:
+                bulk.add(*operation)
+            return dict(bulk.run(), batch_jobs=[])
+
+        results = [
+            {"input": input, "resource_name": None, "error": None}
+            for _, _, _, input in operations
+        ]
+        customers = {}
+        for index, (customer_id, _, _, _) in enumerate(operations):
+            customers.setdefault(customer_id, []).append(index)
+
+        # Start every job before waiting, so they execute side by side
+        jobs = []
+        requests = 0
+        for customer_id, indexes in customers.items():
+            try:
+                job, running, job_requests = self.submit(
+                    customer_id, [operations[index] for index in indexes]
+                )
+            except _sdk.GoogleAdsException as ex:
+                print(f"Error staging batch job for {customer_id}: {ex}")
+                for index in indexes:
+                    results[index]["error"] = {
+                        "message": str(ex),
+                        "error_code": describe_error(ex),
+                    }
+                continue
+            requests += job_requests
+            jobs.append((customer_id, indexes, job, running))
+
+        for customer_id, indexes, job, running in jobs:
+            if not self.wait(running, job, customer_id):
+                for index in indexes:
+                    results[index]["error"] = {
+                        "message": f"Batch job {job} not confirmed done",
+                        "error_code": None,
+                    }
+                continue
+            services = [operations[index][1] for index in indexes]
+            try:
+                for result in self.iter_results(customer_id, job, services):
+                    results[indexes[result.pop("operation_index")]].update(result)
+            except _sdk.GoogleAdsException as ex:
+                print(f"Error fetching results of batch job {job}: {ex}")
+                # Keep the results and errors of pages already read
+                for index in indexes:
+                    result = results[index]
+                    if result["resource_name"] is None and result["error"] is None:
+                        result["error"] = {
+                            "message": str(ex),
+                            "error_code": describe_error(ex),
+                        }
+
+        errors = [
+            dict(result["error"], index=index, input=result["input"])
+            for index, result in enumerate(results)
+            if result["error"] is not None
+        ]
+        return {
+            "success": not errors,
+            "dry_run": False,
+            "operations": len(operations),
+            "requests": requests,
+            "resources": [
+                result["resource_name"]
+                for result in results
+                if result["resource_name"] and result["error"] is None
+            ],
+            "errors": errors,
+            "results": results,
+            "batch_jobs": [job for _, _, job, _ in jobs],
+        }
+
+    def submit(self, customer_id, operations):
+        """
+        Create a batch job, stage the operations into it and start it.
+
+        Args:
+            customer_id: Customer the job belongs to
+            operations: (customer_id, service, operation, input) tuples
+
+        Returns:
+            (job resource name, long-running operation, requests made)
+        """
+        client = self.connector.client
+        service = self.connector._service("BatchJobService")
+
+        job_operation = client.get_type("BatchJobOperation")
+        client.copy_from(job_operation.create, client.get_type("BatchJob"))
+        response = self._call(
+            customer_id,
+            "batch job creation",
+            service.mutate_batch_job,
+            True,
+            customer_id=customer_id,
+            operation=job_operation,
+        )
+        job = response.result.resource_name
+        requests = 1
+
+        sequence_token = None
+        for start in range(0, len(operations), self.chunk_size):
+            mutate_operations = []
+            for _, service_name, operation, _ in operations[
+                start : start + self.chunk_size
+            ]:
+                mutate_operation = client.get_type("MutateOperation")
+                client.copy_from(
+                    getattr(mutate_operation, _mutate_field(service_name)), operation
+                )
+                mutate_operations.append(mutate_operation)
+            response = self._call(
+                customer_id,
+                "batch job operations",
+                service.add_batch_job_operations,
+                True,
+                resource_name=job,
+                sequence_token=sequence_token,
+                mutate_operations=mutate_operations,
+            )
+            sequence_token = response.next_sequence_token
+            requests += 1
+
+        running = self._call(
+            customer_id, "batch job start", service.run_batch_job, resource_name=job
+        )
+        print(f"Started batch job {job} with {len(operations)} operations")
+        return job, running, requests + 1
+
+    def wait(self, running, job=None, customer_id=None):
+        """
+        Poll a started job with exponential backoff until it is done.
+
+        Every check is throttled and retried like any other request.
+
+        Returns:
+            False if the timeout passed first or the job's status could not
+            be read
+        """
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while True:
+            try:
+                if self._call(customer_id, "batch job status", running.done):
+                    return True
+            except _sdk.GoogleAdsException as ex:
+                print(f"Error polling batch job {job}: {ex}")
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"Batch job {job} not done after {self.timeout:.0f}s")
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_poll_interval)
+
+    def iter_results(self, customer_id, job, services):
+        """
+        Yield the result of every operation of a finished job as its page of
+        results arrives.
+
+        Args:
+            customer_id: Customer the job belongs to
+            job: Batch job resource name
+            services: Service name of each staged operation, in order
+
+        Yields:
+            dict with operation_index, resource_name and error
+        """
+        client = self.connector.client
+        service = self.connector._service("BatchJobService")
+        request = client.get_type("ListBatchJobResultsRequest")
+        request.resource_name = job
+        request.page_size = self.page_size
+
+        # One request per page, so each page is throttled and retried (the
+        # pager would fetch later pages on its own)
+        while True:
+            page = self._call(
+                customer_id,
+                "batch job results",
+                service.list_batch_job_results,
+                request=request,
+            )
+            yield from self._page_results(client, page.results, services)
+            if not page.next_page_token:
+                return
+            request.page_token = page.next_page_token
+
+    @staticmethod
+    def _page_results(client, page, services):
+        """Result dicts of one page of ListBatchJobResults."""
+        for result in page:
+            index = result.operation_index
+            item = {"operation_index": index, "resource_name": None, "error": None}
+            if result.status.code:
+                errors = status_errors(client, result.status)
+                item["error"] = (
+                    operation_error(errors[0])
+                    if errors
+                    else {"message": result.status.message, "error_code": None}
+                )
+            else:
+                response = getattr(
+                    result.mutate_operation_response,
+                    _mutate_field(services[index], "result"),
+                )
+                item["resource_name"] = response.resource_name or None
+            yield item
+
+    def _call(self, customer_id, description, method, mutates=False, /, **kwargs):
+        """
+        One BatchJobService request, throttled and retried like the rest.
+
+        Requests that mutate the job (mutates=True) are only retried after
+        quota errors, since any other failure may have been applied.
+        """
+        attempt = 0
+        while True:
+            try:
+                self.connector._throttle(customer_id)
+                response = method(**kwargs)
+                self.connector.rate_limiter.recover()
+                return response
+            except _sdk.GoogleAdsException as ex:
+                if (mutates and not is_quota_error(ex)) or not (
+                    self.connector._wait_to_retry(ex, attempt, description, customer_id)
+                ):
+                    raise
+                attempt += 1
@@ -0,0 +1,303 @@
+"""
+Bulk Mutations.
+Applies thousands of mutate operations in a handful of requests.
+
+Operations are grouped by customer and mutate service, split into chunks of
+at most DEFAULT_CHUNK_SIZE operations and submitted with partial_failure
+enabled, so one invalid keyword no longer rejects the other 4,999. Every
+per-operation error in a partial failure is mapped back, by its operation
+index, to the input the operation was queued with.
+
+Customers are mutated in parallel, but each customer's chunks are sent one
+after another, in the order their operations were queued, so requests never
+compete for the same account (CONCURRENT_MODIFICATION).
+
+Mutates are not idempotent: a request that timed out or hit UNAVAILABLE may
+still have been applied, and sending it again could create duplicates. Only
+quota errors, which reject a request before it runs, are retried; any other
+failure fails the chunk's operations. Validate-only requests change nothing
+and follow the connector's usual retry policy.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.services import _sdk
+from backend.services.retry import describe_error, is_quota_error
+
+# Operations per mutate request. The API rejects requests above 10,000;
+# smaller chunks keep retries and partial-failure responses cheap.
+DEFAULT_CHUNK_SIZE = 5000
+
+# Customers mutated at once, one request each (the shared rate limiter still
+# paces them)
+DEFAULT_MAX_WORKERS = 4
+
+# Mutate service -> (method, request type)
+MUTATE_METHODS = {
+    "AdGroupAdService": ("mutate_ad_group_ads", "MutateAdGroupAdsRequest"),
+    "AdGroupAssetService": ("mutate_ad_group_assets", "MutateAdGroupAssetsRequest"),
+    "AdGroupCriterionService": (
+        "mutate_ad_group_criteria",
+        "MutateAdGroupCriteriaRequest",
+    ),
+    "AdGroupService": ("mutate_ad_groups", "MutateAdGroupsRequest"),
+    "AssetService": ("mutate_assets", "MutateAssetsRequest"),
+    "CampaignAssetService": ("mutate_campaign_assets", "MutateCampaignAssetsRequest"),
+    "CampaignBudgetService": (
+        "mutate_campaign_budgets",
+        "MutateCampaignBudgetsRequest",
+    ),
+    "CampaignCriterionService": (
+        "mutate_campaign_criteria",
+        "MutateCampaignCriteriaRequest",
+    ),
+    "CampaignService": ("mutate_campaigns", "MutateCampaignsRequest"),
+    "CampaignSharedSetService": (
+        "mutate_campaign_shared_sets",
+        "MutateCampaignSharedSetsRequest",
+    ),
+    "SharedCriterionService": (
+        "mutate_shared_criteria",
+        "MutateSharedCriteriaRequest",
+    ),
+    "SharedSetService": ("mutate_shared_sets", "MutateSharedSetsRequest"),
+}
+
+
+def _error_code(error):
+    """Error code of a GoogleAdsError as "field.NAME" (its error_code oneof)."""
+    error_code = getattr(error, "error_code", None)
+    if error_code is None:
+        return None
+    try:
+        field = type(error_code).pb(error_code).WhichOneof("error_code")
+    except (AttributeError, TypeError, ValueError):
+        # Plain attribute bags (e.g. the fake API) hold just the set field
+        field = next(iter(vars(error_code)), None)
+    if not field:
+        return None
+    value = getattr(error_code, field)
+    return f"{field}.{getattr(value, 'name', value)}"
+
+
+def operation_error(error):
+    """Result error dict of a GoogleAdsError: message and error_code."""
+    return {"message": error.message, "error_code": _error_code(error)}
+
+
+def status_errors(client, status):
+    """GoogleAdsErrors packed into the details of a google.rpc.Status."""
+    failure_type = type(client.get_type("GoogleAdsFailure"))
+    errors = []
+    for detail in status.details:
+        errors.extend(failure_type.deserialize(detail.value).errors)
+    return errors
+
+
+def _operation_index(error):
+    """Index of the operation a GoogleAdsError points at, if it says."""
+    location = getattr(error, "location", None)
+    for element in getattr(location, "field_path_elements", None) or ():
+        if element.field_name == "operations":
+            return element.index
+    return None
+
+
+class BulkMutator:
+    """
+    Chunked mutate requests, concurrent across customers, with per-operation
+    error reporting.
+
+    Usage:
+        bulk = BulkMutator(connector, validate_only=False)
+        for keyword, operation in operations:
+            bulk.add(customer_id, "AdGroupCriterionService", operation, keyword)
+        result = bulk.run()
+        for error in result["errors"]:
+            print(error["input"], error["message"])
+
+    Args:
+        connector: AdsConnector whose client, rate limiter, retry policy and
+            instrumented service stubs the requests go through
+        validate_only: Validate the operations without applying them
+        chunk_size: Maximum operations per mutate request
+        max_workers: Customers mutated at once
+    """
+
+    def __init__(
+        self,
+        connector,
+        validate_only=True,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        max_workers=DEFAULT_MAX_WORKERS,
+    ):
+        self.connector = connector
+        self.validate_only = validate_only
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_workers = max(1, int(max_workers))
+        self._operations = []
+
+    def __len__(self):
+        return len(self._operations)
+
+    def add(self, customer_id, service, operation, input=None):
+        """
+        Queue an operation.
+
+        Args:
+            customer_id: Customer the operation applies to
+            service: Mutate service name (a key of MUTATE_METHODS)
+            operation: The XxxOperation message
+            input: What the operation was built from (keyword text, criterion
+                ID...), returned with its result and errors
+
+        Returns:
+            Index of the operation in the run's results
+        """
+        if service not in MUTATE_METHODS:
+            raise ValueError(f"Unsupported mutate service: {service}")
+        self._operations.append((str(customer_id), service, operation, input))
+        return len(self._operations) - 1
+
+    def run(self):
+        """
+        Submit every queued operation and clear the queue.
+
+        Returns:
+            dict with success, dry_run, operations, requests, resources
+            (resource names of the applied operations, in input order),
+            errors (index, input, message and error_code per failed
+            operation) and results (input, resource_name and error per
+            operation, in input order)
+        """
+        operations = self._operations
+        self._operations = []
+        chunks = self._chunks(operations)
+        results = [
+            {"input": input, "resource_name": None, "error": None}
+            for _, _, _, input in operations
+        ]
+
+        customers = {}
+        for chunk in chunks:
+            customers.setdefault(chunk[0], []).append(chunk)
+
+        if customers:
+            workers = min(self.max_workers, len(customers))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="ads-mutate"
+            ) as pool:
+                # Each chunk writes only its own operations' results
+                list(
+                    pool.map(
+                        lambda chunks: self._submit_all(chunks, operations, results),
+                        customers.values(),
+                    )
+                )
+
+        errors = [
+            dict(result["error"], index=index, input=result["input"])
+            for index, result in enumerate(results)
+            if result["error"] is not None
+        ]
+        return {
+            "success": not errors,
+            "dry_run": self.validate_only,
+            "operations": len(operations),
+            "requests": len(chunks),
+            "resources": [
+                result["resource_name"]
+                for result in results
+                if result["resource_name"] and result["error"] is None
+            ],
+            "errors": errors,
+            "results": results,
+        }
+
+    def _chunks(self, operations):
+        """Operation indexes per request: (customer_id, service, indexes)."""
+        groups = {}
+        for index, (customer_id, service, _, _) in enumerate(operations):
+            groups.setdefault((customer_id, service), []).append(index)
+        return [
+            (customer_id, service, indexes[start : start + self.chunk_size])
+            for (customer_id, service), indexes in groups.items()
+            for start in range(0, len(indexes), self.chunk_size)
+        ]
+
+    def _submit_all(self, chunks, operations, results):
+        """Submit one customer's chunks one after another."""
+        for chunk in chunks:
+            self._submit(chunk, operations, results)
+
+    def _submit(self, chunk, operations, results):
+        customer_id, service_name, indexes = chunk
+        method, request_type = MUTATE_METHODS[service_name]
+        connector = self.connector
+        service = connector._service(service_name)
+
+        attempt = 0
+        while True:
+            try:
+                connector._throttle(customer_id)
+                request = connector.client.get_type(request_type)
+                request.customer_id = customer_id
+                request.operations = [operations[index][2] for index in indexes]
+                request.partial_failure = True
+                request.validate_only = self.validate_only
+                response = getattr(service, method)(request=request)
+                break
+            except _sdk.GoogleAdsException as ex:
+                # Only retry requests that cannot have been applied
+                if (self.validate_only or is_quota_error(ex)) and (
+                    connector._wait_to_retry(
+                        ex,
+                        attempt,
+                        f"{method} ({len(indexes)} operations)",
+                        customer_id,
+                    )
+                ):
+                    attempt += 1
+                    continue
+                # The whole request failed: report it against every operation
+                print(f"Error in {method} for {customer_id}: {ex}")
+                located = self._errors_by_operation(ex.failure.errors)
+                for offset, index in enumerate(indexes):
+                    results[index]["error"] = located.get(offset) or {
+                        "message": str(ex),
+                        "error_code": describe_error(ex),
+                    }
+                return
+
+        connector.rate_limiter.recover()
+
+        located = {}
+        status = response.partial_failure_error
+        if status:
+            located = self._errors_by_operation(
+                status_errors(connector.client, status)
+            )
+
+        returned = list(response.results)
+        for offset, index in enumerate(indexes):
+            result = results[index]
+            resource_name = (
+                returned[offset].resource_name if offset < len(returned) else None
+            )
+            if offset in located:
+                result["error"] = located[offset]
+            elif status and not resource_name and not self.validate_only:
+                # Failed operations come back as empty results
+                result["error"] = {"message": status.message, "error_code": None}
+            else:
+                result["resource_name"] = resource_name or None
+
+    @staticmethod
+    def _errors_by_operation(errors):
+        """First error per operation index, for errors that carry a location."""
+        located = {}
+        for error in errors or ():
+            index = _operation_index(error)
+            if index is not None and index not in located:
+                located[index] = operation_error(error)
+        return located
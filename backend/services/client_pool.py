@@ -0,0 +1,57 @@
+"""
+Google Ads Client Pool.
+Process-wide GoogleAdsClient and service stub reuse.
+
+GoogleAdsClient.load_from_dict builds new OAuth credentials, and every
+client.get_service call opens a new gRPC channel. Connectors created for the
+same credentials and login customer therefore share one client (one token
+refresh) and one stub per service (one channel and TLS handshake).
+"""
+
+import hashlib
+import json
+import threading
+
+from backend.services import _sdk
+
+_lock = threading.Lock()
+_clients = {}
+_services = {}
+
+
+def _config_key(config):
+    """Stable key for a client config without keeping secrets in plain text."""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_client(config):
+    """
+    Shared GoogleAdsClient for a config dict (see GoogleAdsClient.load_from_dict).
+
+    Clients are keyed on the full config, i.e. the credentials and the
+    login_customer_id.
+    """
+    key = _config_key(config)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _sdk.GoogleAdsClient.load_from_dict(config)
+        return client
+
+
+def get_service(client, name):
+    """Shared service stub of a client, created on first use."""
+    key = (id(client), name)
+    with _lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = client.get_service(name)
+        return service
+
+
+def clear():
+    """Drop all pooled clients and stubs (e.g. after rotating credentials)."""
+    with _lock:
+        _clients.clear()
+        _services.clear()
@@ -0,0 +1,99 @@
+"""
+GAQL Date Ranges.
+Resolves the predefined DURING date ranges to concrete start/end dates.
+
+Google Ads evaluates DURING ranges in the account's time zone; these helpers
+use the local date, which is what the cache and sync layers need to tell
+whether a window can still change.
+"""
+
+from datetime import date, timedelta
+
+# Days after which conversions and invalid-click adjustments have settled
+SETTLING_DAYS = 3
+
+
+def _last_n_days(n):
+    # LAST_N_DAYS windows end yesterday and do not include today
+    return lambda today: (today - timedelta(days=n), today - timedelta(days=1))
+
+
+def _this_month(today):
+    return today.replace(day=1), today
+
+
+def _last_month(today):
+    end = today.replace(day=1) - timedelta(days=1)
+    return end.replace(day=1), end
+
+
+def _week_start(today, first_weekday):
+    # first_weekday: 0 = Monday, 6 = Sunday
+    return today - timedelta(days=(today.weekday() - first_weekday) % 7)
+
+
+def _last_week(first_weekday):
+    def resolve(today):
+        start = _week_start(today, first_weekday) - timedelta(days=7)
+        return start, start + timedelta(days=6)
+
+    return resolve
+
+
+def _last_business_week(today):
+    start = _week_start(today, 0) - timedelta(days=7)
+    return start, start + timedelta(days=4)
+
+
+DURING_RANGES = {
+    "TODAY": lambda today: (today, today),
+    "YESTERDAY": lambda today: (today - timedelta(days=1),) * 2,
+    "LAST_7_DAYS": _last_n_days(7),
+    "LAST_14_DAYS": _last_n_days(14),
+    "LAST_30_DAYS": _last_n_days(30),
+    "THIS_MONTH": _this_month,
+    "LAST_MONTH": _last_month,
+    "THIS_WEEK_SUN_TODAY": lambda today: (_week_start(today, 6), today),
+    "THIS_WEEK_MON_TODAY": lambda today: (_week_start(today, 0), today),
+    "LAST_WEEK_SUN_SAT": _last_week(6),
+    "LAST_WEEK_MON_SUN": _last_week(0),
+    "LAST_BUSINESS_WEEK": _last_business_week,
+}
+
+
+def to_date(value):
+    """Coerce a date or YYYY-MM-DD string to datetime.date."""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def iter_days(start, end):
+    """Yield every date from start to end, inclusive."""
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def resolve_date_range(date_range, today=None):
+    """
+    Resolve a date range to concrete dates.
+
+    Args:
+        date_range: DURING value (e.g. "LAST_30_DAYS") or an explicit
+            (start, end) tuple of dates or YYYY-MM-DD strings
+        today: Reference date (defaults to date.today())
+
+    Returns:
+        (start_date, end_date) tuple of datetime.date, both inclusive,
+        or None if the range is not a known DURING constant
+    """
+    if isinstance(date_range, (tuple, list)):
+        start, end = date_range
+        return to_date(start), to_date(end)
+
+    resolve = DURING_RANGES.get(str(date_range).upper())
+    if resolve is None:
+        return None
+    return resolve(today or date.today())
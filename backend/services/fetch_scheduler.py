@@ -0,0 +1,111 @@
+"""
+Fetch Scheduler.
+Runs independent report fetches concurrently on a bounded thread pool,
+with a cap on how many requests are in flight per customer.
+"""
+
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_CUSTOMER_LIMIT = 6
+
+
+class FetchScheduler:
+    """
+    Bounded scheduler for report fetches.
+
+    Each task is isolated: an exception raised by one fetch is captured in its
+    result and never affects the other tasks.
+
+    Usage:
+        scheduler = FetchScheduler(max_workers=8)
+        scheduler.add("campaigns", connector.get_campaign_performance, customer_id)
+        for result in scheduler.run():
+            print(result["key"], result["error"])
+    """
+
+    def __init__(
+        self,
+        max_workers=DEFAULT_MAX_WORKERS,
+        per_customer_limit=DEFAULT_PER_CUSTOMER_LIMIT,
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.per_customer_limit = max(1, int(per_customer_limit))
+        self._tasks = []
+
+    def add(self, key, fn, *args, label=None, customer_id=None, **kwargs):
+        """
+        Queue a fetch.
+
+        Args:
+            key: Result key (e.g. the audit section name)
+            fn: Callable performing the fetch
+            *args, **kwargs: Arguments passed to fn
+            label: Human-readable name for progress output (defaults to key)
+            customer_id: Customer the fetch runs against. Defaults to the first
+                positional argument, which is the convention of every
+                AdsConnector.get_* method.
+        """
+        if customer_id is None and args:
+            customer_id = args[0]
+        self._tasks.append(
+            {
+                "key": key,
+                "label": label or key,
+                "fn": fn,
+                "args": args,
+                "kwargs": kwargs,
+                "customer_id": str(customer_id) if customer_id is not None else None,
+            }
+        )
+
+    def run(self):
+        """
+        Execute all queued tasks and yield one result dict per task as it completes.
+
+        Result dict keys: key, label, value, error, elapsed (seconds).
+        """
+        pending = self._tasks
+        self._tasks = []
+        in_flight = {}
+        active = defaultdict(int)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or in_flight:
+                # Dispatch as many tasks as the global and per-customer caps allow
+                deferred = []
+                for task in pending:
+                    customer = task["customer_id"]
+                    if (
+                        len(in_flight) >= self.max_workers
+                        or active[customer] >= self.per_customer_limit
+                    ):
+                        deferred.append(task)
+                        continue
+                    active[customer] += 1
+                    in_flight[pool.submit(self._execute, task)] = task
+                pending = deferred
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    active[task["customer_id"]] -= 1
+                    yield future.result()
+
+    @staticmethod
+    def _execute(task):
+        start = time.perf_counter()
+        value, error = None, None
+        try:
+            value = task["fn"](*task["args"], **task["kwargs"])
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return {
+            "key": task["key"],
+            "label": task["label"],
+            "value": value,
+            "error": error,
+            "elapsed": time.perf_counter() - start,
+        }
@@ -3,6 +3,8 @@ Google Analytics 4 Service.
 Access GA4 data via the Analytics Data API.
 """
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
 
@@ -11,31 +13,21 @@ _plugin_root = Path(__file__).parent.parent.parent
 if str(_plugin_root) not in sys.path:
     sys.path.insert(0, str(_plugin_root))
 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.analytics.data_v1beta.types import (
-    DateRange,
-    Dimension,
-    Metric,
-    RunReportRequest,
-    FilterExpression,
-    Filter,
-    OrderBy,
-    CheckCompatibilityRequest,
-    RunRealtimeReportRequest,
-)
-from google.analytics.admin import AnalyticsAdminServiceClient
-from google.oauth2.credentials import Credentials
 import os
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
+from backend.services import _sdk
 from backend.services.credentials import ensure_credentials
 
-# Load credentials from ~/.mondaybrew/.env - MUST succeed or raise error
-_cred_source = ensure_credentials()
-print(f"[GA4Service] Credentials loaded from: {_cred_source}")
+if TYPE_CHECKING:
+    from google.analytics.data_v1beta.types import FilterExpression
 
 
 class GA4Service:
     def __init__(self):
+        # Load credentials from ~/.mondaybrew/.env - MUST succeed or raise error
+        cred_source = ensure_credentials()
+        print(f"[GA4Service] Credentials loaded from: {cred_source}")
+
         # OAuth 2.0 Authentication (User Context)
         # Uses the same "Master Token" pattern as Sheets and Search Console
 
@@ -53,7 +45,7 @@ class GA4Service:
             return
 
         try:
-            self.creds = Credentials(
+            self.creds = _sdk.Credentials(
                 token=None,
                 refresh_token=refresh_token,
                 token_uri="https://oauth2.googleapis.com/token",
@@ -65,8 +57,10 @@ class GA4Service:
                 ],
             )
 
-            self.client = BetaAnalyticsDataClient(credentials=self.creds)
-            self.admin_client = AnalyticsAdminServiceClient(credentials=self.creds)
+            self.client = _sdk.BetaAnalyticsDataClient(credentials=self.creds)
+            self.admin_client = _sdk.AnalyticsAdminServiceClient(
+                credentials=self.creds
+            )
         except Exception as e:
             print(f"Failed to initialize GA4Service with OAuth: {e}")
             self.client = None
@@ -268,11 +262,13 @@ class GA4Service:
         Generic wrapper for GA4 Data API runReport.
         """
         try:
-            request = RunReportRequest(
+            request = _sdk.RunReportRequest(
                 property=f"properties/{property_id}",
-                dimensions=[Dimension(name=d) for d in dimensions],
-                metrics=[Metric(name=m) for m in metrics],
-                date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+                dimensions=[_sdk.Dimension(name=d) for d in dimensions],
+                metrics=[_sdk.Metric(name=m) for m in metrics],
+                date_ranges=[
+                    _sdk.DateRange(start_date=start_date, end_date=end_date)
+                ],
                 dimension_filter=dimension_filter,
                 metric_filter=metric_filter,
                 limit=limit,
@@ -310,10 +306,10 @@ class GA4Service:
     ) -> Dict[str, Any]:
         """Checks compatibility of dimensions and metrics."""
         try:
-            request = CheckCompatibilityRequest(
+            request = _sdk.CheckCompatibilityRequest(
                 property=f"properties/{property_id}",
-                dimensions=[Dimension(name=d) for d in dimensions],
-                metrics=[Metric(name=m) for m in metrics],
+                dimensions=[_sdk.Dimension(name=d) for d in dimensions],
+                metrics=[_sdk.Metric(name=m) for m in metrics],
             )
             response = self.client.check_compatibility(request)
             return {
@@ -346,10 +342,10 @@ class GA4Service:
     ) -> List[Dict[str, Any]]:
         """Runs a realtime report."""
         try:
-            request = RunRealtimeReportRequest(
+            request = _sdk.RunRealtimeReportRequest(
                 property=f"properties/{property_id}",
-                dimensions=[Dimension(name=d) for d in dimensions],
-                metrics=[Metric(name=m) for m in metrics],
+                dimensions=[_sdk.Dimension(name=d) for d in dimensions],
+                metrics=[_sdk.Metric(name=m) for m in metrics],
                 dimension_filter=dimension_filter,
                 metric_filter=metric_filter,
                 limit=limit,
@@ -464,8 +460,9 @@ class GA4Service:
         mets = ["screenPageViews", "sessions", "conversions"]
 
         order_bys = [
-            OrderBy(
-                metric=OrderBy.MetricOrderBy(metric_name="screenPageViews"), desc=True
+            _sdk.OrderBy(
+                metric=_sdk.OrderBy.MetricOrderBy(metric_name="screenPageViews"),
+                desc=True,
             )
         ]
 
@@ -502,7 +499,9 @@ class GA4Service:
         mets = ["sessions", "conversions"]
 
         order_bys = [
-            OrderBy(metric=OrderBy.MetricOrderBy(metric_name="sessions"), desc=True)
+            _sdk.OrderBy(
+                metric=_sdk.OrderBy.MetricOrderBy(metric_name="sessions"), desc=True
+            )
         ]
 
         data = self.run_report(
@@ -0,0 +1,246 @@
+"""
+Incremental Report Sync.
+Keeps daily report partitions locally and only fetches dates that are missing
+or may still change.
+
+Each (customer, report, date) partition is fetched once with an explicit
+BETWEEN range and stored in SQLite (~/.mondaybrew/sync), including days that
+returned no rows. Only the last SETTLING_DAYS are refetched on every sync,
+since conversions and invalid-click adjustments can still land on them.
+Requested windows are then assembled from the local partitions.
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date, timedelta
+from pathlib import Path
+
+from backend.services.aggregation import aggregate_rows, can_aggregate
+from backend.services.date_ranges import SETTLING_DAYS, iter_days, resolve_date_range
+from backend.services.report_registry import get_report
+
+DEFAULT_SYNC_DIR = Path.home() / ".mondaybrew" / "sync"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS partitions (
+        customer_id TEXT NOT NULL,
+        report TEXT NOT NULL,
+        day TEXT NOT NULL,
+        row_count INTEGER NOT NULL,
+        fetched_at REAL NOT NULL,
+        PRIMARY KEY (customer_id, report, day)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS partition_rows (
+        customer_id TEXT NOT NULL,
+        report TEXT NOT NULL,
+        day TEXT NOT NULL,
+        payload TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS partition_rows_day
+    ON partition_rows (customer_id, report, day)
+    """,
+)
+
+
+class PartitionStore:
+    """
+    SQLite store of daily report rows, one partition per customer/report/day.
+
+    Every operation opens its own connection, so one store can be shared by
+    concurrent fetches.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else DEFAULT_SYNC_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "partitions.sqlite3"
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def stored_days(self, customer_id, report, start, end):
+        """Dates in [start, end] that already have a stored partition."""
+        with closing(self._connect()) as conn:
+            found = conn.execute(
+                "SELECT day FROM partitions WHERE customer_id = ? AND report = ? "
+                "AND day BETWEEN ? AND ?",
+                (str(customer_id), report, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(day) for (day,) in found}
+
+    def replace(self, customer_id, report, start, end, rows):
+        """
+        Store the rows fetched for [start, end], replacing those partitions.
+
+        Every day of the range gets a partition record, so empty days are not
+        fetched again.
+
+        Args:
+            rows: Row dicts with a "date" key (YYYY-MM-DD)
+        """
+        customer_id = str(customer_id)
+        days = [day.isoformat() for day in iter_days(start, end)]
+        counts = dict.fromkeys(days, 0)
+        payloads = []
+        for row in rows:
+            counts[row["date"]] = counts.get(row["date"], 0) + 1
+            payloads.append(
+                (customer_id, report, row["date"], json.dumps(row, default=str))
+            )
+
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM partition_rows WHERE customer_id = ? AND report = ? "
+                "AND day BETWEEN ? AND ?",
+                (customer_id, report, days[0], days[-1]),
+            )
+            conn.executemany("INSERT INTO partition_rows VALUES (?, ?, ?, ?)", payloads)
+            conn.executemany(
+                "INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?, ?)",
+                [(customer_id, report, day, n, now) for day, n in counts.items()],
+            )
+
+    def load(self, customer_id, report, start, end):
+        """Stored rows for [start, end], ordered by date."""
+        with closing(self._connect()) as conn:
+            found = conn.execute(
+                "SELECT payload FROM partition_rows WHERE customer_id = ? "
+                "AND report = ? AND day BETWEEN ? AND ? ORDER BY day, rowid",
+                (str(customer_id), report, start.isoformat(), end.isoformat()),
+            )
+            return [json.loads(payload) for (payload,) in found]
+
+
+class IncrementalSync:
+    """
+    Fetches only the date partitions a report window is missing.
+
+    Usage:
+        sync = IncrementalSync(AdsConnector(), PartitionStore())
+        sync.sync(customer_id, "search_terms", "LAST_30_DAYS")
+        rows = sync.window(customer_id, "search_terms", "LAST_30_DAYS")
+    """
+
+    def __init__(self, connector, store=None, mutable_days=SETTLING_DAYS):
+        self.connector = connector
+        self.store = store or PartitionStore()
+        self.mutable_days = mutable_days
+
+    @staticmethod
+    def supports(spec):
+        """Whether a report can be synced by day and re-aggregated locally."""
+        return (
+            spec.date_field == "segments.date"
+            and spec.limit is None
+            and can_aggregate(spec)
+        )
+
+    def missing_ranges(self, customer_id, report, start, end, today=None):
+        """
+        Contiguous date ranges in [start, end] that must be fetched.
+
+        A day is fetched when it has no stored partition or falls within the
+        last mutable_days before today.
+        """
+        today = today or date.today()
+        mutable_from = today - timedelta(days=self.mutable_days)
+        stored = self.store.stored_days(customer_id, report, start, end)
+
+        ranges = []
+        for day in iter_days(start, end):
+            if day in stored and day < mutable_from:
+                continue
+            if ranges and ranges[-1][1] == day - timedelta(days=1):
+                ranges[-1][1] = day
+            else:
+                ranges.append([day, day])
+
+        if get_report(report).single_day:
+            return [
+                (day, day) for first, last in ranges for day in iter_days(first, last)
+            ]
+        return [tuple(r) for r in ranges]
+
+    def sync(self, customer_id, report, date_range=None, today=None):
+        """
+        Bring the local partitions of a report window up to date.
+
+        Returns:
+            Dict with the fetched and reused day counts, API calls and rows
+            (errors are raised by the connector)
+        """
+        spec = get_report(report)
+        start, end = self._window(spec, date_range, today)
+        ranges = self.missing_ranges(customer_id, report, start, end, today)
+
+        rows_fetched = 0
+        for first, last in ranges:
+            rows = self.connector.run_report(
+                report,
+                customer_id,
+                date_range=(first, last),
+                segment_by_date=True,
+                raise_errors=True,
+            )
+            self.store.replace(customer_id, report, first, last, rows)
+            rows_fetched += len(rows)
+
+        total_days = (end - start).days + 1
+        fetched_days = sum((last - first).days + 1 for first, last in ranges)
+        return {
+            "report": report,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "fetched_days": fetched_days,
+            "reused_days": total_days - fetched_days,
+            "api_calls": len(ranges),
+            "rows_fetched": rows_fetched,
+        }
+
+    def window(
+        self, customer_id, report, date_range=None, aggregate=True, today=None
+    ):
+        """
+        Assemble a report window from local partitions.
+
+        Args:
+            aggregate: Return the layout of the non-incremental report: its
+                daily rows for reports that select segments.date themselves,
+                otherwise one row per entity carrying its latest attributes.
+                When False, return the stored daily rows with their "date".
+        """
+        spec = get_report(report)
+        start, end = self._window(spec, date_range, today)
+        rows = self.store.load(customer_id, report, start, end)
+        if not aggregate:
+            return rows
+        if "segments.date" in spec.fields:
+            names = [column.name for column in spec.columns]
+            return [{name: row.get(name) for name in names} for row in rows]
+        return aggregate_rows(spec, rows, latest_attributes=True)
+
+    def fetch(self, customer_id, report, date_range=None):
+        """Sync a report window, then return it as window() assembles it."""
+        self.sync(customer_id, report, date_range)
+        return self.window(customer_id, report, date_range)
+
+    @staticmethod
+    def _window(spec, date_range, today):
+        window = resolve_date_range(date_range or spec.default_date_range, today)
+        if window is None:
+            raise ValueError(f"Cannot resolve date range '{date_range}'")
+        return window
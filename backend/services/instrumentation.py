@@ -0,0 +1,444 @@
+"""
+API call instrumentation.
+Records every search_stream and mutate call an AdsConnector makes: time to
+first batch, time spent waiting on the stream, time the caller spent
+decoding between batches, batches, rows, operations and bytes received.
+
+Calls are kept in memory and summarized per report (slowest first), so the
+reports that dominate an audit's latency can be found per account; the
+summary is written as JSON next to the audit output. Exporters receive each
+finished call, e.g. to feed OpenTelemetry or Prometheus.
+
+Usage:
+    metrics = ConnectorMetrics(exporters=[PrometheusExporter()])
+    ads = AdsConnector(metrics=metrics)
+    ads.get_keyword_performance("1234567890")
+    metrics.write("output/audit_1234567890_metrics.json", "1234567890")
+"""
+
+import contextlib
+import contextvars
+import json
+import re
+import threading
+import time
+from datetime import datetime
+
+from backend.services.retry import describe_error
+
+_FROM = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+# Report name of the search_stream calls made inside report_label()
+_report_label = contextvars.ContextVar("report_label", default=None)
+
+# Per-report fields added up in summaries
+_TOTALS = (
+    "total_time",
+    "stream_time",
+    "decode_time",
+    "batches",
+    "rows",
+    "operations",
+    "bytes",
+)
+
+
+@contextlib.contextmanager
+def report_label(name):
+    """Attribute the API calls made inside the block to a report name."""
+    token = _report_label.set(name)
+    try:
+        yield
+    finally:
+        _report_label.reset(token)
+
+
+def message_bytes(message):
+    """Serialized size of a proto-plus or protobuf message (0 if unknown)."""
+    cls = type(message)
+    if callable(getattr(cls, "pb", None)):
+        message = cls.pb(message)
+    byte_size = getattr(type(message), "ByteSize", None)
+    return byte_size(message) if byte_size is not None else 0
+
+
+def _round(value):
+    return round(value, 6) if isinstance(value, float) else value
+
+
+def _request_customer_id(args, kwargs):
+    request = kwargs.get("request") or (args[0] if args else None)
+    customer_id = kwargs.get("customer_id") or getattr(request, "customer_id", None)
+    return str(customer_id) if customer_id else None
+
+
+class ApiCall:
+    """Measurements of one API call (all times in seconds)."""
+
+    __slots__ = (
+        "kind",
+        "report",
+        "customer_id",
+        "started_at",
+        "start",
+        "time_to_first_batch",
+        "stream_time",
+        "decode_time",
+        "total_time",
+        "batches",
+        "rows",
+        "operations",
+        "bytes",
+        "error",
+        "finished",
+    )
+
+    def __init__(self, kind, report, customer_id):
+        self.kind = kind
+        self.report = report
+        self.customer_id = customer_id
+        self.started_at = datetime.now().isoformat(timespec="milliseconds")
+        self.start = time.perf_counter()
+        self.time_to_first_batch = None
+        self.stream_time = 0.0
+        self.decode_time = 0.0
+        self.total_time = None
+        self.batches = 0
+        self.rows = 0
+        self.operations = 0
+        self.bytes = 0
+        self.error = None
+        self.finished = False
+
+    def to_dict(self):
+        return {
+            name: _round(getattr(self, name))
+            for name in self.__slots__
+            if name != "start"
+        }
+
+
+class _InstrumentedStream:
+    """
+    Iterator over a search_stream response that times each batch.
+
+    Time spent inside next() is stream time (waiting on the API); time
+    between two next() calls is the caller decoding the previous batch.
+    """
+
+    def __init__(self, response, call, metrics):
+        self._response = iter(response)
+        self._call = call
+        self._metrics = metrics
+        self._returned_at = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        call = self._call
+        now = time.perf_counter()
+        if self._returned_at is not None:
+            call.decode_time += now - self._returned_at
+        try:
+            batch = next(self._response)
+        except StopIteration:
+            call.stream_time += time.perf_counter() - now
+            self._metrics.finish(call)
+            raise
+        except Exception as ex:
+            call.stream_time += time.perf_counter() - now
+            self._metrics.finish(call, ex)
+            raise
+
+        returned_at = time.perf_counter()
+        call.stream_time += returned_at - now
+        if call.time_to_first_batch is None:
+            call.time_to_first_batch = returned_at - call.start
+        call.batches += 1
+        call.rows += len(batch.results)
+        if self._metrics.measure_bytes:
+            call.bytes += message_bytes(batch)
+        self._returned_at = returned_at
+        return batch
+
+
+class InstrumentedService:
+    """
+    Service stub proxy recording search_stream and mutate calls.
+
+    Everything else (path helpers, search...) is passed through untouched.
+    """
+
+    def __init__(self, service, metrics):
+        self._service = service
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        attribute = getattr(self._service, name)
+        if name == "search_stream":
+            return self._search_stream(attribute)
+        if name.startswith("mutate"):
+            return self._mutate(name, attribute)
+        return attribute
+
+    def _search_stream(self, search_stream):
+        metrics = self._metrics
+
+        def call(*args, **kwargs):
+            report = _report_label.get()
+            if report is None:
+                request = kwargs.get("request")
+                query = kwargs.get("query") or getattr(request, "query", "")
+                match = _FROM.search(query or "")
+                report = match.group(1) if match else "search_stream"
+            api_call = metrics.start(
+                "search_stream", report, _request_customer_id(args, kwargs)
+            )
+            try:
+                response = search_stream(*args, **kwargs)
+            except Exception as ex:
+                metrics.finish(api_call, ex)
+                raise
+            return _InstrumentedStream(response, api_call, metrics)
+
+        return call
+
+    def _mutate(self, method, mutate):
+        metrics = self._metrics
+
+        def call(*args, **kwargs):
+            api_call = metrics.start(
+                "mutate",
+                _report_label.get() or method,
+                _request_customer_id(args, kwargs),
+            )
+            request = kwargs.get("request") or (args[0] if args else None)
+            operations = kwargs.get("operations")
+            if operations is None:
+                operations = getattr(request, "operations", None) or ()
+            api_call.operations = len(operations)
+            try:
+                response = mutate(*args, **kwargs)
+            except Exception as ex:
+                metrics.finish(api_call, ex)
+                raise
+            api_call.rows = len(getattr(response, "results", None) or ())
+            if metrics.measure_bytes:
+                api_call.bytes = message_bytes(response)
+            metrics.finish(api_call)
+            return response
+
+        return call
+
+
+class ConnectorMetrics:
+    """
+    Thread-safe store of the API calls of one or more connectors.
+
+    Args:
+        exporters: Objects with an export(call) method, called with every
+            finished ApiCall (see OpenTelemetryExporter, PrometheusExporter)
+        measure_bytes: Compute the serialized size of every response batch
+    """
+
+    def __init__(self, exporters=(), measure_bytes=True):
+        self.exporters = list(exporters)
+        self.measure_bytes = measure_bytes
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def wrap(self, service):
+        """Instrumented proxy of a service stub."""
+        return InstrumentedService(service, self)
+
+    def start(self, kind, report, customer_id=None):
+        call = ApiCall(kind, report, customer_id)
+        with self._lock:
+            self.calls.append(call)
+        return call
+
+    def finish(self, call, error=None):
+        if call.finished:
+            return
+        call.total_time = time.perf_counter() - call.start
+        if error is not None:
+            call.error = describe_error(error)
+        call.finished = True
+        for exporter in self.exporters:
+            try:
+                exporter.export(call)
+            except Exception as e:
+                print(f"Metrics export failed: {e}")
+
+    def mark(self):
+        """Position to summarize from (e.g. the start of one audit)."""
+        with self._lock:
+            return len(self.calls)
+
+    def select(self, customer_id=None, since=0):
+        with self._lock:
+            calls = self.calls[since:]
+        if customer_id is not None:
+            calls = [c for c in calls if c.customer_id == str(customer_id)]
+        return calls
+
+    def summary(self, customer_id=None, since=0):
+        """
+        Per-report totals, slowest first.
+
+        Returns:
+            Dict with totals, reports (one entry per report with calls,
+            errors, max time_to_first_batch and the summed _TOTALS) and the
+            individual calls
+        """
+        calls = self.select(customer_id, since)
+        reports = {}
+        for call in calls:
+            entry = reports.get((call.kind, call.report))
+            if entry is None:
+                entry = reports[(call.kind, call.report)] = {
+                    "report": call.report,
+                    "kind": call.kind,
+                    "calls": 0,
+                    "errors": 0,
+                    "time_to_first_batch": None,
+                    **dict.fromkeys(_TOTALS, 0),
+                }
+            entry["calls"] += 1
+            entry["errors"] += call.error is not None
+            for field in _TOTALS:
+                entry[field] += getattr(call, field) or 0
+            if call.time_to_first_batch is not None:
+                entry["time_to_first_batch"] = max(
+                    entry["time_to_first_batch"] or 0, call.time_to_first_batch
+                )
+
+        ranked = sorted(reports.values(), key=lambda e: e["total_time"], reverse=True)
+        totals = {"calls": len(calls), "errors": sum(e["errors"] for e in ranked)}
+        totals.update((field, sum(e[field] for e in ranked)) for field in _TOTALS)
+        return {
+            "customer_id": str(customer_id) if customer_id is not None else None,
+            "generated_at": datetime.now().isoformat(),
+            "totals": {k: _round(v) for k, v in totals.items()},
+            "reports": [{k: _round(v) for k, v in e.items()} for e in ranked],
+            "calls": [call.to_dict() for call in calls],
+        }
+
+    def write(self, path, customer_id=None, since=0):
+        """Write summary() as JSON; returns the summary."""
+        summary = self.summary(customer_id, since)
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+
+# ============================================
+# Exporters
+# ============================================
+
+
+class OpenTelemetryExporter:
+    """
+    Records finished calls as OpenTelemetry histograms and counters
+    (requires opentelemetry-api; a configured MeterProvider does the export).
+
+    Args:
+        meter: Meter to create the instruments on (default: the global
+            provider's "mb-google-ads-audit" meter)
+    """
+
+    def __init__(self, meter=None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "opentelemetry-api is required: pip install opentelemetry-api"
+                ) from e
+            meter = metrics.get_meter("mb-google-ads-audit")
+        self.durations = meter.create_histogram(
+            "google_ads.call.duration", unit="s", description="API call duration"
+        )
+        self.first_batch = meter.create_histogram(
+            "google_ads.call.time_to_first_batch",
+            unit="s",
+            description="Time to the first streamed batch",
+        )
+        self.decode = meter.create_histogram(
+            "google_ads.call.decode_time", unit="s", description="Decode time"
+        )
+        self.rows = meter.create_counter("google_ads.rows", description="Rows received")
+        self.bytes = meter.create_counter(
+            "google_ads.bytes", unit="By", description="Bytes received"
+        )
+        self.errors = meter.create_counter(
+            "google_ads.errors", description="Failed calls"
+        )
+
+    def export(self, call):
+        attributes = {"kind": call.kind, "report": call.report}
+        self.durations.record(call.total_time, attributes)
+        if call.time_to_first_batch is not None:
+            self.first_batch.record(call.time_to_first_batch, attributes)
+        self.decode.record(call.decode_time, attributes)
+        self.rows.add(call.rows, attributes)
+        self.bytes.add(call.bytes, attributes)
+        if call.error is not None:
+            self.errors.add(1, attributes)
+
+
+class PrometheusExporter:
+    """
+    Records finished calls as Prometheus metrics (requires prometheus_client).
+
+    Args:
+        registry: CollectorRegistry to register on (default: the global one,
+            served by prometheus_client.start_http_server or pushed with
+            push_to_gateway)
+    """
+
+    def __init__(self, registry=None):
+        try:
+            import prometheus_client as prometheus
+        except ImportError as e:
+            raise ImportError(
+                "prometheus_client is required: pip install prometheus-client"
+            ) from e
+        registry = registry or prometheus.REGISTRY
+        labels = ("kind", "report")
+        self.durations = prometheus.Histogram(
+            "google_ads_call_seconds",
+            "API call duration",
+            labels,
+            registry=registry,
+        )
+        self.first_batch = prometheus.Histogram(
+            "google_ads_time_to_first_batch_seconds",
+            "Time to the first streamed batch",
+            labels,
+            registry=registry,
+        )
+        self.decode = prometheus.Counter(
+            "google_ads_decode_seconds", "Decode time", labels, registry=registry
+        )
+        self.rows = prometheus.Counter(
+            "google_ads_rows", "Rows received", labels, registry=registry
+        )
+        self.bytes = prometheus.Counter(
+            "google_ads_bytes", "Bytes received", labels, registry=registry
+        )
+        self.errors = prometheus.Counter(
+            "google_ads_errors", "Failed calls", labels, registry=registry
+        )
+
+    def export(self, call):
+        labels = (call.kind, call.report)
+        self.durations.labels(*labels).observe(call.total_time)
+        if call.time_to_first_batch is not None:
+            self.first_batch.labels(*labels).observe(call.time_to_first_batch)
+        self.decode.labels(*labels).inc(call.decode_time)
+        self.rows.labels(*labels).inc(call.rows)
+        self.bytes.labels(*labels).inc(call.bytes)
+        if call.error is not None:
+            self.errors.labels(*labels).inc()
@@ -0,0 +1,140 @@
+"""
+Multi-Window Reports.
+Derives several trailing windows, and their period-over-period changes, from
+one fetch of daily rows.
+
+Comparing the last 7, 30 and 90 days with the periods before them would take
+six queries per report. Instead, the widest span is fetched once segmented by
+date, and every window is rolled up locally (see aggregation.aggregate_rows).
+"""
+
+from bisect import bisect_left
+from datetime import date, timedelta
+
+from backend.services.aggregation import (
+    aggregate_rows,
+    group_columns,
+    group_key,
+    metric_columns,
+    summarize_rows,
+)
+
+DEFAULT_WINDOWS = (7, 30, 90)
+
+
+def window_label(days):
+    """DURING-style name of a trailing window (e.g. "LAST_30_DAYS")."""
+    return f"LAST_{days}_DAYS"
+
+
+def fetch_span(windows, today=None, compare=True):
+    """
+    Date range covering every window (and the periods before them).
+
+    Like the LAST_N_DAYS ranges, windows end yesterday.
+
+    Returns:
+        (start_date, end_date) tuple of datetime.date, both inclusive
+    """
+    if not windows or min(windows) < 1:
+        raise ValueError("windows must be positive day counts")
+    end = (today or date.today()) - timedelta(days=1)
+    days = max(windows) * (2 if compare else 1)
+    return end - timedelta(days=days - 1), end
+
+
+def split_windows(spec, daily_rows, windows, end, compare=True):
+    """
+    Roll daily rows up into trailing windows ending on `end`.
+
+    Args:
+        spec: ReportSpec the rows were decoded with (see can_aggregate)
+        daily_rows: Row dicts with a "date" key (YYYY-MM-DD), covering
+            fetch_span(windows, compare=compare)
+        windows: Window lengths in days
+        end: Last day of every window (date)
+        compare: Also roll up the equally long period before each window, and
+            add <metric>_previous, <metric>_change and <metric>_change_pct
+            values to its rows and totals
+
+    Returns:
+        Dict of window label -> {"start", "end", "days", "rows", "totals"}
+        (plus "previous_totals" when comparing), ordered by window length.
+        Rows have one row per entity, with status-like attributes as of the
+        last day they appear on.
+    """
+    windows = sorted(set(windows))
+    # Oldest day of each window, then of each previous period
+    starts = [end - timedelta(days=days - 1) for days in windows]
+    if compare:
+        starts += [end - timedelta(days=2 * days - 1) for days in windows]
+    bounds = sorted({start.isoformat() for start in starts})
+    end_iso = end.isoformat()
+
+    # One pass: file each row under the latest window start it is not
+    # older than. Every window then covers a contiguous run of these bands.
+    bands = [[] for _ in bounds]
+    for row in sorted(daily_rows, key=lambda row: row["date"]):
+        day = row["date"]
+        if day > end_iso:
+            continue
+        index = bisect_left(bounds, day)
+        if index == len(bounds) or bounds[index] != day:
+            index -= 1
+        if index >= 0:
+            bands[index].append(row)
+
+    def rows_between(first, last):
+        # Rows dated first..last, in date order
+        lo = bounds.index(first.isoformat())
+        hi = bounds.index(last.isoformat()) if last is not None else len(bounds)
+        return [row for band in bands[lo:hi] for row in band]
+
+    result = {}
+    for days in windows:
+        start = end - timedelta(days=days - 1)
+        current = rows_between(start, None)
+        entry = {
+            "start": start.isoformat(),
+            "end": end_iso,
+            "days": days,
+            "rows": aggregate_rows(spec, current, latest_attributes=True),
+            "totals": summarize_rows(spec, current),
+        }
+        if compare:
+            previous = rows_between(start - timedelta(days=days), start)
+            previous_rows = aggregate_rows(spec, previous, latest_attributes=True)
+            entry["previous_totals"] = summarize_rows(spec, previous)
+            add_changes(entry["totals"], entry["previous_totals"])
+            compare_rows(spec, entry["rows"], previous_rows)
+        result[window_label(days)] = entry
+    return result
+
+
+def compare_rows(spec, rows, previous_rows):
+    """
+    Add previous-period values and changes to aggregated rows, in place.
+
+    Rows are matched on their grouping columns (see aggregate_rows with
+    latest_attributes). Entities without spend in the previous period get 0
+    as their previous values.
+    """
+    metrics = metric_columns(spec)
+    keys = group_columns(spec, latest_attributes=True)
+    previous_by_key = {group_key(row, keys): row for row in previous_rows}
+    for row in rows:
+        previous = previous_by_key.get(group_key(row, keys), {})
+        add_changes(row, {name: previous.get(name, 0) for name in metrics})
+    return rows
+
+
+def add_changes(values, previous):
+    """Add <metric>_previous, _change and _change_pct keys to values, in place."""
+    for name, before in previous.items():
+        now = values.get(name) or 0
+        before = before or 0
+        values[f"{name}_previous"] = before
+        values[f"{name}_change"] = now - before
+        values[f"{name}_change_pct"] = (now - before) / before if before else None
+    return values
+
@@ -0,0 +1,181 @@
+"""
+Rate Limiter.
+Thread-safe token buckets shared by every API call of a process.
+
+Google Ads enforces request rate limits per developer token across all
+accounts it touches, plus limits per customer, so concurrent audits must
+draw from shared buckets rather than each pacing themselves. The developer
+token bucket adapts: quota errors halve its rate, and successful requests
+restore it gradually.
+"""
+
+import threading
+import time
+
+# Conservative defaults that stay clear of RESOURCE_EXHAUSTED on basic access
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_BURST = 20
+# Per-customer cap of fleet runs (single-account audits have none by default)
+DEFAULT_PER_CUSTOMER_REQUESTS_PER_SECOND = 4.0
+DEFAULT_PER_CUSTOMER_BURST = 8
+
+# Adaptive rate bounds, as fractions of the configured rate
+MIN_RATE_FACTOR = 0.1
+RECOVERY_STEP = 0.05
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request takes one. acquire() blocks until a token is available.
+
+    Usage:
+        limiter = TokenBucket(rate=10, capacity=20)
+        limiter.acquire()
+        response = ga_service.search_stream(...)
+    """
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_SECOND, capacity=DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.base_rate = self.rate
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Take tokens, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if acquired, False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.acquired += tokens
+                    self.waited += now - start
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def backoff(self, factor=0.5):
+        """Cut the refill rate after a quota error (down to MIN_RATE_FACTOR)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.base_rate * MIN_RATE_FACTOR, self.rate * factor)
+            self._tokens = min(self._tokens, 0.0)
+
+    def recover(self):
+        """Step the refill rate back towards its configured value."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_STEP)
+
+    def stats(self):
+        """Tokens handed out, total seconds callers spent waiting, current rate."""
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "waited": round(self.waited, 3),
+                "rate": round(self.rate, 3),
+            }
+
+
+class RateLimiter:
+    """
+    Developer-token bucket plus one bucket per customer.
+
+    Every request takes a token from the shared bucket and, when
+    per_customer_rate is set, from its customer's bucket, so one busy account
+    cannot starve the rest of a fleet. The per-customer cap is off by default:
+    a single-account audit only needs the developer-token bucket, and fleet
+    runs pass DEFAULT_PER_CUSTOMER_REQUESTS_PER_SECOND.
+
+    Usage:
+        limiter = shared_limiter(developer_token)
+        limiter.acquire(customer_id)
+    """
+
+    def __init__(
+        self,
+        rate=DEFAULT_REQUESTS_PER_SECOND,
+        burst=DEFAULT_BURST,
+        per_customer_rate=None,
+        per_customer_burst=DEFAULT_PER_CUSTOMER_BURST,
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.per_customer_rate = per_customer_rate
+        self.per_customer_burst = per_customer_burst
+        self._customers = {}
+        self._lock = threading.Lock()
+
+    def _customer_bucket(self, customer_id):
+        with self._lock:
+            bucket = self._customers.get(customer_id)
+            if bucket is None:
+                bucket = self._customers[customer_id] = TokenBucket(
+                    self.per_customer_rate, self.per_customer_burst
+                )
+            return bucket
+
+    def acquire(self, customer_id=None):
+        """Block until both the customer's and the shared bucket allow a request."""
+        if customer_id is not None and self.per_customer_rate:
+            self._customer_bucket(str(customer_id)).acquire()
+        self.bucket.acquire()
+
+    def backoff(self):
+        self.bucket.backoff()
+
+    def recover(self):
+        self.bucket.recover()
+
+    def stats(self):
+        return self.bucket.stats()
+
+
+_SHARED_LIMITERS = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_limiter(developer_token, **config):
+    """
+    Process-wide RateLimiter for a developer token.
+
+    The first call for a token creates the limiter with the given config
+    (RateLimiter arguments); later calls return the same instance.
+    """
+    with _SHARED_LOCK:
+        limiter = _SHARED_LIMITERS.get(developer_token)
+        if limiter is None:
+            limiter = _SHARED_LIMITERS[developer_token] = RateLimiter(**config)
+        return limiter
@@ -0,0 +1,254 @@
+"""
+Report Cache.
+Persistent on-disk cache for GAQL report responses (~/.mondaybrew/cache).
+
+Entries are keyed on the customer ID, the normalized GAQL text and the
+resolved date window, and hold the raw serialized GoogleAdsRow messages of
+the response. The cache therefore sits below row decoding: every output mode
+of AdsConnector.run_report (rows, streams, frames, Arrow) is served from it.
+
+Expiry:
+    - Windows whose dates have all settled are cached indefinitely
+    - Windows ending within the last SETTLING_DAYS get RECENT_TTL
+    - Windows including today get LIVE_TTL
+    - Account settings reports (budgets, recommendations, ...) use REPORT_TTLS
+
+The cache is bounded by size and evicts least recently used entries first.
+"""
+
+import hashlib
+import re
+import sqlite3
+import struct
+import time
+import zlib
+from contextlib import closing
+from datetime import date, timedelta
+from pathlib import Path
+
+from backend.services.date_ranges import SETTLING_DAYS, resolve_date_range
+
+DEFAULT_CACHE_DIR = Path.home() / ".mondaybrew" / "cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Seconds an entry stays valid, by how recent the queried window is
+LIVE_TTL = 15 * 60
+RECENT_TTL = 6 * 60 * 60
+UNDATED_TTL = 60 * 60
+
+# Reports describing current account state rather than dated metrics
+REPORT_TTLS = {
+    "change_history": 15 * 60,
+    "recommendations": 60 * 60,
+    "campaign_budgets": 60 * 60,
+    "bidding_strategies": 60 * 60,
+    "negative_keywords": 60 * 60,
+    "conversion_actions": 6 * 60 * 60,
+}
+
+_LENGTH = struct.Struct(">I")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    key TEXT PRIMARY KEY,
+    report TEXT NOT NULL,
+    customer_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL,
+    row_count INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+)
+"""
+
+
+def normalize_query(query):
+    """Collapse whitespace so formatting changes do not miss the cache."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
+def _encode(records):
+    """Pack serialized rows as length-prefixed records and compress."""
+    parts = []
+    for record in records:
+        parts.append(_LENGTH.pack(len(record)))
+        parts.append(record)
+    return zlib.compress(b"".join(parts), 6)
+
+
+def _decode(payload):
+    data = zlib.decompress(payload)
+    records = []
+    offset = 0
+    while offset < len(data):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        records.append(data[offset : offset + length])
+        offset += length
+    return records
+
+
+class ReportCache:
+    """
+    SQLite-backed, size-bounded LRU cache of report responses.
+
+    Safe to share between the threads of a FetchScheduler: every operation
+    opens its own connection.
+
+    Usage:
+        cache = ReportCache()
+        connector = AdsConnector(cache=cache)
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "reports.sqlite3"
+        self.max_bytes = int(max_bytes)
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    # --- Keys & expiry ---
+
+    @staticmethod
+    def make_key(customer_id, query, window=None):
+        """Cache key for a query against one customer and resolved window."""
+        parts = [str(customer_id), normalize_query(query)]
+        if window:
+            parts.extend(day.isoformat() for day in window)
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def resolve_window(spec, date_range=None, today=None):
+        """Concrete (start, end) dates queried by a report, or None if undated."""
+        if not spec.date_field:
+            return None
+        return resolve_date_range(date_range or spec.default_date_range, today)
+
+    @staticmethod
+    def ttl_for(report, window, today=None):
+        """
+        Seconds a response stays valid, or None to cache it indefinitely.
+
+        Args:
+            report: Registered report name
+            window: (start, end) dates of the query, or None if undated
+            today: Reference date (defaults to date.today())
+        """
+        if report in REPORT_TTLS:
+            return REPORT_TTLS[report]
+        if window is None:
+            return UNDATED_TTL
+
+        today = today or date.today()
+        end = window[1]
+        if end >= today:
+            return LIVE_TTL
+        if end > today - timedelta(days=SETTLING_DAYS):
+            return RECENT_TTL
+        return None
+
+    # --- Storage ---
+
+    def get(self, key):
+        """Return the cached serialized rows for key, or None on a miss."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            found = conn.execute(
+                "SELECT payload, expires_at FROM reports WHERE key = ?", (key,)
+            ).fetchone()
+            if found is None:
+                return None
+            payload, expires_at = found
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM reports WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE reports SET last_access = ? WHERE key = ?", (now, key)
+            )
+        return _decode(payload)
+
+    def put(self, key, report, customer_id, records, ttl=None):
+        """
+        Store serialized rows under key.
+
+        Args:
+            key: Cache key from make_key()
+            report: Report name (for stats and invalidation)
+            customer_id: Customer the rows belong to
+            records: Iterable of serialized GoogleAdsRow bytes
+            ttl: Seconds until expiry, or None to keep indefinitely
+        """
+        records = list(records)
+        payload = _encode(records)
+        if len(payload) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    report,
+                    str(customer_id),
+                    now,
+                    expires_at,
+                    now,
+                    len(records),
+                    len(payload),
+                    payload,
+                ),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        """Drop expired entries, then least recently used ones until under budget."""
+        conn.execute(
+            "DELETE FROM reports WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM reports").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        stale = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM reports ORDER BY last_access"
+        ):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM reports WHERE key = ?", stale)
+
+    def invalidate(self, customer_id=None, report=None):
+        """Delete entries for a customer and/or report (everything if neither)."""
+        conditions, params = [], []
+        if customer_id is not None:
+            conditions.append("customer_id = ?")
+            params.append(str(customer_id))
+        if report is not None:
+            conditions.append("report = ?")
+            params.append(report)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with closing(self._connect()) as conn, conn:
+            deleted = conn.execute(f"DELETE FROM reports{where}", params).rowcount
+        return deleted
+
+    def stats(self):
+        """Entry count, stored rows and compressed bytes."""
+        with closing(self._connect()) as conn:
+            entries, rows, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(row_count), 0), "
+                "COALESCE(SUM(size), 0) FROM reports"
+            ).fetchone()
+        return {"entries": entries, "rows": rows, "bytes": size}
@@ -0,0 +1,1131 @@
+"""
+Google Ads Report Registry.
+Declarative specs for the read-only GAQL reports served by AdsConnector.
+
+Each ReportSpec names the resource, the selected fields, the filters and the
+output columns of one report. AdsConnector.run_report() executes any
+registered spec, so adding a report is a register_report() call rather than
+another hand-written get_* method.
+"""
+
+import copy
+from operator import attrgetter
+
+MICROS = 1000000.0
+
+# Column source placeholder: the customer ID the report was run for
+CUSTOMER_ID = object()
+
+
+# ============================================
+# Column transforms
+# ============================================
+
+
+def micros(value):
+    """Convert a *_micros value to currency units."""
+    return value / MICROS
+
+
+def micros_or_zero(value):
+    """Convert micros to currency units, mapping unset values to 0."""
+    return value / MICROS if value else 0
+
+
+def enum_name_or(default):
+    """Build a transform returning an enum's name, or default when unset."""
+
+    def transform(value):
+        return value.name if value else default
+
+    return transform
+
+
+def const(value):
+    """Column source that always yields value."""
+    return lambda row: value
+
+
+# Integer-valued fields that do not follow the *_micros / *_id naming
+_INTEGER_FIELDS = {
+    "clicks",
+    "impressions",
+    "combined_clicks",
+    "combined_queries",
+    "organic_clicks",
+    "organic_queries",
+    "organic_impressions",
+    "quality_score",
+    "hour",
+}
+
+
+def _infer_dtype(source, transform):
+    """Storage dtype of a column for columnar decoding."""
+    if not isinstance(source, str):
+        return "object"
+
+    field = source.rsplit(".", 1)[-1]
+    if transform in (micros, micros_or_zero):
+        # Raw micros are stored unscaled and converted once at the end.
+        # Averages such as average_cpc are micros-valued doubles.
+        return "int64" if field.endswith("_micros") else "float64"
+    if transform is not None:
+        return "object"
+
+    if (
+        field.endswith("_micros")
+        or field == "id"
+        or field.endswith("_id")
+        or field in _INTEGER_FIELDS
+    ):
+        return "int64"
+    if source.startswith("metrics."):
+        return "float64"
+    return "object"
+
+
+class Column:
+    """
+    One output column of a report.
+
+    Args:
+        name: Key in the output row dict
+        source: Dotted attribute path on the GoogleAdsRow (e.g. "campaign.status.name"),
+            a callable taking the row, or CUSTOMER_ID
+        transform: Optional callable applied to the extracted value
+        dtype: Storage dtype for columnar decoding ("int64", "float64" or "object").
+            Inferred from the source field when omitted.
+    """
+
+    __slots__ = ("name", "source", "transform", "dtype", "raw_getter", "getter")
+
+    def __init__(self, name, source, transform=None, dtype=None):
+        self.name = name
+        self.source = source
+        self.transform = transform
+        self.dtype = dtype or _infer_dtype(source, transform)
+
+        # Precompile the accessor once, so decoding a row is a single call per column
+        getter = attrgetter(source) if isinstance(source, str) else source
+        self.raw_getter = getter
+        if transform is not None and source is not CUSTOMER_ID:
+            extract = getter
+            getter = lambda row: transform(extract(row))
+        self.getter = getter
+
+    @property
+    def is_micros(self):
+        return self.transform in (micros, micros_or_zero)
+
+
+class ReportSpec:
+    """
+    Declarative definition of a GAQL report.
+
+    Args:
+        name: Registry key
+        resource: GAQL FROM resource
+        fields: GAQL SELECT fields
+        columns: Output Column list (defines the row dict layout)
+        where: Static WHERE conditions
+        order_by: Optional ORDER BY clause
+        limit: Optional LIMIT
+        date_field: Field used for the DURING filter, or None for undated reports
+        default_date_range: DURING value used when the caller passes none
+        description: Used in error messages ("Error fetching {description} ...")
+        as_frame: Return a pandas DataFrame instead of a list of dicts
+        single_day: The resource only accepts one day per query (e.g. click_view)
+
+    A date range is either a DURING value or an explicit (start, end) tuple of
+    dates or YYYY-MM-DD strings, which is rendered as BETWEEN.
+    """
+
+    def __init__(
+        self,
+        name,
+        resource,
+        fields,
+        columns,
+        where=(),
+        order_by=None,
+        limit=None,
+        date_field="segments.date",
+        default_date_range="LAST_30_DAYS",
+        description=None,
+        as_frame=False,
+        single_day=False,
+    ):
+        self.name = name
+        self.resource = resource
+        self.fields = list(fields)
+        self.columns = list(columns)
+        self.where = list(where)
+        self.order_by = order_by
+        self.limit = limit
+        self.date_field = date_field
+        self.default_date_range = default_date_range
+        self.description = description or name.replace("_", " ")
+        self.as_frame = as_frame
+        self.single_day = single_day
+
+    def date_condition(self, date_range=None):
+        """GAQL condition restricting the report to a date range."""
+        date_range = date_range or self.default_date_range
+        if isinstance(date_range, (tuple, list)):
+            start, end = (str(day) for day in date_range)
+            return f"{self.date_field} BETWEEN '{start}' AND '{end}'"
+        return f"{self.date_field} DURING {date_range}"
+
+    def build_query(self, date_range=None, extra_where=()):
+        """Render the GAQL query for this report."""
+        conditions = []
+        if self.date_field:
+            conditions.append(self.date_condition(date_range))
+        conditions.extend(self.where)
+        conditions.extend(extra_where)
+
+        lines = ["SELECT", ",\n".join(f"    {field}" for field in self.fields)]
+        lines.append(f"FROM {self.resource}")
+        if conditions:
+            lines.append("WHERE " + "\n    AND ".join(conditions))
+        if self.order_by:
+            lines.append(f"ORDER BY {self.order_by}")
+        if self.limit:
+            lines.append(f"LIMIT {self.limit}")
+        return "\n".join(lines)
+
+    def segmented_by_date(self):
+        """
+        Variant of this report with one row per day.
+
+        Adds segments.date to the query and a leading "date" column.
+        """
+        if self.date_field != "segments.date":
+            raise ValueError(f"Report '{self.name}' cannot be segmented by date")
+        if any(column.name == "date" for column in self.columns):
+            return self
+
+        spec = copy.copy(self)
+        spec.fields = ["segments.date"] + [
+            field for field in self.fields if field != "segments.date"
+        ]
+        spec.columns = [Column("date", "segments.date")] + self.columns
+        return spec
+
+    def decoder(self, customer_id):
+        """Return a function converting one GoogleAdsRow into an output dict."""
+        customer_id = str(customer_id)
+        getters = tuple(
+            (
+                column.name,
+                (lambda row: customer_id)
+                if column.source is CUSTOMER_ID
+                else column.getter,
+            )
+            for column in self.columns
+        )
+
+        def decode(row):
+            return {name: get(row) for name, get in getters}
+
+        return decode
+
+
+REPORTS = {}
+
+
+def register_report(spec):
+    """Add a report to the registry (replacing any spec with the same name)."""
+    REPORTS[spec.name] = spec
+    return spec
+
+
+def get_report(name):
+    """Look up a registered report by name."""
+    try:
+        return REPORTS[name]
+    except KeyError:
+        raise KeyError(
+            f"Unknown report '{name}'. Registered: {', '.join(sorted(REPORTS))}"
+        ) from None
+
+
+# ============================================
+# Shared column definitions
+# ============================================
+
+
+def _metric_columns(*names):
+    """Standard metric columns, in the order requested."""
+    available = {
+        "clicks": Column("clicks", "metrics.clicks"),
+        "impressions": Column("impressions", "metrics.impressions"),
+        "ctr": Column("ctr", "metrics.ctr"),
+        "avg_cpc": Column("avg_cpc", "metrics.average_cpc", micros_or_zero),
+        "cost": Column("cost", "metrics.cost_micros", micros),
+        "conversions": Column("conversions", "metrics.conversions"),
+        "cpa": Column("cpa", "metrics.cost_per_conversion", micros_or_zero),
+    }
+    return [available[name] for name in names]
+
+
+def _rsa_assets(field):
+    """Column source extracting RSA headlines or descriptions with pinning."""
+
+    def extract(row):
+        ad = row.ad_group_ad.ad
+        if ad.type_.name != "RESPONSIVE_SEARCH_AD" or not hasattr(
+            ad, "responsive_search_ad"
+        ):
+            return []
+        return [
+            {
+                "text": asset.text,
+                "pinned_field": (
+                    asset.pinned_field.name if asset.pinned_field else None
+                ),
+            }
+            for asset in getattr(ad.responsive_search_ad, field)
+        ]
+
+    return extract
+
+
+def _target_cpa(row):
+    c = row.campaign
+    if c.maximize_conversions.target_cpa_micros:
+        return c.maximize_conversions.target_cpa_micros / MICROS
+    if c.target_cpa.target_cpa_micros:
+        return c.target_cpa.target_cpa_micros / MICROS
+    return None
+
+
+def _target_roas(row):
+    c = row.campaign
+    if c.maximize_conversion_value.target_roas:
+        return c.maximize_conversion_value.target_roas
+    if c.target_roas.target_roas:
+        return c.target_roas.target_roas
+    return None
+
+
+# ============================================
+# Performance reports
+# ============================================
+
+register_report(
+    ReportSpec(
+        name="auction_insights",
+        resource="campaign_auction_insight",
+        fields=[
+            "segments.date",
+            "campaign.id",
+            "campaign.name",
+            "segments.auction_insight_domain",
+            "metrics.auction_insight_search_impression_share",
+            "metrics.auction_insight_search_outranking_share",
+            "metrics.auction_insight_search_overlap_rate",
+            "metrics.auction_insight_search_position_above_rate",
+        ],
+        where=["campaign.status != 'REMOVED'"],
+        columns=[
+            Column("date", "segments.date"),
+            Column("campaign_id", "campaign.id"),
+            Column("campaign_name", "campaign.name"),
+            Column("competitor_domain", "segments.auction_insight_domain"),
+            Column(
+                "impression_share", "metrics.auction_insight_search_impression_share"
+            ),
+            Column(
+                "outranking_share", "metrics.auction_insight_search_outranking_share"
+            ),
+            Column("overlap_rate", "metrics.auction_insight_search_overlap_rate"),
+            Column(
+                "position_above_rate",
+                "metrics.auction_insight_search_position_above_rate",
+            ),
+        ],
+        description="auction insights",
+        as_frame=True,
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="campaign_performance",
+        resource="campaign",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "campaign.status",
+            "segments.date",
+            "metrics.cost_micros",
+            "metrics.impressions",
+            "metrics.clicks",
+            "metrics.conversions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_per_conversion",
+            "metrics.search_budget_lost_impression_share",
+            "metrics.search_rank_lost_impression_share",
+        ],
+        columns=[
+            Column("customer_id", CUSTOMER_ID),
+            Column("campaign_id", "campaign.id", str),
+            Column("campaign_name", "campaign.name"),
+            Column("status", "campaign.status.name"),
+            Column("date", "segments.date"),
+            *_metric_columns(
+                "cost", "impressions", "clicks", "conversions", "ctr", "avg_cpc", "cpa"
+            ),
+        ],
+        description="campaign data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="ad_group_performance",
+        resource="ad_group",
+        fields=[
+            "ad_group.id",
+            "ad_group.name",
+            "ad_group.status",
+            "ad_group.type",
+            "campaign.id",
+            "campaign.name",
+            "segments.date",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_micros",
+            "metrics.conversions",
+            "metrics.cost_per_conversion",
+            "metrics.search_budget_lost_impression_share",
+            "metrics.search_rank_lost_impression_share",
+        ],
+        where=["ad_group.status != 'REMOVED'"],
+        columns=[
+            Column("ad_group_id", "ad_group.id", str),
+            Column("ad_group_name", "ad_group.name"),
+            Column("status", "ad_group.status.name"),
+            Column("type", "ad_group.type_.name"),
+            Column("campaign_name", "campaign.name"),
+            *_metric_columns(
+                "clicks", "impressions", "ctr", "avg_cpc", "cost", "conversions", "cpa"
+            ),
+        ],
+        description="ad group data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="keyword_performance",
+        resource="keyword_view",
+        fields=[
+            "ad_group_criterion.keyword.text",
+            "ad_group_criterion.keyword.match_type",
+            "ad_group_criterion.status",
+            "ad_group_criterion.quality_info.quality_score",
+            "ad_group_criterion.quality_info.creative_quality_score",
+            "ad_group_criterion.quality_info.post_click_quality_score",
+            "ad_group_criterion.quality_info.search_predicted_ctr",
+            "campaign.name",
+            "ad_group.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_micros",
+            "metrics.conversions",
+            "metrics.cost_per_conversion",
+        ],
+        where=["ad_group_criterion.status != 'REMOVED'"],
+        columns=[
+            Column("keyword", "ad_group_criterion.keyword.text"),
+            Column("match_type", "ad_group_criterion.keyword.match_type.name"),
+            Column("status", "ad_group_criterion.status.name"),
+            Column("quality_score", "ad_group_criterion.quality_info.quality_score"),
+            Column(
+                "creative_qs",
+                "ad_group_criterion.quality_info.creative_quality_score",
+                enum_name_or("UNKNOWN"),
+            ),
+            Column(
+                "landing_page_qs",
+                "ad_group_criterion.quality_info.post_click_quality_score",
+                enum_name_or("UNKNOWN"),
+            ),
+            Column(
+                "expected_ctr",
+                "ad_group_criterion.quality_info.search_predicted_ctr",
+                enum_name_or("UNKNOWN"),
+            ),
+            Column("campaign_name", "campaign.name"),
+            Column("ad_group_name", "ad_group.name"),
+            *_metric_columns(
+                "clicks", "impressions", "ctr", "avg_cpc", "cost", "conversions", "cpa"
+            ),
+        ],
+        description="keyword data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="search_terms",
+        resource="search_term_view",
+        fields=[
+            "search_term_view.search_term",
+            "search_term_view.status",
+            "segments.keyword.info.match_type",
+            "campaign.name",
+            "ad_group.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_micros",
+            "metrics.conversions",
+            "metrics.cost_per_conversion",
+        ],
+        order_by="metrics.cost_micros DESC",
+        columns=[
+            Column("search_term", "search_term_view.search_term"),
+            Column("status", "search_term_view.status.name"),
+            Column(
+                "match_type",
+                "segments.keyword.info.match_type",
+                enum_name_or("UNKNOWN"),
+            ),
+            Column("campaign_name", "campaign.name"),
+            Column("ad_group_name", "ad_group.name"),
+            *_metric_columns(
+                "clicks", "impressions", "ctr", "avg_cpc", "cost", "conversions", "cpa"
+            ),
+        ],
+        description="search terms",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="ad_performance",
+        resource="ad_group_ad",
+        fields=[
+            "ad_group_ad.ad.id",
+            "ad_group_ad.ad.type",
+            "ad_group_ad.ad.responsive_search_ad.headlines",
+            "ad_group_ad.ad.responsive_search_ad.descriptions",
+            "ad_group_ad.ad.final_urls",
+            "ad_group_ad.status",
+            "ad_group_ad.ad_strength",
+            "ad_group_ad.policy_summary.approval_status",
+            "campaign.name",
+            "ad_group.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        where=["ad_group_ad.status != 'REMOVED'"],
+        columns=[
+            Column("ad_id", "ad_group_ad.ad.id", str),
+            Column("type", "ad_group_ad.ad.type_.name"),
+            Column("headlines", _rsa_assets("headlines")),
+            Column("descriptions", _rsa_assets("descriptions")),
+            Column("final_urls", "ad_group_ad.ad.final_urls", list),
+            Column("status", "ad_group_ad.status.name"),
+            Column("ad_strength", "ad_group_ad.ad_strength.name"),
+            Column(
+                "approval_status", "ad_group_ad.policy_summary.approval_status.name"
+            ),
+            Column("campaign_name", "campaign.name"),
+            Column("ad_group_name", "ad_group.name"),
+            *_metric_columns(
+                "clicks", "impressions", "ctr", "avg_cpc", "cost", "conversions"
+            ),
+        ],
+        description="ad performance",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="geographic_performance",
+        resource="geographic_view",
+        fields=[
+            "geographic_view.country_criterion_id",
+            "geographic_view.location_type",
+            "campaign.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("country_id", "geographic_view.country_criterion_id", str),
+            Column("location_type", "geographic_view.location_type.name"),
+            Column("campaign_name", "campaign.name"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+        ],
+        description="geographic data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="device_performance",
+        resource="campaign",
+        fields=[
+            "segments.device",
+            "campaign.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("device", "segments.device.name"),
+            Column("campaign_name", "campaign.name"),
+            *_metric_columns(
+                "clicks", "impressions", "ctr", "avg_cpc", "cost", "conversions"
+            ),
+        ],
+        description="device data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="asset_performance",
+        resource="ad_group_ad_asset_view",
+        fields=[
+            "ad_group_ad_asset_view.ad_group_ad",
+            "ad_group_ad_asset_view.asset",
+            "ad_group_ad_asset_view.field_type",
+            "ad_group_ad_asset_view.performance_label",
+            "asset.text_asset.text",
+            "metrics.impressions",
+            "metrics.clicks",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        order_by="ad_group_ad_asset_view.performance_label",
+        columns=[
+            Column("asset_id", "ad_group_ad_asset_view.asset", str),
+            Column("field_type", "ad_group_ad_asset_view.field_type.name"),
+            Column(
+                "performance_label", "ad_group_ad_asset_view.performance_label.name"
+            ),
+            Column("text", "asset.text_asset.text"),
+            *_metric_columns("impressions", "clicks", "cost", "conversions"),
+        ],
+        description="asset performance",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="landing_page_performance",
+        resource="landing_page_view",
+        fields=[
+            "landing_page_view.unexpanded_final_url",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+            "metrics.mobile_friendly_clicks_percentage",
+            "metrics.valid_accelerated_mobile_pages_clicks_percentage",
+            "metrics.speed_score",
+        ],
+        columns=[
+            Column("url", "landing_page_view.unexpanded_final_url"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+            Column(
+                "mobile_friendly_click_pct",
+                "metrics.mobile_friendly_clicks_percentage",
+            ),
+            Column("speed_score", "metrics.speed_score"),
+        ],
+        description="landing page performance",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="expanded_landing_page_performance",
+        resource="expanded_landing_page_view",
+        fields=[
+            "expanded_landing_page_view.expanded_final_url",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("url", "expanded_landing_page_view.expanded_final_url"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+        ],
+        description="expanded landing page performance",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="user_location_performance",
+        resource="user_location_view",
+        fields=[
+            "user_location_view.country_criterion_id",
+            "user_location_view.targeting_location",
+            "campaign.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("country_id", "user_location_view.country_criterion_id", str),
+            Column("targeting_location", "user_location_view.targeting_location"),
+            Column("campaign_name", "campaign.name"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+        ],
+        description="user location performance",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="impression_share",
+        resource="campaign",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "metrics.search_impression_share",
+            "metrics.search_top_impression_share",
+            "metrics.search_absolute_top_impression_share",
+            "metrics.search_budget_lost_impression_share",
+            "metrics.search_rank_lost_impression_share",
+            "metrics.search_budget_lost_top_impression_share",
+            "metrics.search_rank_lost_top_impression_share",
+            "metrics.search_budget_lost_absolute_top_impression_share",
+            "metrics.search_rank_lost_absolute_top_impression_share",
+        ],
+        where=["campaign.advertising_channel_type = 'SEARCH'"],
+        columns=[
+            Column("campaign_name", "campaign.name"),
+            Column("search_is", "metrics.search_impression_share"),
+            Column("search_top_is", "metrics.search_top_impression_share"),
+            Column("search_abs_top_is", "metrics.search_absolute_top_impression_share"),
+            Column("lost_is_budget", "metrics.search_budget_lost_impression_share"),
+            Column("lost_is_rank", "metrics.search_rank_lost_impression_share"),
+        ],
+        description="impression share data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="paid_organic_performance",
+        resource="paid_organic_search_term_view",
+        fields=[
+            "paid_organic_search_term_view.search_term",
+            "metrics.combined_clicks",
+            "metrics.combined_queries",
+            "metrics.organic_clicks",
+            "metrics.organic_queries",
+            "metrics.organic_impressions",
+        ],
+        columns=[
+            Column("search_term", "paid_organic_search_term_view.search_term"),
+            Column("combined_clicks", "metrics.combined_clicks"),
+            Column("organic_clicks", "metrics.organic_clicks"),
+            Column("organic_impressions", "metrics.organic_impressions"),
+        ],
+        description="paid/organic data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="click_data",
+        resource="click_view",
+        fields=[
+            "click_view.gclid",
+            "click_view.area_of_interest.city",
+            "click_view.area_of_interest.country",
+            "click_view.keyword",
+            "click_view.keyword_info.text",
+            "click_view.keyword_info.match_type",
+            "click_view.ad_group_ad",
+            "campaign.name",
+            "ad_group.name",
+        ],
+        # ClickView only supports single-day queries
+        default_date_range="YESTERDAY",
+        single_day=True,
+        columns=[
+            Column("gclid", "click_view.gclid"),
+            Column("city", "click_view.area_of_interest.city"),
+            Column("country", "click_view.area_of_interest.country"),
+            Column("keyword", "click_view.keyword_info.text"),
+            Column("campaign_name", "campaign.name"),
+            Column("ad_group_name", "ad_group.name"),
+        ],
+        description="click data",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="ad_schedule_performance",
+        resource="campaign",
+        fields=[
+            "segments.hour",
+            "segments.day_of_week",
+            "campaign.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("hour", "segments.hour"),
+            Column("day", "segments.day_of_week.name"),
+            Column("campaign_name", "campaign.name"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+        ],
+        description="ad schedule",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="audience_performance",
+        resource="campaign_audience_view",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "campaign_criterion.criterion_id",
+            "campaign_criterion.display_name",
+            "campaign_criterion.type",
+            "metrics.impressions",
+            "metrics.clicks",
+            "metrics.cost_micros",
+            "metrics.conversions",
+            "metrics.ctr",
+            "metrics.average_cpc",
+        ],
+        columns=[
+            Column("campaign_id", "campaign.id"),
+            Column("campaign_name", "campaign.name"),
+            Column("criterion_id", "campaign_criterion.criterion_id"),
+            Column("audience_name", "campaign_criterion.display_name"),
+            Column("type", "campaign_criterion.type_.name"),
+            Column("impressions", "metrics.impressions"),
+            Column("clicks", "metrics.clicks"),
+            Column("cost_micros", "metrics.cost_micros"),
+            Column("conversions", "metrics.conversions"),
+            Column("ctr", "metrics.ctr"),
+            Column("average_cpc", "metrics.average_cpc"),
+        ],
+        description="audience performance",
+        as_frame=True,
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="demographic_performance",
+        # Age and gender are separate views; this report covers age ranges
+        resource="age_range_view",
+        fields=[
+            "ad_group_criterion.age_range.type",
+            "campaign.name",
+            "ad_group.name",
+            "metrics.clicks",
+            "metrics.impressions",
+            "metrics.cost_micros",
+            "metrics.conversions",
+        ],
+        columns=[
+            Column("age_range", "ad_group_criterion.age_range.type_.name"),
+            Column("campaign_name", "campaign.name"),
+            Column("ad_group_name", "ad_group.name"),
+            *_metric_columns("clicks", "impressions", "cost", "conversions"),
+        ],
+        description="demographic data",
+    )
+)
+
+# ============================================
+# Account configuration & history
+# ============================================
+
+register_report(
+    ReportSpec(
+        name="conversion_actions",
+        resource="conversion_action",
+        fields=[
+            "conversion_action.id",
+            "conversion_action.name",
+            "conversion_action.type",
+            "conversion_action.status",
+            "conversion_action.category",
+            "conversion_action.counting_type",
+        ],
+        date_field=None,
+        columns=[
+            Column("id", "conversion_action.id", str),
+            Column("name", "conversion_action.name"),
+            Column("type", "conversion_action.type_.name"),
+            Column("status", "conversion_action.status.name"),
+            Column("category", "conversion_action.category.name"),
+            # Metrics not available in this view
+            Column("conversions", const(0)),
+            Column("value", const(0)),
+            Column("all_conversions", const(0)),
+        ],
+        description="conversion actions",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="change_history",
+        resource="change_event",
+        fields=[
+            "change_event.change_date_time",
+            "change_event.change_resource_type",
+            "change_event.change_resource_name",
+            "change_event.client_type",
+            "change_event.user_email",
+            "change_event.old_resource",
+            "change_event.new_resource",
+            "change_event.resource_change_operation",
+        ],
+        date_field="change_event.change_date_time",
+        default_date_range="LAST_14_DAYS",
+        order_by="change_event.change_date_time DESC",
+        limit=1000,
+        columns=[
+            Column("date", "change_event.change_date_time"),
+            Column("type", "change_event.change_resource_type.name"),
+            Column("resource", "change_event.change_resource_name"),
+            Column("user", "change_event.user_email"),
+            Column("operation", "change_event.resource_change_operation.name"),
+        ],
+        description="change history",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="recommendations",
+        resource="recommendation",
+        fields=[
+            "recommendation.resource_name",
+            "recommendation.type",
+            "recommendation.impact",
+            "recommendation.campaign",
+            "recommendation.ad_group",
+        ],
+        date_field=None,
+        columns=[
+            Column("type", "recommendation.type_.name"),
+            Column("resource", "recommendation.resource_name"),
+            Column("campaign", "recommendation.campaign"),
+            Column("ad_group", "recommendation.ad_group"),
+        ],
+        description="recommendations",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="campaign_budgets",
+        resource="campaign",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "campaign.campaign_budget",
+            "campaign_budget.amount_micros",
+            "campaign_budget.delivery_method",
+            "campaign_budget.period",
+            "campaign_budget.type",
+            "campaign_budget.explicitly_shared",
+            "metrics.cost_micros",
+        ],
+        where=["campaign.status != 'REMOVED'"],
+        date_field=None,
+        columns=[
+            Column("campaign_name", "campaign.name"),
+            Column("budget_resource", "campaign.campaign_budget"),
+            Column("amount", "campaign_budget.amount_micros", micros),
+            Column("delivery_method", "campaign_budget.delivery_method.name"),
+            Column("period", "campaign_budget.period.name"),
+            Column("type", "campaign_budget.type_.name"),
+            Column("shared", "campaign_budget.explicitly_shared"),
+            Column("cost", "metrics.cost_micros", micros),
+        ],
+        description="campaign budgets",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="bidding_strategies",
+        resource="campaign",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "campaign.advertising_channel_type",
+            "campaign.bidding_strategy_type",
+            "campaign.maximize_conversions.target_cpa_micros",
+            "campaign.maximize_conversion_value.target_roas",
+            "campaign.target_cpa.target_cpa_micros",
+            "campaign.target_roas.target_roas",
+            "accessible_bidding_strategy.id",
+            "accessible_bidding_strategy.name",
+            "accessible_bidding_strategy.type",
+            "accessible_bidding_strategy.maximize_conversions.target_cpa_micros",
+            "accessible_bidding_strategy.target_cpa.target_cpa_micros",
+        ],
+        where=["campaign.status != 'REMOVED'"],
+        date_field=None,
+        columns=[
+            Column("campaign_name", "campaign.name"),
+            Column("channel_type", "campaign.advertising_channel_type.name"),
+            Column("type", "campaign.bidding_strategy_type.name"),
+            Column("target_cpa", _target_cpa),
+            Column("target_roas", _target_roas),
+        ],
+        description="bidding strategies",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="negative_keywords",
+        resource="campaign_criterion",
+        fields=[
+            "campaign_criterion.keyword.text",
+            "campaign_criterion.keyword.match_type",
+            "campaign_criterion.negative",
+            "campaign.id",
+            "campaign.name",
+        ],
+        where=[
+            "campaign_criterion.type = 'KEYWORD'",
+            "campaign_criterion.negative = TRUE",
+        ],
+        date_field=None,
+        columns=[
+            Column("keyword", "campaign_criterion.keyword.text"),
+            Column("match_type", "campaign_criterion.keyword.match_type.name"),
+            Column("campaign_id", "campaign.id", str),
+            Column("campaign_name", "campaign.name"),
+        ],
+        description="negative keywords",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="shared_negative_keywords",
+        resource="shared_criterion",
+        fields=[
+            "shared_criterion.keyword.text",
+            "shared_criterion.keyword.match_type",
+            "shared_set.id",
+            "shared_set.name",
+        ],
+        where=[
+            "shared_criterion.type = 'KEYWORD'",
+            "shared_set.type = 'NEGATIVE_KEYWORDS'",
+            "shared_set.status = 'ENABLED'",
+        ],
+        date_field=None,
+        columns=[
+            Column("keyword", "shared_criterion.keyword.text"),
+            Column("match_type", "shared_criterion.keyword.match_type.name"),
+            Column("shared_set_id", "shared_set.id", str),
+            Column("shared_set_name", "shared_set.name"),
+        ],
+        description="shared negative keywords",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="campaign_negative_lists",
+        resource="campaign_shared_set",
+        fields=[
+            "campaign.id",
+            "campaign.name",
+            "shared_set.id",
+            "shared_set.name",
+        ],
+        where=[
+            "shared_set.type = 'NEGATIVE_KEYWORDS'",
+            "campaign_shared_set.status = 'ENABLED'",
+            "campaign.status != 'REMOVED'",
+        ],
+        date_field=None,
+        columns=[
+            Column("campaign_id", "campaign.id", str),
+            Column("campaign_name", "campaign.name"),
+            Column("shared_set_id", "shared_set.id", str),
+            Column("shared_set_name", "shared_set.name"),
+        ],
+        description="negative keyword list links",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="campaign_extension_assets",
+        resource="campaign_asset",
+        fields=[
+            "campaign.name",
+            "campaign_asset.field_type",
+            "asset.id",
+        ],
+        where=[
+            "campaign_asset.status = 'ENABLED'",
+            "campaign.status != 'REMOVED'",
+        ],
+        date_field=None,
+        columns=[
+            Column("campaign_name", "campaign.name"),
+            Column("field_type", "campaign_asset.field_type.name"),
+            Column("asset_id", "asset.id", str),
+        ],
+        description="campaign extension assets",
+    )
+)
+
+register_report(
+    ReportSpec(
+        name="account_extension_assets",
+        resource="customer_asset",
+        fields=[
+            "customer_asset.field_type",
+            "asset.id",
+        ],
+        where=["customer_asset.status = 'ENABLED'"],
+        date_field=None,
+        columns=[
+            Column("field_type", "customer_asset.field_type.name"),
+            Column("asset_id", "asset.id", str),
+        ],
+        description="account extension assets",
+    )
+)
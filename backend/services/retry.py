@@ -0,0 +1,145 @@
+"""
+API Retry Policy.
+Classifies Google Ads API errors and computes backoff delays.
+
+Quota (RESOURCE_EXHAUSTED) and transient server errors (INTERNAL, UNAVAILABLE,
+DEADLINE_EXCEEDED) are retried with jittered exponential backoff. A
+retry_delay hint in the error's quota details takes precedence over the
+computed delay; hints longer than the policy allows (e.g. an exhausted daily
+quota) are not waited out.
+
+Errors are inspected by attribute, so this module does not import the
+google-ads library.
+"""
+
+import random
+
+# gRPC status codes worth retrying
+RETRYABLE_STATUS_CODES = {
+    "RESOURCE_EXHAUSTED",
+    "UNAVAILABLE",
+    "INTERNAL",
+    "DEADLINE_EXCEEDED",
+    "ABORTED",
+}
+
+# GoogleAdsFailure error codes worth retrying, by error_code oneof field
+RETRYABLE_ERROR_CODES = {
+    "quota_error": {"RESOURCE_EXHAUSTED", "RESOURCE_TEMPORARILY_EXHAUSTED"},
+    "internal_error": {"INTERNAL_ERROR", "TRANSIENT_ERROR", "DEADLINE_EXCEEDED"},
+}
+
+
+def _status_name(error):
+    """gRPC status code name of an exception, if it carries one."""
+    # GoogleAdsException wraps the failed grpc.Call in .error
+    for source in (getattr(error, "error", None), error):
+        if source is None:
+            continue
+        code = getattr(source, "grpc_status_code", None)
+        if code is None and callable(getattr(source, "code", None)):
+            try:
+                code = source.code()
+            except Exception:
+                code = None
+        name = getattr(code, "name", None)
+        if name:
+            return name
+    return None
+
+
+def _failure_errors(error):
+    failure = getattr(error, "failure", None)
+    return list(getattr(failure, "errors", None) or [])
+
+
+def _error_code_names(error):
+    """(oneof field, enum name) pairs of the GoogleAdsFailure error codes."""
+    names = []
+    for failure_error in _failure_errors(error):
+        error_code = getattr(failure_error, "error_code", None)
+        for field in RETRYABLE_ERROR_CODES:
+            name = getattr(getattr(error_code, field, None), "name", None)
+            if name and not name.endswith("UNSPECIFIED"):
+                names.append((field, name))
+    return names
+
+
+def is_quota_error(error):
+    """Whether an API error reports exhausted quota or rate limits."""
+    return _status_name(error) == "RESOURCE_EXHAUSTED" or any(
+        field == "quota_error" for field, _ in _error_code_names(error)
+    )
+
+
+def is_retryable(error):
+    """Whether an API error is a quota or transient failure worth retrying."""
+    if any(
+        name in RETRYABLE_ERROR_CODES[field] for field, name in _error_code_names(error)
+    ):
+        return True
+    return _status_name(error) in RETRYABLE_STATUS_CODES
+
+
+def retry_after(error):
+    """Seconds the API asked callers to wait before retrying, if it said."""
+    hints = []
+    for failure_error in _failure_errors(error):
+        details = getattr(failure_error, "details", None)
+        quota_details = getattr(details, "quota_error_details", None)
+        delay = getattr(quota_details, "retry_delay", None)
+        seconds = getattr(delay, "seconds", 0) + getattr(delay, "nanos", 0) / 1e9
+        if seconds > 0:
+            hints.append(seconds)
+    return max(hints) if hints else None
+
+
+def describe_error(error):
+    """Short label for progress output (e.g. "quota_error.RESOURCE_EXHAUSTED")."""
+    codes = _error_code_names(error)
+    if codes:
+        return ", ".join(f"{field}.{name}" for field, name in codes)
+    return _status_name(error) or type(error).__name__
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff.
+
+    Args:
+        max_attempts: Total attempts per request, including the first
+        base_delay: Backoff ceiling of the first retry, in seconds
+        max_delay: Upper bound of any computed delay, in seconds
+        max_retry_after: Longest server retry_delay hint worth waiting for
+    """
+
+    def __init__(
+        self, max_attempts=5, base_delay=1.0, max_delay=60.0, max_retry_after=300.0
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def delay(self, attempt, error):
+        """
+        Seconds to wait before retrying after a failed attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+            error: The exception it raised
+
+        Returns:
+            Delay in seconds, or None if the request should not be retried
+        """
+        if attempt + 1 >= self.max_attempts or not is_retryable(error):
+            return None
+
+        hint = retry_after(error)
+        if hint is not None and hint > self.max_retry_after:
+            return None
+
+        # "Full jitter": spread concurrent retries over the whole backoff window
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        delay = random.uniform(0, ceiling)
+        return max(delay, hint or 0)
@@ -0,0 +1 @@
+# mb-google-ads-audit offline test doubles
@@ -0,0 +1,1181 @@
+"""
+Fake Google Ads API.
+An in-process stand-in for GoogleAdsClient that serves search_stream and the
+mutate services from synthetic accounts, so AdsConnector can be exercised
+(throughput, memory, retries) without credentials or network access.
+
+Accounts are size-parameterized and generated lazily: rows are built batch
+by batch from the row index, so a 5M-row search term report costs no more
+memory than one batch. Values are deterministic per (seed, entity, day) and
+entities are consistent across reports, e.g. "Campaign 3" has the same ID
+in the campaign, keyword and search term reports.
+
+The fake understands enough GAQL for the registered reports: SELECT fields,
+FROM resource, a segments.date DURING/BETWEEN filter and LIMIT. Other WHERE
+conditions are not evaluated.
+
+Usage:
+    server = FakeAdsServer([FakeAccount("1234567890", search_terms=100000)])
+    with server.install():
+        ads = AdsConnector(rate_limiter=RateLimiter(rate=1000, per_customer_rate=1000))
+        rows = ads.get_search_terms("1234567890")
+    print(server.stats)
+"""
+
+import contextlib
+import pickle
+import random
+import re
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from backend.services import _sdk, client_pool
+from backend.services.date_ranges import resolve_date_range
+
+# Rows per search_stream response (the API's batch size)
+DEFAULT_BATCH_SIZE = 10000
+
+# Rows of resources without a size parameter of their own
+DEFAULT_ROWS = 100
+
+# Error statuses that carry a GoogleAdsFailure error code, like the real API
+_FAILURE_CODES = {
+    "RESOURCE_EXHAUSTED": ("quota_error", "RESOURCE_EXHAUSTED"),
+    "INTERNAL": ("internal_error", "INTERNAL_ERROR"),
+    "DEADLINE_EXCEEDED": ("internal_error", "DEADLINE_EXCEEDED"),
+}
+
+# Words search terms and keywords are built from
+VOCABULARY = (
+    "plumber emergency cheap free near me copenhagen aarhus odense best "
+    "price repair install boiler heating drain leak toilet shower bathroom "
+    "kitchen pipe water service company local 24 hour quote cost how to "
+    "diy job salary course used sale rent review top fast same day weekend "
+    "night certified licensed small large new old replace fix blocked gas "
+    "electric floor radiator tap sink"
+).split()
+
+# Enum values by field path or, failing that, by field name
+ENUM_VALUES = {
+    "campaign.advertising_channel_type": ("SEARCH", "SEARCH", "PERFORMANCE_MAX"),
+    "campaign.bidding_strategy_type": (
+        "MAXIMIZE_CONVERSIONS",
+        "TARGET_CPA",
+        "MANUAL_CPC",
+    ),
+    "campaign_budget.type": ("STANDARD",),
+    "ad_group.type": ("SEARCH_STANDARD",),
+    "ad_group_ad.ad.type": ("RESPONSIVE_SEARCH_AD",),
+    "accessible_bidding_strategy.type": ("TARGET_CPA", "MAXIMIZE_CONVERSIONS"),
+    "conversion_action.type": ("WEBPAGE", "GOOGLE_ANALYTICS_4_CUSTOM"),
+    "campaign_criterion.type": ("KEYWORD",),
+    "recommendation.type": ("KEYWORD", "TARGET_CPA_OPT_IN", "SITELINK_ASSET"),
+    "ad_group_criterion.age_range.type": ("AGE_RANGE_25_34", "AGE_RANGE_35_44"),
+    "status": ("ENABLED", "ENABLED", "ENABLED", "ENABLED", "PAUSED"),
+    "match_type": ("EXACT", "PHRASE", "BROAD"),
+    "ad_strength": ("EXCELLENT", "GOOD", "AVERAGE", "POOR"),
+    "approval_status": ("APPROVED",),
+    "creative_quality_score": ("ABOVE_AVERAGE", "AVERAGE", "BELOW_AVERAGE"),
+    "post_click_quality_score": ("ABOVE_AVERAGE", "AVERAGE", "BELOW_AVERAGE"),
+    "search_predicted_ctr": ("ABOVE_AVERAGE", "AVERAGE", "BELOW_AVERAGE"),
+    "field_type": ("SITELINK", "CALLOUT", "STRUCTURED_SNIPPET", "HEADLINE"),
+    "performance_label": ("BEST", "GOOD", "LOW", "LEARNING"),
+    "device": ("MOBILE", "DESKTOP", "TABLET"),
+    "day_of_week": (
+        "MONDAY",
+        "TUESDAY",
+        "WEDNESDAY",
+        "THURSDAY",
+        "FRIDAY",
+        "SATURDAY",
+        "SUNDAY",
+    ),
+    "period": ("DAILY",),
+    "delivery_method": ("STANDARD",),
+    "category": ("PURCHASE", "SUBMIT_LEAD_FORM", "PHONE_CALL_LEAD"),
+    "counting_type": ("ONE_PER_CLICK", "MANY_PER_CLICK"),
+    "location_type": ("AREA_OF_INTEREST", "LOCATION_OF_PRESENCE"),
+    "change_resource_type": ("CAMPAIGN", "AD_GROUP", "AD_GROUP_CRITERION"),
+    "client_type": ("GOOGLE_ADS_WEB_CLIENT", "GOOGLE_ADS_API"),
+    "resource_change_operation": ("UPDATE", "CREATE"),
+}
+
+# Fields holding lists
+_REPEATED_FIELDS = {"final_urls", "headlines", "descriptions"}
+
+# Share-like metrics (0-1 floats)
+_SHARE_MARKERS = ("impression_share", "_rate", "percentage", "outranking_share")
+
+_DURING = re.compile(r"segments\.date\s+DURING\s+(\w+)", re.I)
+_BETWEEN = re.compile(
+    r"segments\.date\s+BETWEEN\s+'([\d-]+)'\s+AND\s+'([\d-]+)'", re.I
+)
+_SELECT = re.compile(r"SELECT\s+(.*?)\s+FROM\s+(\w+)", re.I | re.S)
+_LIMIT = re.compile(r"\bLIMIT\s+(\d+)", re.I)
+
+
+# ============================================
+# Message stand-ins
+# ============================================
+
+
+class Message:
+    """
+    Attribute bag shaped like a proto-plus message.
+
+    Unset fields read as empty (falsy) messages, so nested assignments such
+    as operation.create.keyword.text = "..." work like they do on the real
+    types.
+    """
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = self.__dict__[name] = Message()
+        return value
+
+    def __bool__(self):
+        return bool(self.__dict__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"Message({fields})"
+
+    @property
+    def _pb(self):
+        return self
+
+    @staticmethod
+    def serialize(message):
+        return pickle.dumps(message)
+
+    @staticmethod
+    def deserialize(data):
+        return pickle.loads(data)
+
+
+class Enum:
+    """Enum value with a .name, falsy when UNSPECIFIED like proto enums."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __bool__(self):
+        return self.name != "UNSPECIFIED"
+
+    def __eq__(self, other):
+        return isinstance(other, Enum) and other.name == self.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return f"Enum({self.name})"
+
+    def __reduce__(self):
+        return (Enum, (self.name,))
+
+
+class _EnumType:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, value):
+        if value.startswith("__"):
+            raise AttributeError(value)
+        return Enum(value)
+
+
+class _Enums:
+    """client.enums: any XxxEnum.VALUE resolves to an Enum named VALUE."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _EnumType(name)
+
+
+def _field_mask(original, modified):
+    """protobuf_helpers.field_mask stand-in: paths of the set fields."""
+    return Message(paths=sorted(modified.__dict__))
+
+
+class _FieldMaskHelpers:
+    field_mask = staticmethod(_field_mask)
+
+
+# ============================================
+# Errors
+# ============================================
+
+_exception_class = None
+
+
+def fake_exception_class():
+    """
+    FakeGoogleAdsException, a subclass of the real GoogleAdsException when
+    google-ads is installed (so except clauses catch it) and of Exception
+    otherwise. Created on first use to keep the SDK import lazy.
+    """
+    global _exception_class
+    if _exception_class is not None:
+        return _exception_class
+
+    try:
+        base = _sdk.GoogleAdsException
+    except ImportError:
+        base = Exception
+
+    class FakeGoogleAdsException(base):
+        """Shaped like GoogleAdsException: .error (grpc.Call), .failure."""
+
+        def __init__(self, status, message=None):
+            Exception.__init__(self, message or f"Fake API error: {status}")
+            code = Enum(status)
+            # Plain namespaces, so absent fields read as missing, not empty
+            self.error = SimpleNamespace(code=lambda: code)
+            error_code = SimpleNamespace()
+            if status in _FAILURE_CODES:
+                field, name = _FAILURE_CODES[status]
+                setattr(error_code, field, Enum(name))
+            self.failure = SimpleNamespace(
+                errors=[SimpleNamespace(error_code=error_code, message=str(self))]
+            )
+            self.request_id = "fake-request"
+            self.status = status
+
+        def __str__(self):
+            return self.args[0]
+
+    _exception_class = FakeGoogleAdsException
+    return _exception_class
+
+
+def fake_error(status, message=None):
+    """A FakeGoogleAdsException with the given gRPC status name."""
+    return fake_exception_class()(status, message)
+
+
+@contextlib.contextmanager
+def sdk_stand_ins():
+    """
+    Resolve the SDK names AdsConnector catches (GoogleAdsException,
+    protobuf_helpers) to the fakes while google-ads is not installed.
+    With google-ads installed this changes nothing.
+    """
+    patched = []
+    for name, fake in (
+        ("GoogleAdsException", fake_exception_class),
+        ("protobuf_helpers", lambda: _FieldMaskHelpers),
+    ):
+        try:
+            getattr(_sdk, name)
+        except ImportError:
+            setattr(_sdk, name, fake())
+            patched.append(name)
+    try:
+        yield
+    finally:
+        for name in patched:
+            delattr(_sdk, name)
+
+
+# ============================================
+# Synthetic accounts
+# ============================================
+
+
+def _mix(*values):
+    """Cheap deterministic 32-bit hash of small integers."""
+    h = 2166136261
+    for value in values:
+        h = ((h ^ (value & 0xFFFFFFFF)) * 16777619) & 0xFFFFFFFF
+    h ^= h >> 15
+    h = (h * 2246822519) & 0xFFFFFFFF
+    return h ^ (h >> 13)
+
+
+def _phrase(index, offset=0):
+    """Distinct 1-4 word phrase for each index (mixed radix over VOCABULARY)."""
+    size = len(VOCABULARY)
+    words = []
+    value = index + offset
+    while True:
+        value, digit = divmod(value, size)
+        words.append(VOCABULARY[digit])
+        if not value or len(words) == 4:
+            return " ".join(words)
+
+
+class FakeAccount:
+    """
+    Size-parameterized synthetic Google Ads account.
+
+    Args:
+        customer_id: Customer ID the account answers to
+        name: Descriptive name (customer_client queries)
+        campaigns: Campaigns in the account
+        ad_groups: Ad groups per campaign
+        keywords: Rows of keyword_view
+        search_terms: Rows of search_term_view (and paid_organic_search_term_view)
+        ads: Rows of ad_group_ad (defaults to two per ad group)
+        rows: Row counts of any other FROM resource, e.g. {"change_event": 500}
+        default_rows: Row count of resources not sized otherwise
+        seed: Varies the generated metrics
+
+    Reports selecting segments.date get one row per entity and day of the
+    queried range.
+    """
+
+    def __init__(
+        self,
+        customer_id,
+        name=None,
+        campaigns=10,
+        ad_groups=5,
+        keywords=1000,
+        search_terms=1000,
+        ads=None,
+        rows=None,
+        default_rows=DEFAULT_ROWS,
+        seed=0,
+    ):
+        self.customer_id = str(customer_id)
+        self.name = name or f"Fake Account {self.customer_id}"
+        self.campaigns = campaigns
+        self.ad_groups = ad_groups
+        self.default_rows = default_rows
+        self.seed = seed
+        self.entity_counts = {
+            "campaign": campaigns,
+            "ad_group": campaigns * ad_groups,
+            "keyword_view": keywords,
+            "search_term_view": search_terms,
+            "paid_organic_search_term_view": search_terms,
+            "ad_group_ad": campaigns * ad_groups * 2 if ads is None else ads,
+            **(rows or {}),
+        }
+
+    def entities(self, resource):
+        return self.entity_counts.get(resource, self.default_rows)
+
+    def campaign_id(self, c):
+        return 1000 + c
+
+    def campaign_name(self, c):
+        return f"Campaign {c + 1}"
+
+    def ad_group_id(self, g):
+        return 100000 + g
+
+    def ad_group_name(self, g):
+        return f"Ad Group {g + 1}"
+
+
+class _RowPlan:
+    """Compiled SELECT of one query: builds GoogleAdsRow stand-ins by index."""
+
+    def __init__(self, account, query, today=None):
+        match = _SELECT.search(query)
+        if not match:
+            raise fake_error("INVALID_ARGUMENT", "Fake API error: unparsable query")
+        self.account = account
+        self.resource = match.group(2)
+        self.fields = [field.strip() for field in match.group(1).split(",")]
+        self.dated = "segments.date" in self.fields
+
+        self.days = [None]
+        if self.dated:
+            self.days = _query_days(query, today)
+        entities = self.account.entities(self.resource)
+        self.entities = entities
+        # Salts keep values of different reports and enum fields independent
+        self.salt = zlib.crc32(self.resource.encode())
+        self.total = entities * len(self.days)
+        limit = _LIMIT.search(query)
+        if limit:
+            self.total = min(self.total, int(limit.group(1)))
+
+        # Nested attribute tree of value functions, compiled once per query:
+        # {"campaign": {"id": fn, ...}, "metrics": {...}}
+        tree = {}
+        for field in self.fields:
+            node = tree
+            parts = field.split(".")
+            for part in parts[:-1]:
+                node = node.setdefault(_attribute(part), {})
+            node[_attribute(parts[-1])] = self._compile(field)
+        self.tree = _freeze(tree)
+
+    def rows(self, start, stop):
+        return [self.row(i) for i in range(start, stop)]
+
+    def row(self, i):
+        day_index, entity = divmod(i, self.entities)
+        day = self.days[day_index]
+        account = self.account
+        c = entity % account.campaigns
+        g = c * account.ad_groups + (entity // account.campaigns) % account.ad_groups
+        # Hashing the calendar day keeps a day's values the same in every
+        # query that covers it, however the range is split
+        context = (
+            entity,
+            c,
+            g,
+            day,
+            _mix(account.seed, self.salt, entity, day.toordinal() if day else 0),
+        )
+        return _build(self.tree, context)
+
+    def _compile(self, field):
+        """Function of the row context (entity, campaign, ad group, day, hash)."""
+        account = self.account
+        name = field.rsplit(".", 1)[-1]
+
+        fixed = {
+            "segments.date": lambda ctx: ctx[3].isoformat(),
+            "campaign.id": lambda ctx: account.campaign_id(ctx[1]),
+            "campaign.name": lambda ctx: account.campaign_name(ctx[1]),
+            "ad_group.id": lambda ctx: account.ad_group_id(ctx[2]),
+            "ad_group.name": lambda ctx: account.ad_group_name(ctx[2]),
+            "campaign.campaign_budget": lambda ctx: (
+                f"customers/{account.customer_id}/campaignBudgets/{ctx[1]}"
+            ),
+            "customer_client.id": lambda ctx: int(account.customer_id),
+            "customer_client.client_customer": lambda ctx: int(account.customer_id),
+            "customer_client.descriptive_name": lambda ctx: account.name,
+            "customer_client.level": lambda ctx: 0,
+        }
+        if field in fixed:
+            return fixed[field]
+
+        values = ENUM_VALUES.get(field) or ENUM_VALUES.get(name)
+        if values:
+            enums = [Enum(value) for value in values]
+            if name == "status" and field.startswith("campaign."):
+                # Campaign status follows the campaign, not the row
+                return lambda ctx: enums[_mix(account.seed, ctx[1]) % len(enums)]
+            salt = zlib.crc32(field.encode())
+            return lambda ctx: enums[_mix(ctx[4], salt) % len(enums)]
+
+        if name in _REPEATED_FIELDS:
+            return _repeated_function(name)
+        if field.startswith("metrics."):
+            return _metric_function(name)
+
+        if name == "quality_score":
+            return lambda ctx: (ctx[4] >> 5) % 11
+        if name == "search_term" or (
+            name == "text" and ("search_term" in field or "click_view" in field)
+        ):
+            return lambda ctx: _phrase(ctx[0])
+        if name == "text":
+            # Keywords and negatives use other phrases than the search terms
+            return lambda ctx: _phrase(ctx[0], offset=7)
+        if name == "negative":
+            return lambda ctx: True
+        if name == "explicitly_shared":
+            return lambda ctx: bool(ctx[4] & 1)
+        if name == "amount_micros":
+            return lambda ctx: (100 + ctx[4] % 900) * 1000000
+        if name == "target_cpa_micros":
+            return lambda ctx: (50 + ctx[4] % 450) * 1000000 if ctx[4] & 2 else 0
+        if name == "target_roas":
+            return lambda ctx: round(2 + ctx[4] % 600 / 100, 2) if ctx[4] & 4 else 0.0
+        if name == "hour":
+            return lambda ctx: ctx[0] % 24
+        if name == "id" or name.endswith("_id"):
+            return lambda ctx: 1000000 + ctx[0]
+        if name == "change_date_time":
+            return _change_time
+        if name.endswith("_url") or name == "url":
+            return lambda ctx: f"https://example.com/{_slug(ctx[0])}"
+        if name in ("new_resource", "old_resource", "impact"):
+            return lambda ctx: Message()
+        return lambda ctx: f"{name} {ctx[0] + 1}"
+
+
+def _freeze(tree):
+    """Tree dict -> tuple of (attribute, function or subtree) pairs."""
+    return tuple(
+        (name, _freeze(child) if isinstance(child, dict) else child)
+        for name, child in tree.items()
+    )
+
+
+def _build(node, context):
+    # Skips Message.__init__; this runs once per message of every row
+    message = object.__new__(Message)
+    fields = message.__dict__
+    for name, child in node:
+        if type(child) is tuple:
+            fields[name] = _build(child, context)
+        else:
+            fields[name] = child(context)
+    return message
+
+
+def _slug(entity):
+    return _phrase(entity).replace(" ", "-")
+
+
+def _change_time(ctx):
+    h = ctx[4]
+    moment = date.today() - timedelta(days=h % 14)
+    return f"{moment.isoformat()} {h % 24:02d}:{(h >> 5) % 60:02d}:00"
+
+
+def _metric_function(name):
+    """
+    Metric value function. Impressions, clicks, cost and conversions all
+    derive from the row hash, so they stay consistent within a row.
+    """
+
+    def impressions(h):
+        return 1 + h % 2000
+
+    def clicks(h):
+        return (h >> 11) % (impressions(h) // 8 + 1)
+
+    def cpc_micros(h):
+        return 300000 + (h >> 3) % 9700000
+
+    def conversions(h):
+        return min(clicks(h), ((h >> 17) % 8) * 0.5) if h % 10 < 3 else 0.0
+
+    def cost_per_conversion(h):
+        converted = conversions(h)
+        return clicks(h) * cpc_micros(h) / converted if converted else 0.0
+
+    functions = {
+        "impressions": impressions,
+        "clicks": clicks,
+        "cost_micros": lambda h: clicks(h) * cpc_micros(h),
+        "conversions": conversions,
+        "ctr": lambda h: clicks(h) / impressions(h),
+        "average_cpc": lambda h: float(cpc_micros(h)) if clicks(h) else 0.0,
+        "cost_per_conversion": cost_per_conversion,
+        "speed_score": lambda h: 1 + h % 10,
+    }
+    function = functions.get(name)
+    if function is None:
+        if any(marker in name for marker in _SHARE_MARKERS):
+            function = lambda h: (h >> 4) % 1000 / 1000
+        elif name.endswith(("clicks", "queries", "impressions")):
+            function = lambda h: (h >> 9) % 500
+        else:
+            function = lambda h: float((h >> 9) % 100)
+    return lambda ctx: function(ctx[4])
+
+
+def _repeated_function(name):
+    if name == "final_urls":
+        return lambda ctx: [
+            "https://example.com/"
+            if ctx[4] % 4 == 0
+            else f"https://example.com/{_slug(ctx[0])}"
+        ]
+
+    unpinned = Enum("UNSPECIFIED")
+    label = name[:-1].title()
+    if name == "headlines":
+        count = lambda h: 3 + h % 13
+    else:
+        count = lambda h: 2 + (h >> 4) % 3
+    return lambda ctx: [
+        Message(text=f"{label} {i + 1}", pinned_field=unpinned)
+        for i in range(count(ctx[4]))
+    ]
+
+
+def _attribute(part):
+    """proto-plus attribute name of a GAQL field part (type -> type_)."""
+    return "type_" if part == "type" else part
+
+
+def _query_days(query, today=None):
+    """Days covered by a query's segments.date filter (yesterday without one)."""
+    today = today or date.today()
+    between = _BETWEEN.search(query)
+    if between:
+        start = date.fromisoformat(between.group(1))
+        end = date.fromisoformat(between.group(2))
+    else:
+        during = _DURING.search(query)
+        if during:
+            start, end = resolve_date_range(during.group(1), today=today)
+        else:
+            start = end = today - timedelta(days=1)
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+# ============================================
+# Services and client
+# ============================================
+
+
+class FakeGoogleAdsService:
+    """GoogleAdsService stand-in: search_stream and search over fake accounts."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def search_stream(self, customer_id=None, query=None, request=None, **kwargs):
+        if request is not None:
+            customer_id, query = request.customer_id, request.query
+        server = self.server
+        fault = server._before_request("search_stream")
+        match = _SELECT.search(query or "")
+        if match and match.group(2) == "customer_client":
+            plan = _CustomerClientPlan(server, query)
+        else:
+            plan = _RowPlan(server.account(customer_id), query, server.today)
+        return server._stream(plan, fault)
+
+    def search(self, customer_id=None, query=None, request=None, **kwargs):
+        for batch in self.search_stream(customer_id, query, request):
+            yield from batch.results
+
+    def __getattr__(self, name):
+        # Path helpers such as conversion_action_path(customer_id, id)
+        if name.endswith("_path"):
+            collection = _collection(name[: -len("_path")])
+            return lambda customer_id, *ids: (
+                f"customers/{customer_id}/{collection}/{'~'.join(map(str, ids))}"
+            )
+        raise AttributeError(name)
+
+
+
+
+class _CustomerClientPlan:
+    """customer_client rows: one per account of the server."""
+
+    def __init__(self, server, query):
+        self.plans = [
+            _RowPlan(account, query, server.today)
+            for account in server.accounts.values()
+        ]
+        self.total = len(self.plans)
+
+    def rows(self, start, stop):
+        return [plan.row(0) for plan in self.plans[start:stop]]
+
+
+def _collection(name):
+    """Resource collection of a type name (CampaignCriterion -> campaignCriteria)."""
+    words = [w for w in re.split(r"_|(?<=[a-z0-9])(?=[A-Z])", name) if w]
+    words = [words[0].lower()] + [w.title() for w in words[1:]]
+    last = words[-1]
+    if last.endswith("ion") and last.lower().endswith("criterion"):
+        words[-1] = last[:-3] + "ia"
+    elif last.endswith("y"):
+        words[-1] = last[:-1] + "ies"
+    else:
+        words[-1] = last + "s"
+    return "".join(words)
+
+
+class FakeMutateService:
+    """
+    Any mutate service stand-in (CampaignService, AdGroupCriterionService...).
+
+    Every mutate_* / upload_* method accepts a request message or the
+    customer_id and operations keywords and returns one result with a
+    resource_name per operation (none for validate_only requests).
+
+    Operations matching a FakeAdsServer.reject() rule fail the request like
+    an invalid operation does, or, with partial_failure set, come back as
+    empty results plus a partial_failure_error locating each of them.
+    """
+
+    def __init__(self, server, name):
+        self.server = server
+        self.name = name
+        self.collection = _collection(name[: -len("Service")])
+
+    def __getattr__(self, method):
+        if method.startswith(("mutate", "upload")):
+            return lambda request=None, **kwargs: self._mutate(
+                method, request, **kwargs
+            )
+        if method.endswith("_path"):
+            collection = _collection(method[: -len("_path")])
+            return lambda customer_id, *ids: (
+                f"customers/{customer_id}/{collection}/{'~'.join(map(str, ids))}"
+            )
+        raise AttributeError(method)
+
+    def _mutate(
+        self,
+        method,
+        request=None,
+        customer_id=None,
+        operations=None,
+        validate_only=False,
+        partial_failure=False,
+        **kwargs,
+    ):
+        if request is not None:
+            customer_id = request.customer_id
+            operations = request.operations or request.conversions or []
+            validate_only = bool(request.validate_only)
+            partial_failure = bool(request.partial_failure)
+        operations = list(operations or [])
+
+        server = self.server
+        server._before_request(method, mutate=True)
+        server.account(customer_id)
+        errors = server._rejections(operations)
+        with server._lock:
+            server.stats["mutate_operations"] += len(operations)
+            server.mutations.append((method, str(customer_id), len(operations)))
+            if errors and not partial_failure:
+                server.stats["errors"] += 1
+            elif not validate_only:
+                start = server._next_id
+                server._next_id += len(operations)
+
+        if errors and not partial_failure:
+            ex = fake_error("INVALID_ARGUMENT", errors[0].message)
+            ex.failure = SimpleNamespace(errors=errors)
+            raise ex
+        response = Message(results=[])
+        if errors:
+            failure = Message(errors=errors)
+            response.partial_failure_error = Message(
+                code=3,
+                message=(
+                    errors[0].message
+                    if len(errors) == 1
+                    else "Multiple errors in 'details' field."
+                ),
+                details=[Message(value=Message.serialize(failure))],
+            )
+        if validate_only:
+            return response
+
+        rejected = {error.location.field_path_elements[0].index for error in errors}
+        for offset, operation in enumerate(operations):
+            if offset in rejected:
+                # Failed operations come back as empty results
+                response.results.append(Message(resource_name=""))
+                continue
+            response.results.append(
+                Message(
+                    resource_name=_resource_name(
+                        operation, customer_id, self.collection, start + offset
+                    )
+                )
+            )
+        return response
+
+
+def _resource_name(operation, customer_id, collection, new_id):
+    """Resource an operation targets: the removed or updated one, or a new one."""
+    if isinstance(operation, Message):
+        if isinstance(operation.__dict__.get("remove"), str):
+            return operation.remove
+        if operation.__dict__.get("update"):
+            resource_name = operation.update.__dict__.get("resource_name")
+            if resource_name:
+                return resource_name
+    return f"customers/{customer_id}/{collection}/{new_id}"
+
+
+class FakeBatchJobService:
+    """
+    BatchJobService stand-in.
+
+    Staged operations are executed when the job's long-running operation
+    first reports done, after FakeAdsServer.batch_job_polls unfinished
+    checks. Rejected operations (see FakeAdsServer.reject) fail with a
+    status in their result; the others get resource names like
+    FakeMutateService results. server.batch_jobs holds every job.
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def mutate_batch_job(self, request=None, customer_id=None, operation=None):
+        if request is not None:
+            customer_id = request.customer_id
+        server = self.server
+        server._before_request("mutate_batch_job", mutate=True)
+        server.account(customer_id)
+        with server._lock:
+            resource_name = f"customers/{customer_id}/batchJobs/{server._next_id}"
+            server._next_id += 1
+            server.batch_jobs[resource_name] = {
+                "customer_id": str(customer_id),
+                "operations": [],
+                "status": "PENDING",
+                "polls": 0,
+                "results": None,
+            }
+        return Message(result=Message(resource_name=resource_name))
+
+    def add_batch_job_operations(
+        self,
+        request=None,
+        resource_name=None,
+        sequence_token=None,
+        mutate_operations=None,
+    ):
+        if request is not None:
+            resource_name = request.resource_name
+            sequence_token = request.sequence_token
+            mutate_operations = request.mutate_operations
+        server = self.server
+        server._before_request("add_batch_job_operations", mutate=True)
+        job = self._job(resource_name)
+        with server._lock:
+            # Like the API, a stale or missing token after the first add fails
+            expected = str(len(job["operations"])) if job["operations"] else None
+            if job["status"] != "PENDING" or (sequence_token or None) != expected:
+                server.stats["errors"] += 1
+                raise fake_error(
+                    "INVALID_ARGUMENT", "Fake API error: invalid sequence token"
+                )
+            job["operations"].extend(mutate_operations or [])
+            server.stats["mutate_operations"] += len(mutate_operations or [])
+            total = len(job["operations"])
+        return Message(total_operations=total, next_sequence_token=str(total))
+
+    def run_batch_job(self, request=None, resource_name=None):
+        if request is not None:
+            resource_name = request.resource_name
+        self.server._before_request("run_batch_job", mutate=True)
+        job = self._job(resource_name)
+        with self.server._lock:
+            job["status"] = "RUNNING"
+        return _FakeBatchJobOperation(self, resource_name)
+
+    def list_batch_job_results(
+        self, request=None, resource_name=None, page_size=None, page_token=None
+    ):
+        """One page of results: results and next_page_token, like the pager."""
+        if request is not None:
+            resource_name = request.resource_name
+            page_size = request.page_size
+            page_token = request.page_token
+        self.server._before_request("list_batch_job_results", mutate=True)
+        job = self._job(resource_name)
+        if job["status"] != "DONE":
+            raise fake_error(
+                "FAILED_PRECONDITION", "Fake API error: batch job not done"
+            )
+        # Page tokens are the offset of the page's first result
+        start = int(page_token or 0)
+        end = start + (page_size or 1000)
+        return Message(
+            results=job["results"][start:end],
+            next_page_token=str(end) if end < len(job["results"]) else "",
+        )
+
+    def _job(self, resource_name):
+        job = self.server.batch_jobs.get(resource_name)
+        if job is None:
+            raise fake_error(
+                "NOT_FOUND", f"Fake API error: unknown batch job {resource_name}"
+            )
+        return job
+
+    def _execute(self, job):
+        server = self.server
+        customer_id = job["customer_id"]
+        results = []
+        for index, mutate_operation in enumerate(job["operations"]):
+            # The one MutateOperation field that is set
+            field = next(iter(vars(mutate_operation)))
+            operation = getattr(mutate_operation, field)
+            errors = server._rejections([operation])
+            if errors:
+                failure = Message(errors=errors)
+                status = Message(
+                    code=3,
+                    message=errors[0].message,
+                    details=[Message(value=Message.serialize(failure))],
+                )
+                results.append(Message(operation_index=index, status=status))
+                continue
+            kind = field[: -len("_operation")]
+            with server._lock:
+                new_id = server._next_id
+                server._next_id += 1
+            response = Message()
+            setattr(
+                response,
+                f"{kind}_result",
+                Message(
+                    resource_name=_resource_name(
+                        operation, customer_id, _collection(kind), new_id
+                    )
+                ),
+            )
+            results.append(
+                Message(
+                    operation_index=index,
+                    status=Message(code=0),
+                    mutate_operation_response=response,
+                )
+            )
+        return results
+
+
+class _FakeBatchJobOperation:
+    """Long-running operation of a started fake batch job."""
+
+    def __init__(self, service, resource_name):
+        self.service = service
+        self.resource_name = resource_name
+
+    def done(self):
+        server = self.service.server
+        # Every check is a GetOperation request (see FakeAdsServer.fail_next)
+        server._before_request("get_operation", mutate=True)
+        job = server.batch_jobs[self.resource_name]
+        with server._lock:
+            job["polls"] += 1
+            ready = job["status"] == "RUNNING" and job["polls"] > server.batch_job_polls
+            if ready:
+                job["status"] = "EXECUTING"
+        if ready:
+            results = self.service._execute(job)
+            with server._lock:
+                job["results"] = results
+                job["status"] = "DONE"
+        return job["status"] == "DONE"
+
+
+class FakeGoogleAdsClient:
+    """GoogleAdsClient stand-in bound to a FakeAdsServer."""
+
+    def __init__(self, server):
+        self.server = server
+        self.enums = _Enums()
+
+    def get_service(self, name, version=None):
+        if name == "GoogleAdsService":
+            return FakeGoogleAdsService(self.server)
+        if name == "BatchJobService":
+            return FakeBatchJobService(self.server)
+        return FakeMutateService(self.server, name)
+
+    def get_type(self, name, version=None):
+        return Message()
+
+    def copy_from(self, destination, origin):
+        destination.__dict__.update(origin.__dict__)
+
+
+# ============================================
+# Server
+# ============================================
+
+
+class FakeAdsServer:
+    """
+    Synthetic Google Ads API with configurable latency and error injection.
+
+    Args:
+        accounts: FakeAccount instances served by customer ID
+        latency: Seconds every request waits before answering
+        batch_latency: Seconds each streamed batch takes
+        error_rate: Probability that a request fails with error_status
+        error_status: gRPC status name of random failures (UNAVAILABLE,
+            RESOURCE_EXHAUSTED, INTERNAL, DEADLINE_EXCEEDED, INVALID_ARGUMENT...)
+        batch_size: Rows per search_stream batch
+        seed: Seeds the error injection
+        today: Reference date for DURING filters (defaults to date.today())
+        batch_job_polls: Unfinished done() checks before a started batch job
+            completes
+
+    stats counts requests, search_streams, mutates, batches, rows,
+    mutate_operations and errors; mutations records (method, customer ID,
+    operation count) per mutate request.
+    """
+
+    def __init__(
+        self,
+        accounts=(),
+        latency=0.0,
+        batch_latency=0.0,
+        error_rate=0.0,
+        error_status="UNAVAILABLE",
+        batch_size=DEFAULT_BATCH_SIZE,
+        seed=0,
+        today=None,
+        batch_job_polls=2,
+    ):
+        self.accounts = {}
+        for account in accounts:
+            self.add_account(account)
+        self.latency = latency
+        self.batch_latency = batch_latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.batch_size = batch_size
+        self.today = today
+        self.batch_job_polls = batch_job_polls
+        self.batch_jobs = {}
+        self.client = FakeGoogleAdsClient(self)
+        self.stats = dict.fromkeys(
+            (
+                "requests",
+                "search_streams",
+                "mutates",
+                "batches",
+                "rows",
+                "mutate_operations",
+                "errors",
+            ),
+            0,
+        )
+        self.mutations = []
+        self._faults = []
+        self._rejects = []
+        self._next_id = 1
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def add_account(self, account):
+        self.accounts[account.customer_id] = account
+        return account
+
+    def account(self, customer_id):
+        account = self.accounts.get(str(customer_id))
+        if account is None:
+            raise fake_error(
+                "PERMISSION_DENIED", f"Fake API error: unknown customer {customer_id}"
+            )
+        return account
+
+    def fail_next(self, status="UNAVAILABLE", times=1, after_batches=0, method=None):
+        """
+        Make the next matching requests fail.
+
+        Args:
+            status: gRPC status name of the error
+            times: Number of requests to fail
+            after_batches: Fail mid-stream after this many search_stream
+                batches instead of before the first
+            method: Only fail this method (e.g. "search_stream",
+                "mutate_campaigns", or "get_operation" for batch job status
+                checks); None matches any
+        """
+        with self._lock:
+            self._faults.extend([(status, after_batches, method)] * times)
+
+    def reject(self, predicate, error="request_error.INVALID_INPUT", message=None):
+        """
+        Reject every mutate operation a predicate matches.
+
+        Args:
+            predicate: Callable taking an operation message, e.g.
+                lambda op: "bad" in op.create.keyword.text
+            error: "field.NAME" error code the operation fails with
+            message: Error message (defaults to one naming the code)
+        """
+        field, name = error.split(".", 1)
+        with self._lock:
+            self._rejects.append(
+                (predicate, field, name, message or f"Fake operation error: {name}")
+            )
+
+    def _rejections(self, operations):
+        """GoogleAdsError stand-ins for the rejected operations, by index."""
+        errors = []
+        for index, operation in enumerate(operations):
+            for predicate, field, name, message in self._rejects:
+                if predicate(operation):
+                    errors.append(
+                        Message(
+                            # Plain namespace: only the set oneof field exists
+                            error_code=SimpleNamespace(**{field: Enum(name)}),
+                            message=message,
+                            location=Message(
+                                field_path_elements=[
+                                    Message(field_name="operations", index=index)
+                                ]
+                            ),
+                        )
+                    )
+                    break
+        return errors
+
+    def _before_request(self, method, mutate=False):
+        """Count a request, apply latency and raise an injected error, if any."""
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["mutates" if mutate else "search_streams"] += 1
+            fault = None
+            for index, (status, after_batches, fault_method) in enumerate(self._faults):
+                if fault_method in (None, method):
+                    fault = self._faults.pop(index)
+                    break
+            if fault is None and self.error_rate and (
+                self._random.random() < self.error_rate
+            ):
+                fault = (self.error_status, 0, None)
+            if fault is not None and (mutate or not fault[1]):
+                self.stats["errors"] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fault is not None and (mutate or not fault[1]):
+            raise fake_error(fault[0])
+        # Mid-stream faults are raised by _stream
+        return fault
+
+    def _stream(self, plan, fault=None):
+        batches = 0
+        for start in range(0, plan.total, self.batch_size):
+            if fault is not None and batches == fault[1]:
+                with self._lock:
+                    self.stats["errors"] += 1
+                raise fake_error(fault[0])
+            if self.batch_latency:
+                time.sleep(self.batch_latency)
+            results = plan.rows(start, min(start + self.batch_size, plan.total))
+            batches += 1
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["rows"] += len(results)
+            yield Message(results=results)
+
+    @contextlib.contextmanager
+    def install(self):
+        """
+        Route AdsConnector to this server for the duration of the block.
+
+        Connectors created inside get the fake client instead of a real one
+        and skip the credentials check. Without google-ads installed, the
+        SDK names the connector catches (GoogleAdsException,
+        protobuf_helpers) resolve to the fakes as well.
+        """
+        from backend.services import ads_connector
+
+        get_client = client_pool.get_client
+        ensure_credentials = ads_connector.ensure_credentials
+        client_pool.get_client = lambda config: self.client
+        ads_connector.ensure_credentials = lambda: "fake Google Ads API"
+        try:
+            with sdk_stand_ins():
+                yield self
+        finally:
+            client_pool.get_client = get_client
+            ads_connector.ensure_credentials = ensure_credentials
+            # Pooled stubs of the fake client must not outlive it
+            with client_pool._lock:
+                for key in list(client_pool._services):
+                    if key[0] == id(self.client):
+                        del client_pool._services[key]
@@ -0,0 +1,619 @@
+"""
+Record/Replay Harness.
+Captures live Google Ads search_stream and GA4 Data/Admin API responses to a
+compact on-disk fixture, then serves them back without network access, so
+an audit can be re-run deterministically for profiling and regression
+benchmarks.
+
+A fixture directory holds:
+    index.json      - one entry per call: method, request key, timings,
+                      batch sizes, response type and payload location
+    responses.bin   - the zlib-compressed, length-prefixed serialized
+                      response messages of every call, back to back
+
+Responses keep their wire format (proto-plus serialize/deserialize), so a
+replayed audit decodes the same messages as the live one. Replay therefore
+needs the client libraries installed, but no credentials or network.
+
+Before anything is written, string fields are scrubbed: fields named in
+SCRUB_FIELDS (e-mail addresses, click IDs) are replaced by stable tokens,
+and e-mail addresses or phone numbers inside any other string are masked.
+Tokens are stable within a fixture, so joins on scrubbed values still hold.
+
+Usage:
+    with Recorder("fixtures/acme").install():
+        run_audit("1234567890")
+
+    with Replayer("fixtures/acme", speed=2.0).install():
+        run_audit("1234567890")
+"""
+
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+from backend.services import _sdk, client_pool
+from backend.services.report_cache import _decode, _encode, normalize_query
+from backend.services.retry import _status_name
+
+FIXTURE_VERSION = 1
+INDEX_FILE = "index.json"
+DATA_FILE = "responses.bin"
+
+# Unary GA4 methods whose responses are recorded (list_* pagers always are)
+GA4_METHODS = {
+    "run_report",
+    "run_realtime_report",
+    "run_pivot_report",
+    "batch_run_reports",
+    "check_compatibility",
+    "get_metadata",
+}
+
+# String fields replaced by a stable token wherever they occur
+SCRUB_FIELDS = {"user_email", "email", "email_address", "gclid", "phone_number"}
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+")
+_PHONE = re.compile(r"\+\d[\d\s().-]{7,}\d")
+_ISO_DATE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+
+# Placeholder credentials that let GA4Service initialize during replay
+_REPLAY_ENV = ("GOOGLE_ADS_CLIENT_ID", "GOOGLE_ADS_CLIENT_SECRET", "GOOGLE_ADS_REFRESH_TOKEN")
+
+
+class FixtureMissError(KeyError):
+    """A replayed request was not recorded in the fixture."""
+
+
+# ============================================
+# Keys, serialization and scrubbing
+# ============================================
+
+
+def _fingerprint(value):
+    """Canonical text of a request argument (messages by serialized bytes)."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    if isinstance(value, dict):
+        items = sorted(value.items())
+        return "{" + ",".join(f"{k}:{_fingerprint(v)}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(map(_fingerprint, value)) + "]"
+    serialize = getattr(type(value), "serialize", None)
+    if serialize is not None:
+        return hashlib.sha256(serialize(value)).hexdigest()
+    if hasattr(value, "__dict__"):
+        return type(value).__name__ + _fingerprint(vars(value))
+    return repr(value)
+
+
+def request_key(method, args=(), kwargs=None):
+    """Fixture key of an API call."""
+    kwargs = dict(kwargs or {})
+    if method == "search_stream" and "query" in kwargs:
+        kwargs["query"] = normalize_query(kwargs["query"])
+    text = f"{method}|{_fingerprint(list(args))}|{_fingerprint(kwargs)}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def _type_name(message):
+    cls = type(message)
+    if getattr(cls, "serialize", None) is None:
+        return "pickle"
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _serialize(message):
+    cls = type(message)
+    if getattr(cls, "serialize", None) is None:
+        return pickle.dumps(message)
+    return cls.serialize(message)
+
+
+def _deserializer(type_name):
+    if type_name == "pickle":
+        return pickle.loads
+    module, _, qualname = type_name.partition(":")
+    cls = importlib.import_module(module)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+    return cls.deserialize
+
+
+class Scrubber:
+    """
+    Replaces personal data in response messages before they are stored.
+
+    Args:
+        fields: Field names whose values are replaced by a stable token
+        salt: Mixed into the tokens (defaults to a random per-fixture salt)
+    """
+
+    def __init__(self, fields=SCRUB_FIELDS, salt=None):
+        self.fields = set(fields)
+        self.salt = salt if salt is not None else os.urandom(8).hex()
+
+    def token(self, value):
+        digest = hashlib.sha256(f"{self.salt}{value}".encode("utf-8")).hexdigest()
+        return digest[:12]
+
+    def field(self, name, value):
+        if not value:
+            return value
+        if name in self.fields:
+            if "@" in value:
+                return f"user-{self.token(value)}@example.com"
+            return f"{name}-{self.token(value)}"
+        return self.text(value)
+
+    def text(self, value):
+        if "@" in value:
+            value = _EMAIL.sub(lambda m: f"user-{self.token(m.group())}@example.com", value)
+        if "+" in value:
+            value = _PHONE.sub(lambda m: f"+00 {self.token(m.group())[:8]}", value)
+        return value
+
+    def scrub(self, message):
+        """Scrub a message in place (proto-plus, raw protobuf or attribute bag)."""
+        cls = type(message)
+        if callable(getattr(cls, "pb", None)):
+            self._scrub_pb(cls.pb(message))
+        elif callable(getattr(cls, "ListFields", None)):
+            self._scrub_pb(message)
+        elif hasattr(message, "__dict__"):
+            self._scrub_object(message)
+        return message
+
+    def _scrub_pb(self, pb):
+        for field, value in pb.ListFields():
+            repeated = field.label == field.LABEL_REPEATED
+            if field.type == field.TYPE_STRING:
+                if repeated:
+                    value[:] = [self.field(field.name, v) for v in value]
+                else:
+                    setattr(pb, field.name, self.field(field.name, value))
+            elif field.type == field.TYPE_MESSAGE:
+                if field.message_type.GetOptions().map_entry:
+                    continue
+                for item in value if repeated else (value,):
+                    self._scrub_pb(item)
+
+    def _scrub_object(self, message):
+        fields = message.__dict__
+        for name, value in fields.items():
+            if isinstance(value, str):
+                fields[name] = self.field(name, value)
+            elif isinstance(value, list):
+                fields[name] = [
+                    self.field(name, v) if isinstance(v, str) else self.scrub(v)
+                    for v in value
+                ]
+            elif hasattr(value, "__dict__") and not callable(value):
+                self.scrub(value)
+
+
+# ============================================
+# Fixture storage
+# ============================================
+
+
+class Fixture:
+    """index.json plus responses.bin of one recording."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.index_path = self.directory / INDEX_FILE
+        self.data_path = self.directory / DATA_FILE
+
+    def load(self):
+        with open(self.index_path) as f:
+            index = json.load(f)
+        if index.get("version") != FIXTURE_VERSION:
+            raise ValueError(
+                f"Unsupported fixture version {index.get('version')} in {self.directory}"
+            )
+        return index
+
+    def read(self, entry):
+        """Serialized messages of an index entry."""
+        with open(self.data_path, "rb") as f:
+            f.seek(entry["offset"])
+            return _decode(f.read(entry["size"]))
+
+
+# ============================================
+# Recording
+# ============================================
+
+
+class Recorder:
+    """
+    Records API responses to a fixture directory.
+
+    Args:
+        directory: Fixture directory (created; an existing fixture is replaced)
+        scrub: Scrub personal data before writing (see Scrubber)
+        scrubber: Custom Scrubber instance
+
+    Connectors and GA4 services created inside install() are recorded
+    automatically; existing ones can be wrapped with attach().
+    """
+
+    def __init__(self, directory, scrub=True, scrubber=None):
+        self.fixture = Fixture(directory)
+        self.scrubber = scrubber or (Scrubber() if scrub else None)
+        self.entries = []
+        self._lock = threading.Lock()
+        self._data = None
+
+    def _open(self):
+        if self._data is None:
+            self.fixture.directory.mkdir(parents=True, exist_ok=True)
+            self._data = open(self.fixture.data_path, "wb")
+        return self._data
+
+    def _store(self, entry, messages):
+        records = [_serialize(message) for message in messages]
+        if self.scrubber is not None and records:
+            # Scrub copies; the live messages belong to the caller
+            deserialize = _deserializer(entry["type"])
+            records = [
+                _serialize(self.scrubber.scrub(deserialize(record)))
+                for record in records
+            ]
+        payload = _encode(records)
+        with self._lock:
+            data = self._open()
+            entry["offset"] = data.tell()
+            entry["size"] = len(payload)
+            data.write(payload)
+            entry["sequence"] = len(self.entries)
+            self.entries.append(entry)
+
+    def save(self):
+        """Write index.json (entries in call order) and close the data file."""
+        with self._lock:
+            self._open().close()
+            self._data = None
+            index = {
+                "version": FIXTURE_VERSION,
+                "recorded_on": date.today().isoformat(),
+                "calls": self.entries,
+            }
+            with open(self.fixture.index_path, "w") as f:
+                json.dump(index, f, indent=1)
+        return self.fixture.index_path
+
+    def _record_stream(self, method, key, call, args, kwargs):
+        """Pass a streamed call through, recording batches as they arrive."""
+        start = time.perf_counter()
+        entry = {"method": method, "key": key, "batches": [], "elapsed": []}
+        messages = []
+        try:
+            for batch in call(*args, **kwargs):
+                results = list(batch.results)
+                entry["elapsed"].append(round(time.perf_counter() - start, 6))
+                entry["batches"].append(len(results))
+                if results and "type" not in entry:
+                    entry["type"] = _type_name(results[0])
+                messages.extend(results)
+                yield batch
+        except Exception as ex:
+            entry["error"] = {"status": _status_name(ex), "message": str(ex)}
+            raise
+        finally:
+            entry["elapsed"].append(round(time.perf_counter() - start, 6))
+            entry.setdefault("type", "pickle")
+            self._store(entry, messages)
+
+    def _record_call(self, method, key, call, args, kwargs, paged):
+        start = time.perf_counter()
+        entry = {"method": method, "key": key}
+        messages = []
+        try:
+            response = call(*args, **kwargs)
+            # Pagers are drained, so every page is recorded
+            messages = list(response) if paged else [response]
+            return messages if paged else response
+        except Exception as ex:
+            entry["error"] = {"status": _status_name(ex), "message": str(ex)}
+            raise
+        finally:
+            entry["elapsed"] = [round(time.perf_counter() - start, 6)]
+            entry["paged"] = paged
+            entry["type"] = _type_name(messages[0]) if messages else "pickle"
+            self._store(entry, messages)
+
+    def wrap(self, service):
+        """Recording proxy of a GoogleAdsService stub or GA4 client."""
+        return _RecordingProxy(self, service)
+
+    def attach(self, service):
+        """Record an existing AdsConnector or GA4Service from now on."""
+        return _attach(service, self.wrap)
+
+    @contextlib.contextmanager
+    def install(self):
+        """Record every connector and GA4 service created inside the block."""
+        get_service = client_pool.get_service
+
+        def recording_get_service(client, name):
+            service = get_service(client, name)
+            return self.wrap(service) if name == "GoogleAdsService" else service
+
+        client_pool.get_service = recording_get_service
+        patched = {}
+        for name in ("BetaAnalyticsDataClient", "AnalyticsAdminServiceClient"):
+            try:
+                cls = getattr(_sdk, name)
+            except ImportError:
+                continue
+            patched[name] = cls
+            setattr(_sdk, name, _factory(cls, self.wrap))
+        try:
+            yield self
+        finally:
+            client_pool.get_service = get_service
+            for name, cls in patched.items():
+                setattr(_sdk, name, cls)
+            self.save()
+
+
+def _factory(cls, wrap):
+    return lambda *args, **kwargs: wrap(cls(*args, **kwargs))
+
+
+def _attach(service, wrap):
+    if hasattr(service, "ga_service"):
+        service.ga_service = wrap(service.ga_service)
+    for name in ("client", "admin_client"):
+        if getattr(service, name, None) is not None and not hasattr(
+            service, "ga_service"
+        ):
+            setattr(service, name, wrap(getattr(service, name)))
+    return service
+
+
+def _recorded(method):
+    """How a method is recorded: "stream", "paged", "unary" or None."""
+    if method == "search_stream":
+        return "stream"
+    if method.startswith("list_"):
+        return "paged"
+    if method in GA4_METHODS or method.startswith("get_"):
+        return "unary"
+    return None
+
+
+class _RecordingProxy:
+    def __init__(self, recorder, target):
+        self._recorder = recorder
+        self._target = target
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        kind = _recorded(name)
+        if kind is None or not callable(attribute):
+            return attribute
+
+        recorder = self._recorder
+
+        def call(*args, **kwargs):
+            key = request_key(name, args, kwargs)
+            if kind == "stream":
+                return recorder._record_stream(name, key, attribute, args, kwargs)
+            return recorder._record_call(
+                name, key, attribute, args, kwargs, paged=kind == "paged"
+            )
+
+        return call
+
+
+# ============================================
+# Replay
+# ============================================
+
+
+class Replayer:
+    """
+    Serves recorded responses instead of calling the APIs.
+
+    Args:
+        directory: Fixture directory written by Recorder
+        speed: None replays as fast as possible; otherwise the recorded
+            timings are reproduced divided by speed (1.0 = recorded pace)
+        today: Date the replay runs on (defaults to date.today()). Queries
+            with explicit dates are matched after shifting them back by the
+            days since the recording, so relative windows still hit.
+
+    Repeated identical requests get the recorded responses in order (e.g. a
+    failed attempt and its retry); once those run out the last one repeats.
+    Only reads are recorded, so mutations raise FixtureMissError.
+    """
+
+    def __init__(self, directory, speed=None, today=None):
+        self.fixture = Fixture(directory)
+        index = self.fixture.load()
+        self.entries = {}
+        for entry in index["calls"]:
+            self.entries.setdefault(entry["key"], []).append(entry)
+        self.shift = (today or date.today()) - date.fromisoformat(
+            index["recorded_on"]
+        )
+        self.speed = speed
+        self.served = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, method, args, kwargs):
+        keys = [request_key(method, args, kwargs)]
+        if self.shift and method == "search_stream" and "query" in kwargs:
+            shifted = dict(kwargs, query=_shift_dates(kwargs["query"], self.shift))
+            keys.append(request_key(method, args, shifted))
+
+        for key in keys:
+            entries = self.entries.get(key)
+            if entries:
+                with self._lock:
+                    count = self.served.get(key, 0)
+                    self.served[key] = count + 1
+                return entries[min(count, len(entries) - 1)]
+
+        detail = kwargs.get("query") or args or kwargs
+        raise FixtureMissError(f"{method} not recorded in {self.fixture.directory}: {detail}")
+
+    def _wait(self, start, elapsed):
+        if self.speed:
+            delay = elapsed / self.speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+    def _messages(self, entry):
+        deserialize = _deserializer(entry["type"])
+        return [deserialize(record) for record in self.fixture.read(entry)]
+
+    def _replay_stream(self, entry):
+        start = time.perf_counter()
+        messages = self._messages(entry)
+        offset = 0
+        for size, elapsed in zip(entry["batches"], entry["elapsed"]):
+            self._wait(start, elapsed)
+            yield SimpleNamespace(results=messages[offset : offset + size])
+            offset += size
+        if "error" in entry:
+            self._wait(start, entry["elapsed"][-1])
+            raise _replayed_error(entry)
+
+    def _replay_call(self, entry):
+        start = time.perf_counter()
+        messages = self._messages(entry)
+        self._wait(start, entry["elapsed"][-1])
+        if "error" in entry:
+            raise _replayed_error(entry)
+        return messages if entry.get("paged") else messages[0]
+
+    def proxy(self):
+        """Replaying stand-in for a GoogleAdsService stub or GA4 client."""
+        return _ReplayProxy(self)
+
+    def attach(self, service):
+        """Serve an existing AdsConnector or GA4Service from the fixture."""
+        return _attach(service, lambda _: self.proxy())
+
+    @contextlib.contextmanager
+    def install(self):
+        """
+        Serve every connector and GA4 service created inside the block from
+        the fixture; no credentials are needed.
+        """
+        from backend.services import ads_connector, ga4_service
+        from backend.testing.fake_ads import sdk_stand_ins
+
+        client = _ReplayClient(self)
+        get_client = client_pool.get_client
+        ads_credentials = ads_connector.ensure_credentials
+        ga4_credentials = ga4_service.ensure_credentials
+        environment = {name: os.environ.get(name) for name in _REPLAY_ENV}
+        sdk_names = (
+            "BetaAnalyticsDataClient",
+            "AnalyticsAdminServiceClient",
+            "Credentials",
+        )
+        sdk_saved = {name: _sdk.__dict__.get(name) for name in sdk_names}
+
+        client_pool.get_client = lambda config: client
+        source = f"replay fixture {self.fixture.directory}"
+        ads_connector.ensure_credentials = lambda: source
+        ga4_service.ensure_credentials = ads_connector.ensure_credentials
+        for name in _REPLAY_ENV:
+            os.environ.setdefault(name, "replay")
+        _sdk.Credentials = lambda **kwargs: None
+        _sdk.BetaAnalyticsDataClient = lambda **kwargs: self.proxy()
+        _sdk.AnalyticsAdminServiceClient = lambda **kwargs: self.proxy()
+        try:
+            with sdk_stand_ins():
+                yield self
+        finally:
+            client_pool.get_client = get_client
+            ads_connector.ensure_credentials = ads_credentials
+            ga4_service.ensure_credentials = ga4_credentials
+            for name, value in environment.items():
+                if value is None:
+                    os.environ.pop(name, None)
+            for name, value in sdk_saved.items():
+                if value is None:
+                    _sdk.__dict__.pop(name, None)
+                else:
+                    setattr(_sdk, name, value)
+            with client_pool._lock:
+                for key in list(client_pool._services):
+                    if key[0] == id(client):
+                        del client_pool._services[key]
+
+
+def _shift_dates(query, shift):
+    """Move the ISO dates of a query back by shift (a timedelta)."""
+    return _ISO_DATE.sub(
+        lambda m: (date.fromisoformat(m.group()) - shift).isoformat(), query
+    )
+
+
+def _replayed_error(entry):
+    from backend.testing.fake_ads import fake_error
+
+    error = entry["error"]
+    return fake_error(error["status"] or "UNKNOWN", error["message"])
+
+
+class _ReplayClient:
+    """GoogleAdsClient stand-in whose GoogleAdsService is the fixture."""
+
+    def __init__(self, replayer):
+        from backend.testing.fake_ads import FakeGoogleAdsClient
+
+        self._replayer = replayer
+        self._types = FakeGoogleAdsClient(server=None)
+        self.enums = self._types.enums
+
+    def get_service(self, name, version=None):
+        return _ReplayProxy(self._replayer, name)
+
+    def get_type(self, name, version=None):
+        return self._types.get_type(name, version)
+
+    def copy_from(self, destination, origin):
+        self._types.copy_from(destination, origin)
+
+
+class _ReplayProxy:
+    def __init__(self, replayer, service=None):
+        self._replayer = replayer
+        self._service = service
+
+    def __getattr__(self, name):
+        if name.endswith("_path"):
+            from backend.testing.fake_ads import FakeGoogleAdsService
+
+            return getattr(FakeGoogleAdsService(server=None), name)
+        kind = _recorded(name)
+        if kind is None:
+            # Fixtures cover reads only; mutations have nothing to replay
+            service = self._service or "client"
+            raise FixtureMissError(f"{service}.{name} is not replayed")
+        replayer = self._replayer
+
+        def call(*args, **kwargs):
+            entry = replayer._entry(name, args, kwargs)
+            if kind == "stream":
+                return replayer._replay_stream(entry)
+            return replayer._replay_call(entry)
+
+        return call
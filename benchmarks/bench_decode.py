@@ -0,0 +1,47 @@
+"""
+Row decoding benchmarks.
+Rows are generated by the fake API in setup, so only the conversion of
+GoogleAdsRow messages into report rows is timed: the per-row dict decoder
+used by every getter and the column-wise decoder behind DataFrame output.
+"""
+
+from backend.services.columnar import ColumnarDecoder
+from backend.services.report_registry import get_report
+from backend.testing.fake_ads import FakeAdsServer, FakeGoogleAdsService
+
+from benchmarks.harness import CUSTOMER_ID, SIZES, synthetic_account
+
+# Reports with the most rows in a typical audit
+REPORTS = (
+    "campaign_performance",
+    "keyword_performance",
+    "search_terms",
+    "ad_performance",
+)
+
+
+class DecodeRows:
+    params = (REPORTS, list(SIZES))
+    param_names = ("report", "size")
+
+    def setup(self, report, size):
+        self.spec = get_report(report)
+        service = FakeGoogleAdsService(FakeAdsServer([synthetic_account(size)]))
+        self.batches = [
+            list(batch.results)
+            for batch in service.search_stream(
+                customer_id=CUSTOMER_ID, query=self.spec.build_query()
+            )
+        ]
+        self.units = sum(map(len, self.batches))
+
+    def time_decode(self, report, size):
+        decode = self.spec.decoder(CUSTOMER_ID)
+        for batch in self.batches:
+            for row in batch:
+                decode(row)
+
+    def time_decode_columns(self, report, size):
+        decoder = ColumnarDecoder(self.spec, CUSTOMER_ID)
+        for batch in self.batches:
+            decoder.append(batch)
@@ -0,0 +1,70 @@
+"""
+Hook benchmarks.
+Runs the phase gate and completion hooks the way Claude Code does (a fresh
+python3 process with the hook input on stdin), against an empty audit
+directory and one holding every phase artifact, so interpreter startup and
+the validation work are both part of the timing.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import PLUGIN_ROOT
+
+HOOKS = ("validate-phase-gate.py", "validate-completion.py")
+
+ARTIFACTS = {
+    "discovery_brief.md": "# Discovery Brief\n",
+    "tracking_audit.md": "# Tracking Audit\n",
+    "structure_analysis.md": "# Structure Analysis\n",
+    "performance_analysis.json": "{}",
+    "keyword_audit.json": "{}",
+    "ad_copy_audit.json": "{}",
+    "recommendations.json": "{}",
+    "audit_presentation.html": "<html></html>",
+}
+
+
+class RunHook:
+    params = (HOOKS, ("empty", "complete"))
+    param_names = ("hook", "audit")
+
+    def setup(self, hook, audit):
+        self.project_root = tempfile.mkdtemp()
+        audit_dir = Path(self.project_root) / "audits" / "benchmark-client"
+        audit_dir.mkdir(parents=True)
+        if audit == "complete":
+            for name, content in ARTIFACTS.items():
+                (audit_dir / name).write_text(content)
+        else:
+            (audit_dir / ".audit-in-progress").touch()
+
+        self.command = [sys.executable, str(PLUGIN_ROOT / "hooks" / hook)]
+        # The gate checks a write of the last phase's artifact
+        self.input = json.dumps(
+            {
+                "tool_name": "Write",
+                "tool_input": {
+                    "file_path": str(audit_dir / "audit_presentation.html")
+                },
+            }
+        )
+        self.env = dict(os.environ, CLAUDE_PROJECT_ROOT=self.project_root)
+
+    def teardown(self, hook, audit):
+        shutil.rmtree(self.project_root, ignore_errors=True)
+
+    def time_hook(self, hook, audit):
+        subprocess.run(
+            self.command,
+            input=self.input,
+            capture_output=True,
+            text=True,
+            cwd=self.project_root,
+            env=self.env,
+        )
@@ -0,0 +1,161 @@
+"""
+Pipeline benchmarks.
+Fetch, analyze and write stages of an audit against the fake Google Ads API
+(no network, no rate limiting, no retry backoff), plus run_audit end to end.
+Audit data for the artifact and report writers is collected once per size.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+
+from backend.analysis.artifacts import build_artifacts
+from backend.analysis.negative_conflicts import collect_negatives, find_conflicts
+from backend.analysis.ngrams import analyze_search_terms
+from backend.analysis.quality_score import analyze_quality_scores
+from backend.services.ads_connector import AdsConnector
+from backend.services.rate_limiter import RateLimiter
+from backend.services.retry import RetryPolicy
+from backend.testing.fake_ads import FakeAdsServer
+
+from benchmarks.harness import CUSTOMER_ID, SIZES, synthetic_account
+
+# Audit data collected by collect_audit, per size
+_AUDITS = {}
+
+
+def _connector():
+    return AdsConnector(
+        rate_limiter=RateLimiter(rate=1_000_000, burst=1000, per_customer_rate=None),
+        retry_policy=RetryPolicy(base_delay=0),
+    )
+
+
+def audit_data(size):
+    """collect_audit output for a synthetic account (cached per size)."""
+    if size not in _AUDITS:
+        from scripts.audit_account import collect_audit
+
+        server = FakeAdsServer([synthetic_account(size)])
+        with server.install():
+            _AUDITS[size] = collect_audit(CUSTOMER_ID, _connector())
+    return _AUDITS[size]
+
+
+class _FakeApi:
+    """Routes connectors created in setup to a fake API until teardown."""
+
+    def setup_api(self, size):
+        self.server = FakeAdsServer([synthetic_account(size)])
+        self._stack = contextlib.ExitStack()
+        self._stack.enter_context(self.server.install())
+        self.ads = _connector()
+
+    def teardown(self, *params):
+        self._stack.close()
+
+
+class FetchReport(_FakeApi):
+    params = (("keyword_performance", "search_terms"), list(SIZES))
+    param_names = ("report", "size")
+
+    def setup(self, report, size):
+        self.setup_api(size)
+        self.units = len(self.ads.run_report(report, CUSTOMER_ID))
+
+    def time_fetch(self, report, size):
+        self.ads.run_report(report, CUSTOMER_ID)
+
+    def time_fetch_stream(self, report, size):
+        for _ in self.ads.run_report(report, CUSTOMER_ID, stream=True):
+            pass
+
+
+class RunAudit(_FakeApi):
+    params = (list(SIZES),)
+    param_names = ("size",)
+
+    def setup(self, size):
+        from scripts.audit_account import run_audit
+
+        self.run_audit = run_audit
+        self.setup_api(size)
+        self.output_dir = tempfile.mkdtemp()
+
+    def teardown(self, size):
+        super().teardown(size)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def time_run_audit(self, size):
+        self.run_audit(
+            CUSTOMER_ID,
+            ads_connector=self.ads,
+            include_ga4=False,
+            output_dir=self.output_dir,
+        )
+
+
+class Analyze(_FakeApi):
+    params = (list(SIZES),)
+    param_names = ("size",)
+
+    def setup(self, size):
+        self.setup_api(size)
+        self.keywords = self.ads.get_keyword_performance(CUSTOMER_ID)
+        self.search_terms = self.ads.get_search_terms(CUSTOMER_ID)
+        self.negatives = (
+            self.ads.get_existing_negative_keywords(CUSTOMER_ID),
+            self.ads.get_shared_negative_keywords(CUSTOMER_ID),
+            self.ads.get_campaign_negative_lists(CUSTOMER_ID),
+        )
+        self.units = len(self.keywords) + len(self.search_terms)
+
+    def time_quality_scores(self, size):
+        analyze_quality_scores(self.keywords)
+
+    def time_ngrams(self, size):
+        analyze_search_terms(self.search_terms)
+
+    def time_negative_conflicts(self, size):
+        find_conflicts(
+            collect_negatives(*self.negatives),
+            keywords=self.keywords,
+            search_terms=self.search_terms,
+        )
+
+
+class BuildArtifacts:
+    params = (list(SIZES),)
+    param_names = ("size",)
+
+    def setup(self, size):
+        self.audit = audit_data(size)
+
+    def time_build_artifacts(self, size):
+        build_artifacts(self.audit)
+
+
+class WriteReports:
+    params = (list(SIZES),)
+    param_names = ("size",)
+
+    def setup(self, size):
+        from scripts.audit_account import generate_markdown_report
+
+        self.generate_markdown_report = generate_markdown_report
+        self.audit = audit_data(size)
+        self.output_dir = tempfile.mkdtemp()
+
+    def teardown(self, size):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def time_json(self, size):
+        with open(os.path.join(self.output_dir, "audit.json"), "w") as f:
+            json.dump(self.audit, f, indent=2)
+
+    def time_markdown(self, size):
+        self.generate_markdown_report(
+            self.audit, os.path.join(self.output_dir, "audit.md")
+        )
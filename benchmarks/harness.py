@@ -0,0 +1,296 @@
+"""
+Benchmark Harness.
+Discovers, runs and tracks asv-style benchmarks: classes in the suite
+modules with time_* methods, optional params/param_names, and
+setup/teardown called once per parameter combination. A setup that raises
+NotImplementedError or ImportError skips that combination (e.g. a missing
+optional dependency).
+
+Each run is appended to a JSONL history together with the git commit,
+Python version and machine, so results can be compared with the previous
+run on the same machine and regressions flagged.
+
+Usage:
+    results = run_benchmarks(sizes=["small"], pattern="decode")
+    run = append_history(results)
+    for row in compare(results, previous_run(load_history()[:-1])):
+        ...
+"""
+
+import contextlib
+import importlib
+import io
+import itertools
+import json
+import platform
+import re
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+from backend.testing.fake_ads import FakeAccount
+
+SUITES = (
+    "benchmarks.bench_decode",
+    "benchmarks.bench_pipeline",
+    "benchmarks.bench_hooks",
+)
+
+# Synthetic account sizes: keyword and search term rows per account
+SIZES = {"small": 1_000, "medium": 10_000, "large": 100_000}
+DEFAULT_SIZES = ("small", "medium")
+
+CUSTOMER_ID = "1234567890"
+
+DEFAULT_REPEAT = 5
+# Calls are looped until one sample takes at least this long
+DEFAULT_MIN_TIME = 0.05
+# Relative slowdown of the median reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+DEFAULT_HISTORY = Path.home() / ".mondaybrew" / "benchmarks" / "history.jsonl"
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+
+def synthetic_account(size, customer_id=CUSTOMER_ID):
+    """FakeAccount for a named size (see SIZES)."""
+    rows = SIZES[size]
+    return FakeAccount(
+        customer_id,
+        name=f"Benchmark {size}",
+        campaigns=max(10, rows // 1000),
+        keywords=rows,
+        search_terms=rows,
+        ads=rows // 5,
+    )
+
+
+# ============================================
+# Running
+# ============================================
+
+
+def discover(modules=SUITES, pattern=None):
+    """(benchmark name, class, method name) of every time_* benchmark."""
+    found = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        short = module_name.rsplit(".", 1)[-1]
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module_name:
+                continue
+            for method in sorted(vars(cls)):
+                if not method.startswith("time_"):
+                    continue
+                name = f"{short}.{cls.__name__}.{method}"
+                if pattern is None or re.search(pattern, name):
+                    found.append((name, cls, method))
+    return found
+
+
+def parameter_sets(cls, sizes=None):
+    """Parameter combinations of a benchmark class, limited to sizes."""
+    params = getattr(cls, "params", None)
+    if not params:
+        return [{}]
+    names = getattr(cls, "param_names", None) or [
+        f"param{i}" for i in range(len(params))
+    ]
+    combos = []
+    for values in itertools.product(*params):
+        combo = dict(zip(names, values))
+        if sizes is not None and "size" in combo and combo["size"] not in sizes:
+            continue
+        combos.append(combo)
+    return combos
+
+
+def _time(func, args, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func(*args)
+    return (time.perf_counter() - start) / number
+
+
+def run_benchmark(
+    name, cls, method, params, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME
+):
+    """
+    Time one benchmark method with one parameter combination.
+
+    Returns:
+        Result dict with name, params and median/min/max/stdev seconds per
+        call (or "skipped" with the reason). Benchmarks that set self.units
+        in setup (rows processed per call) also get units_per_second.
+    """
+    result = {"name": name, "params": params}
+    args = tuple(params.values())
+    instance = cls()
+    # Connectors and report writers print progress; keep the output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            if hasattr(instance, "setup"):
+                instance.setup(*args)
+        except (NotImplementedError, ImportError) as e:
+            result["skipped"] = str(e) or type(e).__name__
+            return result
+
+        try:
+            func = getattr(instance, method)
+            # The first call warms caches and calibrates the loop count
+            first = _time(func, args, 1)
+            number = max(1, int(min_time / first) + 1) if first < min_time else 1
+            samples = [_time(func, args, number) for _ in range(repeat)]
+        finally:
+            if hasattr(instance, "teardown"):
+                instance.teardown(*args)
+
+    median = statistics.median(samples)
+    result.update(
+        median=median,
+        min=min(samples),
+        max=max(samples),
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        repeat=repeat,
+        number=number,
+    )
+    units = getattr(instance, "units", None)
+    if units:
+        result["units_per_second"] = units / median
+    return result
+
+
+def run_benchmarks(
+    modules=SUITES,
+    pattern=None,
+    sizes=DEFAULT_SIZES,
+    repeat=DEFAULT_REPEAT,
+    min_time=DEFAULT_MIN_TIME,
+    progress=None,
+):
+    """
+    Run every discovered benchmark for every parameter combination.
+
+    Args:
+        pattern: Regular expression selecting benchmark names
+        sizes: Synthetic account sizes to run (benchmarks with a "size" param)
+        progress: Called with each result as soon as it is measured
+    """
+    sizes = list(sizes)
+    results = []
+    for name, cls, method in discover(modules, pattern):
+        for params in parameter_sets(cls, sizes):
+            result = run_benchmark(name, cls, method, params, repeat, min_time)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+# ============================================
+# History
+# ============================================
+
+
+def _git_commit():
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=PLUGIN_ROOT,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_metadata():
+    """Where and on what code a benchmark run happened."""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+    }
+
+
+def append_history(results, path=DEFAULT_HISTORY):
+    """Append a run (metadata plus results) to the JSONL history."""
+    run = dict(run_metadata(), results=results)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(run) + "\n")
+    return run
+
+
+def load_history(path=DEFAULT_HISTORY):
+    """Runs recorded in the history, oldest first."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_run(history, machine=None):
+    """Latest run from this machine (timings do not compare across machines)."""
+    machine = machine or platform.node()
+    for run in reversed(history):
+        if run.get("machine") == machine:
+            return run
+    return None
+
+
+def _result_key(result):
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results with a baseline run.
+
+    Returns:
+        One dict per result: result, baseline median (None if new),
+        ratio (median / baseline median) and status "regressed",
+        "improved", "unchanged", "new" or "skipped"
+    """
+    previous = {}
+    if baseline:
+        previous = {
+            _result_key(r): r for r in baseline["results"] if "median" in r
+        }
+
+    rows = []
+    for result in results:
+        before = previous.get(_result_key(result))
+        row = {"result": result, "baseline": None, "ratio": None}
+        if "median" not in result:
+            row["status"] = "skipped"
+        elif before is None:
+            row["status"] = "new"
+        else:
+            ratio = result["median"] / before["median"]
+            row.update(baseline=before["median"], ratio=ratio)
+            if ratio > 1 + threshold:
+                row["status"] = "regressed"
+            elif ratio < 1 / (1 + threshold):
+                row["status"] = "improved"
+            else:
+                row["status"] = "unchanged"
+        rows.append(row)
+    return rows
+
+
+def format_seconds(seconds):
+    """Human readable duration (µs/ms/s)."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
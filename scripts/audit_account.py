@@ -3,172 +3,305 @@ from pathlib import Path
 import sys
 import json
 import argparse
+import contextlib
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from backend.analysis.quality_score import analyze_quality_scores
 from backend.services.ads_connector import AdsConnector
+from backend.services.audit_export import EXPORT_FORMATS, SectionExporter, export_audit
+from backend.services.audit_warehouse import AuditWarehouse
+from backend.services.audit_writer import (
+    COMPRESSION_SUFFIXES,
+    AuditJsonWriter,
+    is_rows,
+    iter_records,
+)
+from backend.services.fetch_scheduler import DEFAULT_MAX_WORKERS, FetchScheduler
+from backend.services.incremental_sync import PartitionStore
+from backend.services.report_cache import ReportCache
 from backend.services.ga4_service import GA4Service
 
 
-def run_audit(customer_id, ga4_property_id=None, ga4_domain=None):
-    print(f"--- Starting Audit for Customer ID: {customer_id} ---")
+# (audit section key, AdsConnector method, progress label)
+GOOGLE_ADS_SECTIONS = [
+    # Core account data
+    ("campaigns", "get_campaign_performance", "Campaigns"),
+    ("ad_groups", "get_ad_group_performance", "Ad Groups"),
+    ("keywords", "get_keyword_performance", "Keywords (with Quality Score)"),
+    ("search_terms", "get_search_terms", "Search Terms"),
+    ("ads", "get_ad_performance", "Ads (RSA details)"),
+    # Audit-specific: Negative keywords (Phase 4)
+    ("negative_keywords", "get_existing_negative_keywords", "Negative Keywords"),
+    (
+        "shared_negative_keywords",
+        "get_shared_negative_keywords",
+        "Shared Negative Keywords",
+    ),
+    ("negative_lists", "get_campaign_negative_lists", "Negative List Links"),
+    # Audit-specific: Auction Insights (Phase 3 - Competition)
+    ("auction_insights", "get_auction_insights", "Auction Insights"),
+    # Asset and landing page data
+    ("asset_performance", "get_asset_performance", "Asset Performance"),
+    (
+        "campaign_extensions",
+        "get_campaign_extension_assets",
+        "Campaign Extensions",
+    ),
+    ("account_extensions", "get_account_extension_assets", "Account Extensions"),
+    ("landing_pages", "get_landing_page_performance", "Landing Pages"),
+    (
+        "expanded_landing_pages",
+        "get_expanded_landing_page_performance",
+        "Expanded Landing Pages",
+    ),
+    # Targeting and segmentation data
+    ("geographic", "get_geographic_performance", "Geographic Performance"),
+    ("user_locations", "get_user_location_performance", "User Locations"),
+    ("devices", "get_device_performance", "Device Performance"),
+    ("demographics", "get_demographic_performance", "Demographics"),
+    ("ad_schedule", "get_ad_schedule_performance", "Ad Schedule"),
+    ("audiences", "get_audience_performance", "Audiences"),
+    # Budget and bidding data (Phase 3)
+    ("impression_share", "get_impression_share_data", "Impression Share"),
+    ("budgets", "get_campaign_budgets", "Budgets"),
+    ("bidding_strategies", "get_bidding_strategies", "Bidding Strategies"),
+    # Tracking and history data (Phase 1)
+    ("conversion_actions", "get_conversion_actions", "Conversion Actions"),
+    ("change_history", "get_change_history", "Change History"),
+    ("recommendations", "get_recommendations", "Google Recommendations"),
+    # Additional data
+    ("paid_organic", "get_paid_organic_performance", "Paid vs Organic"),
+    ("click_data", "get_click_data", "Click Data"),
+]
+
+# Trailing windows (days) of the campaign trend comparison (Phase 3)
+DEFAULT_TREND_WINDOWS = (30, 90, 180)
+
+# Sections the Markdown report and fleet summary read. When an audit is
+# streamed to disk, every other section is dropped once it has been written.
+REPORT_SECTIONS = {
+    "campaigns",
+    "keywords",
+    "search_terms",
+    "campaign_trends",
+    "behavior",
+}
+
+# (audit section key, GA4Service method, progress label)
+GA4_SECTIONS = [
+    ("behavior", "get_behavior_metrics", "GA4 Behavior"),
+    ("conversions", "get_conversion_breakdown", "GA4 Conversions"),
+    ("top_pages", "get_top_pages", "GA4 Top Pages"),
+    ("traffic_sources", "get_traffic_sources", "GA4 Traffic Sources"),
+]
+
+
+def _collect_result(result, audit_data):
+    """Print progress for a finished fetch and return its payload (empty on error)."""
+    if result["error"]:
+        print(f"Error fetching {result['label']}: {result['error']}")
+        audit_data["metadata"]["fetch_errors"][result["key"]] = result["error"]
+        return []
+
+    value = result["value"]
+    count = len(value) if value is not None else 0
+    print(f"  - {result['label']}... {count} rows ({result['elapsed']:.1f}s)")
+    return value if value is not None else []
+
+
+def _normalize(value):
+    """Convert a pandas DataFrame payload to a JSON-serializable list of rows."""
+    if is_rows(value) and not isinstance(value, list):
+        return list(iter_records(value))
+    return value
+
+
+def _emit_section(group, key, value, sinks=()):
+    """
+    Hand a finished section to the output sinks.
+
+    Returns:
+        The section normalized for audit_data, or None if it is on disk and
+        no report reads it (see REPORT_SECTIONS)
+    """
+    for sink in sinks:
+        try:
+            sink.write_section(group, key, value)
+        except Exception as e:
+            print(f"Error writing {group}/{key} ({type(sink).__name__}): {e}")
+    if sinks and key not in REPORT_SECTIONS:
+        return None
+    return _normalize(value)
+
+
+def _store_section(audit_data, group, key, value, sinks=()):
+    value = _emit_section(group, key, value, sinks)
+    if value is not None:
+        audit_data[group][key] = value
+
+
+def run_audit(
+    customer_id,
+    ga4_property_id=None,
+    ga4_domain=None,
+    max_workers=DEFAULT_MAX_WORKERS,
+    use_cache=False,
+    incremental=False,
+    ads_connector=None,
+    ga4_service=None,
+    include_ga4=True,
+    output_dir=None,
+    trend_windows=None,
+    warehouse=None,
+    export_format=None,
+    stream=False,
+    compression=None,
+):
+    """
+    Fetch all audit data for one account and write the JSON/Markdown reports.
+
+    Args:
+        ads_connector: Shared AdsConnector (e.g. from a fleet run); created if None
+        ga4_service: Shared GA4Service; created if None and include_ga4 is set
+        include_ga4: Fetch GA4 data (property discovery included)
+        output_dir: Output directory (default: <plugin root>/output)
+        trend_windows: Window lengths in days for the campaign trend
+            comparison (skipped if None)
+        warehouse: AuditWarehouse to store the audit snapshot in
+        export_format: Also export the sections as "parquet" or "arrow" files
+            (see write_audit_outputs)
+        stream: Write each section as soon as it is fetched (see stream_audit)
+        compression: None, "gzip" or "zstd" for the streamed JSON
+
+    Returns:
+        (json_path, md_path)
+    """
+    if ads_connector is None:
+        # With the cache, re-runs only re-download windows that can still change.
+        # Incremental mode fetches only missing or still-mutable days per report.
+        ads_connector = AdsConnector(
+            cache=ReportCache() if use_cache else None,
+            partitions=PartitionStore() if incremental else None,
+        )
+    if ga4_service is None and include_ga4:
+        ga4_service = GA4Service()
+    metrics_since = ads_connector.metrics.mark()
+
+    if stream:
+        _, json_path, md_path = stream_audit(
+            customer_id,
+            ads_connector,
+            ga4_service,
+            ga4_property_id=ga4_property_id,
+            ga4_domain=ga4_domain,
+            max_workers=max_workers,
+            trend_windows=trend_windows,
+            output_dir=output_dir,
+            compression=compression,
+            warehouse=warehouse,
+            export_format=export_format,
+        )
+    else:
+        audit_data = collect_audit(
+            customer_id,
+            ads_connector,
+            ga4_service,
+            ga4_property_id=ga4_property_id,
+            ga4_domain=ga4_domain,
+            max_workers=max_workers,
+            trend_windows=trend_windows,
+        )
+        if warehouse is not None:
+            store_in_warehouse(audit_data, warehouse)
+        json_path, md_path = write_audit_outputs(
+            audit_data, output_dir, export_format
+        )
+
+    write_audit_metrics(ads_connector, customer_id, metrics_since, output_dir)
+    return json_path, md_path
 
-    ads_connector = AdsConnector()
-    ga4_service = GA4Service()
+
+def collect_audit(
+    customer_id,
+    ads_connector,
+    ga4_service=None,
+    ga4_property_id=None,
+    ga4_domain=None,
+    max_workers=DEFAULT_MAX_WORKERS,
+    trend_windows=None,
+    audit_date=None,
+    sinks=(),
+):
+    """
+    Fetch every audit section for one account (GA4 skipped without a service).
+
+    Args:
+        audit_date: ISO timestamp recorded as the audit date (default: now)
+        sinks: Output writers (write_section(group, key, value)) that receive
+            each section as soon as it is fetched. With sinks, only
+            REPORT_SECTIONS are kept in the returned audit data.
+    """
+    print(f"--- Starting Audit for Customer ID: {customer_id} ---")
 
     audit_data = {
         "metadata": {
             "customer_id": customer_id,
-            "audit_date": datetime.now().isoformat(),
+            "audit_date": audit_date or datetime.now().isoformat(),
             "ga4_property_id": ga4_property_id,
             "ga4_domain": ga4_domain,
+            "fetch_errors": {},
         },
         "google_ads": {},
         "ga4": {},
     }
 
     # 1. Fetch Google Ads Data (Audit-Specific)
+    # Every report is an independent GAQL query, so they run concurrently.
+    # A failed report leaves an empty section and never sinks the others.
     print("Fetching Google Ads Data for Audit...")
 
-    # Core account data
-    try:
-        print("  - Campaigns...")
-        audit_data["google_ads"]["campaigns"] = ads_connector.get_campaign_performance(
-            customer_id
-        )
-        print("  - Ad Groups...")
-        audit_data["google_ads"]["ad_groups"] = ads_connector.get_ad_group_performance(
-            customer_id
-        )
-        print("  - Keywords (with Quality Score)...")
-        audit_data["google_ads"]["keywords"] = ads_connector.get_keyword_performance(
-            customer_id
+    scheduler = FetchScheduler(max_workers=max_workers)
+    for key, method, label in GOOGLE_ADS_SECTIONS:
+        scheduler.add(key, getattr(ads_connector, method), customer_id, label=label)
+    if trend_windows:
+        # All windows and their previous periods come from one daily fetch
+        scheduler.add(
+            "campaign_trends",
+            ads_connector.run_report_windows,
+            "campaign_performance",
+            customer_id,
+            windows=trend_windows,
+            label="Campaign Trends",
+            customer_id=customer_id,
         )
-        print("  - Search Terms...")
-        audit_data["google_ads"]["search_terms"] = ads_connector.get_search_terms(
-            customer_id
-        )
-        print("  - Ads (RSA details)...")
-        audit_data["google_ads"]["ads"] = ads_connector.get_ad_performance(customer_id)
-    except Exception as e:
-        print(f"Error fetching core data: {e}")
 
-    # Audit-specific: Negative keywords (Phase 4)
-    try:
-        print("  - Negative Keywords...")
-        audit_data["google_ads"]["negative_keywords"] = (
-            ads_connector.get_existing_negative_keywords(customer_id)
+    fetched = {}
+    for result in scheduler.run():
+        value = _collect_result(result, audit_data)
+        if result["key"] == "campaign_trends":
+            value = value or {}
+        fetched[result["key"]] = _emit_section(
+            "google_ads", result["key"], value, sinks
         )
-    except Exception as e:
-        print(f"Error fetching negative keywords: {e}")
-        audit_data["google_ads"]["negative_keywords"] = []
-
-    # Audit-specific: Auction Insights (Phase 3 - Competition)
-    try:
-        print("  - Auction Insights...")
-        audit_data["google_ads"]["auction_insights"] = (
-            ads_connector.get_auction_insights(customer_id)
-        )
-    except Exception as e:
-        print(f"Error fetching auction insights: {e}")
-        audit_data["google_ads"]["auction_insights"] = []
 
-    # Asset and landing page data
-    try:
-        print("  - Asset Performance...")
-        audit_data["google_ads"]["asset_performance"] = (
-            ads_connector.get_asset_performance(customer_id)
-        )
-        print("  - Landing Pages...")
-        audit_data["google_ads"]["landing_pages"] = (
-            ads_connector.get_landing_page_performance(customer_id)
-        )
-        audit_data["google_ads"]["expanded_landing_pages"] = (
-            ads_connector.get_expanded_landing_page_performance(customer_id)
-        )
-    except Exception as e:
-        print(f"Error fetching asset/landing page data: {e}")
-
-    # Targeting and segmentation data
-    try:
-        print("  - Geographic Performance...")
-        audit_data["google_ads"]["geographic"] = (
-            ads_connector.get_geographic_performance(customer_id)
-        )
-        audit_data["google_ads"]["user_locations"] = (
-            ads_connector.get_user_location_performance(customer_id)
-        )
-        print("  - Device Performance...")
-        audit_data["google_ads"]["devices"] = ads_connector.get_device_performance(
-            customer_id
-        )
-        print("  - Demographics...")
-        audit_data["google_ads"]["demographics"] = (
-            ads_connector.get_demographic_performance(customer_id)
-        )
-        print("  - Ad Schedule...")
-        audit_data["google_ads"]["ad_schedule"] = (
-            ads_connector.get_ad_schedule_performance(customer_id)
-        )
-        print("  - Audiences...")
-        audit_data["google_ads"]["audiences"] = ads_connector.get_audience_performance(
-            customer_id
-        )
-    except Exception as e:
-        print(f"Error fetching targeting data: {e}")
-
-    # Budget and bidding data (Phase 3)
-    try:
-        print("  - Impression Share...")
-        audit_data["google_ads"]["impression_share"] = (
-            ads_connector.get_impression_share_data(customer_id)
-        )
-        print("  - Budgets...")
-        audit_data["google_ads"]["budgets"] = ads_connector.get_campaign_budgets(
-            customer_id
-        )
-        print("  - Bidding Strategies...")
-        audit_data["google_ads"]["bidding_strategies"] = (
-            ads_connector.get_bidding_strategies(customer_id)
-        )
-    except Exception as e:
-        print(f"Error fetching budget/bidding data: {e}")
-
-    # Tracking and history data (Phase 1)
-    try:
-        print("  - Conversion Actions...")
-        audit_data["google_ads"]["conversion_actions"] = (
-            ads_connector.get_conversion_actions(customer_id)
-        )
-        print("  - Change History...")
-        audit_data["google_ads"]["change_history"] = ads_connector.get_change_history(
-            customer_id
-        )
-        print("  - Google Recommendations...")
-        audit_data["google_ads"]["recommendations"] = ads_connector.get_recommendations(
-            customer_id
-        )
-    except Exception as e:
-        print(f"Error fetching tracking/history data: {e}")
-
-    # Additional data
-    try:
-        audit_data["google_ads"]["paid_organic"] = (
-            ads_connector.get_paid_organic_performance(customer_id)
-        )
-        audit_data["google_ads"]["click_data"] = ads_connector.get_click_data(
-            customer_id
-        )
-    except Exception as e:
-        print(f"Error fetching additional data: {e}")
+    # Keep section order stable regardless of completion order
+    keys = [key for key, _, _ in GOOGLE_ADS_SECTIONS]
+    if trend_windows:
+        keys.append("campaign_trends")
+    audit_data["google_ads"] = {
+        key: fetched[key] for key in keys if fetched.get(key) is not None
+    }
 
     # 2. GA4 Auto-Discovery & Fetch
     resolved_ga4_property_id = ga4_property_id
 
-    if not resolved_ga4_property_id:
+    if ga4_service is None:
+        resolved_ga4_property_id = None
+    elif not resolved_ga4_property_id:
         if ga4_domain:
             # Try to auto-map GA4 property based on website domain
             print(
@@ -180,7 +313,7 @@ def run_audit(customer_id, ga4_property_id=None, ga4_domain=None):
                 print(f"Error during GA4 domain matching: {e}")
                 matches = []
 
-            audit_data["ga4"]["domain_matches"] = matches
+            _store_section(audit_data, "ga4", "domain_matches", matches, sinks)
 
             if matches:
                 selected = matches[0]
@@ -197,7 +330,9 @@ def run_audit(customer_id, ga4_property_id=None, ga4_domain=None):
                 )
                 props = ga4_service.list_properties()
                 print(f"Found {len(props)} accessible GA4 properties.")
-                audit_data["ga4"]["available_properties"] = props
+                _store_section(
+                    audit_data, "ga4", "available_properties", props, sinks
+                )
         else:
             # No GA4 ID and no domain hint: just list what we can see
             print(
@@ -205,69 +340,183 @@ def run_audit(customer_id, ga4_property_id=None, ga4_domain=None):
             )
             props = ga4_service.list_properties()
             print(f"Found {len(props)} accessible GA4 properties.")
-            audit_data["ga4"]["available_properties"] = props
+            _store_section(audit_data, "ga4", "available_properties", props, sinks)
 
     if resolved_ga4_property_id:
         print(f"Fetching GA4 Data for Property: {resolved_ga4_property_id}...")
-        try:
-            audit_data["ga4"]["behavior"] = ga4_service.get_behavior_metrics(
-                resolved_ga4_property_id
-            )
-            audit_data["ga4"]["conversions"] = ga4_service.get_conversion_breakdown(
-                resolved_ga4_property_id
-            )
-            audit_data["ga4"]["top_pages"] = ga4_service.get_top_pages(
-                resolved_ga4_property_id
-            )
-            audit_data["ga4"]["traffic_sources"] = ga4_service.get_traffic_sources(
-                resolved_ga4_property_id
+        scheduler = FetchScheduler(max_workers=max_workers)
+        for key, method, label in GA4_SECTIONS:
+            scheduler.add(
+                key,
+                getattr(ga4_service, method),
+                resolved_ga4_property_id,
+                label=label,
             )
+        for result in scheduler.run():
+            value = _collect_result(result, audit_data)
+            _store_section(audit_data, "ga4", result["key"], value, sinks)
+
+    return audit_data
+
+
+def stream_audit(
+    customer_id,
+    ads_connector,
+    ga4_service=None,
+    ga4_property_id=None,
+    ga4_domain=None,
+    max_workers=DEFAULT_MAX_WORKERS,
+    trend_windows=None,
+    output_dir=None,
+    compression=None,
+    warehouse=None,
+    export_format=None,
+):
+    """
+    Fetch an audit, writing every section to disk as soon as it is fetched.
+
+    The JSON report is written incrementally with compact separators
+    (optionally gzip/zstd compressed), and the warehouse snapshot and
+    section export are filled the same way. Peak memory is bounded by the
+    sections of the max_workers fetches in flight (about twice that with a
+    report cache, which buffers serialized rows), plus the REPORT_SECTIONS
+    the Markdown report needs.
+
+    Returns:
+        (audit_data with REPORT_SECTIONS only, json_path, md_path)
+    """
+    json_path, md_path, export_dir = audit_output_paths(customer_id, output_dir)
+    json_path += COMPRESSION_SUFFIXES[compression]
+    audit_date = datetime.now().isoformat()
+
+    sinks = [AuditJsonWriter(json_path, compression)]
+    if warehouse is not None:
+        sinks.append(warehouse.snapshot(customer_id, audit_date))
+    if export_format:
+        try:
+            sinks.append(SectionExporter(export_dir, export_format))
+        except ImportError as e:
+            print(f"Skipping section export: {e}")
+
+    audit_data = collect_audit(
+        customer_id,
+        ads_connector,
+        ga4_service,
+        ga4_property_id=ga4_property_id,
+        ga4_domain=ga4_domain,
+        max_workers=max_workers,
+        trend_windows=trend_windows,
+        audit_date=audit_date,
+        sinks=sinks,
+    )
+
+    for sink in sinks:
+        try:
+            result = sink.close(audit_data["metadata"])
         except Exception as e:
-            print(f"Error fetching GA4 data: {e}")
+            print(f"Error finishing {type(sink).__name__}: {e}")
+            continue
+        if isinstance(sink, AuditJsonWriter):
+            print(f"JSON Report saved to: {json_path}")
+        elif isinstance(sink, SectionExporter):
+            print(f"Section export saved to: {result}")
+        else:
+            print(
+                f"Warehouse snapshot saved: {sum(result.values())} rows "
+                f"({warehouse.path})"
+            )
+
+    generate_markdown_report(audit_data, md_path)
+    print(f"Markdown Report saved to: {md_path}")
+    return audit_data, json_path, md_path
+
 
-    # Normalize any pandas DataFrame payloads to JSON-serializable structures
+def store_in_warehouse(audit_data, warehouse):
+    """Write an audit snapshot to the warehouse (errors are reported, not raised)."""
     try:
-        import pandas as pd  # Local import to avoid hard dependency if not installed
-
-        def _normalize(obj):
-            if isinstance(obj, pd.DataFrame):
-                return obj.to_dict(orient="records")
-            return obj
-
-        audit_data["google_ads"] = {
-            key: _normalize(val)
-            for key, val in audit_data.get("google_ads", {}).items()
-        }
-        audit_data["ga4"] = {
-            key: _normalize(val) for key, val in audit_data.get("ga4", {}).items()
-        }
+        written = warehouse.write_audit(audit_data)
     except Exception as e:
-        print(
-            f"Warning: Failed to normalize DataFrame outputs ({e}); falling back to raw objects."
+        print(f"Error writing audit to warehouse: {e}")
+        return None
+    print(
+        f"Warehouse snapshot saved: {sum(written.values())} rows ({warehouse.path})"
+    )
+    return written
+
+
+def audit_output_paths(customer_id, output_dir=None):
+    """(json_path, md_path, export_dir) of today's audit outputs for a customer."""
+    if output_dir is None:
+        output_dir = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output"
         )
+    os.makedirs(output_dir, exist_ok=True)
 
-    # 3. Generate Outputs
-    output_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output"
+    base = os.path.join(
+        output_dir, f"audit_{customer_id}_{datetime.now().strftime('%Y%m%d')}"
     )
-    os.makedirs(output_dir, exist_ok=True)
+    return f"{base}.json", f"{base}.md", base
+
+
+def write_audit_outputs(audit_data, output_dir=None, export_format=None):
+    """
+    Write the JSON and Markdown reports for collected audit data.
 
-    date_str = datetime.now().strftime("%Y%m%d")
+    With export_format ("parquet" or "arrow"), every section is also written
+    to audit_<customer_id>_<date>/ with a manifest.json (see audit_export).
+    """
+    customer_id = audit_data["metadata"]["customer_id"]
+
+    # 3. Generate Outputs
+    json_path, md_path, export_dir = audit_output_paths(customer_id, output_dir)
 
     # JSON Output
-    json_path = os.path.join(output_dir, f"audit_{customer_id}_{date_str}.json")
     with open(json_path, "w") as f:
         json.dump(audit_data, f, indent=2)
     print(f"JSON Report saved to: {json_path}")
 
     # Markdown Output
-    md_path = os.path.join(output_dir, f"audit_{customer_id}_{date_str}.md")
     generate_markdown_report(audit_data, md_path)
     print(f"Markdown Report saved to: {md_path}")
 
+    if export_format:
+        try:
+            manifest_path = export_audit(audit_data, export_dir, export_format)
+            print(f"Section export saved to: {manifest_path}")
+        except ImportError as e:
+            print(f"Skipping section export: {e}")
+
     return json_path, md_path
 
 
+def write_audit_metrics(ads_connector, customer_id, since=0, output_dir=None):
+    """
+    Write the API call metrics of one audit (see ConnectorMetrics.summary)
+    next to its outputs and print the slowest reports.
+
+    Args:
+        since: ConnectorMetrics.mark() taken before the audit, so calls of
+            earlier audits on a shared connector are left out
+    """
+    _, _, base = audit_output_paths(customer_id, output_dir)
+    metrics_path = f"{base}_metrics.json"
+    summary = ads_connector.metrics.write(metrics_path, customer_id, since)
+    print(f"API metrics saved to: {metrics_path}")
+
+    slowest = summary["reports"][:5]
+    if slowest:
+        print(
+            "Slowest reports: "
+            + ", ".join(f"{r['report']} ({r['total_time']:.2f}s)" for r in slowest)
+        )
+    return metrics_path
+
+
+def _format_change(change):
+    """Relative change as a signed percentage ("-" without a baseline)."""
+    return "-" if change is None else f"{change:+.0%}"
+
+
 def generate_markdown_report(data, filepath):
     ads = data.get("google_ads", {})
     ga4 = data.get("ga4", {})
@@ -303,8 +552,24 @@ def generate_markdown_report(data, filepath):
         low_qs = [
             k for k in keywords if k["quality_score"] > 0 and k["quality_score"] < 5
         ]
+        qs = analyze_quality_scores(keywords)
+        qs_avg = qs["qs_weighted_avg"]
         f.write(f"- **Total Keywords:** {len(keywords)}\n")
-        f.write(f"- **Low Quality Score (<5):** {len(low_qs)}\n\n")
+        f.write(f"- **Low Quality Score (<5):** {len(low_qs)}\n")
+        f.write(
+            f"- **Spend-Weighted QS:** {qs_avg if qs_avg is not None else '-'} "
+            f"({qs['keyword_count']} enabled keywords with impressions)\n\n"
+        )
+
+        if qs["keyword_count"]:
+            f.write("| QS Band | Keywords | Spend | Spend % |\n")
+            f.write("|---------|----------|-------|---------|\n")
+            for band, b in qs["distribution"].items():
+                f.write(
+                    f"| {band} | {b['keyword_count']} | {b['spend']:.2f} | "
+                    f"{b['spend_pct']:.1f}% |\n"
+                )
+            f.write("\n")
 
         if low_qs:
             f.write("### Low Quality Score Keywords\n")
@@ -329,9 +594,25 @@ def generate_markdown_report(data, filepath):
             )
         f.write("\n")
 
+        # Campaign Trends
+        trends = ads.get("campaign_trends")
+        if trends:
+            f.write("## 5. Campaign Trends (vs. Previous Period)\n")
+            f.write("| Window | Cost | Conv. | CPA | Cost Δ | Conv. Δ | CPA Δ |\n")
+            f.write("|--------|------|-------|-----|--------|---------|-------|\n")
+            for label, window in trends.items():
+                t = window["totals"]
+                f.write(
+                    f"| {label} | {t['cost']:.2f} | {t['conversions']:.1f} | "
+                    f"{t['cpa']:.2f} | {_format_change(t.get('cost_change_pct'))} | "
+                    f"{_format_change(t.get('conversions_change_pct'))} | "
+                    f"{_format_change(t.get('cpa_change_pct'))} |\n"
+                )
+            f.write("\n")
+
         # GA4 Data
         if ga4.get("behavior"):
-            f.write("## 5. GA4 Behavior Metrics\n")
+            f.write("## 6. GA4 Behavior Metrics\n")
             f.write("| Channel | Sessions | Eng. Rate | Conv. |\n")
             f.write("|---------|----------|-----------|-------|\n")
             for b in ga4["behavior"]:
@@ -351,6 +632,94 @@ if __name__ == "__main__":
         help="Client website domain for GA4 auto-mapping (Optional, e.g. example.com)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Reports fetched concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse report responses cached in ~/.mondaybrew/cache",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Assemble daily reports from partitions synced in ~/.mondaybrew/sync",
+    )
+    parser.add_argument(
+        "--warehouse",
+        action="store_true",
+        help="Also store the audit in the ~/.mondaybrew/warehouse history",
+    )
+    parser.add_argument(
+        "--export",
+        choices=sorted(EXPORT_FORMATS),
+        help="Also write each section as a compressed Parquet/Arrow file",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const="none",
+        choices=["none", "gzip", "zstd"],
+        help="Write each section as soon as it is fetched, optionally "
+        "compressed (keeps memory bounded on large accounts)",
+    )
+    parser.add_argument(
+        "--trends",
+        nargs="?",
+        const=",".join(map(str, DEFAULT_TREND_WINDOWS)),
+        help="Compare campaign windows with their previous periods "
+        "(comma-separated days, default: "
+        f"{','.join(map(str, DEFAULT_TREND_WINDOWS))})",
+    )
+
+    fixture = parser.add_mutually_exclusive_group()
+    fixture.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record the API responses to a fixture directory for offline replay",
+    )
+    fixture.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve the API responses from a recorded fixture (no network)",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        help="Reproduce the recorded API timings divided by this factor "
+        "(default: replay as fast as possible)",
+    )
+
     args = parser.parse_args()
 
-    run_audit(args.customer_id, args.ga4_property_id, args.ga4_domain)
+    # The test harness is only loaded when recording or replaying
+    if args.record:
+        from backend.testing.recorder import Recorder
+
+        harness = Recorder(args.record).install()
+    elif args.replay:
+        from backend.testing.recorder import Replayer
+
+        harness = Replayer(args.replay, speed=args.replay_speed).install()
+    else:
+        harness = contextlib.nullcontext()
+
+    with harness:
+        run_audit(
+            args.customer_id,
+            args.ga4_property_id,
+            args.ga4_domain,
+            max_workers=args.max_workers,
+            use_cache=args.cache,
+            incremental=args.incremental,
+            trend_windows=(
+                [int(days) for days in args.trends.split(",")] if args.trends else None
+            ),
+            warehouse=AuditWarehouse() if args.warehouse else None,
+            export_format=args.export,
+            stream=args.stream is not None,
+            compression=None if args.stream in (None, "none") else args.stream,
+        )
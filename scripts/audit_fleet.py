@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Audit every accessible Google Ads account (or a filtered subset) under the MCC."""
+
+import os
+import sys
+import json
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.ads_connector import AdsConnector
+from backend.services.audit_export import EXPORT_FORMATS
+from backend.services.audit_warehouse import AuditWarehouse
+from backend.services.fetch_scheduler import DEFAULT_MAX_WORKERS
+from backend.services.incremental_sync import PartitionStore
+from backend.services.rate_limiter import (
+    DEFAULT_BURST,
+    DEFAULT_PER_CUSTOMER_BURST,
+    DEFAULT_PER_CUSTOMER_REQUESTS_PER_SECOND,
+    DEFAULT_REQUESTS_PER_SECOND,
+    RateLimiter,
+)
+from backend.services.report_cache import ReportCache
+from scripts.audit_account import (
+    collect_audit,
+    store_in_warehouse,
+    stream_audit,
+    write_audit_metrics,
+    write_audit_outputs,
+)
+
+DEFAULT_PARALLEL_ACCOUNTS = 4
+
+
+class FleetLedger:
+    """
+    Resumable progress ledger (ledger.json in the fleet output directory).
+
+    Records each account's status, so an interrupted fleet run can be resumed
+    without re-auditing the accounts that already finished.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.accounts = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.accounts = json.load(f).get("accounts", {})
+
+    def is_done(self, customer_id):
+        return self.accounts.get(customer_id, {}).get("status") == "done"
+
+    def update(self, customer_id, **fields):
+        with self._lock:
+            self.accounts.setdefault(customer_id, {}).update(fields)
+            self._save()
+
+    def _save(self):
+        # Write-then-rename so a crash never leaves a truncated ledger
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"updated": datetime.now().isoformat(), "accounts": self.accounts},
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, self.path)
+
+
+def select_accounts(accounts, include=None, exclude=None, search=None):
+    """Filter accessible accounts by ID allow/deny lists and a name substring."""
+    selected = []
+    for account in accounts:
+        if include and account["id"] not in include:
+            continue
+        if exclude and account["id"] in exclude:
+            continue
+        if search and search.lower() not in account["name"].lower():
+            continue
+        selected.append(account)
+    return selected
+
+
+def summarize_account(account, audit_data):
+    """Headline metrics of one audited account for the fleet summary."""
+    campaigns = audit_data["google_ads"].get("campaigns", [])
+    cost = sum(c["cost"] for c in campaigns)
+    conversions = sum(c["conversions"] for c in campaigns)
+    return {
+        "name": account["name"],
+        "campaigns": len(campaigns),
+        "cost": round(cost, 2),
+        "conversions": round(conversions, 2),
+        "cpa": round(cost / conversions, 2) if conversions > 0 else 0,
+        "fetch_errors": len(audit_data["metadata"]["fetch_errors"]),
+    }
+
+
+def audit_account(
+    account,
+    ads_connector,
+    ledger,
+    output_dir,
+    max_workers,
+    warehouse=None,
+    export_format=None,
+    stream=False,
+    compression=None,
+):
+    """Audit one account, recording the outcome in the ledger."""
+    customer_id = account["id"]
+    ledger.update(customer_id, name=account["name"], status="running")
+    start = time.perf_counter()
+    metrics_since = ads_connector.metrics.mark()
+    try:
+        if stream:
+            audit_data, json_path, md_path = stream_audit(
+                customer_id,
+                ads_connector,
+                max_workers=max_workers,
+                output_dir=output_dir,
+                compression=compression,
+                warehouse=warehouse,
+                export_format=export_format,
+            )
+        else:
+            audit_data = collect_audit(
+                customer_id, ads_connector, max_workers=max_workers
+            )
+            if warehouse is not None:
+                store_in_warehouse(audit_data, warehouse)
+            json_path, md_path = write_audit_outputs(
+                audit_data, output_dir, export_format
+            )
+        write_audit_metrics(ads_connector, customer_id, metrics_since, output_dir)
+    except Exception as e:
+        ledger.update(
+            customer_id,
+            status="failed",
+            error=f"{type(e).__name__}: {e}",
+            elapsed=round(time.perf_counter() - start, 1),
+        )
+        raise
+
+    ledger.update(
+        customer_id,
+        status="done",
+        error=None,
+        json_path=json_path,
+        md_path=md_path,
+        elapsed=round(time.perf_counter() - start, 1),
+        summary=summarize_account(account, audit_data),
+    )
+
+
+def write_fleet_summary(ledger, output_dir):
+    """Write fleet_summary.json and fleet_summary.md from the ledger."""
+    accounts = sorted(
+        ledger.accounts.items(),
+        key=lambda item: -(item[1].get("summary") or {}).get("cost", 0),
+    )
+
+    json_path = os.path.join(output_dir, "fleet_summary.json")
+    with open(json_path, "w") as f:
+        json.dump(dict(accounts), f, indent=2)
+
+    md_path = os.path.join(output_dir, "fleet_summary.md")
+    with open(md_path, "w") as f:
+        done = sum(1 for _, a in accounts if a.get("status") == "done")
+        f.write("# Fleet Audit Summary\n")
+        f.write(f"**Date:** {datetime.now().isoformat()}\n")
+        f.write(f"**Accounts audited:** {done}/{len(accounts)}\n\n")
+        f.write("| Account | Customer ID | Status | Cost | Conv. | CPA | Fetch Errors |\n")
+        f.write("|---------|-------------|--------|------|-------|-----|--------------|\n")
+        for customer_id, a in accounts:
+            s = a.get("summary") or {}
+            f.write(
+                f"| {a.get('name', '')} | {customer_id} | {a.get('status')} | "
+                f"{s.get('cost', 0):.2f} | {s.get('conversions', 0)} | "
+                f"{s.get('cpa', 0):.2f} | {s.get('fetch_errors', '-')} |\n"
+            )
+
+        failed = [(cid, a) for cid, a in accounts if a.get("status") == "failed"]
+        if failed:
+            f.write("\n## Failed Accounts\n")
+            for customer_id, a in failed:
+                f.write(f"- **{customer_id}**: {a.get('error')}\n")
+
+    return json_path, md_path
+
+
+def run_fleet(
+    include=None,
+    exclude=None,
+    search=None,
+    parallel=DEFAULT_PARALLEL_ACCOUNTS,
+    max_workers=DEFAULT_MAX_WORKERS,
+    qps=DEFAULT_REQUESTS_PER_SECOND,
+    output_dir=None,
+    resume=True,
+    use_cache=False,
+    incremental=False,
+    use_warehouse=False,
+    export_format=None,
+    stream=False,
+    compression=None,
+):
+    """Audit the selected accounts concurrently and write a fleet summary.
+
+    Args:
+        include: Customer IDs to audit (default: every accessible account)
+        exclude: Customer IDs to skip
+        search: Only audit accounts whose name contains this string
+        parallel: Accounts audited at the same time
+        max_workers: Reports fetched concurrently within each account
+        qps: Fleet-wide API requests per second (shared token bucket)
+        output_dir: Fleet output directory (default: output/fleet_<date>)
+        resume: Skip accounts the ledger already marks as done
+        use_warehouse: Store every account's audit in the AuditWarehouse
+        export_format: Also export each account's sections ("parquet"/"arrow")
+        stream: Write each account's sections as soon as they are fetched
+        compression: None, "gzip" or "zstd" for the streamed JSON
+
+    Returns:
+        (summary_json_path, summary_md_path)
+    """
+    # One connector and one rate limiter for the whole fleet, so every account's
+    # requests draw from the same developer-token quota (plus a per-account cap)
+    ads_connector = AdsConnector(
+        cache=ReportCache() if use_cache else None,
+        partitions=PartitionStore() if incremental else None,
+        rate_limiter=RateLimiter(
+            rate=qps,
+            burst=max(DEFAULT_BURST, qps),
+            per_customer_rate=DEFAULT_PER_CUSTOMER_REQUESTS_PER_SECOND,
+            per_customer_burst=DEFAULT_PER_CUSTOMER_BURST,
+        ),
+    )
+
+    accounts = select_accounts(
+        ads_connector.get_accessible_customers(), include, exclude, search
+    )
+    if not accounts:
+        print("No accounts selected.")
+        return None
+
+    if output_dir is None:
+        output_dir = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "output",
+            f"fleet_{datetime.now().strftime('%Y%m%d')}",
+        )
+    os.makedirs(output_dir, exist_ok=True)
+
+    warehouse = AuditWarehouse() if use_warehouse else None
+    ledger = FleetLedger(os.path.join(output_dir, "ledger.json"))
+    pending = [a for a in accounts if not (resume and ledger.is_done(a["id"]))]
+    for account in pending:
+        ledger.update(account["id"], name=account["name"], status="pending")
+
+    print(
+        f"--- Fleet audit: {len(pending)} of {len(accounts)} account(s) to run, "
+        f"{parallel} at a time, {qps:g} req/s ---"
+    )
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
+        futures = {
+            pool.submit(
+                audit_account,
+                account,
+                ads_connector,
+                ledger,
+                output_dir,
+                max_workers,
+                warehouse,
+                export_format,
+                stream,
+                compression,
+            ): account
+            for account in pending
+        }
+        for future in as_completed(futures):
+            account = futures[future]
+            try:
+                future.result()
+                print(f"[fleet] Done: {account['name']} ({account['id']})")
+            except Exception as e:
+                print(f"[fleet] Failed: {account['name']} ({account['id']}): {e}")
+
+    json_path, md_path = write_fleet_summary(ledger, output_dir)
+    print(f"Fleet summary saved to: {md_path}")
+    return json_path, md_path
+
+
+if __name__ == "__main__":
+    load_dotenv(Path.home() / ".mondaybrew" / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Run the Google Ads audit for every accessible account"
+    )
+    parser.add_argument("--accounts", help="Comma-separated customer IDs to audit")
+    parser.add_argument("--exclude", help="Comma-separated customer IDs to skip")
+    parser.add_argument("--search", "-s", help="Only audit accounts matching name")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL_ACCOUNTS,
+        help=f"Accounts audited at once (default: {DEFAULT_PARALLEL_ACCOUNTS})",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Reports fetched concurrently per account (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--qps",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help=f"Fleet-wide API requests per second (default: {DEFAULT_REQUESTS_PER_SECOND:g})",
+    )
+    parser.add_argument("--output-dir", help="Fleet output directory")
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Re-audit accounts the ledger already marks as done",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse report responses cached in ~/.mondaybrew/cache",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Assemble daily reports from partitions synced in ~/.mondaybrew/sync",
+    )
+    parser.add_argument(
+        "--warehouse",
+        action="store_true",
+        help="Also store every audit in the ~/.mondaybrew/warehouse history",
+    )
+    parser.add_argument(
+        "--export",
+        choices=sorted(EXPORT_FORMATS),
+        help="Also write each section as a compressed Parquet/Arrow file",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const="none",
+        choices=["none", "gzip", "zstd"],
+        help="Write each section as soon as it is fetched, optionally compressed",
+    )
+
+    args = parser.parse_args()
+
+    run_fleet(
+        include=set(args.accounts.split(",")) if args.accounts else None,
+        exclude=set(args.exclude.split(",")) if args.exclude else None,
+        search=args.search,
+        parallel=args.parallel,
+        max_workers=args.max_workers,
+        qps=args.qps,
+        output_dir=args.output_dir,
+        resume=not args.no_resume,
+        use_cache=args.cache,
+        incremental=args.incremental,
+        use_warehouse=args.warehouse,
+        export_format=args.export,
+        stream=args.stream is not None,
+        compression=None if args.stream in (None, "none") else args.stream,
+    )
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Build the phase JSON artifacts (performance, keyword, ad copy) from an audit file."""
+
+import os
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.analysis.artifacts import write_artifacts
+
+SCHEMAS_DIR = Path(__file__).parent.parent / "schemas"
+
+
+def load_audit(path):
+    """Audit JSON written by audit_account.py (.json/.gz)."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def validate_artifacts(paths):
+    """Validate written artifacts against schemas/ (needs jsonschema)."""
+    try:
+        from jsonschema import validate, ValidationError
+    except ImportError:
+        print("jsonschema not installed - skipping schema validation")
+        return True
+
+    valid = True
+    for path in paths:
+        schema_file = SCHEMAS_DIR / f"{Path(path).stem}.schema.json"
+        with open(schema_file) as f:
+            schema = json.load(f)
+        with open(path) as f:
+            artifact = json.load(f)
+        try:
+            validate(instance=artifact, schema=schema)
+        except ValidationError as e:
+            print(f"  {Path(path).name}: {e.message}")
+            valid = False
+    return valid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build phase JSON artifacts from an audit file"
+    )
+    parser.add_argument(
+        "--audit-file", required=True, help="Audit JSON from audit_account.py"
+    )
+    parser.add_argument(
+        "--output-dir", help="Directory for the artifacts (default: the audit's)"
+    )
+    parser.add_argument(
+        "--target-cpa", type=float, help="Target CPA ($TARGET_CPA) in DKK"
+    )
+    parser.add_argument(
+        "--no-validate", action="store_true", help="Skip schema validation"
+    )
+
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.audit_file))
+    paths = write_artifacts(
+        load_audit(args.audit_file), output_dir, target_cpa=args.target_cpa
+    )
+    for path in paths:
+        print(f"Wrote {path}")
+
+    if not args.no_validate and not validate_artifacts(paths):
+        sys.exit(1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Find negative keywords that block active keywords or converting search terms."""
+
+import os
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.analysis.negative_conflicts import collect_negatives, find_conflicts
+
+
+def load_audit_sections(path):
+    """google_ads sections of an audit JSON written by audit_account.py (.json/.gz)."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f).get("google_ads", {})
+
+
+def fetch_sections(customer_id, date_range):
+    """Fetch the negatives, keywords and search terms live."""
+    from backend.services.ads_connector import AdsConnector
+
+    ads = AdsConnector()
+    return {
+        "negative_keywords": ads.get_existing_negative_keywords(customer_id),
+        "shared_negative_keywords": ads.get_shared_negative_keywords(customer_id),
+        "negative_lists": ads.get_campaign_negative_lists(customer_id),
+        "keywords": ads.get_keyword_performance(customer_id, date_range=date_range),
+        "search_terms": ads.get_search_terms(
+            customer_id, date_range=date_range, stream=True
+        ),
+    }
+
+
+def negative_conflicts(sections, converting_only=True):
+    """Run the conflict check on audit sections (see find_conflicts)."""
+    negatives = collect_negatives(
+        sections.get("negative_keywords", []),
+        sections.get("shared_negative_keywords", []),
+        sections.get("negative_lists", []),
+    )
+    return find_conflicts(
+        negatives,
+        keywords=sections.get("keywords", []),
+        search_terms=sections.get("search_terms", []),
+        converting_only=converting_only,
+    )
+
+
+def print_conflicts(title, conflicts, text_key, limit):
+    print(f"\n{title}: {len(conflicts)}")
+    for c in conflicts[:limit]:
+        print(
+            f"  {c[text_key]:<35} [{c['campaign_name']}]  blocked by "
+            f"{c['negative_match_type'].lower()} '{c['negative']}' "
+            f"({c['negative_level']}: {c['negative_source']})  "
+            f"cost: {c['cost']:,.2f}  conv: {c['conversions']:.1f}"
+        )
+    if len(conflicts) > limit:
+        print(f"  ... and {len(conflicts) - limit} more")
+
+
+if __name__ == "__main__":
+    load_dotenv(Path.home() / ".mondaybrew" / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Check negative keywords against keywords and search terms"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--customer-id", help="Google Ads Customer ID (fetch live)")
+    source.add_argument("--audit-file", help="Audit JSON from audit_account.py")
+    parser.add_argument(
+        "--date-range",
+        default="LAST_90_DAYS",
+        help="Date range for live fetches (default: LAST_90_DAYS)",
+    )
+    parser.add_argument(
+        "--all-search-terms",
+        action="store_true",
+        help="Also check search terms without conversions",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=25, help="Conflicts printed per list"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    if args.audit_file:
+        sections = load_audit_sections(args.audit_file)
+    else:
+        sections = fetch_sections(args.customer_id, args.date_range)
+
+    result = negative_conflicts(sections, converting_only=not args.all_search_terms)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"Checked {result['negatives_checked']:,} negatives against "
+            f"{result['keywords_checked']:,} active keywords and "
+            f"{result['search_terms_checked']:,} search terms"
+        )
+        print_conflicts(
+            "Blocked keywords", result["blocked_keywords"], "keyword", args.limit
+        )
+        print_conflicts(
+            "Blocked search terms",
+            result["blocked_search_terms"],
+            "search_term",
+            args.limit,
+        )
+        print(f"\nConversions on blocked search terms: {result['blocked_conversions']}")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""N-gram analysis of search terms (Phase 4, Step 4)."""
+
+import os
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.analysis.ngrams import (
+    DEFAULT_LIMIT,
+    DEFAULT_MIN_OCCURRENCES,
+    analyze_search_terms,
+)
+
+
+def load_audit_search_terms(path):
+    """Search term rows of an audit JSON written by audit_account.py (.json/.gz)."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        audit_data = json.load(f)
+    return audit_data.get("google_ads", {}).get("search_terms", [])
+
+
+def fetch_search_terms(customer_id, date_range):
+    """Fetch search terms live (streamed, so rows are not buffered twice)."""
+    from backend.services.ads_connector import AdsConnector
+
+    return AdsConnector().get_search_terms(
+        customer_id, date_range=date_range, stream=True
+    )
+
+
+def print_patterns(title, patterns, show_wasted=False):
+    print(f"\n{title}")
+    if not patterns:
+        print("  (none)")
+        return
+    for p in patterns:
+        cpa = f"{p['cpa']:,.2f}" if p["cpa"] is not None else "-"
+        line = (
+            f"  {p['pattern']:<30} terms: {p['occurrences']:>5}  "
+            f"spend: {p['total_spend']:>10,.2f}  conv: {p['total_conversions']:>6.1f}  "
+            f"CPA: {cpa}"
+        )
+        if show_wasted:
+            line += f"  wasted: {p['wasted_spend']:,.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    load_dotenv(Path.home() / ".mondaybrew" / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Rank wasting and converting search term n-grams"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--customer-id", help="Google Ads Customer ID (fetch live)")
+    source.add_argument("--audit-file", help="Audit JSON from audit_account.py")
+    parser.add_argument(
+        "--date-range",
+        default="LAST_90_DAYS",
+        help="Date range for live fetches (default: LAST_90_DAYS)",
+    )
+    parser.add_argument(
+        "--target-cpa",
+        type=float,
+        help="Target CPA ($TARGET_CPA; default: the account CPA)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"Patterns per ranking (default: {DEFAULT_LIMIT})",
+    )
+    parser.add_argument(
+        "--min-occurrences",
+        type=int,
+        default=DEFAULT_MIN_OCCURRENCES,
+        help=f"Minimum search terms per pattern (default: {DEFAULT_MIN_OCCURRENCES})",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the ngram_analysis object as JSON"
+    )
+
+    args = parser.parse_args()
+
+    if args.audit_file:
+        search_terms = load_audit_search_terms(args.audit_file)
+    else:
+        search_terms = fetch_search_terms(args.customer_id, args.date_range)
+
+    analysis = analyze_search_terms(
+        search_terms,
+        limit=args.limit,
+        min_occurrences=args.min_occurrences,
+        target_cpa=args.target_cpa,
+    )
+
+    if args.json:
+        print(json.dumps(analysis, indent=2))
+    else:
+        print(
+            f"Analyzed {analysis['search_terms_analyzed']:,} search terms "
+            f"({analysis['ngrams']:,} n-grams, account CPA: {analysis['account_cpa']})"
+        )
+        print_patterns(
+            "Top wasting patterns ($TOP_WASTING_TERMS)",
+            analysis["top_wasting_patterns"],
+            show_wasted=True,
+        )
+        print_patterns(
+            "Top converting patterns ($TOP_CONVERTING_TERMS)",
+            analysis["top_converting_patterns"],
+        )
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Run SQL against the local audit warehouse (~/.mondaybrew/warehouse)."""
+
+import os
+import sys
+import json
+import argparse
+import sqlite3
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.audit_warehouse import WAREHOUSE_TABLES, AuditWarehouse
+
+
+def query_warehouse(sql=None, output_format="table", customer_id=None):
+    """Print the result of a query, or the stored snapshots if sql is None.
+
+    Args:
+        sql: SQL to run (tables: audits plus WAREHOUSE_TABLES)
+        output_format: 'table' for human-readable, 'json' for machine-readable
+        customer_id: Bound to every "?" placeholder in sql; filters the
+            snapshot listing when no sql is given
+
+    Returns:
+        Result rows as dicts
+    """
+    warehouse = AuditWarehouse()
+    try:
+        if sql is None:
+            rows = warehouse.snapshots(customer_id)
+        else:
+            params = [customer_id] * sql.count("?") if customer_id else []
+            rows = warehouse.query(sql, params)
+    except sqlite3.Error as e:
+        print(f"Query failed: {e}")
+        print(f"Tables: audits, {', '.join(WAREHOUSE_TABLES)}")
+        return []
+
+    if output_format == "json":
+        print(json.dumps(rows, indent=2, default=str))
+        return rows
+
+    if not rows:
+        print("No rows.")
+        return rows
+
+    names = list(rows[0])
+    widths = {
+        name: min(40, max(len(name), *(len(str(row[name])) for row in rows)))
+        for name in names
+    }
+    print("  ".join(f"{name:<{widths[name]}}" for name in names))
+    print("  ".join("-" * widths[name] for name in names))
+    for row in rows:
+        print("  ".join(f"{str(row[name])[:40]:<{widths[name]}}" for name in names))
+    print(f"\nTotal: {len(rows)} row(s)")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Query the audit warehouse (lists snapshots without SQL)"
+    )
+    parser.add_argument("sql", nargs="?", help="SQL query to run")
+    parser.add_argument(
+        "--customer-id", help="Value for the query's ? placeholders / snapshot filter"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+
+    args = parser.parse_args()
+    query_warehouse(args.sql, output_format=args.format, customer_id=args.customer_id)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Run the benchmark suites and compare with the previous run on this machine."""
+
+import os
+import sys
+import json
+import argparse
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import (
+    DEFAULT_HISTORY,
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    SIZES,
+    append_history,
+    compare,
+    discover,
+    format_seconds,
+    load_history,
+    parameter_sets,
+    previous_run,
+    run_benchmarks,
+)
+
+
+def _label(result):
+    params = ", ".join(f"{value}" for value in result["params"].values())
+    return f"{result['name']}({params})" if params else result["name"]
+
+
+def print_result(result):
+    if "skipped" in result:
+        print(f"  {_label(result):<72} skipped: {result['skipped']}")
+        return
+    line = (
+        f"  {_label(result):<72} {format_seconds(result['median']):>9}"
+        f" ±{format_seconds(result['stdev'])}"
+    )
+    if "units_per_second" in result:
+        line += f"  {result['units_per_second']:,.0f} rows/s"
+    print(line, flush=True)
+
+
+def print_comparison(rows, baseline):
+    print(
+        f"\nCompared with {baseline['timestamp']} "
+        f"(commit {baseline.get('commit') or 'unknown'}):"
+    )
+    for row in rows:
+        if row["status"] in ("regressed", "improved"):
+            print(
+                f"  {row['status']:<9} {_label(row['result']):<72} "
+                f"{format_seconds(row['baseline'])} -> "
+                f"{format_seconds(row['result']['median'])} ({row['ratio']:.2f}x)"
+            )
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    print("  " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark decoding, fetching, analysis, report writing and hooks"
+    )
+    parser.add_argument(
+        "--filter", help="Regular expression selecting benchmarks by name"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(DEFAULT_SIZES),
+        help="Comma-separated synthetic account sizes "
+        f"({', '.join(f'{name}={rows:,}' for name, rows in SIZES.items())} rows; "
+        f"default: {','.join(DEFAULT_SIZES)})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Samples per benchmark (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help=f"Minimum seconds per sample (default: {DEFAULT_MIN_TIME})",
+    )
+    parser.add_argument(
+        "--history",
+        default=str(DEFAULT_HISTORY),
+        help=f"JSONL file runs are appended to (default: {DEFAULT_HISTORY})",
+    )
+    parser.add_argument(
+        "--no-save", action="store_true", help="Do not append this run to the history"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown reported as a regression "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any benchmark regressed",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks without running them"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON"
+    )
+
+    args = parser.parse_args()
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    if args.list:
+        for name, cls, _ in discover(pattern=args.filter):
+            for params in parameter_sets(cls, sizes):
+                print(_label({"name": name, "params": params}))
+        sys.exit(0)
+
+    baseline = previous_run(load_history(args.history))
+    results = run_benchmarks(
+        pattern=args.filter,
+        sizes=sizes,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        progress=None if args.json else print_result,
+    )
+    if not args.no_save:
+        append_history(results, args.history)
+
+    rows = compare(results, baseline, args.threshold)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    elif baseline:
+        print_comparison(rows, baseline)
+
+    if args.fail_on_regression and any(r["status"] == "regressed" for r in rows):
+        sys.exit(1)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Incrementally sync daily report partitions for a Google Ads account."""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.ads_connector import AdsConnector
+from backend.services.incremental_sync import IncrementalSync, PartitionStore
+from backend.services.report_registry import REPORTS
+
+
+def syncable_reports():
+    """Names of registered reports that can be synced by day."""
+    return [name for name, spec in REPORTS.items() if IncrementalSync.supports(spec)]
+
+
+def sync_account(customer_id, reports=None, date_range="LAST_30_DAYS", store=None):
+    """Sync the given reports (default: every syncable report) for one account.
+
+    Args:
+        customer_id: Google Ads customer ID
+        reports: Report names to sync (default: all syncable reports)
+        date_range: DURING value covering the partitions to keep current
+        store: Optional PartitionStore (default: ~/.mondaybrew/sync)
+
+    Returns:
+        List of per-report sync summaries
+    """
+    sync = IncrementalSync(AdsConnector(), store or PartitionStore())
+
+    summaries = []
+    for report in reports or syncable_reports():
+        try:
+            summary = sync.sync(customer_id, report, date_range)
+        except Exception as e:
+            print(f"Error syncing {report}: {e}")
+            summaries.append({"report": report, "error": str(e)})
+            continue
+        print(
+            f"  - {report}: fetched {summary['fetched_days']} day(s) in "
+            f"{summary['api_calls']} call(s), reused {summary['reused_days']}"
+        )
+        summaries.append(summary)
+
+    return summaries
+
+
+if __name__ == "__main__":
+    load_dotenv(Path.home() / ".mondaybrew" / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Incrementally sync daily Google Ads report partitions"
+    )
+    parser.add_argument("--customer-id", required=True, help="Google Ads Customer ID")
+    parser.add_argument(
+        "--reports",
+        help=f"Comma-separated reports (default: {', '.join(syncable_reports())})",
+    )
+    parser.add_argument(
+        "--date-range",
+        default="LAST_30_DAYS",
+        help="Window to keep in sync (default: LAST_30_DAYS)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the sync summary as JSON"
+    )
+
+    args = parser.parse_args()
+    reports = args.reports.split(",") if args.reports else None
+
+    print(f"--- Syncing Customer ID: {args.customer_id} ({args.date_range}) ---")
+    summaries = sync_account(args.customer_id, reports, args.date_range)
+    if args.json:
+        print(json.dumps(summaries, indent=2))
@@ -51,6 +51,12 @@ HOOKS_DIR = PLUGIN_ROOT / "hooks"
 SCHEMAS_DIR = PLUGIN_ROOT / "schemas"
 PHASES_DIR = PLUGIN_ROOT / "skills" / "google-ads-audit" / "phases"
 
+# Cold-start budget for importing the service modules (SDKs load on first use)
+IMPORT_BUDGET_SECONDS = 0.5
+
+# Make backend importable for the service-level tests
+sys.path.insert(0, str(PLUGIN_ROOT))
+
 results = {"passed": 0, "failed": 0, "warnings": 0}
 
 
@@ -627,6 +633,2366 @@ def test_variable_consistency():
     return True
 
 
+# =============================================================================
+# TEST 9: Fetch scheduler concurrency and error isolation
+# =============================================================================
+def test_fetch_scheduler():
+    print_header("TEST 9: Fetch Scheduler")
+
+    import threading
+    import time
+
+    from backend.services.fetch_scheduler import FetchScheduler
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_fetch(customer_id, fail=False):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        if fail:
+            raise RuntimeError("boom")
+        return [{"customer_id": customer_id}]
+
+    scheduler = FetchScheduler(max_workers=8, per_customer_limit=3)
+    for i in range(10):
+        scheduler.add(f"section_{i}", fake_fetch, "123", fail=(i == 4))
+
+    start = time.perf_counter()
+    results = {r["key"]: r for r in scheduler.run()}
+    elapsed = time.perf_counter() - start
+
+    if len(results) == 10 and results["section_4"]["error"]:
+        print_pass("Failed fetch isolated, all other sections returned")
+        record_pass()
+    else:
+        print_fail(f"Unexpected results: {sorted(results)}")
+        record_fail()
+
+    if state["peak"] <= 3:
+        print_pass(f"Per-customer cap respected (peak {state['peak']} in flight)")
+        record_pass()
+    else:
+        print_fail(f"Per-customer cap exceeded (peak {state['peak']})")
+        record_fail()
+
+    if elapsed < 10 * 0.05:
+        print_pass(f"Fetches overlapped ({elapsed:.2f}s for 10 x 0.05s)")
+        record_pass()
+    else:
+        print_fail(f"Fetches ran sequentially ({elapsed:.2f}s)")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 10: Report registry
+# =============================================================================
+def test_report_registry():
+    print_header("TEST 10: Report Registry")
+
+    from backend.services.report_registry import REPORTS
+
+    for name, spec in sorted(REPORTS.items()):
+        query = spec.build_query()
+        column_names = [c.name for c in spec.columns]
+        problems = []
+        if not query.startswith("SELECT") or f"FROM {spec.resource}" not in query:
+            problems.append("malformed query")
+        if len(set(column_names)) != len(column_names):
+            problems.append("duplicate output columns")
+        if spec.date_field and "DURING" not in query:
+            problems.append("missing date filter")
+
+        if problems:
+            print_fail(f"{name} - {', '.join(problems)}")
+            record_fail()
+        else:
+            print_pass(
+                f"{name} - {len(spec.fields)} fields, {len(column_names)} columns"
+            )
+            record_pass()
+
+    return True
+
+
+# =============================================================================
+# TEST 11: Columnar report decoding
+# =============================================================================
+def test_columnar_decoder():
+    print_header("TEST 11: Columnar Report Decoding")
+
+    try:
+        import numpy  # noqa: F401
+        import pandas  # noqa: F401
+    except ImportError:
+        print_warn("pandas/numpy not installed - skipping columnar decoding")
+        record_warn()
+        return True
+
+    from types import SimpleNamespace as Row
+
+    from backend.services.columnar import ColumnarDecoder
+    from backend.services.report_registry import get_report
+
+    spec = get_report("search_terms")
+
+    class Enum:
+        def __init__(self, name):
+            self.name = name
+
+        def __bool__(self):
+            return True
+
+    def make_row(i):
+        return Row(
+            search_term_view=Row(search_term=f"term {i}", status=Enum("NONE")),
+            segments=Row(keyword=Row(info=Row(match_type=Enum("BROAD")))),
+            campaign=Row(name="Campaign"),
+            ad_group=Row(name="Ad Group"),
+            metrics=Row(
+                clicks=i,
+                impressions=10 * i,
+                ctr=0.1,
+                average_cpc=1500000.0,
+                cost_micros=2500000 * i,
+                conversions=0.5,
+                cost_per_conversion=5000000.0,
+            ),
+        )
+
+    batches = [[make_row(i) for i in range(100)], [make_row(i) for i in range(50)]]
+    decoder = ColumnarDecoder(spec, "123")
+    for batch in batches:
+        decoder.append(batch)
+    frame = decoder.to_frame()
+
+    row_decode = spec.decoder("123")
+    expected = [row_decode(row) for batch in batches for row in batch]
+
+    if frame.to_dict(orient="records") == expected:
+        print_pass(f"Columnar output matches row decoder ({len(frame)} rows)")
+        record_pass()
+    else:
+        print_fail("Columnar output differs from row decoder")
+        record_fail()
+
+    if str(frame["clicks"].dtype) == "int64" and str(frame["cost"].dtype) == "float64":
+        print_pass("Typed columns (clicks int64, cost float64)")
+        record_pass()
+    else:
+        print_fail(f"Unexpected dtypes: {dict(frame.dtypes.astype(str))}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 12: Report response cache
+# =============================================================================
+def test_report_cache():
+    print_header("TEST 12: Report Response Cache")
+
+    from datetime import date
+
+    from backend.services.date_ranges import resolve_date_range
+    from backend.services.report_cache import (
+        LIVE_TTL,
+        RECENT_TTL,
+        ReportCache,
+        normalize_query,
+    )
+
+    today = date(2026, 3, 15)
+    window = resolve_date_range("LAST_30_DAYS", today)
+    if window == (date(2026, 2, 13), date(2026, 3, 14)):
+        print_pass("LAST_30_DAYS resolves to the 30 days before today")
+        record_pass()
+    else:
+        print_fail(f"LAST_30_DAYS resolved to {window}")
+        record_fail()
+
+    ttls = tuple(
+        ReportCache.ttl_for("search_terms", resolved, today)
+        for resolved in (
+            resolve_date_range("TODAY", today),
+            window,
+            resolve_date_range("LAST_MONTH", today),
+        )
+    )
+    if ttls == (LIVE_TTL, RECENT_TTL, None):
+        print_pass("TTLs: live for today, short for recent days, none for settled")
+        record_pass()
+    else:
+        print_fail(f"Unexpected TTLs: {ttls}")
+        record_fail()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = ReportCache(temp_dir, max_bytes=4096)
+        query = "SELECT campaign.id\nFROM campaign"
+        key = cache.make_key("123", query, window)
+        records = [b"row-%d" % i for i in range(100)]
+        cache.put(key, "campaign_performance", "123", records)
+
+        same_key = key == cache.make_key("123", normalize_query(query), window)
+        if cache.get(key) == records and same_key:
+            print_pass("Cached rows round-trip under the normalized query key")
+            record_pass()
+        else:
+            print_fail("Cache round-trip failed")
+            record_fail()
+
+        for i in range(20):
+            noise = os.urandom(512)
+            cache.put(f"k{i}", "search_terms", "123", [noise], ttl=3600)
+        if cache.stats()["bytes"] <= 4096 and cache.get("k19") is not None:
+            print_pass("Size bound enforced by evicting least recently used entries")
+            record_pass()
+        else:
+            print_fail(f"Cache over budget: {cache.stats()}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return True
+
+
+# =============================================================================
+# TEST 13: Incremental partition sync
+# =============================================================================
+def test_incremental_sync():
+    print_header("TEST 13: Incremental Partition Sync")
+
+    from datetime import date
+
+    from backend.services.date_ranges import iter_days, to_date
+    from backend.services.incremental_sync import IncrementalSync, PartitionStore
+
+    class FakeConnector:
+        def __init__(self):
+            self.calls = []
+
+        def run_report(self, name, customer_id, date_range=None, **kwargs):
+            self.calls.append(date_range)
+            start, end = (to_date(day) for day in date_range)
+            return [
+                {
+                    "date": day.isoformat(),
+                    "search_term": "shoes",
+                    "status": "NONE",
+                    "match_type": "BROAD",
+                    "campaign_name": "Campaign",
+                    "ad_group_name": "Ad Group",
+                    "clicks": 2,
+                    "impressions": 10,
+                    "ctr": 0.2,
+                    "avg_cpc": 1.5,
+                    "cost": 3.0,
+                    "conversions": 1.0,
+                    "cpa": 3.0,
+                }
+                for day in iter_days(start, end)
+            ]
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        connector = FakeConnector()
+        sync = IncrementalSync(connector, PartitionStore(temp_dir))
+        today = date(2026, 3, 15)
+
+        first = sync.sync("123", "search_terms", "LAST_30_DAYS", today=today)
+        second = sync.sync("123", "search_terms", "LAST_30_DAYS", today=today)
+        if (
+            first["fetched_days"] == 30
+            and second["fetched_days"] == 3
+            and second["api_calls"] == 1
+            and connector.calls[-1] == (date(2026, 3, 12), date(2026, 3, 14))
+        ):
+            print_pass("Re-sync only fetches the still-mutable recent days")
+            record_pass()
+        else:
+            print_fail(f"Unexpected sync summaries: {first}, {second}")
+            record_fail()
+
+        rows = sync.window("123", "search_terms", "LAST_30_DAYS", today=today)
+        if (
+            len(rows) == 1
+            and rows[0]["clicks"] == 60
+            and rows[0]["cost"] == 90.0
+            and rows[0]["ctr"] == 0.2
+            and "date" not in rows[0]
+        ):
+            print_pass("Window assembled from partitions with recomputed ratios")
+            record_pass()
+        else:
+            print_fail(f"Unexpected assembled window: {rows}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return True
+
+
+# =============================================================================
+# TEST 14: Shared rate limiter
+# =============================================================================
+def test_rate_limiter():
+    print_header("TEST 14: Shared Rate Limiter")
+
+    import threading
+    import time
+
+    from backend.services.rate_limiter import RateLimiter, TokenBucket
+
+    limiter = TokenBucket(rate=100, capacity=5)
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # 20 requests, 5 from the initial burst, 15 refilled at 100/s
+    if elapsed >= 0.14 and limiter.stats()["acquired"] == 20:
+        print_pass(f"20 requests across 4 threads paced to {elapsed:.2f}s")
+        record_pass()
+    else:
+        print_fail(f"Rate limit not enforced ({elapsed:.2f}s, {limiter.stats()})")
+        record_fail()
+
+    if not TokenBucket(rate=1, capacity=1).acquire(tokens=2, timeout=0.05):
+        print_pass("acquire() gives up when the timeout expires")
+        record_pass()
+    else:
+        print_fail("acquire() ignored its timeout")
+        record_fail()
+
+    # Single-account audits are paced by the developer-token bucket alone
+    limiter = RateLimiter(rate=1000, burst=50)
+    start = time.perf_counter()
+    for _ in range(40):
+        limiter.acquire("1234567890")
+    capped = RateLimiter(
+        rate=1000, burst=50, per_customer_rate=100, per_customer_burst=5
+    )
+    capped_start = time.perf_counter()
+    for _ in range(10):
+        capped.acquire("1234567890")
+    if (
+        limiter.per_customer_rate is None
+        and time.perf_counter() - capped_start >= 0.04
+        and capped_start - start < 0.04
+    ):
+        print_pass("Per-customer cap off by default, enforced when configured")
+        record_pass()
+    else:
+        print_fail("Unexpected per-customer rate limiting")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 15: Retry policy for quota and transient errors
+# =============================================================================
+def test_retry_policy():
+    print_header("TEST 15: API Retry Policy")
+
+    from types import SimpleNamespace as Obj
+
+    from backend.services.retry import RetryPolicy, is_retryable, retry_after
+
+    class FakeApiError(Exception):
+        """Shaped like GoogleAdsException: .error (grpc.Call) and .failure."""
+
+        def __init__(self, status, quota_code="UNSPECIFIED", retry_seconds=0):
+            super().__init__(status)
+            self.error = Obj(code=lambda: Obj(name=status))
+            self.failure = Obj(
+                errors=[
+                    Obj(
+                        error_code=Obj(quota_error=Obj(name=quota_code)),
+                        details=Obj(
+                            quota_error_details=Obj(
+                                retry_delay=Obj(seconds=retry_seconds, nanos=0)
+                            )
+                        ),
+                    )
+                ]
+            )
+
+    quota = FakeApiError("RESOURCE_EXHAUSTED", "RESOURCE_EXHAUSTED", retry_seconds=7)
+    daily_quota = FakeApiError("RESOURCE_EXHAUSTED", "RESOURCE_EXHAUSTED", 86400)
+    transient = FakeApiError("INTERNAL")
+    invalid = FakeApiError("INVALID_ARGUMENT")
+    policy = RetryPolicy(max_attempts=3, base_delay=0.5)
+
+    if is_retryable(quota) and is_retryable(transient) and not is_retryable(invalid):
+        print_pass("Quota and transient errors retryable, request errors not")
+        record_pass()
+    else:
+        print_fail("Retryable error classification is wrong")
+        record_fail()
+
+    delays = [policy.delay(attempt, transient) for attempt in range(3)]
+    if (
+        retry_after(quota) == 7
+        and policy.delay(0, quota) >= 7
+        and policy.delay(0, daily_quota) is None
+        and 0 <= delays[0] <= 0.5
+        and 0 <= delays[1] <= 1.0
+        and delays[2] is None
+    ):
+        print_pass("Backoff honors retry_delay hints and the attempt limit")
+        record_pass()
+    else:
+        print_fail(f"Unexpected backoff delays: {delays}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 16: Cold-start import budget
+# =============================================================================
+def test_import_budget():
+    print_header("TEST 16: Cold-Start Import Budget")
+
+    # Heavy SDKs must load on first use, not when a service module is imported
+    heavy = [
+        "google.ads.googleads.client",
+        "google.analytics.data_v1beta",
+        "google.analytics.admin",
+        "pandas",
+        "numpy",
+    ]
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import backend.services.ads_connector\n"
+        "import backend.services.ga4_service\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(PLUGIN_ROOT),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print_fail(f"Service modules failed to import: {result.stderr.strip()}")
+        record_fail()
+        return False
+
+    lines = result.stdout.strip().splitlines()
+    measured = json.loads(lines[-1])
+    if len(lines) == 1 and not measured["heavy"]:
+        print_pass("Importing services loads no SDKs or credentials")
+        record_pass()
+    else:
+        print_fail(f"Import side effects: {measured['heavy'] or lines[:-1]}")
+        record_fail()
+
+    if measured["elapsed"] <= IMPORT_BUDGET_SECONDS:
+        print_pass(
+            f"Service imports took {measured['elapsed']:.3f}s "
+            f"(budget {IMPORT_BUDGET_SECONDS}s)"
+        )
+        record_pass()
+    else:
+        print_fail(
+            f"Service imports took {measured['elapsed']:.3f}s, "
+            f"over the {IMPORT_BUDGET_SECONDS}s budget"
+        )
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 17: Multi-window reports from one daily fetch
+# =============================================================================
+def test_multi_window():
+    print_header("TEST 17: Multi-Window Reports")
+
+    from datetime import date
+
+    from backend.services.date_ranges import iter_days
+    from backend.services.multi_window import fetch_span, split_windows
+    from backend.services.report_registry import get_report
+
+    spec = get_report("campaign_performance")
+    start, end = fetch_span((7, 30), today=date(2026, 3, 1))
+    if (start, end) != (date(2025, 12, 31), date(2026, 2, 28)):
+        print_fail(f"Unexpected fetch span: {start} - {end}")
+        record_fail()
+        return False
+
+    # 2.0 per day in the last week, 1.0 before; paused three days ago
+    rows = [
+        {
+            "customer_id": "123",
+            "campaign_id": "1",
+            "campaign_name": "Brand",
+            "status": "PAUSED" if (end - day).days < 3 else "ENABLED",
+            "date": day.isoformat(),
+            "cost": 2.0 if (end - day).days < 7 else 1.0,
+            "impressions": 100,
+            "clicks": 10,
+            "conversions": 1.0,
+            "ctr": 0.1,
+            "avg_cpc": 0.1,
+            "cpa": 1.0,
+        }
+        for day in iter_days(start, end)
+    ]
+    windows = split_windows(spec, rows, (30, 7), end)
+
+    week = windows.get("LAST_7_DAYS", {})
+    month = windows.get("LAST_30_DAYS", {})
+    if (
+        list(windows) == ["LAST_7_DAYS", "LAST_30_DAYS"]
+        and week["totals"]["cost"] == 14.0
+        and week["previous_totals"]["cost"] == 7.0
+        and week["totals"]["cost_change_pct"] == 1.0
+        and month["totals"]["cost"] == 37.0
+        and month["totals"]["clicks"] == 300
+        and month["totals"]["cpa"] == 37.0 / 30
+    ):
+        print_pass("Windows and previous periods rolled up from one fetch")
+        record_pass()
+    else:
+        print_fail(f"Unexpected window totals: {windows}")
+        record_fail()
+
+    campaign = week.get("rows", [{}])[0]
+    if (
+        len(week["rows"]) == 1
+        and campaign["status"] == "PAUSED"
+        and campaign["cost_previous"] == 7.0
+        and campaign["cost_change"] == 7.0
+    ):
+        print_pass("Entity rows keep latest status and carry period changes")
+        record_pass()
+    else:
+        print_fail(f"Unexpected window rows: {week.get('rows')}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 18: Audit warehouse snapshots
+# =============================================================================
+def test_audit_warehouse():
+    print_header("TEST 18: Audit Warehouse")
+
+    from backend.services.audit_warehouse import AuditWarehouse
+
+    def make_audit(audit_date, cost):
+        return {
+            "metadata": {
+                "customer_id": "123",
+                "audit_date": audit_date,
+                "fetch_errors": {"ads": "quota"},
+            },
+            "google_ads": {
+                "campaigns": [
+                    {
+                        "customer_id": "123",
+                        "campaign_id": "1",
+                        "campaign_name": "Brand",
+                        "status": "ENABLED",
+                        "date": "2026-02-28",
+                        "cost": cost,
+                        "impressions": 100,
+                        "clicks": 10,
+                        "conversions": 2.0,
+                        "ctr": 0.1,
+                        "avg_cpc": cost / 10,
+                        "cpa": cost / 2,
+                    }
+                ],
+                "keywords": [],
+            },
+        }
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        warehouse = AuditWarehouse(temp_dir)
+        warehouse.write_audit(make_audit("2026-02-01T09:00:00", 10.0))
+        warehouse.write_audit(make_audit("2026-03-01T09:00:00", 20.0))
+        written = warehouse.write_audit(make_audit("2026-03-01T15:00:00", 25.5))
+
+        history = warehouse.history("campaigns", "123")
+        if (
+            written["campaigns"] == 1
+            and [row["snapshot_date"] for row in history]
+            == ["2026-02-01", "2026-03-01"]
+            and history[-1]["cost"] == 25.5
+        ):
+            print_pass("Snapshots kept per date, same-day re-runs replaced")
+            record_pass()
+        else:
+            print_fail(f"Unexpected campaign history: {history}")
+            record_fail()
+
+        totals = warehouse.query(
+            "SELECT snapshot_date, SUM(cost) AS cost FROM campaigns "
+            "WHERE customer_id = ? GROUP BY snapshot_date ORDER BY snapshot_date",
+            ("123",),
+        )
+        snapshots = warehouse.snapshots("123")
+        if totals == [
+            {"snapshot_date": "2026-02-01", "cost": 10.0},
+            {"snapshot_date": "2026-03-01", "cost": 25.5},
+        ] and snapshots[0]["fetch_errors"] == {"ads": "quota"}:
+            print_pass("SQL over the history matches the stored audits")
+            record_pass()
+        else:
+            print_fail(f"Unexpected query result: {totals}, {snapshots}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return True
+
+
+# =============================================================================
+# TEST 19: Parquet/Arrow section export
+# =============================================================================
+def test_audit_export():
+    print_header("TEST 19: Parquet/Arrow Section Export")
+
+    from backend.services.audit_export import export_audit, load_section
+
+    audit_data = {
+        "metadata": {"customer_id": "123", "audit_date": "2026-03-01T09:00:00"},
+        "google_ads": {
+            "search_terms": [
+                {"search_term": f"term {i}", "clicks": i, "cost": i * 1.5}
+                for i in range(100)
+            ],
+            "ads": [{"ad_id": 1, "headlines": [{"text": "Buy", "pinned": None}]}],
+            "budgets": [],
+            "campaign_trends": {"LAST_30_DAYS": {"totals": {"cost": 10.0}}},
+        },
+        "ga4": {},
+    }
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            try:
+                export_audit(audit_data, temp_dir)
+                print_fail("Export without pyarrow did not raise ImportError")
+                record_fail()
+            except ImportError as e:
+                if "pip install pyarrow" in str(e):
+                    print_pass("Export without pyarrow fails with an install hint")
+                    record_pass()
+                else:
+                    print_fail(f"Unexpected ImportError: {e}")
+                    record_fail()
+            print_warn("pyarrow not installed - skipping export round trip")
+            record_warn()
+            return True
+
+        for export_format in ("parquet", "arrow"):
+            target = os.path.join(temp_dir, export_format)
+            export_audit(audit_data, target, export_format)
+            terms = load_section(target, "google_ads/search_terms", ["cost"])
+            trends = load_section(target, "google_ads/campaign_trends")
+            empty = load_section(target, "google_ads/budgets")
+            if (
+                terms.column_names == ["cost"]
+                and terms.num_rows == 100
+                and terms.column("cost")[99].as_py() == 148.5
+                and trends["LAST_30_DAYS"]["totals"]["cost"] == 10.0
+                and empty.num_rows == 0
+            ):
+                print_pass(f"{export_format}: sections round-trip with projection")
+                record_pass()
+            else:
+                print_fail(f"{export_format}: unexpected round trip ({terms})")
+                record_fail()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return True
+
+
+# =============================================================================
+# TEST 20: Streaming audit JSON writer
+# =============================================================================
+def test_audit_writer():
+    print_header("TEST 20: Streaming Audit JSON Writer")
+
+    import gzip
+
+    from backend.services.audit_writer import AuditJsonWriter
+
+    rows = [{"search_term": f"term {i}", "cost": i * 0.5} for i in range(1000)]
+    metadata = {"customer_id": "123", "fetch_errors": {"ads": "quota"}}
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "audit.json.gz")
+        writer = AuditJsonWriter(path, compression="gzip")
+        writer.write_section("google_ads", "search_terms", rows)
+        writer.write_section("google_ads", "campaign_trends", {"LAST_30_DAYS": {}})
+        writer.write_section("google_ads", "budgets", [])
+        writer.close(metadata)
+
+        with gzip.open(path, "rt") as f:
+            written = json.load(f)
+        expected = {
+            "google_ads": {
+                "search_terms": rows,
+                "campaign_trends": {"LAST_30_DAYS": {}},
+                "budgets": [],
+            },
+            "ga4": {},
+            "metadata": metadata,
+        }
+        if written == expected and writer.rows_written == 1000:
+            print_pass("Sections streamed to gzip JSON match json.dump output")
+            record_pass()
+        else:
+            print_fail(f"Streamed JSON differs: {str(written)[:200]}")
+            record_fail()
+
+        writer = AuditJsonWriter(os.path.join(temp_dir, "split.json"))
+        writer.write_section("google_ads", "campaigns", [])
+        writer.write_section("ga4", "behavior", [])
+        try:
+            writer.write_section("google_ads", "keywords", [])
+            print_fail("Interleaved groups were accepted")
+            record_fail()
+        except ValueError:
+            print_pass("Sections of a group must be written together")
+            record_pass()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return True
+
+
+# =============================================================================
+# TEST 21: Search term n-gram analysis
+# =============================================================================
+def test_ngram_analysis():
+    print_header("TEST 21: Search Term N-Grams")
+
+    from backend.analysis import ngrams
+
+    def term(text, cost, conversions, ad_group="AG"):
+        return {
+            "search_term": text,
+            "ad_group_name": ad_group,
+            "cost": cost,
+            "clicks": 10,
+            "conversions": conversions,
+        }
+
+    # Account CPA: 200 / 8 = 25
+    search_terms = [
+        term("free plumber", 50.0, 0),
+        term("Free plumber copenhagen", 30.0, 0),
+        term("plumber price", 40.0, 4),
+        term("plumber price copenhagen", 20.0, 2),
+        term("emergency plumber", 30.0, 1),
+        term("emergency plumber", 30.0, 1, ad_group="Other"),
+    ]
+    analysis = ngrams.analyze_search_terms(search_terms)
+    wasting = analysis["top_wasting_patterns"]
+    converting = analysis["top_converting_patterns"]
+
+    if (
+        analysis["search_terms_analyzed"] == 5
+        and analysis["account_cpa"] == 25.0
+        and [p["pattern"] for p in wasting] == ["free", "free plumber"]
+        and wasting[0]["occurrences"] == 2
+        and wasting[0]["total_spend"] == 80.0
+        and wasting[0]["wasted_spend"] == 80.0
+    ):
+        print_pass("Wasting patterns ranked by spend beyond the account CPA")
+        record_pass()
+    else:
+        print_fail(f"Unexpected wasting patterns: {wasting}")
+        record_fail()
+
+    patterns = [p["pattern"] for p in converting]
+    if (
+        patterns[:2] == ["plumber", "price"]
+        and converting[1]["total_conversions"] == 6.0
+        and converting[1]["cpa"] == 10.0
+        and "free" not in patterns
+    ):
+        print_pass("Converting patterns ranked by conversions at target CPA")
+        record_pass()
+    else:
+        print_fail(f"Unexpected converting patterns: {converting}")
+        record_fail()
+
+    # The numpy and pure-Python aggregations must agree
+    if ngrams._numpy() is None:
+        print_warn("numpy not installed - vectorized path not checked")
+        record_warn()
+        return True
+
+    numpy_loader = ngrams._numpy
+    ngrams._numpy = lambda: None
+    try:
+        fallback = ngrams.analyze_search_terms(search_terms)
+    finally:
+        ngrams._numpy = numpy_loader
+    if fallback == analysis:
+        print_pass("Vectorized and pure-Python aggregations agree")
+        record_pass()
+    else:
+        print_fail(f"Aggregations differ: {fallback} vs {analysis}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 22: Negative keyword conflicts
+# =============================================================================
+def test_negative_conflicts():
+    print_header("TEST 22: Negative Keyword Conflicts")
+
+    from backend.analysis.negative_conflicts import (
+        NegativeMatcher,
+        collect_negatives,
+        find_conflicts,
+    )
+
+    def negative(keyword, match_type, **scope):
+        return dict(scope, keyword=keyword, match_type=match_type)
+
+    negatives = collect_negatives(
+        campaign_negatives=[
+            negative("free", "PHRASE", campaign_name="Search"),
+            negative("plumber repair", "EXACT", campaign_name="Search"),
+            negative("cheap plumber", "BROAD", campaign_name="Search"),
+        ],
+        shared_negatives=[
+            negative("plumber jobs", "PHRASE", shared_set_id="1", shared_set_name="A"),
+            negative("diy", "PHRASE", shared_set_id="2", shared_set_name="Unlinked"),
+        ],
+        list_links=[
+            {"campaign_name": "Search", "shared_set_id": "1"},
+            {"campaign_name": "Brand", "shared_set_id": "1"},
+        ],
+    )
+    matcher = NegativeMatcher(negatives)
+
+    def blocked_by(text, campaign="Search"):
+        return [n["keyword"] for n in matcher.matches(text, campaign)]
+
+    cases = [
+        ("free plumber", "Search", ["free"]),
+        ("freedom plumbing", "Search", []),
+        ("free plumber", "Brand", []),
+        ("plumber repair", "Search", ["plumber repair"]),
+        ("plumber repair now", "Search", []),
+        ("plumber near me cheap", "Search", ["cheap plumber"]),
+        ("best plumber jobs", "Brand", ["plumber jobs"]),
+        ("jobs plumber", "Brand", []),
+        ("diy plumber", "Search", []),
+    ]
+    wrong = [
+        (text, campaign, blocked_by(text, campaign))
+        for text, campaign, expected in cases
+        if blocked_by(text, campaign) != expected
+    ]
+    if not wrong and len(matcher) == 4:
+        print_pass("Exact, phrase and broad negatives matched within their scope")
+        record_pass()
+    else:
+        print_fail(f"Unexpected matches: {wrong}")
+        record_fail()
+
+    def row(text_key, text, campaign, **values):
+        return dict(values, campaign_name=campaign, **{text_key: text})
+
+    result = find_conflicts(
+        matcher,
+        keywords=[
+            row("keyword", "free plumber", "Search", status="ENABLED", cost=10.0),
+            row("keyword", "free quote", "Search", status="PAUSED"),
+            row("keyword", "plumber", "Search", status="ENABLED"),
+        ],
+        search_terms=[
+            row("search_term", "plumber jobs", "Brand", conversions=3.0, cost=50.0),
+            row("search_term", "free plumber", "Search", conversions=0, cost=20.0),
+        ],
+    )
+    blocked = result["blocked_search_terms"]
+    if (
+        [c["keyword"] for c in result["blocked_keywords"]] == ["free plumber"]
+        and result["keywords_checked"] == 2
+        and len(blocked) == 1
+        and blocked[0]["negative_source"] == "A"
+        and result["blocked_conversions"] == 3.0
+    ):
+        print_pass("Active keywords and converting search terms checked for blocks")
+        record_pass()
+    else:
+        print_fail(f"Unexpected conflicts: {result}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 23: Quality Score aggregates
+# =============================================================================
+def test_quality_score_analysis():
+    print_header("TEST 23: Quality Score Analysis")
+
+    from backend.analysis import quality_score
+
+    def keyword(text, qs, cost, status="ENABLED", impressions=100, ctr="AVERAGE"):
+        return {
+            "keyword": text,
+            "status": status,
+            "impressions": impressions,
+            "quality_score": qs,
+            "cost": cost,
+            "clicks": 5,
+            "conversions": 1.0,
+            "expected_ctr": ctr,
+            "creative_qs": "ABOVE_AVERAGE",
+            "landing_page_qs": "UNSPECIFIED",
+            "campaign_name": "Search",
+            "ad_group_name": "AG",
+        }
+
+    keywords = [
+        keyword("plumber", 8, 60.0),
+        keyword("cheap plumber", 3, 30.0, ctr="BELOW_AVERAGE"),
+        keyword("plumber near me", 0, 10.0),
+        keyword("paused plumber", 1, 500.0, status="PAUSED"),
+        keyword("no impressions", 1, 0.0, impressions=0),
+    ]
+    analysis = quality_score.analyze_quality_scores(keywords)
+    distribution = analysis["distribution"]
+
+    # (8 * 60 + 3 * 30) / 90; the unscored keyword is left out
+    if (
+        analysis["keyword_count"] == 3
+        and analysis["qs_weighted_avg"] == round(570 / 90, 2)
+        and list(distribution) == list(quality_score.BAND_NAMES)
+        and distribution["qs_7_8"] == {
+            "keyword_count": 1,
+            "spend": 60.0,
+            "spend_pct": 60.0,
+        }
+        and distribution["qs_null"]["spend_pct"] == 10.0
+        and distribution["qs_1"]["keyword_count"] == 0
+    ):
+        print_pass("Spend-weighted QS and band distribution of enabled keywords")
+        record_pass()
+    else:
+        print_fail(f"Unexpected QS analysis: {analysis}")
+        record_fail()
+
+    ctr = analysis["components"]["expected_ctr"]
+    low_qs = analysis["low_qs_keywords"]
+    if (
+        ctr["all"]["Average"]["keyword_count"] == 2
+        and ctr["low_qs"]["Below average"]["spend_pct"] == 100.0
+        and [k["keyword"] for k in low_qs] == ["cheap plumber"]
+        and low_qs[0]["expected_ctr"] == "Below average"
+        and low_qs[0]["ad_relevance"] == "Above average"
+        and "landing_page_exp" not in low_qs[0]
+    ):
+        print_pass("Component breakdowns and schema-shaped low QS keywords")
+        record_pass()
+    else:
+        print_fail(f"Unexpected components: {ctr} / {low_qs}")
+        record_fail()
+
+    # The numpy and pure-Python aggregations must agree
+    if quality_score._numpy() is None:
+        print_warn("numpy not installed - vectorized path not checked")
+        record_warn()
+        return True
+
+    numpy_loader = quality_score._numpy
+    quality_score._numpy = lambda: None
+    try:
+        fallback = quality_score.analyze_quality_scores(keywords)
+    finally:
+        quality_score._numpy = numpy_loader
+    if fallback == analysis:
+        print_pass("Vectorized and pure-Python aggregations agree")
+        record_pass()
+    else:
+        print_fail(f"Aggregations differ: {fallback} vs {analysis}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 24: Phase artifact builders
+# =============================================================================
+def test_artifact_builders():
+    print_header("TEST 24: Phase Artifact Builders")
+
+    from backend.analysis import artifacts
+
+    def campaign(name, date, cost, conversions, status="ENABLED", cid="1"):
+        return {
+            "campaign_id": cid,
+            "campaign_name": name,
+            "status": status,
+            "date": date,
+            "cost": cost,
+            "impressions": 1000,
+            "clicks": 50,
+            "conversions": conversions,
+        }
+
+    def rsa(headlines, descriptions, strength, url, impressions=100):
+        return {
+            "type": "RESPONSIVE_SEARCH_AD",
+            "status": "ENABLED",
+            "campaign_name": "Brand",
+            "ad_group_name": f"AG {headlines}",
+            "headlines": [{"text": f"H{i}"} for i in range(headlines)],
+            "descriptions": [{"text": f"D{i}"} for i in range(descriptions)],
+            "ad_strength": strength,
+            "final_urls": [url],
+            "impressions": impressions,
+            "clicks": 5,
+        }
+
+    audit_data = {
+        "metadata": {"audit_date": "2025-03-31T10:00:00"},
+        "google_ads": {
+            "campaigns": [
+                campaign("Brand", "2025-03-01", 300.0, 10.0),
+                campaign("Brand", "2025-03-02", 300.0, 10.0),
+                campaign("Generic", "2025-03-01", 400.0, 0.0, "PAUSED", "2"),
+            ],
+            "impression_share": [
+                {
+                    "campaign_name": "Brand",
+                    "search_is": 0.6,
+                    "lost_is_budget": 0.25,
+                    "lost_is_rank": 0.15,
+                }
+            ],
+            "budgets": [
+                {"campaign_name": "Brand", "budget_resource": "b/1", "amount": 50.0},
+                {"campaign_name": "Generic", "budget_resource": "b/2", "amount": 99.0},
+            ],
+            "bidding_strategies": [
+                {
+                    "campaign_name": "Brand",
+                    "channel_type": "SEARCH",
+                    "type": "TARGET_CPA",
+                    "target_cpa": 25.0,
+                },
+                {
+                    "campaign_name": "Generic",
+                    "channel_type": "PERFORMANCE_MAX",
+                    "type": "MANUAL_CPC",
+                },
+            ],
+            "keywords": [
+                {
+                    "keyword": "plumber",
+                    "status": "ENABLED",
+                    "impressions": 10,
+                    "quality_score": 7,
+                    "cost": 100.0,
+                    "campaign_name": "Brand",
+                }
+            ],
+            "search_terms": [
+                {"search_term": "free plumber", "cost": 40.0, "conversions": 0},
+                {"search_term": "plumber", "cost": 90.0, "conversions": 3.0},
+                {"search_term": "plumber", "cost": 10.0, "conversions": 1.0},
+            ],
+            "negative_keywords": [
+                {"keyword": "free", "match_type": "BROAD", "campaign_name": "Brand"}
+            ],
+            "ads": [
+                rsa(4, 2, "POOR", "https://example.com/", 10),
+                rsa(8, 4, "AVERAGE", "http://example.com/plumbing", 500),
+                rsa(15, 4, "EXCELLENT", "https://example.com/plumbing"),
+            ],
+            "account_extensions": [{"field_type": "CALLOUT", "asset_id": "7"}],
+            "campaign_extensions": [
+                {"campaign_name": "Brand", "field_type": "SITELINK", "asset_id": "8"}
+            ],
+        },
+    }
+
+    built = artifacts.build_artifacts(audit_data, target_cpa=20)
+    performance = built["performance_analysis"]
+    brand, generic = performance["campaigns"]
+    bidding = {b["campaign"]: b for b in performance["bid_strategy_analysis"]}
+    if (
+        performance["audit_period"]
+        == {"start_date": "2025-03-01", "end_date": "2025-03-30", "days": 30}
+        and brand["metrics_30d"]["cpa"] == 30.0
+        and brand["metrics_30d"]["impression_share"] == 60.0
+        and brand["limited_by_budget"] is True
+        and generic["type"] == "Performance Max"
+        and performance["overall_metrics"]["cost"] == 1000.0
+        and performance["budget_analysis"]["total_daily_budget"] == 50.0
+        and performance["budget_analysis"]["campaigns_limited_by_budget"] == ["Brand"]
+        and bidding["Brand"]["assessment"] == "insufficient_data"
+        and bidding["Generic"]["assessment"] == "insufficient_data"
+    ):
+        print_pass("performance_analysis: campaign metrics, budgets, bid strategies")
+        record_pass()
+    else:
+        print_fail(f"Unexpected performance_analysis: {performance}")
+        record_fail()
+
+    keyword_audit = built["keyword_audit"]
+    summary = keyword_audit["summary"]
+    terms = keyword_audit["search_term_analysis"]
+    negatives = keyword_audit["negative_keyword_analysis"]
+    if (
+        summary["total_search_terms"] == 2
+        and summary["total_wasted_spend_dkk"] == 40.0
+        and summary["qs_weighted_avg"] == 7.0
+        and summary["negative_positive_ratio"] == 1.0
+        and [t["search_term"] for t in terms["wasted_spend_terms"]] == ["free plumber"]
+        and terms["top_converting_terms"][0]["cpa"] == 30.0
+        and negatives["ratio_assessment"] == "good"
+        and negatives["current_negatives"]["campaign_level"] == 1
+    ):
+        print_pass("keyword_audit: wasted spend, QS, search terms, negatives")
+        record_pass()
+    else:
+        print_fail(f"Unexpected keyword_audit: {keyword_audit}")
+        record_fail()
+
+    ad_copy = built["ad_copy_audit"]
+    rsa_analysis = ad_copy["rsa_analysis"]
+    extensions = ad_copy["extension_analysis"]
+    landing = ad_copy["landing_page_analysis"]
+    if (
+        ad_copy["summary"]["total_ads"] == 3
+        and ad_copy["summary"]["ads_with_poor_strength"] == 2
+        and rsa_analysis["headline_distribution"] == {"1_4": 1, "5_9": 1, "10_15": 1}
+        and [a["severity"] for a in rsa_analysis["underfilled_ads"]]
+        == ["HIGH", "CRITICAL"]
+        and extensions["callouts"] == {
+            "present": True,
+            "count": 1,
+            "campaigns_missing": [],
+        }
+        and extensions["sitelinks"]["campaigns_missing"] == []
+        and extensions["structured_snippets"]["present"] is False
+        and ad_copy["summary"]["extension_coverage_pct"] == 0
+        and [i["url"] for i in landing["issues"]] == ["http://example.com/plumbing"]
+        and landing["homepage_usage"]["assessment"] == "acceptable"
+    ):
+        print_pass("ad_copy_audit: RSA bands, extensions, landing pages")
+        record_pass()
+    else:
+        print_fail(f"Unexpected ad_copy_audit: {ad_copy}")
+        record_fail()
+
+    temp_dir = tempfile.mkdtemp(prefix="mb_artifacts_")
+    try:
+        paths = artifacts.write_artifacts(audit_data, temp_dir, target_cpa=20)
+        with open(paths[0]) as f:
+            written = json.load(f)
+        if [Path(p).name for p in paths] == [
+            "performance_analysis.json",
+            "keyword_audit.json",
+            "ad_copy_audit.json",
+        ] and written == json.loads(json.dumps(performance)):
+            print_pass("write_artifacts writes one JSON file per artifact")
+            record_pass()
+        else:
+            print_fail(f"Unexpected artifact files: {paths}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    try:
+        from jsonschema import validate, ValidationError
+    except ImportError:
+        print_warn("jsonschema not installed - artifacts not validated")
+        record_warn()
+        return True
+
+    for name, artifact in built.items():
+        with open(SCHEMAS_DIR / f"{name}.schema.json") as f:
+            schema = json.load(f)
+        try:
+            validate(instance=artifact, schema=schema)
+            print_pass(f"{name} validates against its schema")
+            record_pass()
+        except ValidationError as e:
+            print_fail(f"{name} is invalid: {e.message}")
+            record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 25: Fake Google Ads API
+# =============================================================================
+def test_fake_ads_api():
+    print_header("TEST 25: Fake Google Ads API")
+
+    from datetime import date
+    from backend.services import ads_connector, client_pool
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer(
+        [FakeAccount(customer_id, campaigns=3, ad_groups=2, search_terms=2500)],
+        batch_size=1000,
+        today=date(2025, 3, 31),
+    )
+    get_client = client_pool.get_client
+
+    with server.install():
+        ads = ads_connector.AdsConnector(
+            rate_limiter=RateLimiter(rate=1000, burst=100, per_customer_rate=1000),
+            retry_policy=RetryPolicy(base_delay=0),
+            login_customer_id="9999999999",
+        )
+
+        campaigns = ads.get_campaign_performance(customer_id)
+        keywords = ads.get_keyword_performance(customer_id)
+        search_terms = list(ads.iter_report("search_terms", customer_id))
+        names = {row["campaign_name"] for row in campaigns}
+        if (
+            len(campaigns) == 3 * 30
+            and names == {row["campaign_name"] for row in keywords}
+            and {row["date"] for row in campaigns} >= {"2025-03-01", "2025-03-30"}
+            and len(search_terms) == 2500
+            and len({row["search_term"] for row in search_terms}) == 2500
+            and server.stats["batches"] == 1 + 1 + 3
+        ):
+            print_pass("Synthetic reports decode with consistent campaigns")
+            record_pass()
+        else:
+            print_fail(f"Unexpected fake reports: {len(campaigns)} / {server.stats}")
+            record_fail()
+
+        # Injected transient errors before the first batch are retried
+        server.fail_next("UNAVAILABLE", times=2)
+        retried = ads.get_search_terms(customer_id)
+        server.fail_next("RESOURCE_EXHAUSTED", after_batches=1)
+        try:
+            list(ads.iter_report("search_terms", customer_id))
+            mid_stream = None
+        except Exception as e:
+            mid_stream = e
+        if (
+            len(retried) == 2500
+            and getattr(mid_stream, "status", None) == "RESOURCE_EXHAUSTED"
+            and server.stats["errors"] == 3
+        ):
+            print_pass("Injected errors are retried, mid-stream failures raised")
+            record_pass()
+        else:
+            print_fail(f"Unexpected error handling: {mid_stream!r} / {server.stats}")
+            record_fail()
+
+        created = ads.create_ad_group(
+            customer_id, "1000", "Fake", validate_only=False
+        )
+        negatives = ads.add_campaign_negative_keywords(
+            customer_id, "1000", ["free", "diy"]
+        )
+        server.fail_next("INVALID_ARGUMENT", method="mutate_campaign_criteria")
+        rejected = ads.add_campaign_negative_keywords(customer_id, "1000", ["jobs"])
+        if (
+            created["resource"].startswith(f"customers/{customer_id}/adGroups/")
+            and len(negatives["added"]) == 2
+            and "campaignCriteria" in negatives["added"][0]
+            and rejected["added"] == []
+            and len(rejected["errors"]) == 1
+            and server.stats["mutate_operations"] == 3
+        ):
+            print_pass("Mutate services return resource names and injected errors")
+            record_pass()
+        else:
+            print_fail(f"Unexpected mutate results: {created} / {negatives}")
+            record_fail()
+
+    if client_pool.get_client is get_client and (
+        ads_connector.ensure_credentials.__module__ == "backend.services.credentials"
+    ):
+        print_pass("install() restores the real client and credential checks")
+        record_pass()
+    else:
+        print_fail("install() left patches behind")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 26: Record/Replay Harness
+# =============================================================================
+def test_record_replay():
+    print_header("TEST 26: Record/Replay Harness")
+
+    import json
+    import tempfile
+    import shutil
+    from datetime import date, timedelta
+    from backend.services import ads_connector, client_pool
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer, Message
+    from backend.testing.recorder import FixtureMissError, Recorder, Replayer
+
+    customer_id = "1234567890"
+    query = (
+        "SELECT campaign.id, metrics.clicks FROM campaign "
+        "WHERE segments.date BETWEEN '2025-03-01' AND '2025-03-07'"
+    )
+    server = FakeAdsServer(
+        [FakeAccount(customer_id, campaigns=3, rows={"change_event": 20})],
+        batch_size=100,
+    )
+    connector = lambda: ads_connector.AdsConnector(
+        rate_limiter=RateLimiter(rate=1000, burst=100, per_customer_rate=1000),
+        retry_policy=RetryPolicy(base_delay=0),
+    )
+
+    class FakeDataClient:
+        def run_report(self, request):
+            return Message(rows=[Message(value="jane@example.org")], row_count=1)
+
+        def list_accounts(self):
+            return iter([Message(name="accounts/1"), Message(name="accounts/2")])
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        recorder = Recorder(temp_dir)
+        with server.install(), recorder.install():
+            ads = connector()
+            server.fail_next("UNAVAILABLE")
+            keywords = ads.get_keyword_performance(customer_id)
+            changes = ads.get_change_history(customer_id)
+            campaigns = [
+                row.campaign.id
+                for batch in ads.ga_service.search_stream(
+                    customer_id=customer_id, query=query
+                )
+                for row in batch.results
+            ]
+            data = recorder.wrap(FakeDataClient())
+            report = data.run_report(Message(property="properties/1"))
+            accounts = data.list_accounts()
+
+        with open(f"{temp_dir}/index.json") as f:
+            calls = json.load(f)["calls"]
+        if (
+            [call["method"] for call in calls].count("search_stream") == 4
+            and calls[0].get("error", {}).get("status") == "UNAVAILABLE"
+            and report.rows[0].value == "jane@example.org"
+            and len(accounts) == 2
+        ):
+            print_pass("Responses, failures and pagers recorded")
+            record_pass()
+        else:
+            print_fail(f"Unexpected recording: {calls[:2]}")
+            record_fail()
+
+        # Replay runs without the fake server; the retry replays the failure
+        stats = dict(server.stats)
+        replayer = Replayer(temp_dir, today=date.today() + timedelta(days=6))
+        with replayer.install():
+            ads = connector()
+            replayed_keywords = ads.get_keyword_performance(customer_id)
+            replayed_changes = ads.get_change_history(customer_id)
+            shifted = query.replace("03-07", "03-13").replace("03-01", "03-07")
+            replayed_campaigns = [
+                row.campaign.id
+                for batch in ads.ga_service.search_stream(
+                    customer_id=customer_id, query=shifted
+                )
+                for row in batch.results
+            ]
+            proxy = replayer.proxy()
+            replayed_report = proxy.run_report(Message(property="properties/1"))
+            replayed_accounts = proxy.list_accounts()
+            try:
+                proxy.run_report(Message(property="properties/2"))
+                miss = None
+            except FixtureMissError as e:
+                miss = e
+
+        if (
+            replayed_keywords == keywords
+            and replayed_campaigns == campaigns
+            and [a.name for a in replayed_accounts] == ["accounts/1", "accounts/2"]
+            and miss is not None
+            and server.stats == stats
+        ):
+            print_pass("Replay serves identical results offline, shifting dates")
+            record_pass()
+        else:
+            print_fail(f"Replay differs: {len(replayed_keywords)} / {miss!r}")
+            record_fail()
+
+        unscrubbed = lambda rows: [dict(row, user=None) for row in rows]
+        scrubbed_email = replayed_report.rows[0].value
+        if (
+            unscrubbed(replayed_changes) == unscrubbed(changes)
+            and replayed_changes[0]["user"].startswith("user_email-")
+            and changes[0]["user"] == "user_email 1"
+            and scrubbed_email.startswith("user-")
+            and scrubbed_email.endswith("@example.com")
+        ):
+            print_pass("Fixtures store e-mails as stable tokens")
+            record_pass()
+        else:
+            print_fail(f"PII not scrubbed: {replayed_changes[:1]} / {scrubbed_email}")
+            record_fail()
+
+        if client_pool.get_client.__module__ == "backend.services.client_pool" and (
+            ads_connector.ensure_credentials.__module__
+            == "backend.services.credentials"
+        ):
+            print_pass("install() restores the real client and credential checks")
+            record_pass()
+        else:
+            print_fail("install() left patches behind")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+
+# =============================================================================
+# TEST 27: Benchmark Harness
+# =============================================================================
+def test_benchmark_harness():
+    print_header("TEST 27: Benchmark Harness")
+
+    import tempfile
+    import shutil
+    from benchmarks.harness import (
+        SUITES,
+        append_history,
+        compare,
+        discover,
+        load_history,
+        parameter_sets,
+        previous_run,
+        run_benchmark,
+        run_benchmarks,
+    )
+
+    found = discover()
+    names = {name for name, _, _ in found}
+    modules = {name.split(".")[0] for name in names}
+    if modules == {suite.rsplit(".", 1)[-1] for suite in SUITES} and {
+        "bench_decode.DecodeRows.time_decode",
+        "bench_pipeline.RunAudit.time_run_audit",
+        "bench_hooks.RunHook.time_hook",
+    } <= names:
+        print_pass(f"Discovered {len(found)} benchmarks in {len(SUITES)} suites")
+        record_pass()
+    else:
+        print_fail(f"Unexpected benchmarks: {sorted(names)}")
+        record_fail()
+
+    results = run_benchmarks(
+        pattern=r"DecodeRows\.time_decode$", sizes=["small"], repeat=2, min_time=0
+    )
+    sizes = {
+        params["size"]
+        for _, cls, _ in found
+        for params in parameter_sets(cls, ["small"])
+        if "size" in params
+    }
+
+    class Unavailable:
+        def setup(self):
+            raise NotImplementedError("needs an optional dependency")
+
+        def time_nothing(self):
+            pass
+
+    skipped = run_benchmark("Unavailable.time_nothing", Unavailable, "time_nothing", {})
+    if (
+        len(results) == 4
+        and all(r["median"] > 0 and r["units_per_second"] > 0 for r in results)
+        and sizes == {"small"}
+        and skipped.get("skipped") == "needs an optional dependency"
+    ):
+        print_pass("Benchmarks timed per parameter set, unavailable ones skipped")
+        record_pass()
+    else:
+        print_fail(f"Unexpected results: {results} / {skipped}")
+        record_fail()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        history_path = f"{temp_dir}/history.jsonl"
+        slower = [dict(r, median=r["median"] * 2) for r in results]
+        slower[1]["median"] = results[1]["median"] / 2
+        append_history(results, history_path)
+        append_history(slower, history_path)
+        history = load_history(history_path)
+        statuses = [
+            row["status"] for row in compare(results, previous_run(history), 0.1)
+        ]
+        if (
+            len(history) == 2
+            and "timestamp" in history[0]
+            and statuses == ["improved", "regressed", "improved", "improved"]
+            and [row["status"] for row in compare(results, None)] == ["new"] * 4
+            and compare([skipped], previous_run(history))[0]["status"] == "skipped"
+        ):
+            print_pass("Runs tracked in the history and compared with the last one")
+            record_pass()
+        else:
+            print_fail(f"Unexpected comparison: {statuses}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+
+# =============================================================================
+# TEST 28: API Call Instrumentation
+# =============================================================================
+def test_instrumentation():
+    print_header("TEST 28: API Call Instrumentation")
+
+    import json
+    import tempfile
+    import shutil
+    from backend.services import ads_connector
+    from backend.services.instrumentation import ConnectorMetrics, message_bytes
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer(
+        [FakeAccount(customer_id, keywords=2500), FakeAccount("5555555555")],
+        batch_size=1000,
+    )
+
+    class Exporter:
+        def __init__(self):
+            self.calls = []
+
+        def export(self, call):
+            self.calls.append(call)
+
+    exporter = Exporter()
+    metrics = ConnectorMetrics(exporters=[exporter])
+    with server.install():
+        ads = ads_connector.AdsConnector(
+            rate_limiter=RateLimiter(rate=1000, burst=100, per_customer_rate=None),
+            retry_policy=RetryPolicy(base_delay=0),
+            metrics=metrics,
+        )
+        ads.get_campaign_performance("5555555555")
+        since = metrics.mark()
+        keywords = ads.get_keyword_performance(customer_id)
+        server.fail_next("UNAVAILABLE")
+        ads.get_campaign_budgets(customer_id)
+        ads.add_campaign_negative_keywords(customer_id, "1000", ["free", "diy"])
+
+    summary = metrics.summary(customer_id, since)
+    reports = {entry["report"]: entry for entry in summary["reports"]}
+    keyword_entry = reports.get("keyword_performance", {})
+    if (
+        keyword_entry.get("rows") == len(keywords) == 2500
+        and keyword_entry.get("batches") == 3
+        and keyword_entry["time_to_first_batch"] <= keyword_entry["total_time"]
+        and keyword_entry["decode_time"] > 0
+        and reports.get("campaign_budgets", {}).get("calls") == 2
+        and reports["campaign_budgets"]["errors"] == 1
+        and reports.get("mutate_campaign_criteria", {}).get("operations") == 2
+        and "campaign_performance" not in reports
+        and summary["totals"]["calls"] == 4
+    ):
+        print_pass("search_stream and mutate calls timed and counted per report")
+        record_pass()
+    else:
+        print_fail(f"Unexpected metrics: {summary['reports']}")
+        record_fail()
+
+    ranked = [entry["total_time"] for entry in summary["reports"]]
+    if (
+        ranked == sorted(ranked, reverse=True)
+        and len(exporter.calls) == 5
+        and all(call.finished for call in exporter.calls)
+    ):
+        print_pass("Reports ranked by time, finished calls exported")
+        record_pass()
+    else:
+        print_fail(f"Unexpected ranking/export: {ranked} / {len(exporter.calls)}")
+        record_fail()
+
+    class RawMessage:
+        def ByteSize(self):
+            return 42
+
+    class ProtoPlusMessage:
+        @classmethod
+        def pb(cls, message):
+            return RawMessage()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = f"{temp_dir}/metrics.json"
+        metrics.write(path, customer_id, since)
+        with open(path) as f:
+            written = json.load(f)
+        if (
+            message_bytes(ProtoPlusMessage()) == 42
+            and message_bytes(object()) == 0
+            and written["customer_id"] == customer_id
+            and len(written["calls"]) == 4
+        ):
+            print_pass("Byte sizes read from protobuf messages, metrics JSON written")
+            record_pass()
+        else:
+            print_fail(f"Unexpected metrics JSON: {written['totals']}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+
+# =============================================================================
+# TEST 29: Bulk Mutations
+# =============================================================================
+def test_bulk_mutations():
+    print_header("TEST 29: Bulk Mutations")
+
+    import threading
+    from backend.services import ads_connector
+    from backend.services.bulk_mutations import BulkMutator
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer([FakeAccount(customer_id), FakeAccount("5555555555")])
+    server.reject(
+        lambda operation: "bad" in str(operation.create.keyword.text),
+        "criterion_error.KEYWORD_HAS_INVALID_CHARS",
+    )
+
+    with server.install():
+        ads = ads_connector.AdsConnector(
+            rate_limiter=RateLimiter(rate=1000, burst=100, per_customer_rate=None),
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+
+        # 12,001 keywords: three chunks, one rejected keyword in the last
+        keywords = [f"plumber {i}" for i in range(12000)] + ["bad keyword"]
+        added = ads.add_keywords(customer_id, "2000", keywords, validate_only=False)
+        if (
+            len(added["resources"]) == 12000
+            and added["errors"][0]["keyword"] == "bad keyword"
+            and [count for _, _, count in server.mutations] == [5000, 5000, 2001]
+        ):
+            print_pass("Operations chunked, rejected keyword mapped to its input")
+            record_pass()
+        else:
+            print_fail(f"Unexpected bulk add: {added['errors']} / {server.mutations}")
+            record_fail()
+
+        # One bulk run across services and customers, recording which thread
+        # sends each request
+        server.mutations.clear()
+        server.fail_next("RESOURCE_EXHAUSTED", method="mutate_campaign_criteria")
+        request_threads = []
+        before_request = server._before_request
+
+        def recording_before_request(method, mutate=False):
+            request_threads.append((method, threading.current_thread().name))
+            return before_request(method, mutate)
+
+        server._before_request = recording_before_request
+        bulk = BulkMutator(ads, validate_only=False, chunk_size=2)
+        for text in ("free", "bad jobs", "diy"):
+            operation = ads.client.get_type("CampaignCriterionOperation")
+            operation.create.negative = True
+            operation.create.keyword.text = text
+            bulk.add(customer_id, "CampaignCriterionService", operation, text)
+        for criterion_id in ("2000~1", "2000~2"):
+            operation = ads.client.get_type("AdGroupCriterionOperation")
+            operation.remove = f"customers/5555555555/adGroupCriteria/{criterion_id}"
+            bulk.add("5555555555", "AdGroupCriterionService", operation, criterion_id)
+        result = bulk.run()
+        server._before_request = before_request
+        customer_threads = {
+            name for method, name in request_threads if "campaign" in method
+        }
+        if (
+            result["requests"] == 3
+            and result["operations"] == 5
+            and [error["input"] for error in result["errors"]] == ["bad jobs"]
+            and result["errors"][0]["error_code"]
+            == "criterion_error.KEYWORD_HAS_INVALID_CHARS"
+            and result["results"][4]["resource_name"].endswith("2000~2")
+            and len(server.mutations) == 3
+            and len(request_threads) == 4
+            and len(customer_threads) == 1
+            and len(bulk) == 0
+        ):
+            print_pass("Customers run in parallel, their chunks in turn, quota retried")
+            record_pass()
+        else:
+            print_fail(f"Unexpected bulk run: {result['errors']} / {server.mutations}")
+            record_fail()
+
+        # Dry runs still report rejected operations; whole-request failures,
+        # including ones that may have been applied, fail every operation in
+        # the request without a retry
+        dry_run = ads.add_keywords(customer_id, "2000", ["ok", "bad"])
+        mutates = server.stats["mutates"]
+        server.fail_next("UNAVAILABLE", method="mutate_ad_group_criteria")
+        bids = ads.set_keyword_bids(
+            customer_id, {"2000~1": 1_000_000, "2000~2": 2_000_000}, False
+        )
+        bid_requests = server.stats["mutates"] - mutates
+        single = ads.update_keyword_bids(customer_id, "2000~3", 500_000, False)
+        if (
+            dry_run["dry_run"]
+            and [error["keyword"] for error in dry_run["errors"]] == ["bad"]
+            and [error["criterion_id"] for error in bids["errors"]]
+            == ["2000~1", "2000~2"]
+            and bid_requests == 1
+            and single["resource"].endswith("adGroupCriteria/2000~3")
+        ):
+            print_pass("Dry runs validate, request failures reported per operation")
+            record_pass()
+        else:
+            print_fail(f"Unexpected bulk results: {dry_run} / {bids} / {single}")
+            record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 30: Batch Job Mutations
+# =============================================================================
+def test_batch_jobs():
+    print_header("TEST 30: Batch Job Mutations")
+
+    from backend.services import ads_connector
+    from backend.services.batch_jobs import BatchJobMutator
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer(
+        [FakeAccount(customer_id), FakeAccount("5555555555")], batch_job_polls=2
+    )
+    server.reject(
+        lambda operation: "bad" in str(operation.create.keyword.text),
+        "criterion_error.KEYWORD_HAS_INVALID_CHARS",
+    )
+
+    with server.install():
+        ads = ads_connector.AdsConnector(
+            rate_limiter=RateLimiter(rate=1000, burst=100, per_customer_rate=None),
+            retry_policy=RetryPolicy(base_delay=0),
+            mutation_mode="batch_job",
+        )
+
+        # 10,000 keyword removals and creations staged in 4,000-operation
+        # chunks, plus a second customer's job
+        batch = ads.bulk_mutator(
+            validate_only=False, chunk_size=4000, poll_interval=0.001, page_size=3000
+        )
+        for i in range(9999):
+            operation = ads.client.get_type("AdGroupCriterionOperation")
+            operation.remove = f"customers/{customer_id}/adGroupCriteria/2000~{i}"
+            batch.add(customer_id, "AdGroupCriterionService", operation, i)
+        operation = ads.client.get_type("AdGroupCriterionOperation")
+        operation.create.keyword.text = "bad keyword"
+        batch.add(customer_id, "AdGroupCriterionService", operation, "bad keyword")
+        operation = ads.client.get_type("CampaignCriterionOperation")
+        operation.create.keyword.text = "free"
+        batch.add("5555555555", "CampaignCriterionService", operation, "free")
+        server.fail_next("RESOURCE_EXHAUSTED", method="add_batch_job_operations")
+        result = batch.run()
+
+        jobs = [server.batch_jobs[job] for job in result.get("batch_jobs", [])]
+        if (
+            isinstance(batch, BatchJobMutator)
+            and [len(job["operations"]) for job in jobs] == [10000, 1]
+            and result["requests"] == 8
+            and len(result["resources"]) == 10000
+            and result["results"][42]["resource_name"].endswith("2000~42")
+            and "campaignCriteria" in result["results"][-1]["resource_name"]
+            and [error["input"] for error in result["errors"]] == ["bad keyword"]
+            and result["errors"][0]["error_code"]
+            == "criterion_error.KEYWORD_HAS_INVALID_CHARS"
+            and all(job["polls"] == 3 for job in jobs)
+        ):
+            print_pass("Operations staged, polled and results mapped to inputs")
+            record_pass()
+        else:
+            print_fail(f"Unexpected batch job run: {result['errors']} / {server.stats}")
+            record_fail()
+
+        # Dry runs never create a job; connector writes follow the mode
+        dry_run = ads.add_keywords(customer_id, "2000", ["ok", "bad"])
+        server.batch_job_polls = 0
+        removed = ads.remove_keywords(customer_id, ["2000~1", "2000~2"], False)
+        if (
+            dry_run["dry_run"]
+            and [error["keyword"] for error in dry_run["errors"]] == ["bad"]
+            and len(server.batch_jobs) == 3
+            and removed["resources"][1].endswith("adGroupCriteria/2000~2")
+        ):
+            print_pass("Dry runs validate synchronously, writes use batch jobs")
+            record_pass()
+        else:
+            print_fail(f"Unexpected batch job mode: {dry_run} / {removed}")
+            record_fail()
+
+        # A staging request that may have been applied is not sent again:
+        # the job stays unstarted and its operations fail
+        mutates = server.stats["mutates"]
+        server.fail_next("UNAVAILABLE", method="add_batch_job_operations")
+        failed = ads.remove_keywords(customer_id, ["2000~3", "2000~4"], False)
+        job = list(server.batch_jobs.values())[-1]
+        if (
+            len(failed["errors"]) == 2
+            and not failed["resources"]
+            and server.stats["mutates"] - mutates == 2
+            and job["status"] == "PENDING"
+            and not job["operations"]
+        ):
+            print_pass("Ambiguous staging failures fail the job without a retry")
+            record_pass()
+        else:
+            print_fail(f"Unexpected staging failure: {failed} / {job['status']}")
+            record_fail()
+
+        # Status checks are retried; a job whose status stays unreadable is
+        # reported as pending under its name instead of raising
+        server.fail_next("UNAVAILABLE", method="get_operation")
+        polled = ads.remove_keywords(customer_id, ["2000~5"], False)
+        server.fail_next("UNAVAILABLE", times=5, method="get_operation")
+        pending = ads.remove_keywords(customer_id, ["2000~6", "2000~7"], False)
+        name, job = list(server.batch_jobs.items())[-1]
+        if (
+            polled["resources"][0].endswith("adGroupCriteria/2000~5")
+            and len(pending["errors"]) == 2
+            and all(name in error["message"] for error in pending["errors"])
+            and job["status"] == "RUNNING"
+            and len(job["operations"]) == 2
+        ):
+            print_pass("Failed status checks retried, then reported as pending")
+            record_pass()
+        else:
+            print_fail(f"Unexpected polling failure: {polled} / {pending}")
+            record_fail()
+
+        # Every results page is its own request: a later page that fails
+        # once is fetched again
+        pages = []
+        before_request = server._before_request
+
+        def failing_second_page(method, mutate=False):
+            if method == "list_batch_job_results":
+                pages.append(method)
+                if len(pages) == 2:
+                    server.fail_next("UNAVAILABLE", method=method)
+            return before_request(method, mutate)
+
+        server._before_request = failing_second_page
+        batch = ads.bulk_mutator(validate_only=False, page_size=1)
+        for criterion_id in ("2000~8", "2000~9", "2000~10"):
+            operation = ads.client.get_type("AdGroupCriterionOperation")
+            operation.remove = f"customers/{customer_id}/adGroupCriteria/{criterion_id}"
+            batch.add(customer_id, "AdGroupCriterionService", operation, criterion_id)
+        paged = batch.run()
+        server._before_request = before_request
+        if len(paged["resources"]) == 3 and not paged["errors"] and len(pages) == 4:
+            print_pass("Each results page fetched and retried on its own")
+            record_pass()
+        else:
+            print_fail(f"Unexpected paged results: {paged['errors']} / {pages}")
+            record_fail()
+
+        # A results page that cannot be read fails only the operations still
+        # without a result; errors from earlier pages are kept
+        pages.clear()
+
+        def rejecting_second_page(method, mutate=False):
+            if method == "list_batch_job_results":
+                pages.append(method)
+                if len(pages) == 2:
+                    server.fail_next("INVALID_ARGUMENT", method=method)
+            return before_request(method, mutate)
+
+        server._before_request = rejecting_second_page
+        batch = ads.bulk_mutator(validate_only=False, page_size=1)
+        for text in ("bad keyword", "plumber"):
+            operation = ads.client.get_type("AdGroupCriterionOperation")
+            operation.create.keyword.text = text
+            batch.add(customer_id, "AdGroupCriterionService", operation, text)
+        partial = batch.run()
+        server._before_request = before_request
+        if [error["error_code"] for error in partial["errors"]] == [
+            "criterion_error.KEYWORD_HAS_INVALID_CHARS",
+            "INVALID_ARGUMENT",
+        ]:
+            print_pass("Failed results page keeps errors already read")
+            record_pass()
+        else:
+            print_fail(f"Unexpected partial results: {partial['errors']}")
+            record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 31: Shared Client Pool
+# =============================================================================
+def test_client_pool():
+    print_header("TEST 31: Shared Client Pool")
+
+    from backend.services import _sdk, ads_connector, client_pool
+    from backend.services.rate_limiter import RateLimiter
+
+    class StubClient:
+        """GoogleAdsClient stand-in counting clients and service stubs."""
+
+        created = []
+
+        def __init__(self, config):
+            self.config = config
+            self.services = []
+
+        @classmethod
+        def load_from_dict(cls, config):
+            client = cls(config)
+            cls.created.append(client)
+            return client
+
+        def get_service(self, name, version=None):
+            self.services.append(name)
+            return object()
+
+    original_client = _sdk.__dict__.get("GoogleAdsClient")
+    ensure_credentials = ads_connector.ensure_credentials
+    _sdk.GoogleAdsClient = StubClient
+    ads_connector.ensure_credentials = lambda: "stub credentials"
+    client_pool.clear()
+    try:
+        connectors = [
+            ads_connector.AdsConnector(
+                rate_limiter=RateLimiter(rate=1000), login_customer_id=login
+            )
+            for login in ("1111111111", "1111111111", "2222222222")
+        ]
+        first, second, other = connectors
+        stubs = [
+            connector._service("CampaignService")._service for connector in connectors
+        ]
+        if (
+            first.client is second.client
+            and other.client is not first.client
+            and len(StubClient.created) == 2
+            and stubs[0] is stubs[1]
+            and stubs[2] is not stubs[0]
+            and first.client.services == ["GoogleAdsService", "CampaignService"]
+            and other.client.services == ["GoogleAdsService", "CampaignService"]
+        ):
+            print_pass("Same credentials share a client and stubs, others do not")
+            record_pass()
+        else:
+            print_fail(
+                f"Unexpected pooling: {len(StubClient.created)} clients, "
+                f"{first.client.services} / {other.client.services}"
+            )
+            record_fail()
+    finally:
+        client_pool.clear()
+        ads_connector.ensure_credentials = ensure_credentials
+        if original_client is None:
+            del _sdk.GoogleAdsClient
+        else:
+            _sdk.GoogleAdsClient = original_client
+
+    return True
+
+
+# =============================================================================
+# TEST 32: Streaming Reports
+# =============================================================================
+def test_streaming_reports():
+    print_header("TEST 32: Streaming Reports")
+
+    import inspect
+    import tempfile
+    import shutil
+    from backend.services import ads_connector
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.report_cache import ReportCache
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer([FakeAccount(customer_id, keywords=2500)], batch_size=1000)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = ReportCache(temp_dir)
+        with server.install():
+            ads = ads_connector.AdsConnector(
+                cache=cache,
+                rate_limiter=RateLimiter(rate=1000, burst=100),
+                retry_policy=RetryPolicy(base_delay=0),
+            )
+            streamed = ads.run_report("keyword_performance", customer_id, stream=True)
+            is_generator = inspect.isgenerator(streamed)
+            streamed = list(streamed)
+            batches = list(
+                ads.iter_report("keyword_performance", customer_id, batch_size=700)
+            )
+            cached_after_streaming = cache.stats()["entries"]
+            rows = ads.get_keyword_performance(customer_id)
+            ads.get_keyword_performance(customer_id)
+            streams = server.stats["search_streams"]
+
+        if (
+            is_generator
+            and [len(batch) for batch in batches] == [700, 700, 700, 400]
+            and [row for batch in batches for row in batch] == streamed == rows
+        ):
+            print_pass("stream=True and iter_report yield rows and batch_size lists")
+            record_pass()
+        else:
+            print_fail(f"Unexpected streamed batches: {[len(b) for b in batches]}")
+            record_fail()
+
+        # Streams neither read nor fill the cache; the list read fills it once
+        if (
+            cached_after_streaming == 0
+            and cache.stats()["entries"] == 1
+            and streams == 3
+        ):
+            print_pass("Streamed reads bypass the report cache")
+            record_pass()
+        else:
+            print_fail(
+                f"Unexpected caching: {cached_after_streaming} entries after "
+                f"streaming, {streams} search_streams"
+            )
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+
+# =============================================================================
+# TEST 33: Async Connector
+# =============================================================================
+def test_async_connector():
+    print_header("TEST 33: Async Connector")
+
+    import asyncio
+    import threading
+    from backend.services import ads_connector
+    from backend.services.async_ads_connector import AsyncAdsConnector
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer(
+        [FakeAccount(customer_id, keywords=2500, search_terms=2500)], batch_size=1000
+    )
+
+    # Record which thread makes every API request
+    request_threads = []
+    before_request = server._before_request
+
+    def recording_before_request(method, mutate=False):
+        request_threads.append(threading.current_thread().name)
+        return before_request(method, mutate)
+
+    server._before_request = recording_before_request
+
+    async def audit(ads):
+        campaigns, keywords = await asyncio.gather(
+            ads.get_campaign_performance(customer_id),
+            ads.get_keyword_performance(customer_id),
+        )
+        stream = await ads.get_search_terms(customer_id, stream=True)
+        streamed = [row async for row in stream]
+        batches = [
+            batch
+            async for batch in ads.iter_report(
+                "keyword_performance", customer_id, batch_size=1000
+            )
+        ]
+        return campaigns, keywords, stream, streamed, batches
+
+    with server.install():
+        sync = ads_connector.AdsConnector(
+            rate_limiter=RateLimiter(rate=1000, burst=100),
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+        expected_keywords = sync.get_keyword_performance(customer_id)
+        expected_terms = sync.get_search_terms(customer_id)
+        request_threads.clear()
+        ads = AsyncAdsConnector(connector=sync, max_concurrency=4)
+        campaigns, keywords, stream, streamed, batches = asyncio.run(audit(ads))
+        ads.close()
+
+    if (
+        campaigns
+        and keywords == expected_keywords
+        and [len(batch) for batch in batches] == [1000, 1000, 500]
+    ):
+        print_pass("Coroutines and iter_report match the synchronous connector")
+        record_pass()
+    else:
+        print_fail(f"Unexpected async results: {[len(b) for b in batches]}")
+        record_fail()
+
+    if (
+        hasattr(stream, "__aiter__")
+        and streamed == expected_terms
+        and len(request_threads) == 4
+        and all(name.startswith("ads-stream") for name in request_threads)
+    ):
+        print_pass("stream=True returns an async iterator reading off the loop")
+        record_pass()
+    else:
+        print_fail(f"Streamed reads ran on: {sorted(set(request_threads))}")
+        record_fail()
+
+    return True
+
+
+# =============================================================================
+# TEST 34: Incremental Reads Match Full Reads
+# =============================================================================
+def test_incremental_matches_full():
+    print_header("TEST 34: Incremental Reads Match Full Reads")
+
+    import tempfile
+    import shutil
+    from backend.services import ads_connector
+    from backend.services.incremental_sync import PartitionStore
+    from backend.services.rate_limiter import RateLimiter
+    from backend.services.retry import RetryPolicy
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    customer_id = "1234567890"
+    server = FakeAdsServer([FakeAccount(customer_id)])
+    reports = ["campaign_performance", "ad_group_performance"]
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with server.install():
+            options = {
+                "rate_limiter": RateLimiter(rate=1000, burst=100),
+                "retry_policy": RetryPolicy(base_delay=0),
+            }
+            full = ads_connector.AdsConnector(**options)
+            incremental = ads_connector.AdsConnector(
+                partitions=PartitionStore(temp_dir), **options
+            )
+            expected = {name: full.run_report(name, customer_id) for name in reports}
+            # The second pass reuses settled partitions and refetches the rest
+            passes = [
+                {name: incremental.run_report(name, customer_id) for name in reports}
+                for _ in range(2)
+            ]
+            streams = server.stats["search_streams"]
+
+        counts = [len(expected[name]) for name in reports]
+        if counts == [300, 1500] and all(rows == expected for rows in passes):
+            print_pass("Incremental reads return the same rows as full reads")
+            record_pass()
+        else:
+            print_fail(
+                "Row counts differ: "
+                f"{[{name: len(rows[name]) for name in reports} for rows in passes]} "
+                f"vs {counts}"
+            )
+            record_fail()
+
+        # 2 full reads, 2 initial syncs and 2 settling-day refetches
+        if streams == 6:
+            print_pass("Second incremental pass refetches only the recent days")
+            record_pass()
+        else:
+            print_fail(f"Expected 6 search_streams, got {streams}")
+            record_fail()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+
+# =============================================================================
+# TEST 35: Fleet Audit
+# =============================================================================
+def test_fleet_audit():
+    print_header("TEST 35: Fleet Audit")
+
+    try:
+        from scripts import audit_fleet
+    except ImportError as e:
+        print_warn(f"{e.name} not installed - skipping fleet audit")
+        record_warn()
+        return True
+
+    import tempfile
+    import shutil
+    from backend.testing.fake_ads import FakeAccount, FakeAdsServer
+
+    accounts = [
+        {"id": "1111111111", "name": "Plumbing Copenhagen"},
+        {"id": "2222222222", "name": "Plumbing Aarhus"},
+        {"id": "3333333333", "name": "Dental Odense"},
+    ]
+
+    def selected(**filters):
+        return [a["id"] for a in audit_fleet.select_accounts(accounts, **filters)]
+
+    if (
+        selected(search="PLUMBING") == ["1111111111", "2222222222"]
+        and selected(include={"2222222222", "3333333333"}, exclude={"3333333333"})
+        == ["2222222222"]
+        and selected() == [a["id"] for a in accounts]
+    ):
+        print_pass("Accounts filtered by include, exclude and name search")
+        record_pass()
+    else:
+        print_fail(f"Unexpected selection: {selected(search='PLUMBING')}")
+        record_fail()
+
+    server = FakeAdsServer(
+        [
+            FakeAccount(a["id"], name=a["name"], keywords=50, search_terms=50)
+            for a in accounts
+        ]
+    )
+
+    # Fail the second account on the first run, and record every status the
+    # ledger moves through
+    audited = []
+    transitions = {}
+    collect_audit = audit_fleet.collect_audit
+    update = audit_fleet.FleetLedger.update
+
+    def failing_collect_audit(customer_id, *args, **kwargs):
+        audited.append(customer_id)
+        if customer_id == "2222222222" and audited.count(customer_id) == 1:
+            raise RuntimeError("simulated outage")
+        return collect_audit(customer_id, *args, **kwargs)
+
+    def recording_update(self, customer_id, **fields):
+        if "status" in fields:
+            transitions.setdefault(customer_id, []).append(fields["status"])
+        return update(self, customer_id, **fields)
+
+    login_customer_id = os.environ.get("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
+    os.environ["GOOGLE_ADS_LOGIN_CUSTOMER_ID"] = "9999999999"
+    audit_fleet.collect_audit = failing_collect_audit
+    audit_fleet.FleetLedger.update = recording_update
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with server.install():
+            runs = []
+            for _ in range(2):
+                json_path, md_path = audit_fleet.run_fleet(
+                    search="plumbing", parallel=2, qps=1000, output_dir=temp_dir
+                )
+                with open(md_path) as f:
+                    runs.append((json_path, f.read()))
+        ledger = audit_fleet.FleetLedger(os.path.join(temp_dir, "ledger.json"))
+        with open(runs[-1][0]) as f:
+            summary = json.load(f)
+    finally:
+        audit_fleet.collect_audit = collect_audit
+        audit_fleet.FleetLedger.update = update
+        if login_customer_id is None:
+            os.environ.pop("GOOGLE_ADS_LOGIN_CUSTOMER_ID", None)
+        else:
+            os.environ["GOOGLE_ADS_LOGIN_CUSTOMER_ID"] = login_customer_id
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if sorted(audited) == ["1111111111", "2222222222", "2222222222"] and (
+        transitions
+        == {
+            "1111111111": ["pending", "running", "done"],
+            "2222222222": ["pending", "running", "failed"]
+            + ["pending", "running", "done"],
+        }
+    ):
+        print_pass("Resumed run re-audits only the failed account")
+        record_pass()
+    else:
+        print_fail(f"Unexpected fleet runs: {audited} / {transitions}")
+        record_fail()
+
+    first_summary = runs[0][1]
+    if (
+        "**Accounts audited:** 1/2" in first_summary
+        and "**2222222222**: RuntimeError: simulated outage" in first_summary
+        and "**Accounts audited:** 2/2" in runs[1][1]
+        and "Failed Accounts" not in runs[1][1]
+        and all(ledger.is_done(customer_id) for customer_id in summary)
+        and sorted(summary) == ["1111111111", "2222222222"]
+        and all(entry["summary"]["campaigns"] for entry in summary.values())
+    ):
+        print_pass("Ledger persisted and fleet summaries written per run")
+        record_pass()
+    else:
+        print_fail(f"Unexpected fleet summary: {first_summary}")
+        record_fail()
+
+    return True
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -643,6 +3009,33 @@ def main():
     test_schema_sample_data()
     test_phase_file_content()
     test_variable_consistency()
+    test_fetch_scheduler()
+    test_report_registry()
+    test_columnar_decoder()
+    test_report_cache()
+    test_incremental_sync()
+    test_rate_limiter()
+    test_retry_policy()
+    test_import_budget()
+    test_multi_window()
+    test_audit_warehouse()
+    test_audit_export()
+    test_audit_writer()
+    test_ngram_analysis()
+    test_negative_conflicts()
+    test_quality_score_analysis()
+    test_artifact_builders()
+    test_fake_ads_api()
+    test_record_replay()
+    test_benchmark_harness()
+    test_instrumentation()
+    test_bulk_mutations()
+    test_batch_jobs()
+    test_client_pool()
+    test_streaming_reports()
+    test_async_connector()
+    test_incremental_matches_full()
+    test_fleet_audit()
 
     # Summary
     print_header("TEST SUMMARY")